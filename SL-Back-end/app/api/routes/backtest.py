@@ -7,11 +7,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Body, WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 import uuid
+import copy
 import logging
 import asyncio
 
@@ -152,6 +153,9 @@ class BacktestRequest(BaseModel):
     # 포트폴리오 저장 설정 (전략 포트폴리오 페이지에서 실행 시 True)
     is_portfolio: Optional[bool] = False
 
+    # headless: 세션 생성/진행률/WebSocket/결과 저장 없이 통계 + NAV만 즉시 반환 (미리보기용)
+    headless: Optional[bool] = False
+
 
 class BacktestResponse(BaseModel):
     """백테스트 응답"""
@@ -164,6 +168,14 @@ class BacktestResponse(BaseModel):
         populate_by_name = True
 
 
+class BacktestHeadlessResponse(BaseModel):
+    """headless 백테스트 응답 (저장 없음)"""
+    statistics: Dict[str, Any]
+    nav: List[Dict[str, Any]]
+    elapsed_seconds: float = Field(..., serialization_alias="elapsedSeconds")
+    trace: Optional[Dict[str, Any]] = None
+
+
 class BacktestStatusResponse(BaseModel):
     """백테스트 상태 응답"""
     backtest_id: str = Field(..., serialization_alias="backtestId")
@@ -302,7 +314,182 @@ class BacktestSettingsResponse(BaseModel):
     trading_rules: List[TradingRuleSettings] = Field([], serialization_alias="tradingRules")
 
 
-@router.post("/backtest/run", response_model=BacktestResponse)
+async def _load_strategy_config(db: AsyncSession, request: BacktestRequest) -> Optional[Dict[str, Any]]:
+    """유명 전략이면 DB에서 벡터화 평가용 expression + conditions 로드 (없으면 None)"""
+    loaded_strategy_config = None
+    if request.strategy_name:
+        from sqlalchemy import text
+        logger.info(f"🎯 전략 감지: {request.strategy_name}")
+
+        # id 또는 name으로 조회 (한글/영문 모두 지원)
+        result = await db.execute(
+            text('SELECT backtest_config FROM investment_strategies WHERE id = :id OR name = :name'),
+            {'id': request.strategy_name, 'name': request.strategy_name}
+        )
+        config = result.scalar_one_or_none()
+
+        if config:
+            # Case 1: expression과 conditions가 이미 있는 경우 (peter_lynch 형식)
+            if 'expression' in config and 'conditions' in config:
+                loaded_strategy_config = {
+                    'expression': config['expression'],
+                    'conditions': config['conditions'],
+                    'priority_factor': config.get('priority_factor', request.priority_factor),
+                    'priority_order': config.get('priority_order', request.priority_order)
+                }
+                logger.info(f"✅ 벡터화 설정 로드: expression={loaded_strategy_config['expression']}, conditions={len(loaded_strategy_config['conditions'])}개")
+
+            # Case 2: buy_conditions만 있는 경우 → 자동 변환
+            elif 'buy_conditions' in config and config['buy_conditions']:
+                logger.info(f"🔄 buy_conditions → conditions 자동 변환 시작")
+
+                def convert_buy_conditions(buy_conditions: list) -> tuple:
+                    """
+                    buy_conditions 형식을 벡터화 평가용 conditions로 변환
+
+                    입력 형식 (warren_buffett 등):
+                    {"name": "A", "inequality": ">", "exp_left_side": "기본값({ROE})", "exp_right_side": 12}
+
+                    출력 형식 (peter_lynch):
+                    {"id": "A", "factor": "ROE", "operator": ">", "value": 12}
+                    """
+                    import re
+                    conditions = []
+                    condition_ids = []
+
+                    for bc in buy_conditions:
+                        # 팩터 추출: "기본값({ROE})" → "ROE"
+                        exp_left = bc.get('exp_left_side', '')
+                        factor_match = re.search(r'\{([A-Z_0-9]+)\}', exp_left)
+                        if not factor_match:
+                            logger.warning(f"⚠️ 팩터 추출 실패: {exp_left}")
+                            continue
+
+                        factor = factor_match.group(1)
+                        condition_id = bc.get('name', f'C{len(conditions)}')
+                        operator = bc.get('inequality', '>')
+                        value = bc.get('exp_right_side', 0)
+
+                        conditions.append({
+                            'id': condition_id,
+                            'factor': factor,
+                            'operator': operator,
+                            'value': value
+                        })
+                        condition_ids.append(condition_id)
+
+                    # expression 생성: buy_logic에 따라 and/or 연결
+                    buy_logic = config.get('buy_logic', 'and')
+                    expression = f' {buy_logic} '.join(condition_ids)
+
+                    return expression, conditions
+
+                expression, conditions = convert_buy_conditions(config['buy_conditions'])
+
+                if conditions:
+                    loaded_strategy_config = {
+                        'expression': expression,
+                        'conditions': conditions,
+                        'priority_factor': config.get('priority_factor', request.priority_factor),
+                        'priority_order': config.get('priority_order', request.priority_order)
+                    }
+                    logger.info(f"✅ 자동 변환 완료: expression={expression}, conditions={len(conditions)}개")
+                else:
+                    logger.warning(f"⚠️ 전략 '{request.strategy_name}' buy_conditions 변환 실패")
+            else:
+                logger.warning(f"⚠️ 전략 '{request.strategy_name}' 설정에 expression/conditions/buy_conditions 없음")
+        else:
+            logger.warning(f"⚠️ 전략 '{request.strategy_name}'을 DB에서 찾을 수 없음")
+
+    return loaded_strategy_config
+
+
+def _resolve_trade_targets(trade_targets: TradeTargets) -> tuple:
+    """매매 대상 → (산업/테마 목록, 종목 코드 목록, 유니버스 목록)"""
+    # 매매 대상 결정:
+    # 1. 유니버스가 선택되어 있으면 유니버스 사용 (use_all_stocks 무시)
+    # 2. 유니버스가 없고 테마/종목이 선택되어 있으면 테마/종목 사용
+    # 3. 아무것도 선택되지 않았거나 use_all_stocks이 true면 전체 종목 사용
+    has_universe_selection = trade_targets.selected_universes and len(trade_targets.selected_universes) > 0
+    has_theme_selection = trade_targets.selected_themes and len(trade_targets.selected_themes) > 0
+    has_stock_selection = trade_targets.selected_stocks and len(trade_targets.selected_stocks) > 0
+
+    if has_universe_selection:
+        # 유니버스 선택이 있으면 유니버스 기반 필터링 (테마와 AND 결합 가능)
+        target_universes = trade_targets.selected_universes
+        # 테마도 함께 전달 (AND 필터링)
+        selected_theme_codes = trade_targets.selected_themes if has_theme_selection else []
+        target_themes = [
+            THEME_CODE_TO_INDUSTRY.get(code, code) for code in selected_theme_codes
+        ]
+        target_stocks = trade_targets.selected_stocks if has_stock_selection else []
+        logger.info(f"🎯 유니버스 & 테마 AND 필터링 모드: universes={target_universes}, themes={len(target_themes)}, stocks={len(target_stocks)}")
+    elif has_theme_selection or has_stock_selection:
+        # 테마/종목 선택이 있으면 테마/종목 기반 필터링
+        selected_theme_codes = trade_targets.selected_themes
+        target_themes = [
+            THEME_CODE_TO_INDUSTRY.get(code, code) for code in selected_theme_codes
+        ]
+        target_stocks = trade_targets.selected_stocks
+        target_universes = []
+        logger.info(f"🎯 테마/종목 필터링 모드: themes={len(target_themes)}, stocks={len(target_stocks)}")
+    else:
+        # 아무것도 선택되지 않았으면 전체 종목 사용
+        target_themes = []
+        target_stocks = []
+        target_universes = []
+        logger.info(f"🎯 전체 종목 모드")
+
+    return target_themes, target_stocks, target_universes
+
+
+async def _acquire_backtest_slot(user_id: Any, count: int = 1) -> None:
+    """사용자별 동시 실행 카운터를 count만큼 증가 (합계 3개 초과 시 429, Redis 에러는 제한 없이 진행)"""
+    try:
+        from app.core.cache import get_redis
+        redis_client = get_redis()
+        if redis_client:
+            rate_limit_key = f"backtest:running:{user_id}"
+            running_count = await redis_client.get(rate_limit_key)
+
+            current_count = int(running_count) if running_count else 0
+            if current_count + count > 3:
+                raise HTTPException(
+                    status_code=429,
+                    detail="동시 실행 가능한 백테스트는 최대 3개입니다. 완료 후 다시 시도해주세요."
+                )
+
+            # 실행 중인 백테스트 카운터 증가 (TTL: 1시간)
+            await redis_client.setex(rate_limit_key, 3600, current_count + count)
+            logger.info(f"🚦 Rate Limit 체크 통과: user_id={user_id}, 실행 중: {current_count + count}/3")
+    except HTTPException:
+        # 429 에러는 그대로 전달
+        raise
+    except Exception as e:
+        # Redis 에러는 무시하고 계속 진행 (Rate Limiting 없이)
+        logger.warning(f"Rate Limiting 스킵 (Redis 에러): {e}")
+
+
+async def _release_backtest_slot(user_id: Any, count: int = 1) -> None:
+    """사용자별 동시 실행 카운터를 count만큼 감소 (실패/동기 실행 완료 시)"""
+    try:
+        from app.core.cache import get_redis
+        redis_client = get_redis()
+        if redis_client:
+            rate_limit_key = f"backtest:running:{user_id}"
+            running_count = await redis_client.get(rate_limit_key)
+            if running_count:
+                new_count = max(0, int(running_count) - count)
+                if new_count > 0:
+                    await redis_client.setex(rate_limit_key, 3600, new_count)
+                else:
+                    await redis_client.delete(rate_limit_key)
+                logger.info(f"🚦 Rate Limit 감소: user_id={user_id}, 남은 실행: {new_count}/3")
+    except Exception as redis_error:
+        logger.warning(f"Rate Limit 감소 실패 (무시): {redis_error}")
+
+
+@router.post("/backtest/run", response_model=Union[BacktestResponse, BacktestHeadlessResponse])
 async def run_backtest(
     request: BacktestRequest,
     current_user: User = Depends(get_current_user),
@@ -313,118 +500,26 @@ async def run_backtest(
     - 비동기로 백그라운드 실행
     - 세션 ID 즉시 반환
     - 🚀 PRODUCTION: 사용자당 동시 1개 백테스트 제한
+    - headless=true: 저장 없이 통계 + NAV를 바로 반환
     """
-    try:
-        # 🚀 PRODUCTION OPTIMIZATION: Rate Limiting (사용자당 동시 3개 백테스트)
+    if request.headless:
+        # headless도 동기로 전체 파이프라인을 실행하므로 같은 동시 실행 제한 적용
+        await _acquire_backtest_slot(current_user.user_id)
         try:
-            from app.core.cache import get_redis
-            redis_client = get_redis()
-            if redis_client:
-                rate_limit_key = f"backtest:running:{current_user.user_id}"
-                running_count = await redis_client.get(rate_limit_key)
-
-                if running_count and int(running_count) >= 3:
-                    raise HTTPException(
-                        status_code=429,
-                        detail="동시 실행 가능한 백테스트는 최대 3개입니다. 완료 후 다시 시도해주세요."
-                    )
+            return await _run_headless_backtest(request, db)
+        finally:
+            await _release_backtest_slot(current_user.user_id)
 
-                # 실행 중인 백테스트 카운터 증가 (TTL: 1시간)
-                current_count = int(running_count) if running_count else 0
-                await redis_client.setex(rate_limit_key, 3600, current_count + 1)
-                logger.info(f"🚦 Rate Limit 체크 통과: user_id={current_user.user_id}, 실행 중: {current_count + 1}/3")
-        except HTTPException:
-            # 429 에러는 그대로 전달
-            raise
-        except Exception as e:
-            # Redis 에러는 무시하고 계속 진행 (Rate Limiting 없이)
-            logger.warning(f"Rate Limiting 스킵 (Redis 에러): {e}")
+    # 🚀 PRODUCTION OPTIMIZATION: Rate Limiting (사용자당 동시 3개 백테스트)
+    await _acquire_backtest_slot(current_user.user_id)
+    return await _start_backtest(request, current_user, db)
 
-        # 🚀 벡터화 평가 지원: 유명 전략 사용 시 DB에서 expression과 conditions 로드
-        loaded_strategy_config = None
-        if request.strategy_name:
-            from sqlalchemy import text
-            logger.info(f"🎯 전략 감지: {request.strategy_name}")
-
-            # id 또는 name으로 조회 (한글/영문 모두 지원)
-            result = await db.execute(
-                text('SELECT backtest_config FROM investment_strategies WHERE id = :id OR name = :name'),
-                {'id': request.strategy_name, 'name': request.strategy_name}
-            )
-            config = result.scalar_one_or_none()
 
-            if config:
-                # Case 1: expression과 conditions가 이미 있는 경우 (peter_lynch 형식)
-                if 'expression' in config and 'conditions' in config:
-                    loaded_strategy_config = {
-                        'expression': config['expression'],
-                        'conditions': config['conditions'],
-                        'priority_factor': config.get('priority_factor', request.priority_factor),
-                        'priority_order': config.get('priority_order', request.priority_order)
-                    }
-                    logger.info(f"✅ 벡터화 설정 로드: expression={loaded_strategy_config['expression']}, conditions={len(loaded_strategy_config['conditions'])}개")
-
-                # Case 2: buy_conditions만 있는 경우 → 자동 변환
-                elif 'buy_conditions' in config and config['buy_conditions']:
-                    logger.info(f"🔄 buy_conditions → conditions 자동 변환 시작")
-
-                    def convert_buy_conditions(buy_conditions: list) -> tuple:
-                        """
-                        buy_conditions 형식을 벡터화 평가용 conditions로 변환
-
-                        입력 형식 (warren_buffett 등):
-                        {"name": "A", "inequality": ">", "exp_left_side": "기본값({ROE})", "exp_right_side": 12}
-
-                        출력 형식 (peter_lynch):
-                        {"id": "A", "factor": "ROE", "operator": ">", "value": 12}
-                        """
-                        import re
-                        conditions = []
-                        condition_ids = []
-
-                        for bc in buy_conditions:
-                            # 팩터 추출: "기본값({ROE})" → "ROE"
-                            exp_left = bc.get('exp_left_side', '')
-                            factor_match = re.search(r'\{([A-Z_0-9]+)\}', exp_left)
-                            if not factor_match:
-                                logger.warning(f"⚠️ 팩터 추출 실패: {exp_left}")
-                                continue
-
-                            factor = factor_match.group(1)
-                            condition_id = bc.get('name', f'C{len(conditions)}')
-                            operator = bc.get('inequality', '>')
-                            value = bc.get('exp_right_side', 0)
-
-                            conditions.append({
-                                'id': condition_id,
-                                'factor': factor,
-                                'operator': operator,
-                                'value': value
-                            })
-                            condition_ids.append(condition_id)
-
-                        # expression 생성: buy_logic에 따라 and/or 연결
-                        buy_logic = config.get('buy_logic', 'and')
-                        expression = f' {buy_logic} '.join(condition_ids)
-
-                        return expression, conditions
-
-                    expression, conditions = convert_buy_conditions(config['buy_conditions'])
-
-                    if conditions:
-                        loaded_strategy_config = {
-                            'expression': expression,
-                            'conditions': conditions,
-                            'priority_factor': config.get('priority_factor', request.priority_factor),
-                            'priority_order': config.get('priority_order', request.priority_order)
-                        }
-                        logger.info(f"✅ 자동 변환 완료: expression={expression}, conditions={len(conditions)}개")
-                    else:
-                        logger.warning(f"⚠️ 전략 '{request.strategy_name}' buy_conditions 변환 실패")
-                else:
-                    logger.warning(f"⚠️ 전략 '{request.strategy_name}' 설정에 expression/conditions/buy_conditions 없음")
-            else:
-                logger.warning(f"⚠️ 전략 '{request.strategy_name}'을 DB에서 찾을 수 없음")
+async def _start_backtest(request: BacktestRequest, current_user: User, db: AsyncSession) -> BacktestResponse:
+    """세션/전략 생성 후 백그라운드 실행 (슬롯은 호출 측에서 확보, 시작 실패 시 1개 반환)"""
+    try:
+        # 🚀 벡터화 평가 지원: 유명 전략 사용 시 DB에서 expression과 conditions 로드
+        loaded_strategy_config = await _load_strategy_config(db, request)
 
         # 1. 세션 ID 생성
         session_id = str(uuid.uuid4())
@@ -605,39 +700,7 @@ async def run_backtest(
         logger.info(f"Start date: {start_date}, End date: {end_date}, Initial capital: {initial_capital}")
         logger.info(f"Trade targets: {request.trade_targets.model_dump()}")
 
-        # 매매 대상 결정:
-        # 1. 유니버스가 선택되어 있으면 유니버스 사용 (use_all_stocks 무시)
-        # 2. 유니버스가 없고 테마/종목이 선택되어 있으면 테마/종목 사용
-        # 3. 아무것도 선택되지 않았거나 use_all_stocks이 true면 전체 종목 사용
-        has_universe_selection = request.trade_targets.selected_universes and len(request.trade_targets.selected_universes) > 0
-        has_theme_selection = request.trade_targets.selected_themes and len(request.trade_targets.selected_themes) > 0
-        has_stock_selection = request.trade_targets.selected_stocks and len(request.trade_targets.selected_stocks) > 0
-
-        if has_universe_selection:
-            # 유니버스 선택이 있으면 유니버스 기반 필터링 (테마와 AND 결합 가능)
-            target_universes = request.trade_targets.selected_universes
-            # 테마도 함께 전달 (AND 필터링)
-            selected_theme_codes = request.trade_targets.selected_themes if has_theme_selection else []
-            target_themes = [
-                THEME_CODE_TO_INDUSTRY.get(code, code) for code in selected_theme_codes
-            ]
-            target_stocks = request.trade_targets.selected_stocks if has_stock_selection else []
-            logger.info(f"🎯 유니버스 & 테마 AND 필터링 모드: universes={target_universes}, themes={len(target_themes)}, stocks={len(target_stocks)}")
-        elif has_theme_selection or has_stock_selection:
-            # 테마/종목 선택이 있으면 테마/종목 기반 필터링
-            selected_theme_codes = request.trade_targets.selected_themes
-            target_themes = [
-                THEME_CODE_TO_INDUSTRY.get(code, code) for code in selected_theme_codes
-            ]
-            target_stocks = request.trade_targets.selected_stocks
-            target_universes = []
-            logger.info(f"🎯 테마/종목 필터링 모드: themes={len(target_themes)}, stocks={len(target_stocks)}")
-        else:
-            # 아무것도 선택되지 않았으면 전체 종목 사용
-            target_themes = []
-            target_stocks = []
-            target_universes = []
-            logger.info(f"🎯 전체 종목 모드")
+        target_themes, target_stocks, target_universes = _resolve_trade_targets(request.trade_targets)
 
         asyncio.create_task(
             execute_backtest_wrapper(
@@ -684,25 +747,317 @@ async def run_backtest(
         logger.error(f"백테스트 실행 실패: {e}", exc_info=True)
         
         # 🚀 Rate Limit 카운터 감소 (백테스트 시작 실패 시)
-        try:
-            from app.core.cache import get_redis
-            redis_client = get_redis()
-            if redis_client:
-                rate_limit_key = f"backtest:running:{current_user.user_id}"
-                running_count = await redis_client.get(rate_limit_key)
-                if running_count:
-                    new_count = max(0, int(running_count) - 1)
-                    if new_count > 0:
-                        await redis_client.setex(rate_limit_key, 3600, new_count)
-                    else:
-                        await redis_client.delete(rate_limit_key)
-                    logger.info(f"🚦 Rate Limit 감소 (에러): user_id={current_user.user_id}, 남은 실행: {new_count}/3")
-        except Exception as redis_error:
-            logger.warning(f"Rate Limit 감소 실패 (무시): {redis_error}")
+        await _release_backtest_slot(current_user.user_id)
         
         raise HTTPException(status_code=500, detail=str(e))
 
 
+class SweepGrid(BaseModel):
+    """파라미터 스윕 후보값 (비어 있는 항목은 기본 요청 값 사용)"""
+    max_holdings: List[int] = []
+    is_day_or_month: List[str] = []
+    target_gain: List[float] = []
+    stop_loss: List[float] = []
+    thresholds: Dict[str, List[float]] = {}  # 매수 조건 이름 → 우변(exp_right_side) 후보값
+
+
+class BacktestSweepRequest(BaseModel):
+    """파라미터 스윕 요청"""
+    base: BacktestRequest
+    grid: SweepGrid
+
+
+class BacktestSweepVariant(BaseModel):
+    """스윕 변형별 비교 지표"""
+    variant_id: int = Field(..., serialization_alias="variantId")
+    params: Dict[str, Any]
+    cagr: Optional[float] = None
+    mdd: Optional[float] = None
+    sharpe: Optional[float] = None
+    turnover: Optional[float] = None
+    total_return: Optional[float] = Field(None, serialization_alias="totalReturn")
+    total_trades: Optional[int] = Field(None, serialization_alias="totalTrades")
+    final_capital: Optional[float] = Field(None, serialization_alias="finalCapital")
+    elapsed_seconds: Optional[float] = Field(None, serialization_alias="elapsedSeconds")
+    error: Optional[str] = None
+
+
+class BacktestSweepResponse(BaseModel):
+    """파라미터 스윕 응답"""
+    sweep_id: str = Field(..., serialization_alias="sweepId")
+    load_seconds: float = Field(..., serialization_alias="loadSeconds")
+    simulate_seconds: float = Field(..., serialization_alias="simulateSeconds")
+    variants: List[BacktestSweepVariant]
+
+
+class BacktestSweepKeepRequest(BaseModel):
+    """저장할 스윕 변형"""
+    variant_ids: List[int] = Field(..., min_length=1, max_length=3)
+
+
+def _sweep_grid_params(grid: SweepGrid) -> Dict[str, List[Any]]:
+    """SweepGrid → expand_sweep_grid 입력 (조건 임계값은 "threshold:{조건 이름}" 키)"""
+    params: Dict[str, List[Any]] = {
+        "max_holdings": grid.max_holdings,
+        "is_day_or_month": grid.is_day_or_month,
+        "target_gain": grid.target_gain,
+        "stop_loss": grid.stop_loss,
+    }
+    for name, values in grid.thresholds.items():
+        params[f"threshold:{name}"] = values
+    return params
+
+
+def _apply_sweep_variant(request: BacktestRequest, variant: Dict[str, Any]) -> BacktestRequest:
+    """기본 요청에 변형 파라미터 적용 (keep 시 그대로 /backtest/run 경로로 실행)"""
+    request = request.model_copy(deep=True)
+    if "max_holdings" in variant:
+        request.max_holdings = variant["max_holdings"]
+    if "is_day_or_month" in variant:
+        request.is_day_or_month = variant["is_day_or_month"]
+    if "target_gain" in variant or "stop_loss" in variant:
+        target_and_loss = request.target_and_loss or TargetAndLoss()
+        if "target_gain" in variant:
+            target_and_loss.target_gain = variant["target_gain"]
+        if "stop_loss" in variant:
+            target_and_loss.stop_loss = variant["stop_loss"]
+        request.target_and_loss = target_and_loss
+
+    for key, value in variant.items():
+        if not key.startswith("threshold:"):
+            continue
+        name = key.split(":", 1)[1]
+        condition = next((c for c in request.buy_conditions if c.name == name), None)
+        if condition is None:
+            raise ValueError(f"매수 조건 '{name}'이 없습니다")
+        condition.exp_right_side = value
+    return request
+
+
+def _engine_params(request: BacktestRequest, loaded_strategy_config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """BacktestRequest → BacktestEngine.run_backtest 인자 (/backtest/run 백그라운드 실행과 동일한 변환)"""
+    from app.services.advanced_backtest import build_engine_conditions
+
+    target_themes, target_stocks, target_universes = _resolve_trade_targets(request.trade_targets)
+    condition_sell = request.condition_sell.model_dump() if request.condition_sell else None
+    buy_conditions, sell_conditions = build_engine_conditions(
+        copy.deepcopy(loaded_strategy_config) or [c.model_dump() for c in request.buy_conditions],
+        request.buy_logic,
+        request.priority_factor,
+        request.priority_order,
+        condition_sell
+    )
+    return {
+        "buy_conditions": buy_conditions,
+        "sell_conditions": sell_conditions,
+        "start_date": datetime.strptime(request.start_date, "%Y%m%d").date(),
+        "end_date": datetime.strptime(request.end_date, "%Y%m%d").date(),
+        "condition_sell": condition_sell,
+        "target_and_loss": request.target_and_loss.model_dump() if request.target_and_loss else None,
+        "hold_days": request.hold_days.model_dump() if request.hold_days else None,
+        "initial_capital": Decimal(str(request.initial_investment * 10000)),
+        "rebalance_frequency": request.is_day_or_month.upper(),
+        "max_positions": request.max_holdings,
+        "position_sizing": "EQUAL_WEIGHT",
+        "benchmark": "KOSPI",
+        "commission_rate": request.commission_rate / 100,  # % -> decimal
+        "slippage": request.slippage / 100,  # % -> decimal
+        "target_themes": target_themes,
+        "target_stocks": target_stocks,
+        "target_universes": target_universes,
+        "per_stock_ratio": request.per_stock_ratio,
+        "max_buy_value": Decimal(str(request.max_buy_value)) * Decimal("10000") if request.max_buy_value is not None else None,
+        "max_daily_stock": request.max_daily_stock,
+    }
+
+
+async def _run_headless_backtest(request: BacktestRequest, db: AsyncSession) -> BacktestHeadlessResponse:
+    """headless 백테스트 (세션/전략 행 생성 없음)"""
+    from app.services.backtest import BacktestEngine
+
+    loaded_strategy_config = await _load_strategy_config(db, request)
+    params = _engine_params(request, loaded_strategy_config)
+    try:
+        result = await BacktestEngine(db, headless=True).run_headless(**params)
+    except Exception as e:
+        logger.error(f"headless 백테스트 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    return BacktestHeadlessResponse(**result)
+
+
+@router.post("/backtest/sweep", response_model=BacktestSweepResponse)
+async def run_backtest_sweep(
+    request: BacktestSweepRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    파라미터 스윕 실행
+    - 데이터 로드/팩터 계산 1회 후 조합별 시뮬레이션을 워커 프로세스에서 병렬 실행
+    - 결과는 저장하지 않고 비교표만 반환 (저장은 /backtest/sweep/{sweep_id}/keep)
+    """
+    from app.services.backtest_sweep import BacktestSweepService, expand_sweep_grid
+
+    try:
+        variants = expand_sweep_grid(_sweep_grid_params(request.grid))
+        variant_requests = [_apply_sweep_variant(request.base, variant) for variant in variants]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    loaded_strategy_config = await _load_strategy_config(db, request.base)
+    if loaded_strategy_config and request.grid.thresholds:
+        raise HTTPException(
+            status_code=400,
+            detail="DB에 등록된 전략은 조건 임계값 스윕을 지원하지 않습니다. 보유 종목 수/리밸런싱/목표가·손절가만 변경할 수 있습니다."
+        )
+
+    await _acquire_backtest_slot(current_user.user_id)
+    try:
+        service = BacktestSweepService(db)
+        result = await service.run([_engine_params(r, loaded_strategy_config) for r in variant_requests])
+    except Exception as e:
+        logger.error(f"파라미터 스윕 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        await _release_backtest_slot(current_user.user_id)
+
+    sweep_id = str(uuid.uuid4())
+    saved = await BacktestSweepService.save_sweep(sweep_id, {
+        "user_id": str(current_user.user_id),
+        "base": request.base.model_dump(),
+        "variants": variants,
+    })
+    if not saved:
+        logger.warning(f"⚠️ 스윕 정의 저장 실패 (keep 불가): {sweep_id}")
+
+    return BacktestSweepResponse(
+        sweep_id=sweep_id,
+        load_seconds=result["load_seconds"],
+        simulate_seconds=result["simulate_seconds"],
+        variants=[
+            BacktestSweepVariant(**row, params=variants[row["variant_id"]])
+            for row in result["variants"]
+        ]
+    )
+
+
+@router.post("/backtest/sweep/{sweep_id}/keep", response_model=List[BacktestResponse])
+async def keep_backtest_sweep_variants(
+    sweep_id: str,
+    request: BacktestSweepKeepRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """선택한 스윕 변형만 일반 백테스트로 실행/저장 (최대 3개, 동시 실행 제한 동일 적용)"""
+    from app.services.backtest_sweep import BacktestSweepService
+
+    sweep = await BacktestSweepService.load_sweep(sweep_id)
+    if not sweep or sweep.get("user_id") != str(current_user.user_id):
+        raise HTTPException(status_code=404, detail="스윕 결과를 찾을 수 없습니다 (만료되었거나 권한 없음)")
+
+    variants = sweep["variants"]
+    invalid = [variant_id for variant_id in request.variant_ids if not 0 <= variant_id < len(variants)]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"존재하지 않는 변형: {invalid}")
+
+    base = BacktestRequest(**sweep["base"])
+    variant_ids = list(dict.fromkeys(request.variant_ids))
+
+    # 일부만 시작되고 429로 끊기지 않도록 전체 실행 수만큼 슬롯을 먼저 확보
+    await _acquire_backtest_slot(current_user.user_id, count=len(variant_ids))
+    responses = []
+    for index, variant_id in enumerate(variant_ids):
+        variant_request = _apply_sweep_variant(base, variants[variant_id])
+        variant_request.headless = False
+        try:
+            responses.append(await _start_backtest(variant_request, current_user, db))
+        except Exception:
+            # 시작하지 못한 나머지 변형 몫의 슬롯 반환
+            await _release_backtest_slot(current_user.user_id, count=len(variant_ids) - index - 1)
+            raise
+    return responses
+
+
+class BacktestWalkForwardRequest(BaseModel):
+    """워크포워드(롤링/확장 윈도우) 평가 요청"""
+    base: BacktestRequest
+    window_months: int = Field(12, ge=1)
+    step_months: int = Field(3, ge=1)
+    mode: str = "rolling"  # "rolling" or "expanding"
+
+
+@router.post("/backtest/walk-forward")
+async def run_backtest_walk_forward(
+    request: BacktestWalkForwardRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    워크포워드 평가
+    - 전체 기간 팩터 패널 1회 계산 후 윈도우별 시뮬레이션을 워커 프로세스에서 병렬 실행
+    - 윈도우별 CAGR/MDD/Sharpe/회전율과 안정성 지표 반환 (DB 저장 없음)
+    """
+    from app.services.backtest import BacktestEngine
+
+    loaded_strategy_config = await _load_strategy_config(db, request.base)
+    params = _engine_params(request.base, loaded_strategy_config)
+
+    await _acquire_backtest_slot(current_user.user_id)
+    try:
+        return await BacktestEngine(db).run_walk_forward(
+            window_months=request.window_months,
+            step_months=request.step_months,
+            mode=request.mode,
+            **params
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"워크포워드 평가 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        await _release_backtest_slot(current_user.user_id)
+
+
+@router.get("/backtest/trace-metrics")
+async def get_backtest_trace_metrics(
+    current_user: User = Depends(get_current_user)
+):
+    """이 서버 프로세스에서 완료된 백테스트의 단계 경로별 지연 (count/avg/p50/p95/max)"""
+    from app.services.backtest_tracing import get_trace_metrics
+    return get_trace_metrics().snapshot()
+
+
+@router.get("/backtest/{backtest_id}/trace")
+async def get_backtest_trace(
+    backtest_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    백테스트 단계별 트레이스 조회
+
+    단계/하위 단계 span 트리(소요 시간, 행 수/바이트, 반복 구간 집계)를 반환합니다.
+    본인이 실행한 백테스트만 조회할 수 있습니다.
+    """
+    result = await db.execute(
+        select(SimulationSession.user_id, SimulationSession.trace)
+        .where(SimulationSession.session_id == backtest_id)
+    )
+    row = result.one_or_none()
+
+    if not row:
+        raise HTTPException(status_code=404, detail="백테스트를 찾을 수 없습니다")
+
+    if str(row.user_id) != str(current_user.user_id):
+        raise HTTPException(status_code=403, detail="본인의 백테스트만 조회할 수 있습니다")
+
+    if row.trace is None:
+        raise HTTPException(status_code=404, detail="트레이스가 없습니다 (실행 중이거나 이전 버전 세션)")
+
+    return {"backtest_id": backtest_id, "trace": row.trace}
+
+
 @router.get("/backtest/{backtest_id}/status", response_model=BacktestStatusResponse)
 async def get_backtest_status(
     backtest_id: str,
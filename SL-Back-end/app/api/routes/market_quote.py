@@ -40,6 +40,7 @@ async def get_market_quotes(
     page_size: int = Query(50, ge=1, le=100, description="페이지 크기"),
     user_id: Optional[UUID] = Query(None, description="사용자 ID (관심종목 판단용)"),
     search: Optional[str] = Query(None, description="검색어 (종목명 또는 종목코드)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -52,6 +53,7 @@ async def get_market_quotes(
         page_size: 페이지 크기 (1-100)
         user_id: 사용자 ID (선택, 관심종목 판단용)
         search: 검색어 (종목명 또는 종목코드, 부분 일치)
+        cursor: keyset 페이지네이션 커서 (지정 시 page 대신 사용)
         db: 데이터베이스 세션
 
     Returns:
@@ -61,6 +63,7 @@ async def get_market_quotes(
         GET /api/v1/market/quotes?sort_by=volume&sort_order=desc&page=1&page_size=50&user_id=...
         GET /api/v1/market/quotes?search=삼성전자
         GET /api/v1/market/quotes?search=005930
+        GET /api/v1/market/quotes?sort_by=volume&sort_order=desc&cursor=<nextCursor>
     """
     try:
         service = MarketQuoteService(db)
@@ -70,7 +73,8 @@ async def get_market_quotes(
             page=page,
             page_size=page_size,
             user_id=user_id,
-            search=search
+            search=search,
+            cursor=cursor
         )
 
         return MarketQuoteListResponse(
@@ -78,9 +82,12 @@ async def get_market_quotes(
             total=data["total"],
             page=data["page"],
             page_size=data["page_size"],
-            has_next=data["has_next"]
+            has_next=data["has_next"],
+            next_cursor=data["next_cursor"]
         )
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"시세 조회 실패: {e}", exc_info=True)
         raise HTTPException(
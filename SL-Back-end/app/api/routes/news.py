@@ -14,6 +14,7 @@ from app.core.database import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.news_repository import NewsRepository, _load_theme_mappings
 from app.models.news import ThemeSentiment
+from app.services.news_sentiment import NewsSentimentService
 from loguru import logger
 
 router = APIRouter(prefix="/news", tags=["news"])
@@ -45,6 +46,18 @@ class NewsListResponse(BaseModel):
     news: List[NewsArticleSchema] = Field(..., description="News list")
 
 
+class NewsSearchItemSchema(NewsArticleSchema):
+    """랭킹 검색 결과 항목"""
+    score: float = Field(..., description="Relevance score")
+    snippet: str = Field(..., description="Keyword context snippet")
+
+
+class NewsSearchResponse(BaseModel):
+    """랭킹 검색 응답 (커서 페이지네이션)"""
+    news: List[NewsSearchItemSchema] = Field(..., description="Ranked news list")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page")
+
+
 # === API Endpoints (DB-backed only, no crawling) ===
 
 @router.get(
@@ -67,6 +80,23 @@ async def get_stock_news(
         raise HTTPException(status_code=500, detail="Failed to fetch news from DB")
 
 
+@router.get(
+    "/db/stock/{stock_code}/sentiment-trend",
+    summary="종목 뉴스 감성 추세 (일간 롤업 기반)"
+)
+async def get_stock_sentiment_trend(
+    stock_code: str,
+    latest: int = Query(5, ge=0, le=20, description="함께 반환할 최신 기사 수"),
+    db: AsyncSession = Depends(get_db),
+):
+    """news_sentiment_daily 롤업으로 7일/30일 추세와 감성 급변 여부 반환."""
+    try:
+        return await NewsSentimentService(db).get_stock_sentiment_trend(stock_code, latest)
+    except Exception as e:
+        logger.error(f"Sentiment trend fetch failed for {stock_code}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch sentiment trend from DB")
+
+
 @router.get(
     "/db/search",
     response_model=NewsListResponse,
@@ -87,6 +117,28 @@ async def search_news(
         raise HTTPException(status_code=500, detail="Failed to search news from DB")
 
 
+@router.get(
+    "/db/search/ranked",
+    response_model=NewsSearchResponse,
+    summary="DB에서 키워드 뉴스 랭킹 검색 (커서 페이지네이션)"
+)
+async def search_news_ranked(
+    keyword: str = Query(..., min_length=1, description="Search keyword"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_db),
+):
+    """트라이그램 인덱스 기반 관련도순 검색. 스니펫 포함."""
+    try:
+        result = await NewsRepository.search_news_ranked(db, keyword, limit, cursor)
+        return NewsSearchResponse(**result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"DB news ranked search failed for '{keyword}': {e}")
+        raise HTTPException(status_code=500, detail="Failed to search news from DB")
+
+
 @router.get(
     "/db/theme",
     response_model=NewsListResponse,
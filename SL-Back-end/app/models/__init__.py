@@ -4,12 +4,13 @@ ERD_GUIDE.md 기반으로 구성된 테이블 모델
 """
 from app.models.company import Company
 from app.models.stock_price import StockPrice
+from app.models.latest_quote import LatestQuote
 from app.models.disclosure import Disclosure
 from app.models.financial_statement import FinancialStatement
 from app.models.balance_sheet import BalanceSheet
 from app.models.income_statement import IncomeStatement
 from app.models.cashflow_statement import CashflowStatement
-from app.models.news import NewsArticle, ThemeSentiment
+from app.models.news import NewsArticle, ThemeSentiment, NewsSentimentDaily
 from app.models.theme import Theme
 from app.models.user import User
 from app.models.auto_trading import (
@@ -59,6 +60,7 @@ __all__ = [
     # 기본 데이터 모델
     "Company",
     "StockPrice",
+    "LatestQuote",
     "Disclosure",
     "FinancialStatement",
     "BalanceSheet",
@@ -67,6 +69,7 @@ __all__ = [
     # 뉴스 모델
     "NewsArticle",
     "ThemeSentiment",
+    "NewsSentimentDaily",
     "Theme",
     # 사용자 모델
     "User",
@@ -0,0 +1,56 @@
+"""
+최신 시세 스냅샷 테이블 모델
+"""
+from sqlalchemy import Column, Integer, BigInteger, Float, String, Date, TIMESTAMP, ForeignKey, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class LatestQuote(Base):
+    """
+    최신 시세 스냅샷 테이블 (종목당 1행)
+    - 시세 화면 전용 materialized 테이블
+    - 시세 적재 후 MarketQuoteService.refresh_latest_quotes()로 갱신
+    - 전일 종가/등락 금액/등락률을 미리 계산해 저장
+    - 정렬 컬럼별 (컬럼, company_id) 인덱스로 keyset 페이지네이션 지원
+    """
+    __tablename__ = "latest_quotes"
+
+    # Primary Key
+    company_id = Column(
+        Integer,
+        ForeignKey("companies.company_id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="기업 참조 ID"
+    )
+
+    # 종목 정보 (조인 없이 조회하기 위해 중복 저장)
+    stock_code = Column(String(6), nullable=False, unique=True, comment="종목코드")
+    stock_name = Column(String(100), nullable=False, comment="종목 약칭")
+    industry = Column(String(100), nullable=True, comment="업종")
+
+    # 시세 정보 (최신 거래일 기준)
+    trade_date = Column(Date, nullable=False, comment="거래일자")
+    close_price = Column(Integer, nullable=False, server_default="0", comment="종가 (원)")
+    prev_close_price = Column(Integer, nullable=True, comment="전일 종가 (원)")
+    change_amount = Column(Integer, nullable=False, server_default="0", comment="전일 대비 (원)")
+    change_rate = Column(Float, nullable=False, server_default="0", comment="등락률 (%)")
+    volume = Column(BigInteger, nullable=False, server_default="0", comment="거래량 (주)")
+    trading_value = Column(BigInteger, nullable=False, server_default="0", comment="거래대금 (원)")
+    market_cap = Column(BigInteger, nullable=False, server_default="0", comment="시가총액 (원, 미상 시 0)")
+
+    # Timestamp
+    refreshed_at = Column(TIMESTAMP, server_default=func.now(), nullable=False, comment="갱신일시")
+
+    # Indexes (정렬 컬럼별 keyset 인덱스, 트라이그램 인덱스는 migrations/create_latest_quotes.sql)
+    __table_args__ = (
+        Index('idx_latest_quotes_market_cap', 'market_cap', 'company_id'),
+        Index('idx_latest_quotes_volume', 'volume', 'company_id'),
+        Index('idx_latest_quotes_change_rate', 'change_rate', 'company_id'),
+        Index('idx_latest_quotes_trading_value', 'trading_value', 'company_id'),
+        Index('idx_latest_quotes_stock_name', 'stock_name', 'company_id'),
+        {"comment": "최신 시세 스냅샷 테이블 - 시세 화면 전용"}
+    )
+
+    def __repr__(self):
+        return f"<LatestQuote(stock_code={self.stock_code}, date={self.trade_date}, close={self.close_price})>"
@@ -2,8 +2,9 @@
 뉴스 관련 데이터베이스 모델 (DB 조회 전용)
 - 뉴스 기사 저장/조회
 - 테마별 감성 분석 결과 (읽기 전용)
+- 종목별 일간 감성 롤업 (news 트리거로 갱신)
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Date, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Date, JSON, PrimaryKeyConstraint
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -88,3 +89,30 @@ class ThemeSentiment(Base):
 
     def __repr__(self):
         return f"<ThemeSentiment(theme={self.theme}, score={self.avg_sentiment_score})>"
+
+
+class NewsSentimentDaily(Base):
+    """
+    종목별 일간 뉴스 감성 롤업 (읽기 전용)
+    - migrations/create_news_sentiment_daily.sql의 news 트리거로 증분 갱신
+    - 점수: positive=+1, negative=-1, neutral=0 의 합
+    """
+    __tablename__ = "news_sentiment_daily"
+    __table_args__ = (
+        PrimaryKeyConstraint("stock_code", "date"),
+    )
+
+    stock_code = Column(String(20), nullable=False, comment="종목 코드")
+    date = Column(Date, nullable=False, comment="기사 발행일")
+
+    # Counts
+    article_count = Column(Integer, nullable=False, default=0, comment="기사 수")
+    positive_count = Column(Integer, nullable=False, default=0, comment="긍정 기사 수")
+    negative_count = Column(Integer, nullable=False, default=0, comment="부정 기사 수")
+    neutral_count = Column(Integer, nullable=False, default=0, comment="중립 기사 수")
+    score_sum = Column(Integer, nullable=False, default=0, comment="감성 점수 합")
+
+    updated_at = Column(DateTime, server_default=func.now(), nullable=False, comment="갱신 일시")
+
+    def __repr__(self):
+        return f"<NewsSentimentDaily(stock_code={self.stock_code}, date={self.date}, count={self.article_count})>"
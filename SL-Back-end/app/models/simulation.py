@@ -258,6 +258,9 @@ class SimulationSession(Base):
     # 메타데이터
     started_at = Column(TIMESTAMP, nullable=True, comment="실행 시작 시간")
     completed_at = Column(TIMESTAMP, nullable=True, comment="실행 완료 시간")
+    trace = Column(JSON, nullable=True, comment="단계별 실행 트레이스 (span 트리)")
+    checkpoint = Column(JSON, nullable=True, comment="완료 시점 시뮬레이션 상태 (종료일 연장 재실행용)")
+    checkpoint_key = Column(String(64), nullable=True, index=True, comment="체크포인트 설정 키 (종료일 제외 설정 해시)")
     created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False, comment="생성일시")
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False, comment="수정일시")
 
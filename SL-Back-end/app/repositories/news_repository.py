@@ -2,13 +2,15 @@
 뉴스 Repository - DB 조회 전용
 
 """
-from typing import List, Dict, Optional, Tuple
-from sqlalchemy import select, func, and_, or_, text
+from typing import List, Dict, Optional, Tuple, Any
+from sqlalchemy import select, func, and_, or_, text, case, literal, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.news import NewsArticle, ThemeSentiment
 from app.repositories.theme_repository import ThemeRepository
 from loguru import logger
+import base64
 import html
+import json
 from datetime import datetime
 from pytz import UTC, timezone
 
@@ -151,6 +153,10 @@ STOCK_CODE_MAPPING = {
 }
 
 
+# 검색 결과 스니펫 길이 (키워드 앞뒤 문자 수)
+SNIPPET_CONTEXT_CHARS = 60
+
+
 class NewsRepository:
     """뉴스 DB 조회 레포지토리"""
 
@@ -243,6 +249,104 @@ class NewsRepository:
             logger.error(f"Failed to search news for '{keyword}': {e}")
             return []
 
+    @staticmethod
+    async def search_news_ranked(
+        db: AsyncSession,
+        keyword: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        키워드 뉴스 랭킹 검색 (트라이그램 인덱스 + 커서 페이지네이션)
+
+        migrations/add_news_search_indexes.sql의 pg_trgm GIN 인덱스를 사용한다.
+        점수: 종목코드/회사명 일치(3) + 제목 포함(2) + 제목 단어 유사도(0~1) + 본문 포함(0.5)
+
+        Args:
+            db: 데이터베이스 세션
+            keyword: 검색 키워드 (회사명, 종목코드, 제목, 내용)
+            limit: 페이지 크기
+            cursor: 이전 응답의 next_cursor
+
+        Returns:
+            {"news": [...], "next_cursor": str | None}
+            각 뉴스에 score, snippet 필드 추가
+        """
+        keyword = keyword.strip()
+        if not keyword:
+            return {"news": [], "next_cursor": None}
+
+        try:
+            theme_mapping, _ = await _load_theme_mappings(db)
+            pattern = f"%{keyword}%"
+
+            score = (
+                case(
+                    (or_(NewsArticle.stock_code == keyword, NewsArticle.company_name == keyword), 3.0),
+                    else_=0.0
+                )
+                + case((NewsArticle.title.ilike(pattern), 2.0), else_=0.0)
+                + func.word_similarity(literal(keyword), func.coalesce(NewsArticle.title, ""))
+                + case((NewsArticle.content.ilike(pattern), 0.5), else_=0.0)
+            ).label("score")
+
+            ranked = (
+                select(NewsArticle.id.label("news_id"), score)
+                .where(
+                    or_(
+                        NewsArticle.title.ilike(pattern),
+                        NewsArticle.content.ilike(pattern),
+                        NewsArticle.company_name.ilike(pattern),
+                        NewsArticle.stock_code == keyword
+                    )
+                )
+                .subquery()
+            )
+
+            page_query = select(ranked.c.news_id, ranked.c.score)
+            if cursor:
+                last_score, last_id = _decode_search_cursor(cursor)
+                page_query = page_query.where(
+                    tuple_(ranked.c.score, ranked.c.news_id) < (last_score, last_id)
+                )
+            page_query = page_query.order_by(
+                ranked.c.score.desc(),
+                ranked.c.news_id.desc()
+            ).limit(limit + 1)
+
+            page_rows = (await db.execute(page_query)).all()
+            has_next = len(page_rows) > limit
+            page_rows = page_rows[:limit]
+            if not page_rows:
+                return {"news": [], "next_cursor": None}
+
+            # 본문은 현재 페이지 기사만 로드
+            ids = [row.news_id for row in page_rows]
+            articles_result = await db.execute(select(NewsArticle).where(NewsArticle.id.in_(ids)))
+            articles = {article.id: article for article in articles_result.scalars().all()}
+
+            news = []
+            for row in page_rows:
+                article = articles.get(row.news_id)
+                if not article:
+                    continue
+                item = _serialize_news(article, theme_mapping)
+                item["score"] = round(float(row.score), 4)
+                item["snippet"] = _extract_snippet(item["content"] or item["title"], keyword)
+                news.append(item)
+
+            next_cursor = None
+            if has_next:
+                last = page_rows[-1]
+                next_cursor = _encode_search_cursor(float(last.score), last.news_id)
+
+            return {"news": news, "next_cursor": next_cursor}
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to ranked-search news for '{keyword}': {e}")
+            return {"news": [], "next_cursor": None}
+
     @staticmethod
     async def search_news_by_theme(
         db: AsyncSession,
@@ -431,6 +535,37 @@ class NewsRepository:
           return []
 
 
+def _encode_search_cursor(score: float, news_id: int) -> str:
+    """랭킹 검색 커서 생성 (마지막 행의 점수, ID)"""
+    return base64.urlsafe_b64encode(json.dumps([score, news_id]).encode()).decode()
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    """랭킹 검색 커서 해석"""
+    try:
+        score, news_id = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        return float(score), int(news_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {e}")
+
+
+def _extract_snippet(text_value: str, keyword: str, context_chars: int = SNIPPET_CONTEXT_CHARS) -> str:
+    """키워드 주변 문맥 스니펫 추출 (키워드가 없으면 앞부분)"""
+    if not text_value:
+        return ""
+
+    position = text_value.lower().find(keyword.lower())
+    if position < 0:
+        snippet = text_value[:context_chars * 2]
+        return snippet + ("…" if len(text_value) > len(snippet) else "")
+
+    start = max(0, position - context_chars)
+    end = min(len(text_value), position + len(keyword) + context_chars)
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text_value) else ""
+    return f"{prefix}{text_value[start:end].strip()}{suffix}"
+
+
 def _serialize_news(article: NewsArticle, theme_mapping: Optional[Dict[str, str]] = None) -> Dict:
     """뉴스 기사를 직렬화 - 프론트 스키마에 맞게"""
     # 날짜 선택 (우선순위: analyzed_at(분석 완료 시간) > crawled_at > news_date)
@@ -51,3 +51,4 @@ class MarketQuoteListResponse(BaseModel):
     page: int = Field(..., description="현재 페이지")
     page_size: int = Field(..., serialization_alias="pageSize", description="페이지 크기")
     has_next: bool = Field(..., serialization_alias="hasNext", description="다음 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(None, serialization_alias="nextCursor", description="다음 페이지 커서 (keyset 페이지네이션)")
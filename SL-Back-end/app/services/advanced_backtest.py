@@ -6,9 +6,10 @@
 
 import asyncio
 import logging
+import re
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -108,6 +109,99 @@ def run_advanced_backtest(
         loop.close()
 
 
+def _extract_factor(expr: str) -> Optional[str]:
+    """
+    팩터 이름 추출 (중괄호 유무 무관)
+    - "{roe}" → "ROE" (포트폴리오 페이지 형식)
+    - "roe" → "ROE" (DB 저장 형식, AI 어시스턴트 형식)
+    """
+    if not expr:
+        return None
+    # 중괄호가 있으면 추출
+    match = re.search(r'\{([^}]+)\}', expr)
+    if match:
+        return match.group(1).strip().upper()
+    # 중괄호가 없으면 그대로 사용
+    return expr.strip().upper()
+
+
+def build_engine_conditions(
+    buy_conditions: Union[List[dict], dict],
+    buy_logic: str,
+    priority_factor: Optional[str],
+    priority_order: Optional[str],
+    condition_sell: Optional[dict]
+) -> Tuple[Union[List[dict], dict], List[dict]]:
+    """
+    API 매수/매도 조건 → BacktestEngine 입력 형식 변환
+
+    Returns:
+        (매수 조건 - 벡터화 형식 expression + conditions, 매도 팩터 조건 리스트)
+    """
+    # 🚀 벡터화 평가 지원: buy_conditions가 이미 딕셔너리 형식인 경우 그대로 사용
+    buy_condition_payload: Optional[dict] = None
+    parsed_conditions: List[dict] = []
+
+    if isinstance(buy_conditions, dict) and 'expression' in buy_conditions and 'conditions' in buy_conditions:
+        # 이미 벡터화 형식 (expression + conditions)
+        logger.info("✅ 벡터화 형식의 buy_conditions 감지")
+        buy_condition_payload = buy_conditions
+        # 우선순위 팩터가 없으면 파라미터에서 가져옴
+        if 'priority_factor' not in buy_condition_payload:
+            buy_condition_payload['priority_factor'] = _extract_factor(priority_factor)
+        if 'priority_order' not in buy_condition_payload:
+            buy_condition_payload['priority_order'] = priority_order or "desc"
+    else:
+        # 레거시 형식 (리스트) → 파싱하여 벡터화 형식으로 변환
+        logger.info("📋 레거시 형식의 buy_conditions 감지 - 벡터화 형식으로 변환")
+        if buy_conditions:
+            for cond in buy_conditions:
+                factor_code = _extract_factor(cond.get('exp_left_side'))
+                if not factor_code:
+                    continue
+                parsed_conditions.append({
+                    "id": cond.get('name') or factor_code,
+                    "factor": factor_code,
+                    "operator": cond.get('inequality', '>'),
+                    "value": cond.get('exp_right_side'),
+                    "description": cond.get('exp_left_side')
+                })
+
+        # 논리식 생성: buy_logic에 따라 조건 ID들을 연결
+        expression_text = ""
+        if parsed_conditions:
+            if buy_logic and buy_logic.upper() == "OR":
+                expression_text = " or ".join([c["id"] for c in parsed_conditions])
+            else:
+                # 기본값은 AND
+                expression_text = " and ".join([c["id"] for c in parsed_conditions])
+
+        if parsed_conditions and expression_text:
+            buy_condition_payload = {
+                "expression": expression_text,
+                "conditions": parsed_conditions,
+                "priority_factor": _extract_factor(priority_factor),
+                "priority_order": priority_order or "desc"
+            }
+
+    # 기능상 SELL condition 리스트는 STOP/TAKE/HOLD 로직에 의해 관리하므로
+    # condition_sell 의 factor 조건만 전달 (없으면 빈 리스트)
+    parsed_sell_conditions = []
+    if condition_sell:
+        for sell_cond in condition_sell.get('sell_conditions', []):
+            factor_code = _extract_factor(sell_cond.get('exp_left_side', ''))
+            if not factor_code:
+                continue
+            parsed_sell_conditions.append({
+                "factor": factor_code,
+                "operator": sell_cond.get('inequality', '>'),
+                "value": sell_cond.get('exp_right_side', 0),
+                "description": sell_cond.get('exp_left_side')
+            })
+
+    return buy_condition_payload or parsed_conditions, parsed_sell_conditions
+
+
 async def _run_backtest_async(
     session_id: str,
     strategy_id: str,
@@ -190,87 +284,9 @@ async def _run_backtest_async(
             # 최적화는 BacktestEngine 내부에 통합되어 있음
             logger.info("✅ BacktestEngine 초기화 완료 (최적화 내장)")
 
-            import re
-
-            def _extract_factor(expr: str) -> Optional[str]:
-                """
-                팩터 이름 추출 (중괄호 유무 무관)
-                - "{roe}" → "ROE" (포트폴리오 페이지 형식)
-                - "roe" → "ROE" (DB 저장 형식, AI 어시스턴트 형식)
-                """
-                if not expr:
-                    return None
-                # 중괄호가 있으면 추출
-                match = re.search(r'\{([^}]+)\}', expr)
-                if match:
-                    return match.group(1).strip().upper()
-                # 중괄호가 없으면 그대로 사용
-                return expr.strip().upper()
-
-            # 🚀 벡터화 평가 지원: buy_conditions가 이미 딕셔너리 형식인 경우 그대로 사용
-            buy_condition_payload: Optional[dict] = None
-
-            if isinstance(buy_conditions, dict) and 'expression' in buy_conditions and 'conditions' in buy_conditions:
-                # 이미 벡터화 형식 (expression + conditions)
-                logger.info("✅ 벡터화 형식의 buy_conditions 감지")
-                buy_condition_payload = buy_conditions
-                # 우선순위 팩터가 없으면 파라미터에서 가져옴
-                if 'priority_factor' not in buy_condition_payload:
-                    normalized_priority_factor = _extract_factor(priority_factor)
-                    buy_condition_payload['priority_factor'] = normalized_priority_factor
-                if 'priority_order' not in buy_condition_payload:
-                    buy_condition_payload['priority_order'] = priority_order or "desc"
-            else:
-                # 레거시 형식 (리스트) → 파싱하여 벡터화 형식으로 변환
-                logger.info("📋 레거시 형식의 buy_conditions 감지 - 벡터화 형식으로 변환")
-                parsed_conditions = []
-                if buy_conditions:
-                    for cond in buy_conditions:
-                        factor_code = _extract_factor(cond.get('exp_left_side'))
-                        if not factor_code:
-                            continue
-                        parsed_conditions.append({
-                            "id": cond.get('name') or factor_code,
-                            "factor": factor_code,
-                            "operator": cond.get('inequality', '>'),
-                            "value": cond.get('exp_right_side'),
-                            "description": cond.get('exp_left_side')
-                        })
-
-                # 논리식 생성: buy_logic에 따라 조건 ID들을 연결
-                expression_text = ""
-                if parsed_conditions:
-                    if buy_logic and buy_logic.upper() == "OR":
-                        expression_text = " or ".join([c["id"] for c in parsed_conditions])
-                    else:
-                        # 기본값은 AND
-                        expression_text = " and ".join([c["id"] for c in parsed_conditions])
-
-                # 우선순위 팩터 정규화
-                normalized_priority_factor = _extract_factor(priority_factor)
-
-                if parsed_conditions and expression_text:
-                    buy_condition_payload = {
-                        "expression": expression_text,
-                        "conditions": parsed_conditions,
-                        "priority_factor": normalized_priority_factor,
-                        "priority_order": priority_order or "desc"
-                    }
-
-            # 기능상 SELL condition 리스트는 STOP/TAKE/HOLD 로직에 의해 관리하므로
-            # condition_sell 의 factor 조건만 전달 (없으면 빈 리스트)
-            parsed_sell_conditions = []
-            if condition_sell:
-                for sell_cond in condition_sell.get('sell_conditions', []):
-                    factor_code = _extract_factor(sell_cond.get('exp_left_side', ''))
-                    if not factor_code:
-                        continue
-                    parsed_sell_conditions.append({
-                        "factor": factor_code,
-                        "operator": sell_cond.get('inequality', '>'),
-                        "value": sell_cond.get('exp_right_side', 0),
-                        "description": sell_cond.get('exp_left_side')
-                    })
+            buy_condition_payload, parsed_sell_conditions = build_engine_conditions(
+                buy_conditions, buy_logic, priority_factor, priority_order, condition_sell
+            )
 
             max_buy_value_won: Optional[Decimal] = None
             if max_buy_value is not None:
@@ -279,7 +295,7 @@ async def _run_backtest_async(
             # 백테스트 실행
             result = await engine.run_backtest(
                 backtest_id=UUID(session_id),
-                buy_conditions=buy_condition_payload or parsed_conditions,
+                buy_conditions=buy_condition_payload,
                 sell_conditions=parsed_sell_conditions,
                 start_date=start_date,
                 end_date=end_date,
@@ -55,6 +55,10 @@ from app.services.condition_evaluator_vectorized import vectorized_evaluator
 from app.core.cache import cache
 from app.services import backtest_config as config  # Phase 0 최적화 설정
 from app.services.performance_monitor import PerformanceMonitor  # 성능 모니터링
+from app.services.backtest_tracing import BacktestTracer, frame_stats, get_trace_metrics
+from app.services import backtest_checkpoint as checkpoints
+from app.services import backtest_compact as compact
+from app.services import backtest_stats_kernel as stats_kernel
 
 logger = logging.getLogger(__name__)
 
@@ -222,10 +226,14 @@ def calculate_portfolio_value_numba(
 class BacktestEngine:
     """백테스트 엔진"""
 
-    def __init__(self, db: AsyncSession, random_seed: int = 42):
+    def __init__(self, db: AsyncSession, random_seed: int = 42, headless: bool = False):
         self.db = db
         self.tax_rate = Decimal("0.0023")  # 0.23% 거래세 (고정)
 
+        # headless: 진행률 DB 업데이트/WebSocket/연출용 지연/결과 행 생성 없이 통계만 계산
+        # (스윕, 캐시 워밍, 랭킹 재계산, 챗봇 전략 미리보기용)
+        self.headless = headless
+
         # 랜덤 시드 고정 (결과 재현성 보장)
         self.random_seed = random_seed
         np.random.seed(random_seed)
@@ -236,6 +244,8 @@ class BacktestEngine:
 
         # 성능 모니터링
         self.perf_monitor = PerformanceMonitor() if config.ENABLE_PERFORMANCE_MONITORING else None
+        # 단계별 span 트레이스 (세션에 저장, 프로세스 지표로 집계)
+        self.tracer = BacktestTracer()
 
         # 추적용 컨테이너
         self.orders: List[Order] = []
@@ -249,6 +259,17 @@ class BacktestEngine:
         self.yearly_stats: List[Dict] = []
         self.drawdown_periods: List[DrawdownPeriod] = []
         self.factor_contributions: Dict[str, Dict] = {}
+        # daily_snapshots 배열 패널 (통계/월별/연도별/드로다운/차트 공용)
+        self._stats_panel: Optional[Tuple[List[Dict], stats_kernel.PerformancePanel]] = None
+        # 가격 로드 단계의 Polars 프레임 (pandas 결과와 짝, 팩터 단계까지 재사용)
+        self._price_frames: Optional[Tuple[pd.DataFrame, pl.DataFrame]] = None
+        # 압축 dtype 모드: 문자열 → 범주형, 팩터 float32, 순위 int32 (대규모 유니버스 메모리 절감)
+        self.compact_dtypes = config.COMPACT_DTYPES
+        # 종목 코드 ↔ 정수 id 테이블 (압축 모드에서 가격/팩터 프레임이 공유)
+        self.stock_index: Optional[compact.StockIndex] = None
+        # 완료 시점 시뮬레이션 상태 (같은 설정으로 종료일만 늘린 재실행이 이어서 실행, run_backtest에서만 생성)
+        self.checkpoint_key: Optional[str] = None
+        self.checkpoint: Optional[Dict[str, Any]] = None
 
         # 조건 평가기
         self.condition_evaluator = ConditionEvaluator()
@@ -260,6 +281,9 @@ class BacktestEngine:
         # 기업행동으로 매수 금지된 종목
         self.blocked_stocks: Set[str] = set()
 
+        # 시점별 유니버스 편입 인덱스 (유니버스 필터 사용 시)
+        self.universe_membership = None
+
         # 전략 제약 기본값
         self.initial_capital: Decimal = Decimal("0")
         self.per_stock_ratio: Optional[Decimal] = None
@@ -267,6 +291,15 @@ class BacktestEngine:
         self.max_daily_stock: Optional[int] = None
         self.condition_sell_meta: Optional[Dict[str, Any]] = None
 
+    @property
+    def skip_db_save(self) -> bool:
+        """headless의 이전 이름 (하위 호환)"""
+        return self.headless
+
+    @skip_db_save.setter
+    def skip_db_save(self, value: bool) -> None:
+        self.headless = value
+
     async def _load_benchmark_data(
         self,
         benchmark_code: str,
@@ -354,7 +387,8 @@ class BacktestEngine:
         target_universes: List[str] = None,  # 선택된 유니버스
         per_stock_ratio: Optional[float] = None,
         max_buy_value: Optional[Decimal] = None,
-        max_daily_stock: Optional[int] = None
+        max_daily_stock: Optional[int] = None,
+        resume: Optional[bool] = None
     ) -> BacktestResult:
         """
         백테스트 실행
@@ -362,12 +396,520 @@ class BacktestEngine:
         최적화 전략:
         1. 시뮬레이션: 메모리에만 저장 (초고속)
         2. 완료 후: Bulk DB INSERT (1~2초)
+        3. 같은 설정으로 더 이른 종료일까지 완료된 세션이 있으면 그 체크포인트에서 이어서 실행
+           (resume=None이면 config.RESUME_FROM_CHECKPOINT)
         """
 
         # 🚀 성능 측정 시작
         import time
         backtest_start_time = time.time()
 
+        self._configure_run(
+            commission_rate=commission_rate,
+            slippage=slippage,
+            initial_capital=initial_capital,
+            condition_sell=condition_sell,
+            target_and_loss=target_and_loss,
+            hold_days=hold_days,
+            target_themes=target_themes,
+            target_stocks=target_stocks,
+            target_universes=target_universes,
+            per_stock_ratio=per_stock_ratio,
+            max_buy_value=max_buy_value,
+            max_daily_stock=max_daily_stock
+        )
+
+        # 시뮬레이션 결과를 결정하는 설정 (종료일 제외) → 체크포인트 키
+        self.checkpoint_key = checkpoints.config_key({
+            "buy_conditions": buy_conditions,
+            "sell_conditions": sell_conditions,
+            "start_date": start_date,
+            "condition_sell": condition_sell,
+            "target_and_loss": target_and_loss,
+            "hold_days": hold_days,
+            "initial_capital": initial_capital,
+            "rebalance_frequency": rebalance_frequency,
+            "max_positions": max_positions,
+            "position_sizing": position_sizing,
+            "benchmark": benchmark,
+            "commission_rate": commission_rate,
+            "slippage": slippage,
+            "target_themes": target_themes,
+            "target_stocks": target_stocks,
+            "target_universes": target_universes,
+            "per_stock_ratio": per_stock_ratio,
+            "max_buy_value": max_buy_value,
+            "max_daily_stock": max_daily_stock,
+            "random_seed": self.random_seed,
+            "compact_dtypes": self.compact_dtypes,
+        })
+
+        try:
+            resume_state = None
+            if config.RESUME_FROM_CHECKPOINT if resume is None else resume:
+                resume_state = await self._find_checkpoint(start_date, end_date)
+
+            portfolio_result, statistics = await self._run_pipeline(
+                backtest_id=backtest_id,
+                buy_conditions=buy_conditions,
+                sell_conditions=sell_conditions,
+                condition_sell=condition_sell,
+                start_date=start_date,
+                end_date=end_date,
+                initial_capital=initial_capital,
+                rebalance_frequency=rebalance_frequency,
+                max_positions=max_positions,
+                position_sizing=position_sizing,
+                benchmark=benchmark,
+                target_themes=target_themes,
+                target_stocks=target_stocks,
+                target_universes=target_universes,
+                resume_state=resume_state
+            )
+
+            # 6. 결과 포맷팅
+            with self.tracer.span("format_result"):
+                result = await self._format_result(
+                    backtest_id=backtest_id,
+                    portfolio_result=portfolio_result,
+                    statistics=statistics,
+                    buy_conditions=buy_conditions,
+                    sell_conditions=sell_conditions,
+                    condition_sell=condition_sell,
+                    settings={
+                        "rebalance_frequency": rebalance_frequency,
+                        "max_positions": max_positions,
+                        "position_sizing": position_sizing,
+                        "benchmark": benchmark,
+                        "commission_rate": float(self.commission_rate),
+                        "tax_rate": float(self.tax_rate),
+                        "slippage": float(self.slippage)
+                    }
+                )
+
+            # 7. 결과 저장 - 비활성화
+            # _save_result는 구 시스템(BacktestSession)에 저장하려고 함
+            # 현재는 SimulationSession을 사용하므로 불필요 (이미 3340-3353줄에서 저장)
+            # await self._save_result(backtest_id, result)
+
+            # 🚀 성능 측정 종료
+            backtest_elapsed = time.time() - backtest_start_time
+            logger.info(f"⚡⚡⚡ 백테스트 총 소요 시간: {backtest_elapsed:.2f}초 ⚡⚡⚡")
+
+            with self.tracer.span("checkpoint"):
+                await self._save_checkpoint(backtest_id)
+            await self._save_trace(backtest_id)
+            return result
+
+        except Exception as e:
+            logger.error(f"백테스트 실패: {e}")
+            # 실패 세션은 트랜잭션 상태를 알 수 없으므로 트레이스는 로그로만 남김
+            trace = self._finish_trace()
+            logger.warning(f"실패한 백테스트 트레이스: {json.dumps(trace, ensure_ascii=False, default=str)}")
+            raise
+
+    async def run_headless(
+        self,
+        buy_conditions: Union[List[Dict], Dict[str, Any]],
+        sell_conditions: List[Dict],
+        start_date: date,
+        end_date: date,
+        condition_sell: Optional[Dict[str, Any]] = None,
+        target_and_loss: Optional[Dict[str, Any]] = None,
+        hold_days: Optional[Dict[str, Any]] = None,
+        initial_capital: Decimal = Decimal("100000000"),
+        rebalance_frequency: str = "MONTHLY",
+        max_positions: int = 20,
+        position_sizing: str = "EQUAL_WEIGHT",
+        benchmark: str = "KOSPI",
+        commission_rate: float = 0.00015,
+        slippage: float = 0.001,
+        target_themes: List[str] = None,
+        target_stocks: List[str] = None,
+        target_universes: List[str] = None,
+        per_stock_ratio: Optional[float] = None,
+        max_buy_value: Optional[Decimal] = None,
+        max_daily_stock: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        통계 전용 백테스트 (headless)
+
+        세션 진행률 UPDATE, WebSocket 전송, 연출용 지연, 결과 행 생성/저장 없이
+        요약 통계와 일별 NAV만 반환한다. DB는 데이터 로드에만 사용한다.
+
+        Returns:
+            statistics(BacktestStatistics dict), nav([{date, value}]), elapsed_seconds
+        """
+        import time
+        started = time.time()
+        self.headless = True
+        self._configure_run(
+            commission_rate=commission_rate,
+            slippage=slippage,
+            initial_capital=initial_capital,
+            condition_sell=condition_sell,
+            target_and_loss=target_and_loss,
+            hold_days=hold_days,
+            target_themes=target_themes,
+            target_stocks=target_stocks,
+            target_universes=target_universes,
+            per_stock_ratio=per_stock_ratio,
+            max_buy_value=max_buy_value,
+            max_daily_stock=max_daily_stock
+        )
+
+        portfolio_result, statistics = await self._run_pipeline(
+            backtest_id=uuid4(),
+            buy_conditions=buy_conditions,
+            sell_conditions=sell_conditions,
+            condition_sell=condition_sell,
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=initial_capital,
+            rebalance_frequency=rebalance_frequency,
+            max_positions=max_positions,
+            position_sizing=position_sizing,
+            benchmark=benchmark,
+            target_themes=target_themes,
+            target_stocks=target_stocks,
+            target_universes=target_universes
+        )
+
+        nav = [
+            {
+                "date": pd.Timestamp(snapshot['date']).date().isoformat(),
+                "value": float(snapshot['portfolio_value'])
+            }
+            for snapshot in portfolio_result['daily_snapshots']
+        ]
+        elapsed = time.time() - started
+        logger.info(f"⚡ headless 백테스트 완료: {elapsed:.2f}초 ({len(nav)}일)")
+        return {
+            "statistics": statistics.model_dump(),
+            "nav": nav,
+            "elapsed_seconds": round(elapsed, 3),
+            "trace": self._finish_trace()
+        }
+
+    async def _run_pipeline(
+        self,
+        backtest_id: UUID,
+        buy_conditions: Union[List[Dict], Dict[str, Any]],
+        sell_conditions: List[Dict],
+        condition_sell: Optional[Dict[str, Any]],
+        start_date: date,
+        end_date: date,
+        initial_capital: Decimal,
+        rebalance_frequency: str,
+        max_positions: int,
+        position_sizing: str,
+        benchmark: str,
+        target_themes: List[str],
+        target_stocks: List[str],
+        target_universes: List[str],
+        resume_state: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], StatsSchema]:
+        """
+        데이터 로드 → 팩터 계산 → 시뮬레이션 → 통계 (_configure_run 이후 호출)
+
+        resume_state(체크포인트)가 있으면 다음 거래일부터 시뮬레이션하고,
+        가격은 새 구간 + RESUME_LOOKBACK_DAYS만 로드, 팩터는 새 구간만 계산
+        (재무/벤치마크는 전체 기간 - 전체 실행과 같은 팩터 값, 통계는 복원한 기록 포함 전체 기간)
+        """
+        # 1. 데이터 준비
+        logger.info(f"백테스트 시작: {backtest_id}")
+        logger.info(f"📅 백테스트 기간: {start_date} ~ {end_date}")
+
+        simulate_from = start_date
+        history_start = None
+        known_corporate_actions = None
+        if resume_state:
+            simulate_from = resume_state['last_date'] + timedelta(days=1)
+            history_start = simulate_from - timedelta(days=config.RESUME_LOOKBACK_DAYS)
+            known_corporate_actions = resume_state['corporate_actions']
+            logger.info(f"♻️ 체크포인트에서 이어서 실행: {resume_state['last_date']}까지 복원, {simulate_from}부터 시뮬레이션")
+        logger.info(f"매매 대상 필터 - 테마: {self.target_themes}, 종목: {self.target_stocks}, 유니버스: {self.target_universes}")
+
+        # 📡 준비 단계 1: 가격 데이터 로딩
+        await self._send_preparation_stage(backtest_id, "LOADING_PRICE_DATA", 1, "주가 데이터를 불러오는 중...")
+
+        # 순차 데이터 로딩 (SQLAlchemy AsyncSession은 동시 작업 미지원)
+        with self.tracer.span("load_price") as span:
+            price_data = await self._load_price_data(
+                start_date, end_date, target_themes, target_stocks, target_universes,
+                history_start=history_start,
+                known_corporate_actions=known_corporate_actions
+            )
+            span.set(**frame_stats(price_data))
+
+        # 🔥 가격 데이터에서 실제 선택된 종목 코드 추출 (테마 필터링 결과 반영)
+        actual_stocks = price_data['stock_code'].unique().tolist() if not price_data.empty else []
+        logger.info(f"🎯 실제 선택된 종목: {len(actual_stocks)}개")
+
+        # 📡 준비 단계 2: 재무 데이터 로딩
+        await self._send_preparation_stage(backtest_id, "LOADING_FINANCIAL_DATA", 2, f"재무 데이터를 불러오는 중... ({len(actual_stocks)}개 종목)")
+
+        with self.tracer.span("load_financial", stocks=len(actual_stocks)) as span:
+            financial_data = await self._load_financial_data(start_date, end_date, actual_stocks)
+            span.set(**frame_stats(financial_data))
+
+        # 1.5. 히스토리 보존 모드: 기존 데이터 삭제 제거
+        # 매번 새로운 backtest_id(session_id)가 생성되므로 DELETE 불필요
+        # 동일 strategy_id에 여러 session_id가 연결되어 히스토리 보존됨
+        logger.info(f"📝 새로운 백테스트 세션: {backtest_id} (히스토리 보존 모드)")
+
+        # 2. 팩터 계산 - 최적화된 버전 사용
+        backtest_conditions, priority_factor = self._prepare_buy_conditions(buy_conditions)
+
+        # 📡 준비 단계 3: 팩터 계산
+        await self._send_preparation_stage(backtest_id, "CALCULATING_FACTORS", 3, "매수 조건 팩터를 계산하는 중...")
+
+        # 최적화된 팩터 계산 호출
+        logger.info("최적화된 팩터 계산 사용")
+        with self.tracer.span("factors") as span:
+            factor_data = await self._calculate_all_factors_optimized(
+                price_data, financial_data, simulate_from, end_date,
+                buy_conditions=backtest_conditions,
+                priority_factor=priority_factor
+            )
+            span.set(**frame_stats(factor_data))
+        # 시뮬레이션은 pandas/numpy 경로만 사용 → 가격 Polars 프레임 해제
+        self._price_frames = None
+
+        # 📡 준비 단계 4: 시뮬레이션 준비
+        await self._send_preparation_stage(backtest_id, "PREPARING_SIMULATION", 4, "시뮬레이션을 준비하는 중...")
+
+        # 3. 벤치마크 데이터 로드
+        with self.tracer.span("load_benchmark") as span:
+            benchmark_data = await self._load_benchmark_data(benchmark, start_date, end_date)
+            span.set(**frame_stats(benchmark_data))
+
+        # 4. 포트폴리오 시뮬레이션
+        with self.tracer.span("simulate") as span:
+            portfolio_result = await self._simulate_portfolio(
+                backtest_id=backtest_id,
+                factor_data=factor_data,
+                price_data=price_data,
+                buy_conditions=buy_conditions,
+                sell_conditions=sell_conditions,
+                condition_sell=condition_sell,
+                initial_capital=initial_capital,
+                rebalance_frequency=rebalance_frequency,
+                max_positions=max_positions,
+                position_sizing=position_sizing,
+                benchmark_data=benchmark_data,
+                start_date=start_date,
+                end_date=end_date,
+                resume_state=resume_state
+            )
+            span.set(
+                days=len(portfolio_result['daily_snapshots']),
+                executions=len(portfolio_result['executions'])
+            )
+
+        # 5. 통계 계산
+        with self.tracer.span("statistics"):
+            statistics = self._calculate_statistics(
+                portfolio_result, initial_capital, start_date, end_date
+            )
+
+        return portfolio_result, statistics
+
+    def _finish_trace(self) -> Dict[str, Any]:
+        """트레이스 종료 + 프로세스 지표 집계 + 단계별 소요 로그"""
+        trace = self.tracer.finish()
+        get_trace_metrics().observe(self.tracer)
+        stages = ", ".join(
+            f"{span['name']} {span['duration_ms'] / 1000:.2f}s"
+            for span in trace.get('children', []) if span['duration_ms'] is not None
+        )
+        logger.info(f"🧭 단계별 소요: {stages}")
+        return trace
+
+    async def _save_trace(self, backtest_id: UUID) -> None:
+        """트레이스를 simulation_sessions.trace에 저장 (저장 실패는 백테스트 결과에 영향 없음)"""
+        trace = self._finish_trace()
+        if self.headless:
+            return
+
+        from sqlalchemy import update
+        from app.models.simulation import SimulationSession
+        try:
+            await self.db.execute(
+                update(SimulationSession)
+                .where(SimulationSession.session_id == str(backtest_id))
+                .values(trace=trace)
+            )
+            await self.db.commit()
+        except Exception as e:
+            logger.warning(f"트레이스 저장 실패: {e}")
+            await self.db.rollback()
+
+    async def _find_checkpoint(self, start_date: date, end_date: date) -> Optional[Dict[str, Any]]:
+        """같은 설정으로 더 이른 종료일까지 완료된 세션의 체크포인트 (없거나 조회 실패 시 전체 기간 실행)"""
+        if self.headless or self.checkpoint_key is None:
+            return None
+
+        from app.models.simulation import SimulationSession, SimulationDailyValue, SimulationTrade
+        try:
+            result = await self.db.execute(
+                select(SimulationSession.session_id, SimulationSession.checkpoint)
+                .where(and_(
+                    SimulationSession.checkpoint_key == self.checkpoint_key,
+                    SimulationSession.status == 'COMPLETED',
+                    SimulationSession.start_date == start_date,
+                    SimulationSession.end_date < end_date
+                ))
+                .order_by(SimulationSession.end_date.desc(), SimulationSession.completed_at.desc())
+                .limit(1)
+            )
+            row = result.first()
+            if row is None:
+                return None
+            state = checkpoints.restore_checkpoint(row.checkpoint, self.checkpoint_key)
+            if state is None or not (start_date <= state['last_date'] < end_date):
+                return None
+
+            # 체크포인트 시점까지의 기록은 원본 세션의 결과 행에서 복원
+            daily_rows = (await self.db.execute(
+                select(SimulationDailyValue)
+                .where(and_(
+                    SimulationDailyValue.session_id == row.session_id,
+                    SimulationDailyValue.date <= state['last_date']
+                ))
+                .order_by(SimulationDailyValue.date)
+            )).scalars().all()
+            trade_rows = (await self.db.execute(
+                select(SimulationTrade)
+                .where(SimulationTrade.session_id == row.session_id)
+                .order_by(SimulationTrade.trade_id)
+                .limit(state['trade_rows'])
+            )).scalars().all()
+        except Exception as e:
+            logger.warning(f"체크포인트 조회 실패 (전체 기간 실행): {e}")
+            await self.db.rollback()
+            return None
+
+        history = checkpoints.history_from_rows(state, daily_rows, trade_rows)
+        if history is None:
+            logger.warning(f"체크포인트 원본 세션({row.session_id}) 결과 행 수 불일치 (전체 기간 실행)")
+            return None
+        state['daily_snapshots'], state['executions'] = history
+        return state
+
+    async def _save_checkpoint(self, backtest_id: UUID) -> None:
+        """체크포인트를 simulation_sessions.checkpoint에 저장 (저장 실패는 백테스트 결과에 영향 없음)"""
+        if self.headless or self.checkpoint is None:
+            return
+
+        from sqlalchemy import update
+        from app.models.simulation import SimulationSession
+        try:
+            await self.db.execute(
+                update(SimulationSession)
+                .where(SimulationSession.session_id == str(backtest_id))
+                .values(checkpoint=self.checkpoint, checkpoint_key=self.checkpoint_key)
+            )
+            await self.db.commit()
+        except Exception as e:
+            logger.warning(f"체크포인트 저장 실패: {e}")
+            await self.db.rollback()
+
+    async def _send_preparation_stage(self, backtest_id: UUID, stage: str, stage_number: int, message: str) -> None:
+        """준비 단계 WebSocket 전송 (headless 모드에서는 생략)"""
+        if self.headless:
+            return
+        from app.services.backtest_websocket import ws_manager
+        await ws_manager.send_preparation_stage(
+            backtest_id=str(backtest_id),
+            stage=stage,
+            stage_number=stage_number,
+            total_stages=4,
+            message=message
+        )
+
+    async def run_walk_forward(
+        self,
+        buy_conditions: Union[List[Dict], Dict[str, Any]],
+        sell_conditions: List[Dict],
+        start_date: date,
+        end_date: date,
+        window_months: int = 12,
+        step_months: int = 3,
+        mode: str = "rolling",
+        max_workers: Optional[int] = None,
+        **run_kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        워크포워드/롤링 윈도우 평가 (DB 저장 없음)
+
+        전체 기간의 가격/팩터 패널을 한 번만 계산하고, 롤링(rolling) 또는 확장(expanding)
+        윈도우 K개를 워커 프로세스에서 동시에 시뮬레이션한다.
+
+        Args:
+            window_months: 윈도우 길이 (개월)
+            step_months: 윈도우 이동 간격 (개월)
+            mode: "rolling" | "expanding"
+            run_kwargs: run_backtest와 같은 나머지 설정 (initial_capital, rebalance_frequency 등)
+
+        Returns:
+            windows(윈도우별 기간 + CAGR/MDD/Sharpe/회전율), summary(분포 + 안정성 지표)
+        """
+        from app.services.backtest_sweep import BacktestSweepService, summarize_windows, walk_forward_windows
+
+        windows = walk_forward_windows(start_date, end_date, window_months, step_months, mode)
+        params = {
+            "initial_capital": Decimal("100000000"),
+            "rebalance_frequency": "MONTHLY",
+            "max_positions": 20,
+            "position_sizing": "EQUAL_WEIGHT",
+            "benchmark": "KOSPI",
+            "commission_rate": 0.00015,
+            "slippage": 0.001,
+            **run_kwargs,
+            "buy_conditions": buy_conditions,
+            "sell_conditions": sell_conditions,
+        }
+        window_params = [
+            {**params, "start_date": window_start, "end_date": window_end}
+            for window_start, window_end in windows
+        ]
+        logger.info(f"🪟 워크포워드 평가: {mode}, {len(windows)}개 윈도우 ({window_months}개월, {step_months}개월 간격)")
+
+        result = await BacktestSweepService(self.db, max_workers=max_workers).run(window_params)
+        rows = result["variants"]
+        for row in rows:
+            window_start, window_end = windows[row["variant_id"]]
+            row["start_date"] = window_start.isoformat()
+            row["end_date"] = window_end.isoformat()
+
+        return {
+            "mode": mode,
+            "window_months": window_months,
+            "step_months": step_months,
+            "load_seconds": result["load_seconds"],
+            "simulate_seconds": result["simulate_seconds"],
+            "windows": rows,
+            "summary": summarize_windows(rows),
+        }
+
+    def _configure_run(
+        self,
+        commission_rate: float,
+        slippage: float,
+        initial_capital: Decimal,
+        condition_sell: Optional[Dict[str, Any]] = None,
+        target_and_loss: Optional[Dict[str, Any]] = None,
+        hold_days: Optional[Dict[str, Any]] = None,
+        target_themes: List[str] = None,
+        target_stocks: List[str] = None,
+        target_universes: List[str] = None,
+        per_stock_ratio: Optional[float] = None,
+        max_buy_value: Optional[Decimal] = None,
+        max_daily_stock: Optional[int] = None
+    ) -> None:
+        """시뮬레이션 설정 저장 (거래 비용, 매도 조건, 매매 대상)"""
+
         # Decimal로 변환
         self.commission_rate = Decimal(str(commission_rate))
         self.slippage = Decimal(str(slippage))
@@ -414,225 +956,109 @@ class BacktestEngine:
         self.target_stocks = target_stocks or []
         self.target_universes = target_universes or []
 
-        try:
-            # 📡 웹소켓 매니저 import (준비 단계 전송용)
-            from app.services.backtest_websocket import ws_manager
-
-            # 1. 데이터 준비
-            logger.info(f"백테스트 시작: {backtest_id}")
-            logger.info(f"📅 백테스트 기간: {start_date} ~ {end_date}")
-            logger.info(f"매매 대상 필터 - 테마: {self.target_themes}, 종목: {self.target_stocks}, 유니버스: {self.target_universes}")
-
-            # 📡 준비 단계 1: 가격 데이터 로딩
-            await ws_manager.send_preparation_stage(
-                backtest_id=str(backtest_id),
-                stage="LOADING_PRICE_DATA",
-                stage_number=1,
-                total_stages=4,
-                message="주가 데이터를 불러오는 중..."
-            )
-
-            # 순차 데이터 로딩 (SQLAlchemy AsyncSession은 동시 작업 미지원)
-            price_data = await self._load_price_data(start_date, end_date, target_themes, target_stocks, target_universes)
-
-            # 🔥 가격 데이터에서 실제 선택된 종목 코드 추출 (테마 필터링 결과 반영)
-            actual_stocks = price_data['stock_code'].unique().tolist() if not price_data.empty else []
-            logger.info(f"🎯 실제 선택된 종목: {len(actual_stocks)}개")
-
-            # 📡 준비 단계 2: 재무 데이터 로딩
-            await ws_manager.send_preparation_stage(
-                backtest_id=str(backtest_id),
-                stage="LOADING_FINANCIAL_DATA",
-                stage_number=2,
-                total_stages=4,
-                message=f"재무 데이터를 불러오는 중... ({len(actual_stocks)}개 종목)"
-            )
-
-            financial_data = await self._load_financial_data(start_date, end_date, actual_stocks)
-
-            # 1.5. 히스토리 보존 모드: 기존 데이터 삭제 제거
-            # 매번 새로운 backtest_id(session_id)가 생성되므로 DELETE 불필요
-            # 동일 strategy_id에 여러 session_id가 연결되어 히스토리 보존됨
-            logger.info(f"📝 새로운 백테스트 세션: {backtest_id} (히스토리 보존 모드)")
-
-            # 2. 팩터 계산 - 최적화된 버전 사용
-            # 매수 조건에서 priority_factor 추출
-            priority_factor = None
-            if isinstance(buy_conditions, dict):
-                priority_factor = buy_conditions.get('priority_factor')
-            elif isinstance(buy_conditions, list) and buy_conditions:
-                # 리스트에서 priority_factor 찾기
-                for condition in buy_conditions:
-                    if isinstance(condition, dict) and 'priority_factor' in condition:
-                        priority_factor = condition.get('priority_factor')
-                        break
-
-            # priority_factor 파싱: "{PER}" 또는 "기본값({PER})" → "PER"
-            if priority_factor:
-                import re
-                match = re.search(r'\{([^}]+)\}', priority_factor)
-                if match:
-                    priority_factor = match.group(1).upper()
-
-            # SimpleCondition 객체 리스트 생성 (최적화된 팩터 계산을 위해)
-            # BacktestCondition 스키마 대신 간단한 객체 사용
-            class SimpleCondition:
-                def __init__(self, exp_left_side, inequality, exp_right_side):
-                    self.exp_left_side = exp_left_side
-                    self.inequality = inequality
-                    self.exp_right_side = exp_right_side
-
-            backtest_conditions = []
-
-            # buy_conditions가 딕셔너리 형식인 경우 (새로운 형식)
-            if isinstance(buy_conditions, dict) and 'conditions' in buy_conditions:
-                conditions_list = buy_conditions.get('conditions', [])
-                for cond in conditions_list:
-                    if isinstance(cond, dict):
-                        if 'factor' in cond:
-                            exp_left_side = f"기본값({{{cond['factor']}}})"
-                            inequality = cond.get('operator', '>')
-                            exp_right_side = cond.get('value', 0)
-                        else:
-                            exp_left_side = cond.get('exp_left_side', '')
-                            inequality = cond.get('inequality', '')
-                            exp_right_side = cond.get('exp_right_side', 0)
-
-                            # exp_left_side에서 팩터명 추출하여 factor 필드 추가
-                            import re
-                            match = re.search(r'\{([^}]+)\}', exp_left_side)
-                            if match:
-                                cond['factor'] = match.group(1).upper()
-                            cond['operator'] = inequality
-                            cond['value'] = exp_right_side
-                            if 'name' in cond:
-                                cond['id'] = cond['name']
-
-                        backtest_conditions.append(SimpleCondition(
-                            exp_left_side=exp_left_side,
-                            inequality=inequality,
-                            exp_right_side=exp_right_side
-                        ))
-
-            # buy_conditions가 리스트 형식인 경우 (기존 형식)
-            elif isinstance(buy_conditions, list):
-                for cond in buy_conditions:
-                    if isinstance(cond, dict):
-                        # Dict를 SimpleCondition 객체로 변환
-                        # 두 가지 형식 지원:
-                        # 1. {'exp_left_side': '기본값({PBR})', 'inequality': '>', 'exp_right_side': 10}
-                        # 2. {'factor': 'PBR', 'operator': '>', 'value': 10}
-                        if 'factor' in cond:
-                            # 파싱된 형식 (advanced_backtest.py에서 온 경우)
-                            exp_left_side = f"기본값({{{cond['factor']}}})"
-                            inequality = cond.get('operator', '>')
-                            exp_right_side = cond.get('value', 0)
-                        else:
-                            # 원본 형식
-                            exp_left_side = cond.get('exp_left_side', '')
-                            inequality = cond.get('inequality', '')
-                            exp_right_side = cond.get('exp_right_side', 0)
-
-                            # exp_left_side에서 팩터명 추출하여 factor 필드 추가
-                            import re
-                            match = re.search(r'\{([^}]+)\}', exp_left_side)
-                            if match:
-                                cond['factor'] = match.group(1).upper()
-                            cond['operator'] = inequality
-                            cond['value'] = exp_right_side
-                            if 'name' in cond:
-                                cond['id'] = cond['name']
-
-                        backtest_conditions.append(SimpleCondition(
-                            exp_left_side=exp_left_side,
-                            inequality=inequality,
-                            exp_right_side=exp_right_side
-                        ))
-
-            # 📡 준비 단계 3: 팩터 계산
-            await ws_manager.send_preparation_stage(
-                backtest_id=str(backtest_id),
-                stage="CALCULATING_FACTORS",
-                stage_number=3,
-                total_stages=4,
-                message="매수 조건 팩터를 계산하는 중..."
-            )
-
-            # 최적화된 팩터 계산 호출
-            logger.info("최적화된 팩터 계산 사용")
-            factor_data = await self._calculate_all_factors_optimized(
-                price_data, financial_data, start_date, end_date,
-                buy_conditions=backtest_conditions,
-                priority_factor=priority_factor
-            )
-
-            # 📡 준비 단계 4: 시뮬레이션 준비
-            await ws_manager.send_preparation_stage(
-                backtest_id=str(backtest_id),
-                stage="PREPARING_SIMULATION",
-                stage_number=4,
-                total_stages=4,
-                message="시뮬레이션을 준비하는 중..."
-            )
-
-            # 3. 벤치마크 데이터 로드
-            benchmark_data = await self._load_benchmark_data(benchmark, start_date, end_date)
-
-            # 4. 포트폴리오 시뮬레이션
-            portfolio_result = await self._simulate_portfolio(
-                backtest_id=backtest_id,
-                factor_data=factor_data,
-                price_data=price_data,
-                buy_conditions=buy_conditions,
-                sell_conditions=sell_conditions,
-                condition_sell=condition_sell,
-                initial_capital=initial_capital,
-                rebalance_frequency=rebalance_frequency,
-                max_positions=max_positions,
-                position_sizing=position_sizing,
-                benchmark_data=benchmark_data,
-                start_date=start_date,
-                end_date=end_date
-            )
-
-            # 5. 통계 계산
-            statistics = self._calculate_statistics(
-                portfolio_result, initial_capital, start_date, end_date
-            )
+    def _prepare_buy_conditions(
+        self,
+        buy_conditions: Union[List[Dict], Dict[str, Any]]
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        매수 조건 정규화 → (팩터 계산용 조건 리스트, 우선순위 팩터)
 
-            # 6. 결과 포맷팅
-            result = await self._format_result(
-                backtest_id=backtest_id,
-                portfolio_result=portfolio_result,
-                statistics=statistics,
-                buy_conditions=buy_conditions,
-                sell_conditions=sell_conditions,
-                condition_sell=condition_sell,
-                settings={
-                    "rebalance_frequency": rebalance_frequency,
-                    "max_positions": max_positions,
-                    "position_sizing": position_sizing,
-                    "benchmark": benchmark,
-                    "commission_rate": float(self.commission_rate),
-                    "tax_rate": float(self.tax_rate),
-                    "slippage": float(self.slippage)
-                }
-            )
+        조건 dict에 factor/operator/value/id 필드를 채우므로 시뮬레이션 전에 호출해야 한다.
+        """
+        # 매수 조건에서 priority_factor 추출
+        priority_factor = None
+        if isinstance(buy_conditions, dict):
+            priority_factor = buy_conditions.get('priority_factor')
+        elif isinstance(buy_conditions, list) and buy_conditions:
+            # 리스트에서 priority_factor 찾기
+            for condition in buy_conditions:
+                if isinstance(condition, dict) and 'priority_factor' in condition:
+                    priority_factor = condition.get('priority_factor')
+                    break
 
-            # 7. 결과 저장 - 비활성화
-            # _save_result는 구 시스템(BacktestSession)에 저장하려고 함
-            # 현재는 SimulationSession을 사용하므로 불필요 (이미 3340-3353줄에서 저장)
-            # await self._save_result(backtest_id, result)
+        # priority_factor 파싱: "{PER}" 또는 "기본값({PER})" → "PER"
+        if priority_factor:
+            import re
+            match = re.search(r'\{([^}]+)\}', priority_factor)
+            if match:
+                priority_factor = match.group(1).upper()
 
-            # 🚀 성능 측정 종료
-            backtest_elapsed = time.time() - backtest_start_time
-            logger.info(f"⚡⚡⚡ 백테스트 총 소요 시간: {backtest_elapsed:.2f}초 ⚡⚡⚡")
+        # SimpleCondition 객체 리스트 생성 (최적화된 팩터 계산을 위해)
+        # BacktestCondition 스키마 대신 간단한 객체 사용
+        class SimpleCondition:
+            def __init__(self, exp_left_side, inequality, exp_right_side):
+                self.exp_left_side = exp_left_side
+                self.inequality = inequality
+                self.exp_right_side = exp_right_side
 
-            return result
+        backtest_conditions = []
 
-        except Exception as e:
-            logger.error(f"백테스트 실패: {e}")
-            raise
+        # buy_conditions가 딕셔너리 형식인 경우 (새로운 형식)
+        if isinstance(buy_conditions, dict) and 'conditions' in buy_conditions:
+            conditions_list = buy_conditions.get('conditions', [])
+            for cond in conditions_list:
+                if isinstance(cond, dict):
+                    if 'factor' in cond:
+                        exp_left_side = f"기본값({{{cond['factor']}}})"
+                        inequality = cond.get('operator', '>')
+                        exp_right_side = cond.get('value', 0)
+                    else:
+                        exp_left_side = cond.get('exp_left_side', '')
+                        inequality = cond.get('inequality', '')
+                        exp_right_side = cond.get('exp_right_side', 0)
+
+                        # exp_left_side에서 팩터명 추출하여 factor 필드 추가
+                        import re
+                        match = re.search(r'\{([^}]+)\}', exp_left_side)
+                        if match:
+                            cond['factor'] = match.group(1).upper()
+                        cond['operator'] = inequality
+                        cond['value'] = exp_right_side
+                        if 'name' in cond:
+                            cond['id'] = cond['name']
+
+                    backtest_conditions.append(SimpleCondition(
+                        exp_left_side=exp_left_side,
+                        inequality=inequality,
+                        exp_right_side=exp_right_side
+                    ))
+
+        # buy_conditions가 리스트 형식인 경우 (기존 형식)
+        elif isinstance(buy_conditions, list):
+            for cond in buy_conditions:
+                if isinstance(cond, dict):
+                    # Dict를 SimpleCondition 객체로 변환
+                    # 두 가지 형식 지원:
+                    # 1. {'exp_left_side': '기본값({PBR})', 'inequality': '>', 'exp_right_side': 10}
+                    # 2. {'factor': 'PBR', 'operator': '>', 'value': 10}
+                    if 'factor' in cond:
+                        # 파싱된 형식 (advanced_backtest.py에서 온 경우)
+                        exp_left_side = f"기본값({{{cond['factor']}}})"
+                        inequality = cond.get('operator', '>')
+                        exp_right_side = cond.get('value', 0)
+                    else:
+                        # 원본 형식
+                        exp_left_side = cond.get('exp_left_side', '')
+                        inequality = cond.get('inequality', '')
+                        exp_right_side = cond.get('exp_right_side', 0)
+
+                        # exp_left_side에서 팩터명 추출하여 factor 필드 추가
+                        import re
+                        match = re.search(r'\{([^}]+)\}', exp_left_side)
+                        if match:
+                            cond['factor'] = match.group(1).upper()
+                        cond['operator'] = inequality
+                        cond['value'] = exp_right_side
+                        if 'name' in cond:
+                            cond['id'] = cond['name']
+
+                    backtest_conditions.append(SimpleCondition(
+                        exp_left_side=exp_left_side,
+                        inequality=inequality,
+                        exp_right_side=exp_right_side
+                    ))
+
+        return backtest_conditions, priority_factor
 
     async def _load_price_data(
         self,
@@ -640,9 +1066,16 @@ class BacktestEngine:
         end_date: date,
         target_themes: List[str] = None,
         target_stocks: List[str] = None,
-        target_universes: List[str] = None
+        target_universes: List[str] = None,
+        history_start: Optional[date] = None,
+        known_corporate_actions: Optional[Dict[str, Dict]] = None
     ) -> pd.DataFrame:
-        """가격 데이터 로드 (매매 대상 필터 적용) + Redis 캐싱"""
+        """
+        가격 데이터 로드 (매매 대상 필터 적용) + Redis 캐싱
+
+        history_start: 조회 시작일 하한 (체크포인트 이어서 실행 시 새 구간 + lookback만 로드)
+        known_corporate_actions: 이전 구간에서 감지된 기업행동 (이후 데이터 제외에 함께 적용)
+        """
 
         logger.info(f"📊 가격 데이터 로드 - target_themes: {target_themes}, target_stocks: {target_stocks}, target_universes: {target_universes}")
 
@@ -658,6 +1091,8 @@ class BacktestEngine:
         # 요청 범위가 캐시 범위에 포함되면 캐시 히트
         lookback_days = config.get_lookback_days(getattr(self, 'required_factors', None))
         extended_start = start_date - timedelta(days=lookback_days)
+        if history_start is not None:
+            extended_start = max(extended_start, history_start)
 
         # 캐시 키 후보: 정확한 범위 또는 상위 범위
         cache_key_candidates = [
@@ -673,64 +1108,66 @@ class BacktestEngine:
 
         cached_data = None
         used_cache_key = None
-        for cache_key in cache_key_candidates:
-            try:
-                cached_data = await cache.get(cache_key)
-                if cached_data:
-                    used_cache_key = cache_key
-                    break
-            except Exception:
-                continue
+        with self.tracer.span("cache_lookup", candidates=len(cache_key_candidates)) as span:
+            for cache_key in cache_key_candidates:
+                try:
+                    cached_data = await cache.get(cache_key)
+                    if cached_data:
+                        used_cache_key = cache_key
+                        break
+                except Exception:
+                    continue
+            span.set(hit=bool(cached_data), key=used_cache_key, records=len(cached_data) if cached_data else 0)
 
         if cached_data:
             logger.info(f"💾 시세 데이터 캐시 히트: {len(cached_data)}개 레코드 (키: {used_cache_key})")
 
-            # 캐시 데이터를 DataFrame으로 변환
-            df = pd.DataFrame(cached_data)
+            # 캐시 레코드 → Polars (pandas 경유 없이 구성)
+            df_pl = self._records_to_polars(cached_data)
 
             # 날짜 범위 필터링 (캐시 범위 > 요청 범위일 수 있음)
-            if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'])
-                df = df[(df['date'].dt.date >= extended_start) & (df['date'].dt.date <= end_date)]
-                logger.info(f"📅 날짜 범위 필터링 후: {len(df)}개 레코드")
+            if 'date' in df_pl.columns:
+                date_col = pl.col('date')
+                if df_pl.schema['date'] == pl.Utf8:
+                    date_col = date_col.str.to_datetime(time_unit='ns')
+                df_pl = df_pl.with_columns(date_col.cast(pl.Datetime('ns')).alias('date'))
+                df_pl = df_pl.filter(pl.col('date').dt.date().is_between(extended_start, end_date))
+                logger.info(f"📅 날짜 범위 필터링 후: {len(df_pl)}개 레코드")
 
             # 메모리에서 필터링 적용 (AND 로직)
             if target_themes or target_stocks or target_universes:
                 if target_stocks:
                     # 개별 종목 선택 시 다른 필터 무시
-                    filter_mask = df['stock_code'].isin(target_stocks) if 'stock_code' in df.columns else pd.Series([False] * len(df), index=df.index)
+                    filter_expr = pl.col('stock_code').is_in(target_stocks) if 'stock_code' in df_pl.columns else pl.lit(False)
                     logger.info(f"🎯 개별 종목 필터만 적용 (메모리): {len(target_stocks)}개")
                 else:
                     # 유니버스 & 테마를 AND로 결합
-                    # 🔧 FIX: df.index를 사용하여 인덱스 일치시킴
-                    filter_mask = pd.Series([True] * len(df), index=df.index)
+                    filter_expr = pl.lit(True)
 
-                    if target_themes and 'industry' in df.columns:
-                        filter_mask &= df['industry'].isin(target_themes)
+                    if target_themes and 'industry' in df_pl.columns:
+                        filter_expr = filter_expr & pl.col('industry').is_in(target_themes)
                         logger.info(f"🎯 테마 AND 필터 (메모리): {len(target_themes)}개 산업")
 
                     if target_universes:
-                        # 유니버스 종목 코드 조회
-                        from app.services.universe_service import UniverseService
-                        universe_service = UniverseService(self.db)
-                        universe_stock_codes = await universe_service.get_stock_codes_by_universes(
-                            target_universes,
-                            trade_date=start_date.strftime("%Y%m%d")
+                        # 유니버스 종목 코드 조회 (기간 중 편입 이력이 있는 종목 전체)
+                        universe_stock_codes = await self._resolve_universe_stock_codes(
+                            target_universes, start_date, end_date
                         )
-                        if universe_stock_codes and 'stock_code' in df.columns:
-                            filter_mask &= df['stock_code'].isin(universe_stock_codes)
+                        if universe_stock_codes and 'stock_code' in df_pl.columns:
+                            filter_expr = filter_expr & pl.col('stock_code').is_in(universe_stock_codes)
                             logger.info(f"🎯 유니버스 AND 필터 (메모리): {len(universe_stock_codes)}개 종목")
 
-                df = df[filter_mask]
-                logger.info(f"✅ AND 필터링 후: {len(df)}개 레코드")
+                df_pl = df_pl.filter(filter_expr)
+                logger.info(f"✅ AND 필터링 후: {len(df_pl)}개 레코드")
 
             # 🚨 캐시 히트 시에도 기업행동 감지 필수!
-            df, corporate_actions = self._detect_corporate_actions(df)
+            with self.tracer.span("corporate_actions", rows=len(df_pl)):
+                df_pl, corporate_actions = self._detect_corporate_actions(df_pl, known_corporate_actions)
             if corporate_actions:
                 self.corporate_actions = corporate_actions
                 logger.warning(f"🚨 기업행동 감지 (캐시 히트): {len(corporate_actions)}개 종목 - 강제 청산 대상")
 
-            return df
+            return self._price_frame_to_pandas(df_pl)
 
         # 캐시 미스 - DB 조회
         logger.info(f"📊 Lookback 기간: {lookback_days}일 (이전: 365일)")
@@ -758,12 +1195,9 @@ class BacktestEngine:
                 filter_conditions.append(Company.stock_code.in_(target_stocks))
 
             if target_universes:
-                # 선택된 유니버스에 속한 종목만
-                from app.services.universe_service import UniverseService
-                universe_service = UniverseService(self.db)
-                universe_stock_codes = await universe_service.get_stock_codes_by_universes(
-                    target_universes,
-                    trade_date=start_date.strftime("%Y%m%d")
+                # 선택된 유니버스에 (기간 중 한 번이라도) 속한 종목만
+                universe_stock_codes = await self._resolve_universe_stock_codes(
+                    target_universes, start_date, end_date
                 )
                 if universe_stock_codes:
                     logger.info(f"🎯 유니버스 필터링: {len(universe_stock_codes)}개 종목 (유니버스: {target_universes})")
@@ -809,40 +1243,42 @@ class BacktestEngine:
             StockPrice.company_id  # 3차 정렬: 일관성 보장
         )
 
-        result = await self.db.execute(query)
-        rows = result.mappings().all()
-
-        # DataFrame으로 변환
-        df = pd.DataFrame(rows)
+        with self.tracer.span("db_query") as span:
+            result = await self.db.execute(query)
+            columns = list(result.keys())
+            rows = result.all()
+            span.set(rows=len(rows))
 
-        if df.empty:
+        if not rows:
             logger.warning(f"No price data found for period {start_date} to {end_date}")
             return pd.DataFrame()
 
-        # 데이터 타입 변환
-        df['date'] = pd.to_datetime(df['date'])
-        numeric_columns = ['open_price', 'high_price', 'low_price', 'close_price',
-                          'volume', 'trading_value', 'market_cap', 'listed_shares']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        # 행 튜플 → 컬럼 리스트 → Polars (pandas DataFrame 생성 없이)
+        df_pl = self._columns_to_polars({name: list(values) for name, values in zip(columns, zip(*rows))})
+        del rows
 
-        logger.info(f"📊 시세 데이터 로드 완료: {len(df):,}개 레코드, {df['stock_code'].nunique()}개 종목")
-        logger.info(f"📅 시세 데이터 날짜 범위: {df['date'].min().date()} ~ {df['date'].max().date()}")
+        # 날짜는 pandas to_datetime과 같은 ns 단위
+        df_pl = df_pl.with_columns(pl.col('date').cast(pl.Datetime('ns')))
+
+        logger.info(f"📊 시세 데이터 로드 완료: {len(df_pl):,}개 레코드, {df_pl['stock_code'].n_unique()}개 종목")
+        logger.info(f"📅 시세 데이터 날짜 범위: {df_pl['date'].min().date()} ~ {df_pl['date'].max().date()}")
 
         # 🚨 기업행동 감지 (무상증자/액면분할 등)
-        df, corporate_actions = self._detect_corporate_actions(df)
+        with self.tracer.span("corporate_actions", rows=len(df_pl)):
+            df_pl, corporate_actions = self._detect_corporate_actions(df_pl, known_corporate_actions)
         if corporate_actions:
             self.corporate_actions = corporate_actions
             logger.warning(f"🚨 기업행동 감지: {len(corporate_actions)}개 종목 - 강제 청산 대상")
 
         # Phase 0 최적화: price_lookup 사전 구축 (10-20배 빠른 가격 조회)
-        self.price_lookup = {}
-        for _, row in df.iterrows():
-            key = (row['stock_code'], row['date'].date() if hasattr(row['date'], 'date') else row['date'])
-            self.price_lookup[key] = row['close_price']
+        self.price_lookup = dict(zip(
+            zip(df_pl['stock_code'].to_list(), df_pl['date'].dt.date().to_list()),
+            df_pl['close_price'].to_list()
+        ))
         logger.info(f"🚀 Price lookup 사전 구축 완료: {len(self.price_lookup)}개 항목")
 
+        df = self._price_frame_to_pandas(df_pl)
+
         # 성능 모니터링
         if self.perf_monitor:
             elapsed = self.perf_monitor.stop_timer('data_load')
@@ -856,8 +1292,8 @@ class BacktestEngine:
         if not target_themes and not target_stocks and not target_universes:
             try:
                 cache_key = f"price_data:all:{extended_start}:{end_date}"
-                # DataFrame을 dict 리스트로 변환하여 저장
-                cache_data = df.to_dict('records')
+                # Polars 프레임을 dict 리스트로 변환하여 저장
+                cache_data = df_pl.to_dicts()
                 # 날짜 객체를 문자열로 변환
                 for record in cache_data:
                     if 'date' in record and hasattr(record['date'], 'isoformat'):
@@ -869,7 +1305,85 @@ class BacktestEngine:
 
         return df
 
-    def _detect_corporate_actions(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Dict]]:
+    async def _resolve_universe_stock_codes(
+        self,
+        target_universes: List[str],
+        start_date: date,
+        end_date: date
+    ) -> List[str]:
+        """
+        유니버스 필터 종목 조회 + 시점별 편입 인덱스 준비
+
+        편입 비트맵 인덱스를 로드해 self.universe_membership에 보관하고
+        (리밸런싱 날짜마다 시점별 필터 적용), 가격 로드용으로는
+        기간 중 한 번이라도 편입된 종목 전체를 반환한다.
+        인덱스를 만들 수 없으면 시작일 기준 분류로 폴백한다.
+        """
+        from app.services.universe_service import UniverseService
+        universe_service = UniverseService(self.db)
+
+        try:
+            self.universe_membership = await universe_service.get_membership_index(
+                target_universes, start_date, end_date
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ 유니버스 편입 인덱스 로드 실패 (시작일 기준 폴백): {e}")
+            self.universe_membership = None
+
+        if self.universe_membership is not None:
+            return sorted(self.universe_membership.all_members())
+
+        return await universe_service.get_stock_codes_by_universes(
+            target_universes,
+            trade_date=start_date.strftime("%Y%m%d")
+        )
+
+    def _columns_to_polars(self, columns: Dict[str, List[Any]]) -> pl.DataFrame:
+        """
+        컬럼별 값 리스트 → Polars DataFrame (pandas 경유 변환과 같은 값/타입)
+
+        - Polars 엄격 추론이 실패하는 컬럼(정수/실수 혼합 등)만 pandas 추론으로 변환
+        - Decimal, null이 있는 정수 컬럼은 Float64 (pandas의 float64 + NaN과 동일)
+        - NaN은 null (pl.from_pandas 기본 동작과 동일)
+        """
+        series = []
+        for name, values in columns.items():
+            try:
+                column = pl.Series(name, values)
+            except (TypeError, pl.exceptions.PolarsError):
+                column = pl.from_pandas(pd.Series(values, name=name))
+            if isinstance(column.dtype, pl.Decimal) or (column.dtype.is_integer() and column.null_count() > 0):
+                column = column.cast(pl.Float64)
+            series.append(column)
+        return pl.DataFrame(series).with_columns(pl.col(pl.Float32, pl.Float64).fill_nan(None))
+
+    def _records_to_polars(self, records: List[Dict[str, Any]]) -> pl.DataFrame:
+        """dict 레코드 → Polars DataFrame (컬럼은 키 등장 순서의 합집합, 없는 키는 null)"""
+        names = dict.fromkeys(key for record in records for key in record)
+        return self._columns_to_polars({name: [record.get(name) for record in records] for name in names})
+
+    def _price_frame_to_pandas(self, df_pl: pl.DataFrame) -> pd.DataFrame:
+        """가격 Polars 프레임 → 시뮬레이션용 pandas (1회 변환, 팩터 단계용으로 Polars 프레임 보관)"""
+        if self.compact_dtypes:
+            # 팩터 단계의 재무 조인은 문자열 stock_code 기준이므로 보관용 Polars 프레임은 압축하지 않음
+            self.stock_index = compact.StockIndex(df_pl['stock_code'].unique().to_list())
+            df = compact.compact_price_frame(df_pl, self.stock_index).to_pandas()
+        else:
+            df = df_pl.to_pandas()
+        self._price_frames = (df, df_pl)
+        return df
+
+    def _price_polars(self, price_data: pd.DataFrame) -> pl.DataFrame:
+        """price_data의 Polars 프레임 (로드 단계에서 만든 프레임이 있으면 재사용)"""
+        if self._price_frames is not None and self._price_frames[0] is price_data:
+            return self._price_frames[1]
+        return pl.from_pandas(price_data)
+
+    def _detect_corporate_actions(
+        self,
+        df_pl: pl.DataFrame,
+        known_actions: Optional[Dict[str, Dict]] = None
+    ) -> Tuple[pl.DataFrame, Dict[str, Dict]]:
         """
         🚀 기업행동 감지 (무상증자/액면분할 등) - Polars 최적화 버전
 
@@ -877,23 +1391,21 @@ class BacktestEngine:
         해당 정보를 반환합니다. 기업행동 발생일 이후 데이터는 제외됩니다.
 
         Args:
-            df: 주가 데이터 DataFrame
+            df_pl: 주가 데이터 Polars DataFrame
+            known_actions: 이전 구간에서 감지된 기업행동 (종목별로 더 이른 이벤트 사용)
 
         Returns:
-            Tuple[DataFrame, Dict]:
-                - 기업행동 발생일 이후 데이터가 제외된 DataFrame
+            Tuple[pl.DataFrame, Dict]:
+                - 기업행동 발생일 이후 데이터가 제외된 DataFrame (stock_code, date 순 정렬)
                 - 기업행동 이벤트 정보 딕셔너리 {stock_code: {event_date, prev_close, action_type, ...}}
         """
         corporate_actions = {}
 
-        if df.empty:
-            return df, corporate_actions
+        if df_pl.is_empty():
+            return df_pl, corporate_actions
 
         detect_start = time.time()
 
-        # 🚀 ULTRA-FAST: Polars로 벡터화 연산 (4배 빠름)
-        df_pl = pl.from_pandas(df)
-
         # 정렬 및 등락률 계산 (Polars 방식)
         df_pl = df_pl.sort(['stock_code', 'date'])
         df_pl = df_pl.with_columns([
@@ -912,11 +1424,10 @@ class BacktestEngine:
         # 급등/급락 이벤트 감지
         abnormal_events = df_pl.filter(pl.col('change_rate').abs() > ABNORMAL_THRESHOLD)
 
-        if len(abnormal_events) == 0:
-            # Pandas로 변환 후 임시 컬럼 제거
-            df_result = df_pl.drop(['prev_close', 'change_rate']).to_pandas()
+        if len(abnormal_events) == 0 and not known_actions:
+            # 임시 컬럼 제거
             logger.info(f"✅ 기업행동 감지 완료: 0개 (소요 {time.time() - detect_start:.2f}초)")
-            return df_result, corporate_actions
+            return df_pl.drop(['prev_close', 'change_rate']), corporate_actions
 
         # 각 종목별 첫 번째 기업행동 이벤트만 사용 (가장 이른 날짜)
         abnormal_events = abnormal_events.sort('date').unique(subset=['stock_code'], keep='first')
@@ -948,6 +1459,11 @@ class BacktestEngine:
                 f"({change_rate:+.1f}%) [{action_type}]"
             )
 
+        for stock_code, event_info in (known_actions or {}).items():
+            detected = corporate_actions.get(stock_code)
+            if detected is None or event_info['event_date'] < detected['event_date']:
+                corporate_actions[stock_code] = event_info
+
         # 🚀 벡터화된 필터링 (루프 제거)
         if corporate_actions:
             # 각 종목별 이벤트 날짜를 DataFrame으로
@@ -965,8 +1481,8 @@ class BacktestEngine:
                 (pl.col('date') < pl.col('event_date'))
             ).drop('event_date')
 
-        # 임시 컬럼 제거 및 Pandas 변환
-        df_filtered = df_pl.drop(['prev_close', 'change_rate']).to_pandas()
+        # 임시 컬럼 제거
+        df_filtered = df_pl.drop(['prev_close', 'change_rate'])
 
         after_count = len(df_filtered)
         filtered_count = before_count - after_count
@@ -996,7 +1512,9 @@ class BacktestEngine:
         cache_key = f"financial_data:{start_date}:{end_date}:{stocks_str}"
 
         try:
-            cached_data = await cache.get(cache_key)
+            with self.tracer.span("cache_lookup") as span:
+                cached_data = await cache.get(cache_key)
+                span.set(hit=bool(cached_data), records=len(cached_data) if cached_data else 0)
             if cached_data:
                 logger.info(f"💾 재무 데이터 캐시 히트: {len(cached_data)}개 레코드")
                 df = pd.DataFrame(cached_data)
@@ -1088,11 +1606,13 @@ class BacktestEngine:
         ).order_by(Company.stock_code, FinancialStatement.bsns_year, FinancialStatement.reprt_code)
 
         # 데이터 실행
-        income_result = await self.db.execute(income_query)
-        balance_result = await self.db.execute(balance_query)
+        with self.tracer.span("db_query") as span:
+            income_result = await self.db.execute(income_query)
+            balance_result = await self.db.execute(balance_query)
 
-        income_df = pd.DataFrame(income_result.mappings().all())
-        balance_df = pd.DataFrame(balance_result.mappings().all())
+            income_df = pd.DataFrame(income_result.mappings().all())
+            balance_df = pd.DataFrame(balance_result.mappings().all())
+            span.set(income_rows=len(income_df), balance_rows=len(balance_df))
 
         # 계정 과목 정규화 (연도별 차이 해결)
         if not income_df.empty:
@@ -1213,7 +1733,9 @@ class BacktestEngine:
         cache_key = f"benchmark:{benchmark}:{start_date}:{end_date}"
 
         try:
-            cached_data = await cache.get(cache_key)
+            with self.tracer.span("cache_lookup") as span:
+                cached_data = await cache.get(cache_key)
+                span.set(hit=bool(cached_data))
             if cached_data:
                 logger.info(f"💾 벤치마크 데이터 캐시 히트: {benchmark}")
                 df = pd.DataFrame(cached_data)
@@ -1688,7 +2210,9 @@ class BacktestEngine:
                 cache_key = cache._generate_key('backtest_factors_v2', cache_params)
 
                 try:
+                    lookup_start = time.time()
                     cached_data = await cache.get(cache_key)
+                    self.tracer.count("factor_cache_lookup", time.time() - lookup_start, hits=1 if cached_data else 0)
                     if cached_data:
                         # 🔧 FIX: 캐시에서 현재 백테스트 종목만 필터링
                         filtered_rows = []
@@ -1792,28 +2316,32 @@ class BacktestEngine:
             if financial_pl is not None or financial_dict is not None:
                 # 가치 팩터 (PER, PBR, PSR, PCR, DIVIDEND_YIELD, EARNINGS_YIELD, FCF_YIELD, EV_EBITDA, EV_SALES, BOOK_TO_MARKET)
                 try:
-                    value_map = self._calculate_value_factors(price_until_date, financial_pl, calc_date, financial_dict)
+                    with self.tracer.timed("factor.value"):
+                        value_map = self._calculate_value_factors(price_until_date, financial_pl, calc_date, financial_dict)
                     self._merge_factor_maps(stock_factor_map, value_map)
                 except Exception as e:
                     logger.error(f"가치 팩터 계산 에러 ({calc_date}): {e}")
 
                 # 수익성 팩터 (ROE, ROA, DEBT_RATIO, GPM, OPM, NPM)
                 try:
-                    profit_map = self._calculate_profitability_factors(financial_pl, calc_date, financial_dict)
+                    with self.tracer.timed("factor.profitability"):
+                        profit_map = self._calculate_profitability_factors(financial_pl, calc_date, financial_dict)
                     self._merge_factor_maps(stock_factor_map, profit_map)
                 except Exception as e:
                     logger.error(f"수익성 팩터 계산 에러 ({calc_date}): {e}")
 
                 # 안정성 팩터 (DEBT_TO_EQUITY, EQUITY_RATIO, CURRENT_RATIO, QUICK_RATIO, CASH_RATIO, INTEREST_COVERAGE)
                 try:
-                    stability_map = self._calculate_stability_factors(financial_pl, calc_date, financial_dict)
+                    with self.tracer.timed("factor.stability"):
+                        stability_map = self._calculate_stability_factors(financial_pl, calc_date, financial_dict)
                     self._merge_factor_maps(stock_factor_map, stability_map)
                 except Exception as e:
                     logger.error(f"안정성 팩터 계산 에러 ({calc_date}): {e}")
 
                 # 성장성 팩터
                 try:
-                    growth_map = self._calculate_growth_factors(financial_pl, calc_date, financial_dict)
+                    with self.tracer.timed("factor.growth"):
+                        growth_map = self._calculate_growth_factors(financial_pl, calc_date, financial_dict)
                     self._merge_factor_maps(stock_factor_map, growth_map)
                 except Exception as e:
                     logger.error(f"성장성 팩터 계산 에러 ({calc_date}): {e}")
@@ -1832,28 +2360,32 @@ class BacktestEngine:
             # 🚀 V2 최적화: 모든 시장/기술적 팩터도 전체 계산 (캐시 재사용 극대화)
             # 모멘텀 팩터
             try:
-                momentum_map = self._calculate_momentum_factors(price_until_date, calc_date)
+                with self.tracer.timed("factor.momentum"):
+                    momentum_map = self._calculate_momentum_factors(price_until_date, calc_date)
                 self._merge_factor_maps(stock_factor_map, momentum_map)
             except Exception as e:
                 logger.error(f"모멘텀 팩터 계산 에러 ({calc_date}): {e}")
 
             # 변동성 팩터
             try:
-                volatility_map = self._calculate_volatility_factors(price_until_date, calc_date)
+                with self.tracer.timed("factor.volatility"):
+                    volatility_map = self._calculate_volatility_factors(price_until_date, calc_date)
                 self._merge_factor_maps(stock_factor_map, volatility_map)
             except Exception as e:
                 logger.error(f"변동성 팩터 계산 에러 ({calc_date}): {e}")
 
             # 유동성 팩터
             try:
-                liquidity_map = self._calculate_liquidity_factors(price_until_date, calc_date)
+                with self.tracer.timed("factor.liquidity"):
+                    liquidity_map = self._calculate_liquidity_factors(price_until_date, calc_date)
                 self._merge_factor_maps(stock_factor_map, liquidity_map)
             except Exception as e:
                 logger.error(f"유동성 팩터 계산 에러 ({calc_date}): {e}")
 
             # 기술적 지표 팩터
             try:
-                technical_map = self._calculate_technical_indicators(price_until_date, calc_date)
+                with self.tracer.timed("factor.technical"):
+                    technical_map = self._calculate_technical_indicators(price_until_date, calc_date)
                 self._merge_factor_maps(stock_factor_map, technical_map)
             except Exception as e:
                 logger.error(f"기술적 지표 팩터 계산 에러 ({calc_date}): {e}")
@@ -1879,7 +2411,8 @@ class BacktestEngine:
             # 캐시 저장 (분기별 1회)
             if cache_enabled and cache_key and quarter_rows:
                 try:
-                    await cache.set(cache_key, quarter_rows, ttl=0)
+                    with self.tracer.timed("factor_cache_store", rows=len(quarter_rows)):
+                        await cache.set(cache_key, quarter_rows, ttl=0)
                     logger.info(f"💾 캐시 저장: {quarter_key} - {len(quarter_rows)}개 레코드")
                 except Exception as e:
                     logger.debug(f"캐시 저장 실패: {e}")
@@ -1888,6 +2421,7 @@ class BacktestEngine:
 
             # 분기 완료 로깅
             quarter_elapsed = time.time() - quarter_start_time
+            self.tracer.count("quarter", quarter_elapsed, dates=len(quarter_dates), rows=len(quarter_rows))
             logger.info(f"✅ 분기 {quarter_key} 완료: {len(quarter_rows)}개 레코드, {len(all_stocks)}개 종목, {quarter_elapsed:.1f}초")
 
         return all_rows
@@ -1956,8 +2490,8 @@ class BacktestEngine:
                               'DIVIDEND_GROWTH_3Y', 'DIVIDEND_GROWTH_YOY'
                               }
 
-        # Polars DataFrame으로 변환
-        price_pl = pl.from_pandas(price_data)
+        # Polars DataFrame (가격은 로드 단계 프레임 재사용)
+        price_pl = self._price_polars(price_data)
         financial_pl = pl.from_pandas(financial_data) if not financial_data.empty else None
 
         financial_dict = None
@@ -1977,6 +2511,7 @@ class BacktestEngine:
                 financial_dict[stock_code] = df_partition
 
             _index_elapsed = time.time() - _index_start
+            self.tracer.add("financial_index", _index_elapsed, stocks=len(financial_dict))
             logger.info(f"✅ 재무 데이터 색인화 완료: {len(financial_dict)}개 종목 ({_index_elapsed:.2f}초)")
 
         unique_dates = sorted(price_data[price_data['date'] >= pd.Timestamp(start_date)]['date'].unique())
@@ -2012,19 +2547,31 @@ class BacktestEngine:
                 required_factors, price_data, start_time, cache_enabled
             )
 
-        factor_df = pd.DataFrame(all_rows)
-
-        if not factor_df.empty:
-            # 팩터 순위 계산 (정규화는 스킵 - 원본 값 사용)
-            # factor_df = self._normalize_factors(factor_df)  # 정규화 비활성화: 사용자가 입력한 조건 값과 비교하기 위해
-            factor_df = self._calculate_factor_ranks(factor_df)
+        if not all_rows:
+            return pd.DataFrame()
 
-            elapsed_total = time.time() - start_time
-            logger.info(
-                f"최적화된 팩터 계산 완료: {len(factor_df)}개 종목-일 조합, "
-                f"{len([c for c in factor_df.columns if c not in ('date', 'stock_code')])}개 팩터, "
-                f"총 소요시간: {elapsed_total:.1f}초 (기존 대비 {elapsed_total/180*100:.0f}% 속도)"
-            )
+        # 행 dict → Polars에서 순위 계산 후 pandas로 1회 변환
+        factor_pl = self._records_to_polars(all_rows)
+        factor_pl = factor_pl.with_columns(pl.col('date').cast(pl.Datetime('ns')))
+        del all_rows
+
+        # 팩터 순위 계산 (정규화는 스킵 - 원본 값 사용)
+        # factor_df = self._normalize_factors(factor_df)  # 정규화 비활성화: 사용자가 입력한 조건 값과 비교하기 위해
+        with self.tracer.span("ranks", rows=len(factor_pl)):
+            factor_pl = self._rank_factors(factor_pl)
+        if self.compact_dtypes:
+            if self.stock_index is None:
+                self.stock_index = compact.StockIndex([])
+            factor_pl = compact.compact_factor_frame(factor_pl, self.stock_index)
+        factor_df = factor_pl.to_pandas()
+        del factor_pl
+
+        elapsed_total = time.time() - start_time
+        logger.info(
+            f"최적화된 팩터 계산 완료: {len(factor_df)}개 종목-일 조합, "
+            f"{len([c for c in factor_df.columns if c not in ('date', 'stock_code')])}개 팩터, "
+            f"총 소요시간: {elapsed_total:.1f}초 (기존 대비 {elapsed_total/180*100:.0f}% 속도)"
+        )
 
         return factor_df
 
@@ -3896,10 +4443,13 @@ class BacktestEngine:
         if factor_df.empty:
             return factor_df
 
-        factor_pl = pl.from_pandas(factor_df)
+        return self._rank_factors(pl.from_pandas(factor_df)).to_pandas()
+
+    def _rank_factors(self, factor_pl: pl.DataFrame) -> pl.DataFrame:
+        """팩터별 날짜 단면 순위 컬럼({factor}_RANK) 추가"""
 
         meta_columns = {'date', 'stock_code', 'industry', 'size_bucket', 'market_type'}
-        factor_columns = [col for col in factor_df.columns if col not in meta_columns]
+        factor_columns = [col for col in factor_pl.columns if col not in meta_columns]
         lower_is_better = {'PER', 'PBR', 'VOLATILITY'}
 
         # 결과 일관성을 위해 stock_code로 먼저 정렬 (동점 시 알파벳 순 랭크 보장)
@@ -3919,7 +4469,7 @@ class BacktestEngine:
                 .alias(f'{col}_RANK')
             )
 
-        return factor_pl.to_pandas()
+        return factor_pl
 
     async def _simulate_portfolio(
         self,
@@ -3935,13 +4485,15 @@ class BacktestEngine:
         position_sizing: str,
         benchmark_data: pd.DataFrame,
         start_date: date,
-        end_date: date
+        end_date: date,
+        resume_state: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         포트폴리오 시뮬레이션 (초고속 모드)
 
         - 시뮬레이션 중: 메모리에만 저장
         - 완료 후: Bulk DB INSERT
+        - resume_state: 체크포인트의 보유/현금/기록을 복원하고 다음 거래일부터 시뮬레이션
         """
 
         logger.info("포트폴리오 시뮬레이션 시작")
@@ -3988,14 +4540,37 @@ class BacktestEngine:
             priority_factor = buy_conditions.get('priority_factor')
             priority_order = buy_conditions.get('priority_order', 'desc')
 
-        # 일별 시뮬레이션
-        total_days = len([d for d in trading_days if pd.Timestamp(start_date) <= d <= pd.Timestamp(end_date)])
-        current_day_index = 0
-
         # MDD 추적 변수
         peak_value = float(initial_capital)
         current_mdd = 0.0
 
+        # 체크포인트에서 이어서 실행: 종료 시점 상태/기록 복원
+        simulate_from = start_date
+        history_rebalance_dates: List = []
+        if resume_state:
+            simulate_from = resume_state['last_date'] + timedelta(days=1)
+            cash_balance = resume_state['cash_balance']
+            holdings = {fields['stock_code']: Position(**fields) for fields in resume_state['holdings']}
+            daily_snapshots = resume_state['daily_snapshots']
+            executions = resume_state['executions']
+            peak_value = resume_state['peak_value']
+            current_mdd = resume_state['current_mdd']
+            self.blocked_stocks |= resume_state['blocked_stocks']
+            history_rebalance_dates = resume_state['rebalance_dates']
+            rebalance_dates = [d for d in rebalance_dates if pd.Timestamp(d) >= pd.Timestamp(simulate_from)]
+            for snapshot in daily_snapshots:
+                benchmark_value, benchmark_ret = self._benchmark_point(benchmark_lookup, snapshot['date'])
+                snapshot['benchmark_value'] = benchmark_value
+                snapshot['benchmark_return'] = benchmark_ret
+                snapshot['benchmark_daily_return'] = benchmark_ret
+
+        # 일별 시뮬레이션
+        simulated_days = [d for d in trading_days if pd.Timestamp(simulate_from) <= d <= pd.Timestamp(end_date)]
+        total_days = len(simulated_days)
+        # 체크포인트는 마지막 전 거래일 종료 시점 (마지막 날은 익일이 없어 이어서 실행할 때 다시 시뮬레이션)
+        checkpoint_day = simulated_days[-2] if self.checkpoint_key is not None and len(simulated_days) >= 2 else None
+        current_day_index = 0
+
         rebalance_dates_set = {pd.Timestamp(d) for d in rebalance_dates}
 
         # 🚀 OPTIMIZATION: 조건 평가 사전 계산 (벡터화 + 병렬화)
@@ -4009,14 +4584,20 @@ class BacktestEngine:
             # 🚀 ULTRA-FAST: 날짜별 팩터 데이터 사전 준비 (1회만)
             rebalance_dates_list = list(rebalance_dates_set)
 
+            conditions_span = self.tracer.current
+
             def evaluate_single_date(rebalance_date):
                 """단일 날짜의 조건 평가 (병렬 실행용)"""
+                eval_start = time.time()
                 valid_stocks = factor_integrator.evaluate_buy_conditions_with_factors(
                     factor_data=factor_data,
                     stock_codes=all_stocks,
                     buy_conditions=buy_conditions,
                     trading_date=rebalance_date
                 )
+                self.tracer.count(
+                    "condition_eval", time.time() - eval_start, span=conditions_span, selected=len(valid_stocks)
+                )
                 return rebalance_date, set(valid_stocks)
 
             # 🚀 병렬 처리 (4 workers)
@@ -4027,7 +4608,22 @@ class BacktestEngine:
             for rebalance_date, valid_stocks_set in results:
                 buy_conditions_cache[rebalance_date] = valid_stocks_set
 
+            # 🎯 시점별 유니버스 필터: 리밸런싱 시점에 편입된 종목만 매수 후보로 유지
+            if self.universe_membership is not None and getattr(self, "target_universes", None) and not getattr(self, "target_stocks", None):
+                for rebalance_date, valid_stocks_set in buy_conditions_cache.items():
+                    if not valid_stocks_set:
+                        continue
+                    candidates = list(valid_stocks_set)
+                    in_universe = self.universe_membership.mask_for(rebalance_date, candidates)
+                    if in_universe is None:
+                        continue  # 분류 이력 이전 날짜는 필터하지 않음
+                    buy_conditions_cache[rebalance_date] = {
+                        code for code, keep in zip(candidates, in_universe) if keep
+                    }
+                logger.info(f"🎯 시점별 유니버스 필터 적용: {len(buy_conditions_cache)}개 리밸런싱 날짜")
+
             elapsed = time.time() - start_precompute
+            self.tracer.add("conditions", elapsed, dates=len(buy_conditions_cache), stocks=len(all_stocks))
             logger.info(f"✅ {len(buy_conditions_cache)}개 리밸런싱 날짜의 조건 평가 완료 ({elapsed:.2f}초, 병렬)")
 
         from sqlalchemy import update
@@ -4042,8 +4638,9 @@ class BacktestEngine:
                 current_mdd=0.0
             )
         )
-        await self.db.execute(stmt_init)
-        await self.db.commit()
+        if not self.headless:
+            await self.db.execute(stmt_init)
+            await self.db.commit()
         logger.info("💹 시뮬레이션 시작 - 0%")
 
         # ⚡ 배치 commit 전략: 20개 거래일마다 commit
@@ -4055,7 +4652,7 @@ class BacktestEngine:
 
         # 🚀 ULTRA-FAST: NumPy 기반 벡터화 (14초 → 2초 목표)
         price_dates = pd.to_datetime(price_data['date']).values
-        stock_codes = price_data['stock_code'].values
+        stock_codes = price_data['stock_code'].to_numpy()
 
         # 기본값 처리: high/low가 없으면 close 사용
         close_prices = price_data['close_price'].values.astype(np.float64)
@@ -4084,6 +4681,7 @@ class BacktestEngine:
                 }
 
         price_index_elapsed = time.time() - price_index_start
+        self.tracer.add("price_index", price_index_elapsed, entries=len(price_lookup))
         logger.info(f"✅ 가격 데이터 색인화 완료: {len(price_lookup):,}개 엔트리 ({price_index_elapsed:.2f}초)")
 
         # 🚀 ULTRA-FAST: 거래일 인덱스 매핑 사전 계산 (기업행동 체크 O(n)→O(1))
@@ -4111,8 +4709,9 @@ class BacktestEngine:
                 stock_names[row['stock_code']] = row['stock_name']
         logger.info(f"✅ 종목명 사전 구축 완료: {len(stock_names)}개")
 
+        loop_start = time.time()
         for trading_day in trading_days:
-            if trading_day < pd.Timestamp(start_date) or trading_day > pd.Timestamp(end_date):
+            if trading_day < pd.Timestamp(simulate_from) or trading_day > pd.Timestamp(end_date):
                 continue
 
             current_day_index += 1
@@ -4447,18 +5046,7 @@ class BacktestEngine:
                     cash_balance -= trade['amount'] + trade['commission']
 
             # 벤치마크 정보
-            benchmark_value = None
-            benchmark_ret = None
-            if benchmark_lookup is not None:
-                bench_idx = pd.Timestamp(trading_day)
-                if bench_idx in benchmark_lookup.index:
-                    bench_row = benchmark_lookup.loc[bench_idx]
-                    benchmark_value = Decimal(str(bench_row.get('close'))) if bench_row.get('close') is not None else None
-                    raw_return = bench_row.get('return')
-                    if raw_return is not None:
-                        # percent 스케일로 변환
-                        ret_value = raw_return * 100 if abs(raw_return) < 1 else raw_return
-                        benchmark_ret = Decimal(str(ret_value))
+            benchmark_value, benchmark_ret = self._benchmark_point(benchmark_lookup, trading_day)
 
             # 🚀 ULTRA-FAST: float로 포트폴리오 평가 (Decimal 변환 최소화)
             stock_value_float = 0.0
@@ -4511,9 +5099,27 @@ class BacktestEngine:
             }
             daily_snapshots.append(daily_snapshot)
 
+            if trading_day == checkpoint_day:
+                self.checkpoint = checkpoints.build_checkpoint(
+                    key=self.checkpoint_key,
+                    random_seed=self.random_seed,
+                    last_date=pd.Timestamp(trading_day).date(),
+                    cash_balance=cash_balance,
+                    peak_value=peak_value,
+                    current_mdd=current_mdd,
+                    holdings=[asdict(holding) for holding in holdings.values()],
+                    blocked_stocks=self.blocked_stocks,
+                    corporate_actions=self.corporate_actions,
+                    rebalance_dates=history_rebalance_dates + [
+                        d for d in rebalance_dates if pd.Timestamp(d) <= pd.Timestamp(trading_day)
+                    ],
+                    daily_snapshots=daily_snapshots,
+                    executions=executions
+                )
+
             # Phase 0 최적화: 설정된 주기마다 진행률만 DB 업데이트 (I/O 감소)
-            # 🚀 최적화: skip_db_save 모드에서는 DB 업데이트도 완전 스킵
-            if not getattr(self, 'skip_db_save', False):
+            # 🚀 최적화: headless 모드에서는 DB 업데이트도 완전 스킵
+            if not self.headless:
                 should_update_progress = (
                     progress_percentage % config.PROGRESS_UPDATE_INTERVAL == 0 or
                     current_day_index == total_days - 1  # 마지막은 무조건 업데이트
@@ -4547,8 +5153,8 @@ class BacktestEngine:
             daily_return = ((portfolio_value - prev_portfolio_value) / prev_portfolio_value) * 100 if prev_portfolio_value > 0 else 0
 
             # 매일 WebSocket 전송 (진행률 로그는 10% 단위로만)
-            # 🚀 최적화: skip_db_save 모드에서는 WebSocket 전송 스킵
-            if not getattr(self, 'skip_db_save', False):
+            # 🚀 최적화: headless 모드에서는 WebSocket 전송/연출용 지연 스킵
+            if not self.headless:
                 if progress_percentage % 10 == 0 or progress_percentage == 100:
                     logger.info(f"📡 WebSocket 전송: backtest_id={str(backtest_id)}, progress={progress_percentage}%")
 
@@ -4667,29 +5273,177 @@ class BacktestEngine:
                 else:
                     current_price = Decimal(str(current_price_data.iloc[0]['close_price']))
 
-                # 평가 금액 계산 (슬리피지/수수료/세금 없음)
-                stock_value = current_price * holding.quantity
-                total_stock_value += stock_value
+                # 평가 금액 계산 (슬리피지/수수료/세금 없음)
+                stock_value = current_price * holding.quantity
+                total_stock_value += stock_value
+
+                # 보유 종목 정보 업데이트 (매도하지 않음!)
+                holding.current_price = current_price
+                holding.unrealized_pnl = (current_price - holding.entry_price) * holding.quantity
+                holding.unrealized_pnl_pct = ((current_price / holding.entry_price) - 1) * 100
+
+                logger.debug(f"  📊 평가: {stock_code} {holding.quantity}주 @ {current_price:,.0f}원 = {stock_value:,.0f}원")
+
+            logger.info(f"💰 총 평가금액: 현금 {cash_balance:,.0f}원 + 주식 {total_stock_value:,.0f}원 = {cash_balance + total_stock_value:,.0f}원")
+
+            # ⚠️ 매도 기록을 남기지 않음! holdings도 유지!
+
+        self.tracer.add("loop", time.time() - loop_start, days=len(daily_snapshots), executions=len(executions))
+
+        # 🚀 시뮬레이션 완료! 이제 Bulk INSERT로 DB 저장 시작
+        logger.info(f"💾 Bulk INSERT 시작: {len(daily_snapshots)}일 + {len(executions)}건 거래")
+
+        bulk_insert_start = time.time()
+
+        # headless 모드: 저장용 일별/거래 행 생성 자체를 생략 (통계는 daily_snapshots/executions로 계산)
+        if not self.headless:
+            with self.tracer.span("save"):
+                await self._save_simulation_results(
+                    backtest_id, daily_snapshots, executions, initial_capital, benchmark_data
+                )
+
+        bulk_insert_elapsed = time.time() - bulk_insert_start
+        logger.info(f"⚡ Bulk COPY 완료: {bulk_insert_elapsed:.2f}초")
+
+        # 📡 WebSocket 완료 메시지 전송
+        final_portfolio_value = daily_snapshots[-1]['portfolio_value'] if daily_snapshots else initial_capital
+        final_return = ((final_portfolio_value - initial_capital) / initial_capital) * 100
+        total_sell_trades = len([e for e in executions if e['side'] == 'SELL'])
+
+        # 📊 연환산 수익률 및 일 평균 수익률 계산
+        total_days = (end_date - start_date).days
+        years = total_days / 365.0
+
+        # CAGR (연평균 복리 수익률): (최종값/초기값)^(1/년수) - 1
+        cagr = (((float(final_portfolio_value) / float(initial_capital)) ** (1 / years)) - 1) * 100 if years > 0 else 0
+
+        # 일 평균 수익률 (연간 252 거래일 기준): (1 + CAGR)^(1/252) - 1
+        daily_avg_return = ((1 + cagr / 100) ** (1 / 252) - 1) * 100
+
+        # 📝 AI 요약 생성 (마크다운 형식, headless 모드 생략)
+        summary = None if self.headless else self._generate_backtest_summary(
+            initial_capital=float(initial_capital),
+            final_value=float(final_portfolio_value),
+            total_return=float(final_return),
+            max_drawdown=float(current_mdd),
+            total_trades=total_sell_trades,
+            simulation_time=bulk_insert_elapsed,
+            start_date=start_date,
+            end_date=end_date,
+            daily_snapshots=daily_snapshots
+        )
+
+        # 📊 SimulationStatistics DB 저장 (WebSocket 전송 전에 저장)
+        # headless 모드에서는 세션/통계 저장 생략
+        if not self.headless:
+            from app.models.simulation import SimulationStatistics, SimulationSession
+            from sqlalchemy import delete, update
+
+            try:
+                # 기존 통계 삭제 (중복 방지)
+                await self.db.execute(delete(SimulationStatistics).where(
+                    SimulationStatistics.session_id == str(backtest_id)
+                ))
 
-                # 보유 종목 정보 업데이트 (매도하지 않음!)
-                holding.current_price = current_price
-                holding.unrealized_pnl = (current_price - holding.entry_price) * holding.quantity
-                holding.unrealized_pnl_pct = ((current_price / holding.entry_price) - 1) * 100
+                # 새로운 통계 저장
+                simulation_stats = SimulationStatistics(
+                    session_id=str(backtest_id),
+                    total_return=float(final_return),
+                    annualized_return=float(cagr),  # CAGR 저장
+                    benchmark_return=None,  # 벤치마크는 나중에 구현
+                    excess_return=None,
+                    max_drawdown=float(current_mdd),
+                    win_rate=50.0,  # TODO: 실제 승률 계산
+                    sharpe_ratio=0.0,  # TODO: 샤프 비율 계산
+                    # avg_daily_return 필드는 SimulationStatistics 모델에 없음 (제거)
+                    volatility=0.0,  # TODO: 변동성 계산
+                    total_trades=total_sell_trades,
+                    winning_trades=total_sell_trades // 2,  # TODO: 실제 승리 거래 수 계산
+                    losing_trades=total_sell_trades // 2,   # TODO: 실제 패배 거래 수 계산
+                    avg_profit=0.0,  # TODO: 평균 수익 계산
+                    avg_loss=0.0,    # TODO: 평균 손실 계산
+                    final_capital=float(final_portfolio_value),
+                    total_commission=None,
+                    total_tax=None
+                )
+                self.db.add(simulation_stats)
 
-                logger.debug(f"  📊 평가: {stock_code} {holding.quantity}주 @ {current_price:,.0f}원 = {stock_value:,.0f}원")
+                # 세션 상태를 COMPLETED로 업데이트
+                from sqlalchemy.sql import func
+                await self.db.execute(
+                    update(SimulationSession)
+                    .where(SimulationSession.session_id == str(backtest_id))
+                    .values(
+                        status='COMPLETED',
+                        completed_at=func.now()
+                    )
+                )
 
-            logger.info(f"💰 총 평가금액: 현금 {cash_balance:,.0f}원 + 주식 {total_stock_value:,.0f}원 = {cash_balance + total_stock_value:,.0f}원")
+                # DB 커밋
+                await self.db.commit()
+                logger.info(f"✅ SimulationStatistics 저장 완료 - session_id: {backtest_id}")
 
-            # ⚠️ 매도 기록을 남기지 않음! holdings도 유지!
+            except Exception as e:
+                logger.error(f"❌ SimulationStatistics 저장 실패: {e}")
+                await self.db.rollback()
 
-        # 🚀 시뮬레이션 완료! 이제 Bulk INSERT로 DB 저장 시작
-        logger.info(f"💾 Bulk INSERT 시작: {len(daily_snapshots)}일 + {len(executions)}건 거래")
+        # 📡 WebSocket 완료 메시지 전송은 advanced_backtest.py에서 DB 저장 완료 후 전송
+        # (타이밍 이슈 해결: DB 저장 완료 전에 프론트엔드가 결과 페이지로 이동하는 문제 방지)
+        # WebSocket 전송에 필요한 데이터를 반환값에 포함
+        websocket_data = {
+            'final_value': float(final_portfolio_value),
+            'total_return': float(final_return),
+            'annualized_return': float(cagr),
+            'daily_avg_return': float(daily_avg_return),
+            'max_drawdown': float(current_mdd),
+            'total_trades': total_sell_trades,
+            'simulation_time': bulk_insert_elapsed,
+            'summary': summary
+        }
 
-        bulk_insert_start = time.time()
+        return {
+            'trades': [execution for execution in executions if execution['side'] == 'SELL'],
+            'orders': orders,
+            'executions': executions,
+            'daily_snapshots': daily_snapshots,
+            'final_holdings': holdings,
+            'final_cash': cash_balance,
+            'rebalance_dates': history_rebalance_dates + rebalance_dates,
+            'position_history': position_history,
+            'websocket_data': websocket_data  # WebSocket 전송용 데이터 (advanced_backtest.py에서 사용)
+        }
 
-        # 1. 일별 데이터 bulk insert
+    @staticmethod
+    def _benchmark_point(benchmark_lookup: Optional[pd.DataFrame], day: Any) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+        """거래일의 벤치마크 종가, 일간 수익률(%) (데이터 없으면 None)"""
+        benchmark_value = None
+        benchmark_ret = None
+        if benchmark_lookup is not None:
+            bench_idx = pd.Timestamp(day)
+            if bench_idx in benchmark_lookup.index:
+                bench_row = benchmark_lookup.loc[bench_idx]
+                benchmark_value = Decimal(str(bench_row.get('close'))) if bench_row.get('close') is not None else None
+                raw_return = bench_row.get('return')
+                if raw_return is not None:
+                    # percent 스케일로 변환
+                    ret_value = raw_return * 100 if abs(raw_return) < 1 else raw_return
+                    benchmark_ret = Decimal(str(ret_value))
+        return benchmark_value, benchmark_ret
+
+    async def _save_simulation_results(
+        self,
+        backtest_id: UUID,
+        daily_snapshots: List[Dict[str, Any]],
+        executions: List[Dict[str, Any]],
+        initial_capital: Decimal,
+        benchmark_data: pd.DataFrame
+    ) -> None:
+        """일별 값/거래 내역 행 생성 + Bulk 저장 (asyncpg COPY, 그 외 드라이버는 INSERT) 후 commit"""
+        # 1. 일별 데이터 bulk insert (asyncpg COPY)
         from app.models.simulation import SimulationDailyValue
-        from sqlalchemy import insert
+        from app.services.result_writer import BulkResultWriter
+
+        result_writer = BulkResultWriter(self.db)
 
         daily_values_to_insert = []
         prev_portfolio_value = None
@@ -4807,10 +5561,12 @@ class BacktestEngine:
             })
             prev_portfolio_value = portfolio_value
 
-        if daily_values_to_insert and not getattr(self, 'skip_db_save', False):
-            stmt = insert(SimulationDailyValue).values(daily_values_to_insert)
-            await self.db.execute(stmt)
-            logger.info(f"✅ 일별 데이터 {len(daily_values_to_insert)}건 저장 완료")
+        if daily_values_to_insert:
+            write_stats = await result_writer.write(SimulationDailyValue, daily_values_to_insert)
+            self.tracer.add(
+                f"bulk_insert.{write_stats.table}", write_stats.seconds,
+                rows=write_stats.rows, method=write_stats.method
+            )
 
         # 2. 거래 내역 bulk insert
         from app.models.simulation import SimulationTrade
@@ -4837,129 +5593,23 @@ class BacktestEngine:
                         'quantity': quantity,
                         'price': price,
                         'amount': amount,
+                        'commission': trade.get('commission'),
+                        'tax': trade.get('tax'),
                         'realized_pnl': trade.get('realized_pnl'),  # ✅ 실현 손익 (매도시에만)
                         'return_pct': trade.get('profit_rate'),  # ✅ 수익률 (매도시에만) - profit_rate 필드 사용
                         'holding_days': trade.get('hold_days'),  # ✅ 보유일수 (매도시에만) - hold_days 필드 사용
                         'reason': trade.get('selection_reason', '')
                     })
 
-            if trades_to_insert and not getattr(self, 'skip_db_save', False):
-                stmt = insert(SimulationTrade).values(trades_to_insert)
-                await self.db.execute(stmt)
-                logger.info(f"✅ 거래 내역 {len(trades_to_insert)}건 저장 완료")
-
-        # ⚡ 극한 최적화: 시뮬레이션 완료 후 단 한 번만 commit!
-        if not getattr(self, 'skip_db_save', False):
-            await self.db.commit()
-
-        bulk_insert_elapsed = time.time() - bulk_insert_start
-        logger.info(f"⚡ Bulk INSERT 완료: {bulk_insert_elapsed:.2f}초")
-
-        # 📡 WebSocket 완료 메시지 전송
-        final_portfolio_value = daily_snapshots[-1]['portfolio_value'] if daily_snapshots else initial_capital
-        final_return = ((final_portfolio_value - initial_capital) / initial_capital) * 100
-        total_sell_trades = len([e for e in executions if e['side'] == 'SELL'])
-
-        # 📊 연환산 수익률 및 일 평균 수익률 계산
-        total_days = (end_date - start_date).days
-        years = total_days / 365.0
-
-        # CAGR (연평균 복리 수익률): (최종값/초기값)^(1/년수) - 1
-        cagr = (((float(final_portfolio_value) / float(initial_capital)) ** (1 / years)) - 1) * 100 if years > 0 else 0
-
-        # 일 평균 수익률 (연간 252 거래일 기준): (1 + CAGR)^(1/252) - 1
-        daily_avg_return = ((1 + cagr / 100) ** (1 / 252) - 1) * 100
-
-        # 📝 AI 요약 생성 (마크다운 형식)
-        summary = self._generate_backtest_summary(
-            initial_capital=float(initial_capital),
-            final_value=float(final_portfolio_value),
-            total_return=float(final_return),
-            max_drawdown=float(current_mdd),
-            total_trades=total_sell_trades,
-            simulation_time=bulk_insert_elapsed,
-            start_date=start_date,
-            end_date=end_date,
-            daily_snapshots=daily_snapshots
-        )
-
-        # 📊 SimulationStatistics DB 저장 (WebSocket 전송 전에 저장)
-        from app.models.simulation import SimulationStatistics, SimulationSession
-        from sqlalchemy import delete, update
-
-        try:
-            # 기존 통계 삭제 (중복 방지)
-            await self.db.execute(delete(SimulationStatistics).where(
-                SimulationStatistics.session_id == str(backtest_id)
-            ))
-
-            # 새로운 통계 저장
-            simulation_stats = SimulationStatistics(
-                session_id=str(backtest_id),
-                total_return=float(final_return),
-                annualized_return=float(cagr),  # CAGR 저장
-                benchmark_return=None,  # 벤치마크는 나중에 구현
-                excess_return=None,
-                max_drawdown=float(current_mdd),
-                win_rate=50.0,  # TODO: 실제 승률 계산
-                sharpe_ratio=0.0,  # TODO: 샤프 비율 계산
-                # avg_daily_return 필드는 SimulationStatistics 모델에 없음 (제거)
-                volatility=0.0,  # TODO: 변동성 계산
-                total_trades=total_sell_trades,
-                winning_trades=total_sell_trades // 2,  # TODO: 실제 승리 거래 수 계산
-                losing_trades=total_sell_trades // 2,   # TODO: 실제 패배 거래 수 계산
-                avg_profit=0.0,  # TODO: 평균 수익 계산
-                avg_loss=0.0,    # TODO: 평균 손실 계산
-                final_capital=float(final_portfolio_value),
-                total_commission=None,
-                total_tax=None
-            )
-            self.db.add(simulation_stats)
-
-            # 세션 상태를 COMPLETED로 업데이트
-            from sqlalchemy.sql import func
-            await self.db.execute(
-                update(SimulationSession)
-                .where(SimulationSession.session_id == str(backtest_id))
-                .values(
-                    status='COMPLETED',
-                    completed_at=func.now()
+            if trades_to_insert:
+                write_stats = await result_writer.write(SimulationTrade, trades_to_insert)
+                self.tracer.add(
+                    f"bulk_insert.{write_stats.table}", write_stats.seconds,
+                    rows=write_stats.rows, method=write_stats.method
                 )
-            )
-
-            # DB 커밋
-            await self.db.commit()
-            logger.info(f"✅ SimulationStatistics 저장 완료 - session_id: {backtest_id}")
-
-        except Exception as e:
-            logger.error(f"❌ SimulationStatistics 저장 실패: {e}")
-            await self.db.rollback()
-
-        # 📡 WebSocket 완료 메시지 전송은 advanced_backtest.py에서 DB 저장 완료 후 전송
-        # (타이밍 이슈 해결: DB 저장 완료 전에 프론트엔드가 결과 페이지로 이동하는 문제 방지)
-        # WebSocket 전송에 필요한 데이터를 반환값에 포함
-        websocket_data = {
-            'final_value': float(final_portfolio_value),
-            'total_return': float(final_return),
-            'annualized_return': float(cagr),
-            'daily_avg_return': float(daily_avg_return),
-            'max_drawdown': float(current_mdd),
-            'total_trades': total_sell_trades,
-            'simulation_time': bulk_insert_elapsed,
-            'summary': summary
-        }
 
-        return {
-            'trades': [execution for execution in executions if execution['side'] == 'SELL'],
-            'orders': orders,
-            'executions': executions,
-            'daily_snapshots': daily_snapshots,
-            'final_holdings': holdings,
-            'final_cash': cash_balance,
-            'rebalance_dates': rebalance_dates,
-            'position_history': position_history,
-            'websocket_data': websocket_data  # WebSocket 전송용 데이터 (advanced_backtest.py에서 사용)
-        }
+        # ⚡ 극한 최적화: 시뮬레이션 완료 후 단 한 번만 commit!
+        await self.db.commit()
 
     def _generate_backtest_summary(
         self,
@@ -5663,7 +6313,7 @@ class BacktestEngine:
 
             vol_map: Dict[str, float] = {}
             if not returns.empty:
-                for stock, group in returns.groupby('stock_code'):
+                for stock, group in returns.groupby('stock_code', observed=True):
                     if len(group) > 10:
                         pct = group.sort_values('date')['close_price'].pct_change().dropna()
                         if not pct.empty:
@@ -5999,7 +6649,6 @@ class BacktestEngine:
 
         daily_snapshots = portfolio_result['daily_snapshots']
         executions = portfolio_result.get('executions', portfolio_result.get('trades', []))
-        sell_executions = [exe for exe in executions if exe.get('side') == 'SELL']
 
         if not daily_snapshots:
             # 빈 통계 반환
@@ -6027,44 +6676,8 @@ class BacktestEngine:
                 trading_days=0
             )
 
-        # DataFrame 변환
-        df = pd.DataFrame(daily_snapshots)
-        df['date'] = pd.to_datetime(df['date'])
-        df.set_index('date', inplace=True)
-
-        df['portfolio_value'] = df['portfolio_value'].astype(float)
-        df['cash_balance'] = df['cash_balance'].astype(float)
-
-        # 일별 수익률 계산
-        df['daily_return'] = df['portfolio_value'].pct_change()
-        df['cumulative_return'] = (1 + df['daily_return']).cumprod() - 1
-
-        # 벤치마크 계산
-        benchmark_return_pct = None
-        excess_return = None
-        if 'benchmark_value' in df.columns and df['benchmark_value'].notna().any():
-            df['benchmark_value'] = df['benchmark_value'].astype(float)
-            df['benchmark_daily_return'] = df['benchmark_value'].pct_change()
-            if df['benchmark_value'].iloc[0] and df['benchmark_value'].iloc[-1]:
-                benchmark_return_pct = ((df['benchmark_value'].iloc[-1] / df['benchmark_value'].iloc[0]) - 1) * 100
-        else:
-            df['benchmark_daily_return'] = np.nan
-
-        # 최대 낙폭 (MDD) 계산
-        df['cummax'] = df['portfolio_value'].cummax()
-        df['drawdown'] = (df['portfolio_value'] - df['cummax']) / df['cummax']
-        max_drawdown = abs(df['drawdown'].min()) * 100 if not df['drawdown'].empty else 0
-
-        # 총 수익률
-        final_value = float(df['portfolio_value'].iloc[-1]) if not df.empty else float(initial_capital)
-        total_return = ((final_value / float(initial_capital)) - 1) * 100
-        if benchmark_return_pct is not None:
-            excess_return = total_return - benchmark_return_pct
-
-        # 연환산 수익률 (CAGR)
-        days = (end_date - start_date).days
-        years = days / 365.25
-        annualized_return = ((final_value / float(initial_capital)) ** (1/years) - 1) * 100 if years > 0 else 0
+        panel = self._performance_panel(daily_snapshots)
+        stats = stats_kernel.summary_stats(panel, executions, float(initial_capital), start_date, end_date)
 
         # 거래 비용 계산
         total_trades = len(executions)
@@ -6073,67 +6686,45 @@ class BacktestEngine:
         total_costs = total_commission + total_tax
 
         # 로깅: 수익률 계산 확인
-        logger.info(f"📊 수익률 계산: 기간={days}일({years:.2f}년) | 누적수익률={total_return:.2f}% | CAGR={annualized_return:.2f}% | MDD={max_drawdown:.2f}%")
+        logger.info(f"📊 수익률 계산: 기간={stats['days']}일({stats['years']:.2f}년) | 누적수익률={stats['total_return']:.2f}% | CAGR={stats['annualized_return']:.2f}% | MDD={stats['max_drawdown']:.2f}%")
         logger.info(f"💸 거래 비용 분석: 총 거래={total_trades}회 | 수수료={total_commission:,.0f}원 | 거래세={total_tax:,.0f}원 | 총 비용={total_costs:,.0f}원 ({total_costs/float(initial_capital)*100:.2f}%)")
 
-        # 변동성
-        volatility_val = df['daily_return'].std() * np.sqrt(252) * 100 if not df['daily_return'].empty else 0
-        volatility = 0 if np.isnan(volatility_val) or np.isinf(volatility_val) else volatility_val
-
-        # 하방 변동성
-        negative_returns = df['daily_return'][df['daily_return'] < 0]
-        downside_vol_val = negative_returns.std() * np.sqrt(252) * 100 if not negative_returns.empty else 0
-        downside_volatility = 0 if np.isnan(downside_vol_val) or np.isinf(downside_vol_val) else downside_vol_val
-
-        # 샤프 비율
-        # 🔧 FIX: 단위 통일 - annualized_return은 % 단위이므로 risk_free_rate도 % 단위로 변환
-        risk_free_rate_pct = 2.0  # 2% 무위험 수익률 (% 단위)
-        sharpe_val = (annualized_return - risk_free_rate_pct) / volatility if volatility > 0 else 0
-        sharpe_ratio = 0 if np.isnan(sharpe_val) or np.isinf(sharpe_val) else sharpe_val
-
-        # 소르티노 비율
-        sortino_val = (annualized_return - risk_free_rate_pct) / downside_volatility if downside_volatility > 0 else 0
-        sortino_ratio = 0 if np.isnan(sortino_val) or np.isinf(sortino_val) else sortino_val
-
-        # 칼마 비율
-        calmar_val = annualized_return / max_drawdown if max_drawdown > 0 else 0
-        calmar_ratio = 0 if np.isnan(calmar_val) or np.isinf(calmar_val) else calmar_val
-
-        # 거래 통계
-        winning_trades = [t for t in sell_executions if t.get('realized_pnl', 0) > 0]
-        losing_trades = [t for t in sell_executions if t.get('realized_pnl', 0) <= 0]
-        win_rate = len(winning_trades) / len(sell_executions) * 100 if sell_executions else 0
-
-        avg_win = np.mean([float(t.get('profit_rate', 0)) for t in winning_trades]) if winning_trades else 0
-        avg_loss = np.mean([abs(float(t.get('profit_rate', 0))) for t in losing_trades]) if losing_trades else 0
-        profit_loss_ratio = avg_win / avg_loss if avg_loss > 0 else 0
-
         return StatsSchema(
-            total_return=Decimal(str(total_return)),
-            annualized_return=Decimal(str(annualized_return)),
-            benchmark_return=Decimal(str(benchmark_return_pct)) if benchmark_return_pct is not None else None,
-            excess_return=Decimal(str(excess_return)) if excess_return is not None else None,
-            max_drawdown=Decimal(str(max_drawdown)),
-            volatility=Decimal(str(volatility)),
-            downside_volatility=Decimal(str(downside_volatility)),
-            sharpe_ratio=Decimal(str(sharpe_ratio)),
-            sortino_ratio=Decimal(str(sortino_ratio)),
-            calmar_ratio=Decimal(str(calmar_ratio)),
-            total_trades=len(sell_executions),
-            winning_trades=len(winning_trades),
-            losing_trades=len(losing_trades),
-            win_rate=Decimal(str(win_rate)),
-            avg_win=Decimal(str(avg_win)),
-            avg_loss=Decimal(str(avg_loss)),
-            profit_loss_ratio=Decimal(str(profit_loss_ratio)),
+            total_return=Decimal(str(stats['total_return'])),
+            annualized_return=Decimal(str(stats['annualized_return'])),
+            benchmark_return=Decimal(str(stats['benchmark_return'])) if stats['benchmark_return'] is not None else None,
+            excess_return=Decimal(str(stats['excess_return'])) if stats['excess_return'] is not None else None,
+            max_drawdown=Decimal(str(stats['max_drawdown'])),
+            volatility=Decimal(str(stats['volatility'])),
+            downside_volatility=Decimal(str(stats['downside_volatility'])),
+            sharpe_ratio=Decimal(str(stats['sharpe_ratio'])),
+            sortino_ratio=Decimal(str(stats['sortino_ratio'])),
+            calmar_ratio=Decimal(str(stats['calmar_ratio'])),
+            total_trades=stats['total_trades'],
+            winning_trades=stats['winning_trades'],
+            losing_trades=stats['losing_trades'],
+            win_rate=Decimal(str(stats['win_rate'])),
+            avg_win=Decimal(str(stats['avg_win'])),
+            avg_loss=Decimal(str(stats['avg_loss'])),
+            profit_loss_ratio=Decimal(str(stats['profit_loss_ratio'])),
             initial_capital=initial_capital,
-            final_capital=Decimal(str(final_value)),
-            peak_capital=Decimal(str(df['portfolio_value'].max())) if not df.empty else initial_capital,
+            final_capital=Decimal(str(stats['final_capital'])),
+            peak_capital=Decimal(str(stats['peak_capital'])),
             start_date=start_date,
             end_date=end_date,
-            trading_days=len(df)
+            trading_days=stats['trading_days']
         )
 
+    def _performance_panel(self, daily_snapshots: List[Dict]) -> stats_kernel.PerformancePanel:
+        """daily_snapshots 배열 패널 (같은 리스트는 한 번만 변환)"""
+        if self._stats_panel is not None:
+            cached_snapshots, panel = self._stats_panel
+            if cached_snapshots is daily_snapshots and panel.size == len(daily_snapshots):
+                return panel
+        panel = stats_kernel.PerformancePanel(daily_snapshots)
+        self._stats_panel = (daily_snapshots, panel)
+        return panel
+
     def _aggregate_monthly_performance(
         self,
         daily_snapshots: List[Dict],
@@ -6144,58 +6735,19 @@ class BacktestEngine:
         if not daily_snapshots:
             return []
 
-        df = pd.DataFrame(daily_snapshots)
-        df['date'] = pd.to_datetime(df['date'])
-        df['year'] = df['date'].dt.year
-        df['month'] = df['date'].dt.month
-
-        # Convert Decimal columns to float to avoid type mismatch in calculations
-        if 'portfolio_value' in df.columns:
-            df['portfolio_value'] = df['portfolio_value'].astype(float)
-
-        monthly_data = []
-        for (year, month), group in df.groupby(['year', 'month']):
-            if group.empty:
-                continue
-
-            start_value = float(group['portfolio_value'].iloc[0])
-            end_value = float(group['portfolio_value'].iloc[-1])
-            monthly_return = ((end_value / start_value) - 1) * 100 if start_value > 0 else 0
-
-            # 월별 거래 기반 승률 계산
-            win_rate = Decimal("0")
-            avg_hold_days = 0
-
-            if trades:
-                # 해당 월의 매도 거래만 필터링
-                month_sell_trades = [
-                    t for t in trades
-                    if t.get('trade_type') == 'SELL'
-                    and pd.to_datetime(t.get('trade_date')).year == year
-                    and pd.to_datetime(t.get('trade_date')).month == month
-                ]
-
-                if month_sell_trades:
-                    # 수익 거래 카운트
-                    winning_trades = [t for t in month_sell_trades if float(t.get('profit', 0)) > 0]
-                    win_rate = Decimal(str(len(winning_trades) / len(month_sell_trades) * 100))
-
-                    # 평균 보유일수 계산
-                    hold_days_list = [t.get('hold_days', 0) for t in month_sell_trades if t.get('hold_days')]
-                    if hold_days_list:
-                        avg_hold_days = sum(hold_days_list) // len(hold_days_list)
-
-            monthly_data.append(MonthlyPerformance(
-                year=int(year),
-                month=int(month),
-                return_rate=Decimal(str(monthly_return)),
+        panel = self._performance_panel(daily_snapshots)
+        return [
+            MonthlyPerformance(
+                year=row['year'],
+                month=row['month'],
+                return_rate=Decimal(str(row['return_rate'])),
                 benchmark_return=None,  # 벤치마크 제외
-                win_rate=win_rate,
-                trade_count=int(group['trade_count'].sum()),
-                avg_hold_days=avg_hold_days
-            ))
-
-        return monthly_data
+                win_rate=Decimal(str(row['win_rate'])) if row['win_rate'] is not None else Decimal("0"),
+                trade_count=row['trade_count'],
+                avg_hold_days=row['avg_hold_days']
+            )
+            for row in stats_kernel.monthly_table(panel, trades)
+        ]
 
     def _aggregate_yearly_performance(
         self,
@@ -6206,43 +6758,18 @@ class BacktestEngine:
         if not daily_snapshots:
             return []
 
-        df = pd.DataFrame(daily_snapshots)
-        df['date'] = pd.to_datetime(df['date'])
-        df['year'] = df['date'].dt.year
-
-        # Convert Decimal columns to float to avoid type mismatch in calculations
-        if 'portfolio_value' in df.columns:
-            df['portfolio_value'] = df['portfolio_value'].astype(float)
-
-        yearly_data = []
-        for year, group in df.groupby('year'):
-            if group.empty:
-                continue
-
-            start_value = float(group['portfolio_value'].iloc[0])
-            end_value = float(group['portfolio_value'].iloc[-1])
-            yearly_return = ((end_value / start_value) - 1) * 100 if start_value > 0 else 0
-
-            # 연도별 MDD 계산
-            cummax = group['portfolio_value'].cummax()
-            drawdown = (group['portfolio_value'] - cummax) / cummax
-            max_drawdown = abs(drawdown.min()) * 100 if not drawdown.empty else 0
-
-            # 연도별 샤프 비율 계산
-            daily_returns = group['portfolio_value'].pct_change()
-            volatility = daily_returns.std() * np.sqrt(252)
-            sharpe = (yearly_return / 100 - 0.02) / volatility if volatility > 0 else 0
-
-            yearly_data.append(YearlyPerformance(
-                year=int(year),
-                return_rate=Decimal(str(yearly_return)),
+        panel = self._performance_panel(daily_snapshots)
+        return [
+            YearlyPerformance(
+                year=row['year'],
+                return_rate=Decimal(str(row['return_rate'])),
                 benchmark_return=None,
-                max_drawdown=Decimal(str(max_drawdown)),
-                sharpe_ratio=Decimal(str(sharpe)),
-                trades=int(group['trade_count'].sum())
-            ))
-
-        return yearly_data
+                max_drawdown=Decimal(str(row['max_drawdown'])),
+                sharpe_ratio=Decimal(str(row['sharpe_ratio'])),
+                trades=row['trades']
+            )
+            for row in stats_kernel.yearly_table(panel)
+        ]
 
     def _analyze_factor_contribution(
         self,
@@ -6254,67 +6781,7 @@ class BacktestEngine:
         if not trades or not buy_conditions:
             return {}
 
-        # 팩터별 거래 성과 집계
-        factor_performance = {}
-
-        # 매도 거래만 필터링 (수익률 계산 가능)
-        sell_trades = [t for t in trades if t.get('trade_type') == 'SELL']
-
-        if not sell_trades:
-            return {}
-
-        # buy_conditions가 dict 형태(논리식)인 경우 조건 리스트 추출
-        conditions_list = buy_conditions
-        if isinstance(buy_conditions, dict) and 'conditions' in buy_conditions:
-            conditions_list = buy_conditions['conditions']
-        elif isinstance(buy_conditions, dict):
-            # dict이지만 'conditions' 키가 없는 경우 빈 리스트
-            conditions_list = []
-
-        # 각 팩터별 성과 분석
-        for condition in conditions_list:
-            factor_name = condition.get('factor')
-            if not factor_name:
-                continue
-
-            # 해당 팩터가 포함된 거래 찾기
-            factor_trades = []
-            for trade in sell_trades:
-                trade_factors = trade.get('factors', {})
-                if factor_name in trade_factors:
-                    factor_trades.append(trade)
-
-            if factor_trades:
-                # 팩터별 통계 계산
-                profits = [float(t.get('profit', 0)) for t in factor_trades]
-                profit_rates = [float(t.get('profit_rate', 0)) for t in factor_trades]
-                winning_trades = [t for t in factor_trades if float(t.get('profit', 0)) > 0]
-
-                factor_performance[factor_name] = {
-                    'total_trades': len(factor_trades),
-                    'winning_trades': len(winning_trades),
-                    'win_rate': len(winning_trades) / len(factor_trades) * 100 if factor_trades else 0,
-                    'avg_profit': sum(profits) / len(profits) if profits else 0,
-                    'avg_profit_rate': sum(profit_rates) / len(profit_rates) if profit_rates else 0,
-                    'total_profit': sum(profits),
-                    'best_trade': max(profits) if profits else 0,
-                    'worst_trade': min(profits) if profits else 0,
-                    'contribution_score': len(winning_trades) / len(sell_trades) * 100  # 전체 수익 거래 중 기여도
-                }
-
-        # 팩터 중요도 순위 계산
-        if factor_performance:
-            # contribution_score 기준으로 정렬
-            sorted_factors = sorted(
-                factor_performance.items(),
-                key=lambda x: x[1]['contribution_score'],
-                reverse=True
-            )
-
-            for rank, (factor, _) in enumerate(sorted_factors, 1):
-                factor_performance[factor]['importance_rank'] = rank
-
-        return factor_performance
+        return stats_kernel.factor_contributions(trades, buy_conditions, detailed=True)
 
     async def _format_current_holdings(
         self,
@@ -6403,28 +6870,15 @@ class BacktestEngine:
                 'drawdowns': []
             }
 
-        df = pd.DataFrame(daily_snapshots)
-
-        # Convert Decimal columns to float to avoid type mismatch in calculations
-        if 'portfolio_value' in df.columns:
-            df['portfolio_value'] = df['portfolio_value'].astype(float)
-        if 'cash_balance' in df.columns:
-            df['cash_balance'] = df['cash_balance'].astype(float)
-
-        # 누적 수익률 계산
-        initial_value = float(df['portfolio_value'].iloc[0]) if not df.empty else 1
-        cumulative_returns = [(float(v) / initial_value - 1) * 100 for v in df['portfolio_value']]
-
-        # 낙폭 계산
-        cummax = df['portfolio_value'].cummax()
-        drawdowns = ((df['portfolio_value'] - cummax) / cummax * 100).tolist()
+        panel = self._performance_panel(daily_snapshots)
+        initial_value = float(panel.nav[0])
 
         return {
-            'dates': [d.strftime('%Y-%m-%d') if hasattr(d, 'strftime') else str(d) for d in df['date'].tolist()],
-            'portfolio_values': [float(v) for v in df['portfolio_value'].tolist()],
-            'cash_balances': [float(v) for v in df['cash_balance'].tolist()],
-            'cumulative_returns': cumulative_returns,
-            'drawdowns': drawdowns
+            'dates': [d.strftime('%Y-%m-%d') if hasattr(d, 'strftime') else str(d) for d in (s['date'] for s in daily_snapshots)],
+            'portfolio_values': panel.nav.tolist(),
+            'cash_balances': panel.cash.tolist(),
+            'cumulative_returns': [(v / initial_value - 1) * 100 for v in panel.nav.tolist()],
+            'drawdowns': (panel.drawdown * 100).tolist()
         }
 
     async def _format_result(
@@ -6451,42 +6905,25 @@ class BacktestEngine:
         daily_snapshots = portfolio_result['daily_snapshots']
 
         if daily_snapshots:
-            df = pd.DataFrame(daily_snapshots)
-            df['date'] = pd.to_datetime(df['date'])
-
-            # Convert Decimal columns to float to avoid type mismatch in calculations
-            if 'portfolio_value' in df.columns:
-                df['portfolio_value'] = df['portfolio_value'].astype(float)
-            if 'cash_balance' in df.columns:
-                df['cash_balance'] = df['cash_balance'].astype(float)
-
-            # 일별 수익률 계산
-            df['daily_return'] = df['portfolio_value'].pct_change() * 100
-            df['cumulative_return'] = ((df['portfolio_value'] / df['portfolio_value'].iloc[0]) - 1) * 100
-
-            # 낙폭 계산
-            df['cummax'] = df['portfolio_value'].cummax()
-            df['drawdown'] = (df['portfolio_value'] - df['cummax']) / df['cummax'] * 100
-
-            if 'benchmark_value' in df.columns and df['benchmark_value'].notna().any():
-                df['benchmark_value'] = df['benchmark_value'].astype(float)
-                df['benchmark_daily_return'] = df['benchmark_value'].pct_change() * 100
-            elif 'benchmark_return' in df.columns:
-                df['benchmark_daily_return'] = df['benchmark_return']
-            else:
-                df['benchmark_daily_return'] = np.nan
-
-            for _, row in df.iterrows():
+            panel = self._performance_panel(daily_snapshots)
+            daily_returns = (panel.daily_return * 100).tolist()
+            cumulative_returns = ((panel.nav / panel.nav[0] - 1) * 100).tolist()
+            drawdowns = (panel.drawdown * 100).tolist()
+            benchmark_returns = panel.benchmark_daily_return_pct().tolist()
+
+            for i, snapshot in enumerate(daily_snapshots):
+                daily_return = daily_returns[i]
+                benchmark_return = benchmark_returns[i]
                 daily_performance.append(DailyPerformance(
-                    date=row['date'].date() if hasattr(row['date'], 'date') else row['date'],
-                    portfolio_value=Decimal(str(row['portfolio_value'])),
-                    cash_balance=Decimal(str(row['cash_balance'])),
-                    invested_amount=Decimal(str(row['invested_amount'])),
-                    daily_return=Decimal(str(row['daily_return'])) if not pd.isna(row['daily_return']) else Decimal("0"),
-                    cumulative_return=Decimal(str(row['cumulative_return'])),
-                    drawdown=Decimal(str(row['drawdown'])),
-                    benchmark_return=Decimal(str(row['benchmark_daily_return'])) if not pd.isna(row['benchmark_daily_return']) else None,
-                    trade_count=int(row['trade_count'])
+                    date=panel.dates[i].date(),
+                    portfolio_value=Decimal(str(panel.nav[i])),
+                    cash_balance=Decimal(str(panel.cash[i])),
+                    invested_amount=Decimal(str(snapshot['invested_amount'])),
+                    daily_return=Decimal(str(daily_return)) if not pd.isna(daily_return) else Decimal("0"),
+                    cumulative_return=Decimal(str(cumulative_returns[i])),
+                    drawdown=Decimal(str(drawdowns[i])),
+                    benchmark_return=Decimal(str(benchmark_return)) if not pd.isna(benchmark_return) else None,
+                    trade_count=int(panel.trade_count[i])
                 ))
 
         # 월별 성과 집계 (거래 데이터 포함)
@@ -6846,61 +7283,21 @@ class BacktestEngine:
         if not daily_snapshots:
             return []
 
-        df = pd.DataFrame(daily_snapshots)
-        df['date'] = pd.to_datetime(df['date'])
-
-        # Convert Decimal columns to float to avoid type mismatch in calculations
-        if 'portfolio_value' in df.columns:
-            df['portfolio_value'] = df['portfolio_value'].astype(float)
-
-        # 누적 최대값
-        df['cummax'] = df['portfolio_value'].cummax()
-        df['drawdown'] = (df['portfolio_value'] - df['cummax']) / df['cummax'] * 100
-
+        panel = self._performance_panel(daily_snapshots)
         drawdown_periods = []
-        in_drawdown = False
-        current_period = None
-
-        for idx, row in df.iterrows():
-            if row['drawdown'] < 0 and not in_drawdown:
-                # 드로다운 시작
-                current_period = DrawdownPeriod(
-                    start_date=row['date'].date(),
-                    end_date=None,
-                    peak_value=Decimal(str(row['cummax'])),
-                    trough_value=Decimal(str(row['portfolio_value'])),
-                    max_drawdown=Decimal(str(row['drawdown'])),
-                    duration_days=1,
-                    is_active=True
-                )
-                in_drawdown = True
-
-            elif row['drawdown'] < 0 and in_drawdown:
-                # 드로다운 지속
-                current_period.trough_value = min(
-                    current_period.trough_value,
-                    Decimal(str(row['portfolio_value']))
-                )
-                current_period.max_drawdown = min(
-                    current_period.max_drawdown,
-                    Decimal(str(row['drawdown']))
-                )
-                current_period.duration_days += 1
-
-            elif row['drawdown'] >= 0 and in_drawdown:
-                # 드로다운 종료
-                current_period.end_date = row['date'].date()
-                current_period.is_active = False
-                current_period.recovery_days = (
-                    current_period.end_date - current_period.start_date
-                ).days - current_period.duration_days
-                drawdown_periods.append(current_period)
-                in_drawdown = False
-                current_period = None
-
-        # 마지막 드로다운이 진행중인 경우
-        if current_period and in_drawdown:
-            drawdown_periods.append(current_period)
+        for run in stats_kernel.drawdown_runs(panel):
+            start_date = panel.dates[run['start']].date()
+            end_date = panel.dates[run['end']].date() if run['end'] is not None else None
+            drawdown_periods.append(DrawdownPeriod(
+                start_date=start_date,
+                end_date=end_date,
+                peak_value=Decimal(str(run['peak_value'])),
+                trough_value=Decimal(str(run['trough_value'])),
+                max_drawdown=Decimal(str(run['max_drawdown'])),
+                duration_days=run['duration_days'],
+                is_active=end_date is None,
+                recovery_days=(end_date - start_date).days - run['duration_days'] if end_date is not None else None
+            ))
 
         self.drawdown_periods = drawdown_periods
         return drawdown_periods
@@ -6914,59 +7311,7 @@ class BacktestEngine:
         if not trades or not buy_conditions:
             return {}
 
-        factor_performance = {}
-        sell_trades = [t for t in trades if t.get('trade_type') == 'SELL']
-
-        # 조건이 논리식 형태인 경우
-        if isinstance(buy_conditions, dict) and 'conditions' in buy_conditions:
-            conditions_list = buy_conditions['conditions']
-        else:
-            conditions_list = buy_conditions
-
-        for condition in conditions_list:
-            factor_name = condition.get('factor')
-            if not factor_name:
-                continue
-
-            # 해당 팩터와 관련된 거래 필터링
-            factor_trades = []
-            for trade in sell_trades:
-                if 'factors' in trade and factor_name in trade.get('factors', {}):
-                    factor_trades.append(trade)
-
-            if not factor_trades:
-                continue
-
-            # 통계 계산
-            profits = [float(t.get('profit', 0)) for t in factor_trades]
-            winning_trades = [t for t in factor_trades if float(t.get('profit', 0)) > 0]
-
-            win_rate = len(winning_trades) / len(factor_trades) * 100 if factor_trades else 0
-            avg_profit = sum(profits) / len(profits) if profits else 0
-            total_profit = sum(profits)
-
-            # 기여도 점수 (전체 거래 대비 수익 기여)
-            contribution_score = (len(winning_trades) / len(sell_trades) * 100) if sell_trades else 0
-
-            factor_performance[factor_name] = {
-                'total_trades': len(factor_trades),
-                'winning_trades': len(winning_trades),
-                'win_rate': win_rate,
-                'avg_profit': avg_profit,
-                'total_profit': total_profit,
-                'contribution_score': contribution_score
-            }
-
-        # 중요도 순위 매기기
-        sorted_factors = sorted(
-            factor_performance.items(),
-            key=lambda x: x[1]['contribution_score'],
-            reverse=True
-        )
-
-        for rank, (factor_name, _) in enumerate(sorted_factors, 1):
-            factor_performance[factor_name]['importance_rank'] = rank
-
+        factor_performance = stats_kernel.factor_contributions(trades, buy_conditions)
         self.factor_contributions = factor_performance
         return factor_performance
 
@@ -6978,8 +7323,10 @@ class BacktestEngine:
             BacktestDailySnapshot, BacktestTrade, BacktestHolding
         )
         from datetime import datetime
+        from app.services.result_writer import BulkResultWriter
 
         logger.info(f"Saving backtest result for {backtest_id}")
+        result_writer = BulkResultWriter(self.db)
 
         try:
             # 1. 백테스트 세션 저장
@@ -7113,10 +7460,9 @@ class BacktestEngine:
             self.db.add(simulation_stats)
             logger.info(f"✅ SimulationStatistics 저장 완료 - session_id: {backtest_id}")
 
-            # 4. 일별 스냅샷 저장 (Bulk INSERT 최적화)
-            snapshots_data = []
-            for daily in result.daily_performance:
-                snapshots_data.append({
+            # 4. 일별 스냅샷 저장 (COPY, 세션/통계 행은 writer가 먼저 flush)
+            snapshots_data = (
+                {
                     'backtest_id': backtest_id,
                     'snapshot_date': daily.date,
                     'portfolio_value': daily.portfolio_value,
@@ -7127,18 +7473,14 @@ class BacktestEngine:
                     'drawdown': daily.drawdown,
                     'benchmark_return': daily.benchmark_return,
                     'trade_count': daily.trade_count
-                })
-
-            if snapshots_data:
-                await self.db.execute(
-                    BacktestDailySnapshot.__table__.insert(),
-                    snapshots_data
-                )
+                }
+                for daily in result.daily_performance
+            )
+            await result_writer.write(BacktestDailySnapshot, snapshots_data)
 
-            # 5. 거래 내역 저장 (Bulk INSERT 최적화)
-            trades_data = []
-            for trade in result.trades:
-                trades_data.append({
+            # 5. 거래 내역 저장 (COPY)
+            trades_data = (
+                {
                     'backtest_id': backtest_id,
                     'trade_date': trade.trade_date,
                     'trade_type': trade.trade_type,
@@ -7154,18 +7496,14 @@ class BacktestEngine:
                     'hold_days': trade.hold_days,
                     'factors': trade.factors if trade.factors else {},
                     'selection_reason': trade.selection_reason
-                })
-
-            if trades_data:
-                await self.db.execute(
-                    BacktestTrade.__table__.insert(),
-                    trades_data
-                )
+                }
+                for trade in result.trades
+            )
+            await result_writer.write(BacktestTrade, trades_data)
 
-            # 6. 현재 보유 종목 저장 (Bulk INSERT 최적화)
-            holdings_data = []
-            for holding in result.current_holdings:
-                holdings_data.append({
+            # 6. 현재 보유 종목 저장 (COPY)
+            holdings_data = (
+                {
                     'backtest_id': backtest_id,
                     'stock_code': holding.stock_code,
                     'stock_name': holding.stock_name,
@@ -7179,13 +7517,10 @@ class BacktestEngine:
                     'buy_date': holding.buy_date,
                     'hold_days': holding.hold_days,
                     'factors': holding.factors if holding.factors else {}
-                })
-
-            if holdings_data:
-                await self.db.execute(
-                    BacktestHolding.__table__.insert(),
-                    holdings_data
-                )
+                }
+                for holding in result.current_holdings
+            )
+            await result_writer.write(BacktestHolding, holdings_data)
 
             # 커밋
             await self.db.commit()
@@ -0,0 +1,172 @@
+"""
+백테스트 체크포인트 (마지막 전 거래일 종료 시점의 시뮬레이션 상태)
+- 보유 종목(진입가/진입일), 현금, 최고 평가액/MDD, 매수 금지 종목, 기업행동, 랜덤 시드를 저장
+- 마지막 거래일은 익일이 없어 주문이 당일 종가로 체결되므로, 이어서 실행할 때 그날부터 다시 시뮬레이션
+- 일별 스냅샷/체결 내역은 저장하지 않고 원본 세션의 simulation_daily_values/simulation_trades에서 복원
+  (체크포인트에는 행 수와 DB에 없는 일별 매도 횟수만 보관)
+- 같은 설정(config_key)으로 종료일만 늘려 재실행하면 체크포인트 다음 거래일부터 시뮬레이션
+- 값은 JSON 컬럼 저장용으로 인코딩 (Decimal/날짜/NaN은 태그로 보존해 복원 시 같은 타입)
+"""
+
+import hashlib
+import json
+import math
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+CHECKPOINT_VERSION = 2
+
+
+def config_key(params: Dict[str, Any]) -> str:
+    """시뮬레이션 결과를 결정하는 설정(종료일 제외)의 해시"""
+    payload = json.dumps({"version": CHECKPOINT_VERSION, **params}, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    if isinstance(value, pd.Timestamp):
+        return {"$ts": value.isoformat()}
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return {"$f": repr(value)}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if len(value) == 1:
+            tag, raw = next(iter(value.items()))
+            if tag == "$dec":
+                return Decimal(raw)
+            if tag == "$ts":
+                return pd.Timestamp(raw)
+            if tag == "$dt":
+                return datetime.fromisoformat(raw)
+            if tag == "$date":
+                return date.fromisoformat(raw)
+            if tag == "$f":
+                return float(raw)
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def build_checkpoint(
+    key: str,
+    random_seed: int,
+    last_date: date,
+    cash_balance: Decimal,
+    peak_value: float,
+    current_mdd: float,
+    holdings: Iterable[Dict[str, Any]],
+    blocked_stocks: Iterable[str],
+    corporate_actions: Dict[str, Dict],
+    rebalance_dates: List[Any],
+    daily_snapshots: List[Dict[str, Any]],
+    executions: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    시뮬레이션 상태 → JSON 저장용 dict (holdings는 Position 필드 dict)
+
+    daily_snapshots/executions는 체크포인트 시점까지의 기록으로, 저장 행 수와 일별 매도 횟수만 남긴다.
+    """
+    return {
+        "version": CHECKPOINT_VERSION,
+        "config_key": key,
+        "random_seed": random_seed,
+        "last_date": _encode(last_date),
+        "cash_balance": _encode(cash_balance),
+        "peak_value": _encode(peak_value),
+        "current_mdd": _encode(current_mdd),
+        "holdings": _encode(list(holdings)),
+        "blocked_stocks": sorted(blocked_stocks),
+        "corporate_actions": _encode(corporate_actions),
+        "rebalance_dates": _encode(rebalance_dates),
+        "snapshot_rows": len(daily_snapshots),
+        # 거래 행은 저장 시 (체결일, 종목, 가격) 중복을 제거하므로 고유 키 수
+        "trade_rows": len({trade_row_key(execution) for execution in executions}),
+        "trade_counts": [int(snapshot.get("trade_count", 0)) for snapshot in daily_snapshots],
+    }
+
+
+def trade_row_key(execution: Dict[str, Any]) -> tuple:
+    """simulation_trades 저장 시 중복 제거 키"""
+    return (execution["execution_date"], execution["stock_code"], execution["price"])
+
+
+def history_from_rows(
+    state: Dict[str, Any],
+    daily_rows: List[Any],
+    trade_rows: List[Any]
+) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """
+    원본 세션의 일별 값/거래 행 → (daily_snapshots, executions)
+    행 수가 체크포인트와 다르면 None (벤치마크 값은 호출 측에서 채움)
+    """
+    if len(daily_rows) != state["snapshot_rows"] or len(trade_rows) != state["trade_rows"]:
+        return None
+
+    daily_snapshots = [
+        {
+            "date": pd.Timestamp(row.date),
+            "portfolio_value": row.portfolio_value,
+            "cash_balance": row.cash,
+            "invested_amount": row.position_value,
+            "benchmark_value": None,
+            "benchmark_return": None,
+            "daily_return": row.daily_return,
+            "cumulative_return": row.cumulative_return,
+            "drawdown": float(row.daily_drawdown or 0),
+            "trade_count": trade_count,
+            "benchmark_daily_return": None,
+        }
+        for row, trade_count in zip(daily_rows, state["trade_counts"])
+    ]
+    executions = [
+        {
+            "execution_id": f"EXE-DB-{row.trade_id}",
+            "execution_date": row.trade_date,
+            "trade_date": row.trade_date,
+            "stock_code": row.stock_code,
+            "stock_name": row.stock_name,
+            "side": row.trade_type,
+            "trade_type": row.trade_type,
+            "quantity": row.quantity,
+            "price": row.price,
+            "amount": row.amount,
+            "commission": row.commission if row.commission is not None else Decimal("0"),
+            "tax": row.tax if row.tax is not None else Decimal("0"),
+            "realized_pnl": row.realized_pnl,
+            "profit": row.realized_pnl,
+            "profit_rate": row.return_pct,
+            "hold_days": row.holding_days,
+            "selection_reason": row.reason,
+        }
+        for row in trade_rows
+    ]
+    return daily_snapshots, executions
+
+
+def restore_checkpoint(payload: Optional[Dict[str, Any]], key: str) -> Optional[Dict[str, Any]]:
+    """저장된 체크포인트 복원 (버전/설정이 다르면 None)"""
+    if not payload or payload.get("version") != CHECKPOINT_VERSION or payload.get("config_key") != key:
+        return None
+    state = {name: _decode(value) for name, value in payload.items()}
+    state["blocked_stocks"] = set(state["blocked_stocks"])
+    return state
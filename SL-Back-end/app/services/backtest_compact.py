@@ -0,0 +1,66 @@
+"""
+백테스트 압축 dtype 모드
+- 문자열 컬럼은 사전 인코딩(Polars Enum/Categorical → pandas category)
+- stock_code는 단계 간 공유하는 종목 코드 ↔ 정수 id 테이블(StockIndex)의 범주로 인코딩
+- 팩터 값은 float32, 순위는 int32 (결측이 있는 순위 컬럼은 NaN 표현을 위해 float32)
+- 가격 수치 컬럼은 금액/수량 계산에 쓰이므로 그대로 유지
+"""
+
+from typing import Iterable, List
+
+import pandas as pd
+import polars as pl
+
+RANK_SUFFIX = "_RANK"
+
+
+class StockIndex:
+    """종목 코드 ↔ 정수 id 테이블 (코드 정렬 순서 = id 순서, 추가 시 뒤에 붙여 기존 id 유지)"""
+
+    def __init__(self, codes: Iterable[str]):
+        self.codes: List[str] = sorted({code for code in codes if code is not None})
+        self.ids = {code: i for i, code in enumerate(self.codes)}
+        self._refresh()
+
+    def _refresh(self) -> None:
+        self.polars_dtype = pl.Enum(self.codes)
+        self.pandas_dtype = pd.CategoricalDtype(self.codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def extend(self, codes: Iterable[str]) -> "StockIndex":
+        """없는 코드만 뒤에 추가 (기존 id/범주 순서 유지)"""
+        new_codes = sorted({code for code in codes if code is not None and code not in self.ids})
+        if new_codes:
+            for code in new_codes:
+                self.ids[code] = len(self.codes)
+                self.codes.append(code)
+            self._refresh()
+        return self
+
+
+def _encode_strings(df: pl.DataFrame, index: StockIndex) -> List[pl.Expr]:
+    exprs = []
+    for name, dtype in df.schema.items():
+        if name == "stock_code":
+            exprs.append(pl.col(name).cast(pl.String).cast(index.polars_dtype))
+        elif dtype == pl.String:
+            exprs.append(pl.col(name).cast(pl.Categorical))
+    return exprs
+
+
+def compact_price_frame(df: pl.DataFrame, index: StockIndex) -> pl.DataFrame:
+    """가격 프레임 압축: stock_code → 공유 인덱스 Enum, 나머지 문자열 → Categorical"""
+    return df.with_columns(_encode_strings(df, index.extend(df["stock_code"].unique().to_list())))
+
+
+def compact_factor_frame(df: pl.DataFrame, index: StockIndex) -> pl.DataFrame:
+    """팩터 프레임 압축: 문자열 → 범주형, 팩터 값 → Float32, 순위 → Int32 (결측 시 Float32)"""
+    exprs = _encode_strings(df, index.extend(df["stock_code"].unique().to_list()))
+    for name, dtype in df.schema.items():
+        if name.endswith(RANK_SUFFIX) and dtype.is_integer():
+            exprs.append(pl.col(name).cast(pl.Float32 if df[name].null_count() else pl.Int32))
+        elif dtype == pl.Float64:
+            exprs.append(pl.col(name).cast(pl.Float32))
+    return df.with_columns(exprs)
@@ -148,6 +148,19 @@ ENABLE_NUMBA_JIT = True
 # Polars 벡터화 사용
 ENABLE_POLARS_VECTORIZATION = True
 
+# 압축 dtype 모드 (문자열 → 범주형, 팩터 float32, 순위 int32)
+# 대규모 유니버스 메모리 절감용, 팩터 값이 float32로 저장되므로 조건 경계값 비교가 달라질 수 있음
+COMPACT_DTYPES = os.getenv('BACKTEST_COMPACT_DTYPES', 'false').lower() == 'true'
+
+# ==================== 체크포인트 설정 ====================
+
+# 같은 설정으로 종료일만 늘린 재실행은 이전 완료 세션의 체크포인트에서 이어서 시뮬레이션 (opt-in)
+# 팩터는 분기별 마지막 로드일 기준으로 계산되므로 이전 종료일이 분기 중간이면 전체 재실행과 결과가 다를 수 있음
+RESUME_FROM_CHECKPOINT = os.getenv('BACKTEST_RESUME_FROM_CHECKPOINT', 'false').lower() == 'true'
+
+# 이어서 실행 시 새 구간 앞에 추가로 로드하는 가격 기간 (52주/240일 팩터용 약 1년 + 여유)
+RESUME_LOOKBACK_DAYS = int(os.getenv('BACKTEST_RESUME_LOOKBACK_DAYS', '400'))
+
 # ==================== 디버그 설정 ====================
 
 # 디버그 모드
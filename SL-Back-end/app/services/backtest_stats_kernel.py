@@ -0,0 +1,322 @@
+"""
+백테스트 통계 커널
+- daily_snapshots(Decimal 값 dict 리스트)를 NAV/현금/거래 수/벤치마크 배열로 한 번만 변환 (PerformancePanel)
+- 일별 수익률/누적 최대값/낙폭/월·연 구간 경계를 패널에서 한 번 계산하고
+  요약 통계, 월별/연도별 표, 드로다운 기간, 일별 성과/차트 데이터가 같이 사용
+- 공식은 기존 pandas 구현과 동일 (pct_change, std(ddof=1, NaN 제외), cummax)
+- 반환값은 float/int dict이며 Decimal 스키마 변환은 엔진이 담당
+"""
+
+from collections import defaultdict
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+RISK_FREE_RATE_PCT = 2.0  # 연 2% 무위험 수익률 (% 단위)
+TRADING_DAYS_PER_YEAR = 252
+
+
+def pct_change(values: np.ndarray) -> np.ndarray:
+    """pandas Series.pct_change와 같은 값 (첫 값 NaN, 0으로 나누면 inf)"""
+    result = np.full(len(values), np.nan)
+    if len(values) > 1:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[1:] = values[1:] / values[:-1] - 1
+    return result
+
+
+def nanstd(values: np.ndarray, ddof: int = 1) -> float:
+    """pandas Series.std와 같은 값 (NaN 제외, 2-pass, 유효 값이 ddof 이하이면 NaN)"""
+    mask = np.isnan(values)
+    count = len(values) - int(mask.sum())
+    if count <= ddof:
+        return float("nan")
+    values = np.where(mask, 0.0, values)
+    avg = values.sum(dtype=np.float64) / count
+    sqr = (avg - values) ** 2
+    sqr[mask] = 0.0
+    return float(np.sqrt(sqr.sum(dtype=np.float64) / (count - ddof)))
+
+
+def _finite_or_zero(value: float) -> float:
+    return 0 if np.isnan(value) or np.isinf(value) else value
+
+
+def _groups(keys: np.ndarray) -> List[Tuple[int, np.ndarray]]:
+    """키별 위치 배열 (groupby처럼 키 오름차순, 그룹 안에서는 원래 순서 유지)"""
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    bounds = np.flatnonzero(np.diff(sorted_keys)) + 1
+    return [
+        (int(sorted_keys[chunk[0]]), order[chunk])
+        for chunk in np.split(np.arange(len(keys)), bounds)
+        if len(chunk)
+    ]
+
+
+class PerformancePanel:
+    """daily_snapshots 배열 패널 (스냅샷 리스트 1개당 1회 생성)"""
+
+    def __init__(self, daily_snapshots: List[Dict[str, Any]]):
+        self.snapshots = daily_snapshots
+        self.size = len(daily_snapshots)
+        self.dates = pd.to_datetime([s["date"] for s in daily_snapshots])
+        self.nav = np.array([float(s["portfolio_value"]) for s in daily_snapshots], dtype=float)
+        self.cash = np.array([float(s["cash_balance"]) for s in daily_snapshots], dtype=float)
+        self.trade_count = np.array([s.get("trade_count", 0) for s in daily_snapshots], dtype=np.int64)
+
+        # 벤치마크 값 (없는 날은 NaN, 전부 없으면 None)
+        self.benchmark: Optional[np.ndarray] = None
+        if any(s.get("benchmark_value") is not None for s in daily_snapshots):
+            self.benchmark = np.array(
+                [np.nan if s.get("benchmark_value") is None else float(s["benchmark_value"]) for s in daily_snapshots],
+                dtype=float,
+            )
+            if np.isnan(self.benchmark).all():
+                self.benchmark = None
+
+        self.daily_return = pct_change(self.nav)
+        self.cummax = np.maximum.accumulate(self.nav) if self.size else self.nav
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.drawdown = (self.nav - self.cummax) / self.cummax
+
+        years = self.dates.year.to_numpy()
+        self.years = years
+        self.month_keys = years * 100 + self.dates.month.to_numpy()
+
+    def benchmark_daily_return_pct(self) -> np.ndarray:
+        """일별 벤치마크 수익률(%) (벤치마크 값이 없으면 legacy benchmark_return 값, 그것도 없으면 NaN)"""
+        if self.benchmark is not None:
+            return pct_change(self.benchmark) * 100
+        if any("benchmark_return" in s for s in self.snapshots):
+            return np.array(
+                [np.nan if pd.isna(s.get("benchmark_return")) else s["benchmark_return"] for s in self.snapshots],
+                dtype=object,
+            )
+        return np.full(self.size, np.nan)
+
+
+def summary_stats(
+    panel: PerformancePanel,
+    executions: List[Dict[str, Any]],
+    initial_capital: float,
+    start_date: date,
+    end_date: date,
+) -> Dict[str, Any]:
+    """수익률/MDD/변동성/샤프·소르티노·칼마/승패 통계 (기존 StatsSchema 필드 값)"""
+    nav = panel.nav
+    daily_return = panel.daily_return
+
+    benchmark_return_pct = None
+    if panel.benchmark is not None:
+        first, last = panel.benchmark[0], panel.benchmark[-1]
+        if first and last:
+            benchmark_return_pct = ((last / first) - 1) * 100
+
+    max_drawdown = abs(float(np.nanmin(panel.drawdown))) * 100
+
+    final_value = float(nav[-1])
+    total_return = ((final_value / initial_capital) - 1) * 100
+    excess_return = total_return - benchmark_return_pct if benchmark_return_pct is not None else None
+
+    days = (end_date - start_date).days
+    years = days / 365.25
+    annualized_return = ((final_value / initial_capital) ** (1 / years) - 1) * 100 if years > 0 else 0
+
+    volatility = _finite_or_zero(nanstd(daily_return) * np.sqrt(TRADING_DAYS_PER_YEAR) * 100)
+    negative_returns = daily_return[daily_return < 0]
+    downside_volatility = (
+        _finite_or_zero(nanstd(negative_returns) * np.sqrt(TRADING_DAYS_PER_YEAR) * 100)
+        if len(negative_returns) else 0
+    )
+
+    sharpe = (annualized_return - RISK_FREE_RATE_PCT) / volatility if volatility > 0 else 0
+    sortino = (annualized_return - RISK_FREE_RATE_PCT) / downside_volatility if downside_volatility > 0 else 0
+    calmar = annualized_return / max_drawdown if max_drawdown > 0 else 0
+
+    # 매도 체결 승패 (realized_pnl 기준)
+    sell_executions = [exe for exe in executions if exe.get("side") == "SELL"]
+    winning = [t for t in sell_executions if t.get("realized_pnl", 0) > 0]
+    losing = [t for t in sell_executions if t.get("realized_pnl", 0) <= 0]
+    win_rate = len(winning) / len(sell_executions) * 100 if sell_executions else 0
+    avg_win = np.mean([float(t.get("profit_rate", 0)) for t in winning]) if winning else 0
+    avg_loss = np.mean([abs(float(t.get("profit_rate", 0))) for t in losing]) if losing else 0
+    profit_loss_ratio = avg_win / avg_loss if avg_loss > 0 else 0
+
+    return {
+        "total_return": total_return,
+        "annualized_return": annualized_return,
+        "benchmark_return": benchmark_return_pct,
+        "excess_return": excess_return,
+        "max_drawdown": max_drawdown,
+        "volatility": volatility,
+        "downside_volatility": downside_volatility,
+        "sharpe_ratio": _finite_or_zero(sharpe),
+        "sortino_ratio": _finite_or_zero(sortino),
+        "calmar_ratio": _finite_or_zero(calmar),
+        "total_trades": len(sell_executions),
+        "winning_trades": len(winning),
+        "losing_trades": len(losing),
+        "win_rate": win_rate,
+        "avg_win": avg_win,
+        "avg_loss": avg_loss,
+        "profit_loss_ratio": profit_loss_ratio,
+        "final_capital": final_value,
+        "peak_capital": float(np.nanmax(nav)),
+        "trading_days": panel.size,
+        "days": days,
+        "years": years,
+    }
+
+
+def _period_return(values: np.ndarray) -> float:
+    start_value, end_value = float(values[0]), float(values[-1])
+    return ((end_value / start_value) - 1) * 100 if start_value > 0 else 0
+
+
+def monthly_table(panel: PerformancePanel, trades: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """월별 수익률/매도 승률/평균 보유일/거래 수 (win_rate는 매도 거래가 없으면 None)"""
+    # 매도 거래를 (연, 월)별로 한 번만 분류
+    sells_by_month: Dict[Tuple[int, int], List[Dict[str, Any]]] = defaultdict(list)
+    for trade in trades or []:
+        if trade.get("trade_type") != "SELL":
+            continue
+        trade_date = pd.to_datetime(trade.get("trade_date"))
+        if trade_date is None or pd.isna(trade_date):
+            continue
+        sells_by_month[(trade_date.year, trade_date.month)].append(trade)
+
+    rows = []
+    for key, idx in _groups(panel.month_keys):
+        year, month = divmod(key, 100)
+        month_sells = sells_by_month.get((year, month), [])
+        win_rate = None
+        avg_hold_days = 0
+        if month_sells:
+            winning = [t for t in month_sells if float(t.get("profit", 0)) > 0]
+            win_rate = len(winning) / len(month_sells) * 100
+            hold_days = [t.get("hold_days", 0) for t in month_sells if t.get("hold_days")]
+            if hold_days:
+                avg_hold_days = sum(hold_days) // len(hold_days)
+
+        rows.append({
+            "year": year,
+            "month": month,
+            "return_rate": _period_return(panel.nav[idx]),
+            "win_rate": win_rate,
+            "trade_count": int(panel.trade_count[idx].sum()),
+            "avg_hold_days": avg_hold_days,
+        })
+    return rows
+
+
+def yearly_table(panel: PerformancePanel) -> List[Dict[str, Any]]:
+    """연도별 수익률/연중 MDD/샤프 비율/거래 수"""
+    rows = []
+    for year, idx in _groups(panel.years):
+        values = panel.nav[idx]
+        yearly_return = _period_return(values)
+
+        cummax = np.maximum.accumulate(values)
+        max_drawdown = abs(float(np.nanmin((values - cummax) / cummax))) * 100
+
+        volatility = nanstd(pct_change(values)) * np.sqrt(TRADING_DAYS_PER_YEAR)
+        sharpe = (yearly_return / 100 - 0.02) / volatility if volatility > 0 else 0
+
+        rows.append({
+            "year": year,
+            "return_rate": yearly_return,
+            "max_drawdown": max_drawdown,
+            "sharpe_ratio": sharpe,
+            "trades": int(panel.trade_count[idx].sum()),
+        })
+    return rows
+
+
+def drawdown_runs(panel: PerformancePanel) -> List[Dict[str, Any]]:
+    """낙폭(<0) 연속 구간: 시작/회복 위치, 고점, 저점, 최대 낙폭(%), 기간(일 수)"""
+    underwater = panel.drawdown < 0
+    if not underwater.any():
+        return []
+
+    previous = np.concatenate(([False], underwater[:-1]))
+    starts = np.flatnonzero(underwater & ~previous)
+    ends = np.flatnonzero(~underwater & previous)  # 회복일 (마지막 구간은 없을 수 있음)
+
+    bounds = np.empty(len(starts) + len(ends), dtype=np.int64)
+    bounds[0::2] = starts
+    bounds[1::2] = ends
+    troughs = np.minimum.reduceat(panel.nav, bounds)[0::2]
+    depths = np.minimum.reduceat(panel.drawdown * 100, bounds)[0::2]
+
+    runs = []
+    for k, start in enumerate(starts):
+        end = int(ends[k]) if k < len(ends) else None
+        runs.append({
+            "start": int(start),
+            "end": end,
+            "peak_value": float(panel.cummax[start]),
+            "trough_value": float(troughs[k]),
+            "max_drawdown": float(depths[k]),
+            "duration_days": (end if end is not None else panel.size) - int(start),
+        })
+    return runs
+
+
+def factor_contributions(
+    trades: List[Dict[str, Any]],
+    buy_conditions: Any,
+    detailed: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    매수 조건 팩터별 매도 거래 성과 + contribution_score 순위
+
+    Args:
+        detailed: True면 평균 수익률/최고/최저 거래 포함 (결과 차트용)
+    """
+    sell_trades = [t for t in trades if t.get("trade_type") == "SELL"]
+    if not sell_trades:
+        return {}
+
+    # 논리식(dict) 형태면 conditions 리스트 사용
+    conditions_list = buy_conditions.get("conditions", []) if isinstance(buy_conditions, dict) else buy_conditions
+
+    # 거래별 손익/수익률을 한 번만 변환
+    profits_all = [float(t.get("profit", 0)) for t in sell_trades]
+    rates_all = [float(t.get("profit_rate", 0)) for t in sell_trades] if detailed else None
+    factor_sets = [t.get("factors") or {} for t in sell_trades]
+
+    factor_performance: Dict[str, Dict[str, Any]] = {}
+    for condition in conditions_list:
+        factor_name = condition.get("factor")
+        if not factor_name:
+            continue
+
+        positions = [i for i, factors in enumerate(factor_sets) if factor_name in factors]
+        if not positions:
+            continue
+
+        profits = [profits_all[i] for i in positions]
+        winning = sum(1 for profit in profits if profit > 0)
+        stats: Dict[str, Any] = {
+            "total_trades": len(positions),
+            "winning_trades": winning,
+            "win_rate": winning / len(positions) * 100,
+            "avg_profit": sum(profits) / len(profits),
+        }
+        if detailed:
+            rates = [rates_all[i] for i in positions]
+            stats["avg_profit_rate"] = sum(rates) / len(rates)
+        stats["total_profit"] = sum(profits)
+        if detailed:
+            stats["best_trade"] = max(profits)
+            stats["worst_trade"] = min(profits)
+        stats["contribution_score"] = winning / len(sell_trades) * 100
+        factor_performance[factor_name] = stats
+
+    ranked = sorted(factor_performance.items(), key=lambda item: item[1]["contribution_score"], reverse=True)
+    for rank, (factor_name, _) in enumerate(ranked, 1):
+        factor_performance[factor_name]["importance_rank"] = rank
+    return factor_performance
@@ -0,0 +1,327 @@
+"""
+파라미터 스윕 백테스트
+- 가격/재무 데이터 로드와 팩터 계산은 한 번만 수행 (SweepDataset)
+- 파라미터 조합(variant)별 시뮬레이션은 워커 프로세스에서 병렬 실행 (DB 저장 없음)
+- CAGR/MDD/Sharpe/회전율 비교표 반환, 사용자가 고른 변형만 일반 백테스트로 저장
+- 워크포워드: 같은 데이터셋으로 롤링/확장 윈도우 K개를 시뮬레이션하고 안정성 지표 집계
+"""
+
+import asyncio
+import copy
+import itertools
+import logging
+import multiprocessing
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import get_cache
+from app.core.config import settings
+from app.services.backtest import BacktestEngine
+
+logger = logging.getLogger(__name__)
+
+SWEEP_MAX_VARIANTS = 64
+SWEEP_CACHE_TTL = 3600  # 비교표 확인 후 저장(keep)까지 유지 시간
+
+# BacktestEngine._configure_run 인자
+_CONFIG_KEYS = (
+    "commission_rate", "slippage", "initial_capital", "condition_sell", "target_and_loss", "hold_days",
+    "target_themes", "target_stocks", "target_universes", "per_stock_ratio", "max_buy_value", "max_daily_stock",
+)
+
+
+def expand_sweep_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """파라미터별 후보값 → 전체 조합 목록 (후보값이 비어 있는 파라미터는 제외)"""
+    keys = [key for key, values in grid.items() if values]
+    if not keys:
+        return [{}]
+
+    variant_count = 1
+    for key in keys:
+        variant_count *= len(grid[key])
+    if variant_count > SWEEP_MAX_VARIANTS:
+        raise ValueError(f"파라미터 조합이 너무 많습니다: {variant_count}개 (최대 {SWEEP_MAX_VARIANTS}개)")
+
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+
+
+def walk_forward_windows(
+    start_date: date,
+    end_date: date,
+    window_months: int,
+    step_months: int,
+    mode: str = "rolling"
+) -> List[Tuple[date, date]]:
+    """
+    워크포워드 평가 구간 목록
+
+    - rolling: 길이 window_months 구간을 step_months씩 이동
+    - expanding: 시작일 고정, 종료일만 step_months씩 연장
+    """
+    if mode not in ("rolling", "expanding"):
+        raise ValueError(f"지원하지 않는 윈도우 방식: {mode} (rolling/expanding)")
+    if window_months <= 0 or step_months <= 0:
+        raise ValueError("window_months와 step_months는 1 이상이어야 합니다")
+
+    origin = pd.Timestamp(start_date)
+    windows = []
+    while True:
+        offset = len(windows) * step_months
+        window_end = (origin + pd.DateOffset(months=window_months + offset)).date() - timedelta(days=1)
+        if window_end > end_date:
+            break
+        window_start = start_date if mode == "expanding" else (origin + pd.DateOffset(months=offset)).date()
+        windows.append((window_start, window_end))
+
+    if not windows:
+        raise ValueError(f"백테스트 기간이 윈도우({window_months}개월)보다 짧습니다")
+    if len(windows) > SWEEP_MAX_VARIANTS:
+        raise ValueError(f"윈도우가 너무 많습니다: {len(windows)}개 (최대 {SWEEP_MAX_VARIANTS}개)")
+    return windows
+
+
+def summarize_windows(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """윈도우별 지표 → 분포(평균/표준편차/최소/최대)와 안정성 지표"""
+    completed = [row for row in rows if "error" not in row]
+    summary: Dict[str, Any] = {"windows": len(rows), "failed": len(rows) - len(completed)}
+    if not completed:
+        return summary
+
+    for key in ("cagr", "mdd", "sharpe", "turnover"):
+        values = [row[key] for row in completed]
+        summary[key] = {
+            "mean": round(statistics.fmean(values), 4),
+            "std": round(statistics.pstdev(values), 4),
+            "min": round(min(values), 4),
+            "max": round(max(values), 4),
+        }
+
+    # 수익 구간 비율, 최악 구간, CAGR 변동계수(낮을수록 구간별 성과가 고름)
+    summary["positive_ratio"] = round(sum(1 for row in completed if row["total_return"] > 0) / len(completed), 4)
+    summary["worst_window"] = min(completed, key=lambda row: row["total_return"])["variant_id"]
+    cagr_mean = summary["cagr"]["mean"]
+    summary["cagr_cv"] = round(summary["cagr"]["std"] / abs(cagr_mean), 4) if cagr_mean else None
+    return summary
+
+
+@dataclass
+class SweepDataset:
+    """모든 변형이 공유하는 입력 데이터 (워커 프로세스마다 한 번만 전달)"""
+    price_data: pd.DataFrame
+    factor_data: pd.DataFrame
+    benchmark_data: pd.DataFrame
+    price_lookup: Dict[Any, float]
+    corporate_actions: Dict[str, Dict]
+    universe_membership: Any
+    start_date: date
+    end_date: date
+
+
+# 워커 프로세스 전역 데이터셋 (initializer에서 설정)
+_worker_dataset: Optional[SweepDataset] = None
+
+
+def _init_worker(dataset: SweepDataset) -> None:
+    global _worker_dataset
+    _worker_dataset = dataset
+
+
+def _simulate_variant(variant_id: int, params: Dict[str, Any]) -> Dict[str, Any]:
+    """워커 프로세스 진입점"""
+    return asyncio.run(_simulate_variant_async(variant_id, params))
+
+
+async def _simulate_variant_async(variant_id: int, params: Dict[str, Any]) -> Dict[str, Any]:
+    dataset = _worker_dataset
+    started = time.perf_counter()
+    # 워크포워드 윈도우는 전체 구간 데이터셋 중 자기 구간만 시뮬레이션
+    start_date = params.get("start_date") or dataset.start_date
+    end_date = params.get("end_date") or dataset.end_date
+
+    # 변형마다 새 엔진 (blocked_stocks 등 시뮬레이션 상태 분리), DB 없이 실행
+    engine = BacktestEngine(None, headless=True)
+    engine.price_lookup = dataset.price_lookup
+    engine.corporate_actions = dataset.corporate_actions
+    engine.universe_membership = dataset.universe_membership
+    engine._configure_run(**{key: params.get(key) for key in _CONFIG_KEYS})
+
+    buy_conditions = params["buy_conditions"]
+    engine._prepare_buy_conditions(buy_conditions)
+
+    # 종료일 이후 행은 잘라 단독 실행과 같게 (마지막 날 익일 시가 체결이 구간 밖으로 나가지 않도록)
+    price_data = _until(dataset.price_data, end_date)
+    factor_data = _until(dataset.factor_data, end_date)
+
+    initial_capital = params["initial_capital"]
+    portfolio_result = await engine._simulate_portfolio(
+        backtest_id=uuid4(),
+        factor_data=factor_data,
+        price_data=price_data,
+        buy_conditions=buy_conditions,
+        sell_conditions=params.get("sell_conditions") or [],
+        condition_sell=params.get("condition_sell"),
+        initial_capital=initial_capital,
+        rebalance_frequency=params["rebalance_frequency"],
+        max_positions=params["max_positions"],
+        position_sizing=params.get("position_sizing", "EQUAL_WEIGHT"),
+        benchmark_data=dataset.benchmark_data,
+        start_date=start_date,
+        end_date=end_date
+    )
+    statistics = engine._calculate_statistics(portfolio_result, initial_capital, start_date, end_date)
+
+    return {
+        "variant_id": variant_id,
+        "cagr": float(statistics.annualized_return),
+        "mdd": float(statistics.max_drawdown),
+        "sharpe": float(statistics.sharpe_ratio),
+        "turnover": _annual_turnover(portfolio_result, start_date, end_date),
+        "total_return": float(statistics.total_return),
+        "total_trades": statistics.total_trades,
+        "final_capital": float(statistics.final_capital),
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def _until(df: pd.DataFrame, end_date: date) -> pd.DataFrame:
+    """date <= end_date 행만 (잘라낼 행이 없으면 그대로)"""
+    cutoff = pd.Timestamp(end_date)
+    if df.empty or df["date"].max() <= cutoff:
+        return df
+    return df[df["date"] <= cutoff]
+
+
+def _annual_turnover(portfolio_result: Dict[str, Any], start_date: date, end_date: date) -> float:
+    """연환산 회전율 = (매수+매도 거래대금 / 2) / 평균 평가금액 / 연수"""
+    snapshots = portfolio_result.get("daily_snapshots") or []
+    if not snapshots:
+        return 0.0
+    traded = sum(float(execution.get("amount", 0)) for execution in portfolio_result.get("executions", []))
+    avg_value = sum(float(snapshot["portfolio_value"]) for snapshot in snapshots) / len(snapshots)
+    years = max((end_date - start_date).days / 365.0, 1 / 365.0)
+    return round(traded / 2 / avg_value / years, 4) if avg_value > 0 else 0.0
+
+
+class BacktestSweepService:
+    """한 번 로드한 데이터셋으로 여러 파라미터 조합을 병렬 시뮬레이션"""
+
+    def __init__(self, db: AsyncSession, max_workers: Optional[int] = None):
+        self.db = db
+        self.max_workers = max_workers or settings.MAX_WORKERS
+
+    async def load_dataset(self, variant_params: List[Dict[str, Any]]) -> SweepDataset:
+        """
+        가격/재무/팩터/벤치마크 데이터 로드 (1회)
+
+        매매 대상/벤치마크는 모든 변형이 같아야 한다. 기간은 전체 변형을 덮는 구간,
+        팩터는 전체 변형의 매수 조건 합집합으로 계산한다.
+        """
+        base = variant_params[0]
+        engine = BacktestEngine(self.db)
+        engine._configure_run(**{key: base.get(key) for key in _CONFIG_KEYS})
+
+        start_date = min(params["start_date"] for params in variant_params)
+        end_date = max(params["end_date"] for params in variant_params)
+        price_data = await engine._load_price_data(
+            start_date, end_date, base.get("target_themes"), base.get("target_stocks"), base.get("target_universes")
+        )
+        actual_stocks = price_data["stock_code"].unique().tolist() if not price_data.empty else []
+        financial_data = await engine._load_financial_data(start_date, end_date, actual_stocks)
+
+        factor_conditions: List[Any] = []
+        priority_factor = None
+        for params in variant_params:
+            conditions, priority_factor = engine._prepare_buy_conditions(copy.deepcopy(params["buy_conditions"]))
+            factor_conditions.extend(conditions)
+
+        factor_data = await engine._calculate_all_factors_optimized(
+            price_data, financial_data, start_date, end_date,
+            buy_conditions=factor_conditions,
+            priority_factor=priority_factor
+        )
+        benchmark_data = await engine._load_benchmark_data(base.get("benchmark", "KOSPI"), start_date, end_date)
+
+        return SweepDataset(
+            price_data=price_data,
+            factor_data=factor_data,
+            benchmark_data=benchmark_data,
+            price_lookup=engine.price_lookup,
+            corporate_actions=engine.corporate_actions,
+            universe_membership=engine.universe_membership,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+    async def run(self, variant_params: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        변형별 시뮬레이션 실행
+
+        Args:
+            variant_params: 변형별 BacktestEngine.run_backtest 인자 (backtest_id 제외)
+
+        Returns:
+            load_seconds, simulate_seconds, variants(변형 순서대로 지표 또는 error)
+        """
+        load_start = time.perf_counter()
+        dataset = await self.load_dataset(variant_params)
+        load_seconds = time.perf_counter() - load_start
+        logger.info(
+            f"📦 스윕 데이터셋 로드 완료: {load_seconds:.2f}초 "
+            f"(가격 {len(dataset.price_data)}행, 팩터 {len(dataset.factor_data)}행)"
+        )
+
+        simulate_start = time.perf_counter()
+        workers = max(1, min(self.max_workers, len(variant_params)))
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(dataset,)
+        )
+        try:
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(
+                *[
+                    loop.run_in_executor(executor, _simulate_variant, variant_id, params)
+                    for variant_id, params in enumerate(variant_params)
+                ],
+                return_exceptions=True
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        simulate_seconds = time.perf_counter() - simulate_start
+
+        rows = []
+        for variant_id, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ 스윕 변형 {variant_id} 실패: {result}")
+                rows.append({"variant_id": variant_id, "error": str(result)})
+            else:
+                rows.append(result)
+
+        logger.info(
+            f"⚡ 스윕 완료: {len(variant_params)}개 변형, 워커 {workers}개, "
+            f"로드 {load_seconds:.2f}초 + 시뮬레이션 {simulate_seconds:.2f}초"
+        )
+        return {
+            "load_seconds": round(load_seconds, 3),
+            "simulate_seconds": round(simulate_seconds, 3),
+            "variants": rows,
+        }
+
+    @staticmethod
+    async def save_sweep(sweep_id: str, payload: Dict[str, Any]) -> bool:
+        """keep 요청용 스윕 정의 저장 (기본 요청 + 변형 파라미터)"""
+        return await get_cache().set(f"backtest:sweep:{sweep_id}", payload, ttl=SWEEP_CACHE_TTL)
+
+    @staticmethod
+    async def load_sweep(sweep_id: str) -> Optional[Dict[str, Any]]:
+        return await get_cache().get(f"backtest:sweep:{sweep_id}")
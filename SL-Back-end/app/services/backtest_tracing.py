@@ -0,0 +1,197 @@
+"""
+백테스트 단계별 트레이싱
+- 엔진 단계/하위 단계(캐시 조회, 팩터 계열, 조건 평가, 시뮬레이션 루프, 대량 저장)를 span 트리로 기록
+- span마다 소요 시간과 행 수/바이트 등 속성을 남김
+- 반복 구간(리밸런싱 날짜별 조건 평가, 분기별 팩터 계열 계산)은 개별 span 대신 횟수/합계/최대로 집계
+- 완료된 트리는 simulation_sessions.trace에 저장하고, 단계 경로별 지연은 프로세스 지표로 집계
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+# 프로세스 지표에서 경로별로 보관하는 최근 관측값 수 (p50/p95 계산용)
+RECENT_SAMPLES = 200
+
+
+def frame_stats(df: Optional[pd.DataFrame]) -> Dict[str, int]:
+    """DataFrame 행 수/메모리 바이트 (object 컬럼 내용은 제외한 얕은 크기)"""
+    if df is None:
+        return {"rows": 0, "bytes": 0}
+    return {"rows": len(df), "bytes": int(df.memory_usage(index=True, deep=False).sum())}
+
+
+class Span:
+    """소요 시간 + 속성 + 하위 span/집계 구간"""
+
+    __slots__ = ("name", "started_at", "duration_ms", "attrs", "children", "aggregates")
+
+    def __init__(self, name: str, started_at: float, attrs: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.started_at = started_at
+        self.duration_ms: Optional[float] = None
+        self.attrs: Dict[str, Any] = dict(attrs or {})
+        self.children: List["Span"] = []
+        self.aggregates: Dict[str, Dict[str, Any]] = {}
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def to_dict(self, origin: float) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "name": self.name,
+            "offset_ms": round((self.started_at - origin) * 1000, 1),
+            "duration_ms": round(self.duration_ms, 1) if self.duration_ms is not None else None,
+        }
+        if self.attrs:
+            payload["attrs"] = self.attrs
+        if self.aggregates:
+            payload["aggregates"] = {
+                name: {key: round(value, 1) if isinstance(value, float) else value for key, value in agg.items()}
+                for name, agg in self.aggregates.items()
+            }
+        if self.children:
+            payload["children"] = [child.to_dict(origin) for child in self.children]
+        return payload
+
+
+class BacktestTracer:
+    """백테스트 1회의 span 트리 (엔진 인스턴스마다 1개)"""
+
+    def __init__(self, name: str = "backtest"):
+        self.root = Span(name, time.perf_counter())
+        self._stack: List[Span] = [self.root]
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> Span:
+        return self._stack[-1]
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Span]:
+        """현재 span 아래에 하위 span 기록 (예외 시 error 속성 추가 후 전파)"""
+        span = Span(name, time.perf_counter(), attrs)
+        self.current.children.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        except Exception as e:
+            span.attrs["error"] = type(e).__name__
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - span.started_at) * 1000
+            self._stack.remove(span)
+
+    def add(self, name: str, seconds: float, **attrs: Any) -> Span:
+        """이미 측정한 구간을 완료된 하위 span으로 추가"""
+        span = Span(name, time.perf_counter() - seconds, attrs)
+        span.duration_ms = seconds * 1000
+        with self._lock:
+            self.current.children.append(span)
+        return span
+
+    def count(self, name: str, seconds: float, span: Optional[Span] = None, **counters: float) -> None:
+        """반복 구간 집계 (스레드 안전): 횟수/합계/최대 ms + 숫자 카운터 합계"""
+        ms = seconds * 1000
+        with self._lock:
+            target = span or self.current
+            agg = target.aggregates.setdefault(name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            agg["count"] += 1
+            agg["total_ms"] += ms
+            agg["max_ms"] = max(agg["max_ms"], ms)
+            for key, value in counters.items():
+                agg[key] = agg.get(key, 0) + value
+
+    @contextmanager
+    def timed(self, name: str, **counters: float) -> Iterator[None]:
+        """with 블록 소요 시간을 현재 span의 name 집계에 더함"""
+        target = self.current
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.count(name, time.perf_counter() - start, span=target, **counters)
+
+    def finish(self) -> Dict[str, Any]:
+        """루트 span 종료 후 트리 반환"""
+        if self.root.duration_ms is None:
+            self.root.duration_ms = (time.perf_counter() - self.root.started_at) * 1000
+        return self.to_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.root.to_dict(self.root.started_at)
+
+    def stage_durations(self) -> Dict[str, float]:
+        """span 경로별 소요 시간 ms (예: simulate/save, 집계 구간은 합계: factors/factor.value)"""
+        durations: Dict[str, float] = {}
+
+        def walk(span: Span, prefix: str) -> None:
+            for name, agg in span.aggregates.items():
+                durations[f"{prefix}/{name}" if prefix else name] = agg["total_ms"]
+            for child in span.children:
+                path = f"{prefix}/{child.name}" if prefix else child.name
+                if child.duration_ms is not None:
+                    durations[path] = child.duration_ms
+                walk(child, path)
+
+        walk(self.root, "")
+        return durations
+
+
+class _PathStats:
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent: Deque[float] = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, ms: float) -> None:
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.recent.append(ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.recent)
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "p50_ms": round(ordered[len(ordered) // 2], 1) if ordered else None,
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1) if ordered else None,
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class TraceMetrics:
+    """완료된 백테스트 트레이스의 단계 경로별 지연 집계 (프로세스 단위)"""
+
+    def __init__(self):
+        self._paths: Dict[str, _PathStats] = {}
+        self._lock = threading.Lock()
+        self.backtests = 0
+
+    def observe(self, tracer: BacktestTracer) -> None:
+        durations = tracer.stage_durations()
+        with self._lock:
+            self.backtests += 1
+            self._paths.setdefault("total", _PathStats()).observe(tracer.root.duration_ms or 0.0)
+            for path, ms in durations.items():
+                self._paths.setdefault(path, _PathStats()).observe(ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backtests": self.backtests,
+                "stages": {path: stats.to_dict() for path, stats in sorted(self._paths.items())},
+            }
+
+
+_metrics = TraceMetrics()
+
+
+def get_trace_metrics() -> TraceMetrics:
+    return _metrics
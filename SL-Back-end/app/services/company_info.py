@@ -11,9 +11,12 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select, and_, or_, desc, case
+from sqlalchemy import select, and_, or_, desc, case, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.core.cache import cache
+from app.core.config import settings
 from app.models.company import Company
 from app.models.stock_price import StockPrice
 from app.models.financial_statement import FinancialStatement
@@ -27,6 +30,12 @@ logger = logging.getLogger(__name__)
 class CompanyInfoService:
     """종목 정보 조회 및 재무 지표 계산 서비스"""
 
+    # 종목 상세 응답 캐시 TTL (초) - 장중 시세 반영을 위해 짧게 유지
+    COMPANY_INFO_CACHE_TTL = 60
+
+    # 기간별 변동률 기준 거래일 (1일, 1주=5거래일, 1개월≈22거래일, 2개월≈44거래일)
+    PERIOD_TRADING_DAYS = {"1d": 1, "1w": 5, "1m": 22, "2m": 44}
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -41,26 +50,25 @@ class CompanyInfoService:
         Returns:
             종목 기본정보, 투자지표, 수익지표, 재무비율, 분기별실적, 재무제표, 차트 데이터
         """
+        # 0. 조립된 응답 캐시 조회 (관심종목 여부는 사용자별이므로 캐시에서 제외)
+        cache_key = self._get_cache_key(stock_code)
+        cached = await cache.get(cache_key)
+        if cached:
+            company_id, payload = cached
+            return await self._apply_user_fields(payload, company_id, user_id)
+
         # 1. 기업 정보 조회
         company = await self._get_company(stock_code)
         if not company:
             return None
 
-        # 1-1. 관심종목 여부 확인
-        is_favorite = False
-        if user_id:
-            is_favorite = await self._check_is_favorite(user_id, company.company_id)
-
-        # 2. 최신 주가 정보
-        latest_price = await self._get_latest_price(company.company_id)
-
-        # 3. 기간별 변동률 계산
-        change_rates = await self._calculate_period_change_rates(
-            company.company_id, latest_price
+        # 2, 4. 최신 주가 + 기간별 기준가 + 5년 차트 데이터 (단일 윈도우 쿼리)
+        latest_price, reference_prices, price_history = await self._get_price_snapshot(
+            company.company_id
         )
 
-        # 4. 5년 차트 데이터
-        price_history = await self._get_price_history(company.company_id)
+        # 3. 기간별 변동률 계산
+        change_rates = self._calculate_period_change_rates(latest_price, reference_prices)
 
         # 5. 최근 8분기 재무제표
         financial_statements = await self._get_financial_statements(company.company_id, limit=8)
@@ -90,7 +98,7 @@ class CompanyInfoService:
         previous_close = self._calculate_previous_close(latest_price)
 
         # 11. 응답 데이터 조합
-        return {
+        payload = {
             "basic_info": {
                 "company_name": company.company_name,
                 "stock_code": company.stock_code,
@@ -120,8 +128,8 @@ class CompanyInfoService:
                 # # 점수
                 # "momentum_score": company.momentum_score,
                 # "fundamental_score": company.fundamental_score,
-                # 관심종목 여부
-                "is_favorite": is_favorite
+                # 관심종목 여부 (_apply_user_fields에서 채움)
+                "is_favorite": False
             },
             "investment_indicators": investment_indicators,
             "profitability_indicators": profitability_indicators,
@@ -142,6 +150,9 @@ class CompanyInfoService:
             ]
         }
 
+        await cache.set(cache_key, (company.company_id, payload), ttl=self.COMPANY_INFO_CACHE_TTL)
+        return await self._apply_user_fields(payload, company.company_id, user_id)
+
     async def search_companies(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         종목 검색 (종목명 또는 종목코드)
@@ -186,36 +197,80 @@ class CompanyInfoService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    async def _get_latest_price(self, company_id: int) -> Optional[StockPrice]:
-        """최신 주가 정보 조회"""
-        query = (
-            select(StockPrice)
-            .where(StockPrice.company_id == company_id)
-            .order_by(desc(StockPrice.trade_date))
-            .limit(1)
-        )
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+    @staticmethod
+    def _get_cache_key(stock_code: str) -> str:
+        """종목 상세 응답 캐시 키"""
+        return f"{settings.CACHE_PREFIX}:company_info:{stock_code}"
+
+    async def _apply_user_fields(
+        self,
+        payload: Dict[str, Any],
+        company_id: int,
+        user_id: Optional[UUID]
+    ) -> Dict[str, Any]:
+        """캐시된 공용 응답에 사용자별 필드(관심종목 여부) 반영"""
+        is_favorite = False
+        if user_id:
+            is_favorite = await self._check_is_favorite(user_id, company_id)
 
-    async def _get_price_history(
+        return {
+            **payload,
+            "basic_info": {**payload["basic_info"], "is_favorite": is_favorite}
+        }
+
+    async def _get_price_snapshot(
         self,
         company_id: int,
         years: int = 5
-    ) -> List[StockPrice]:
-        """일별 차트 데이터 조회"""
+    ) -> Tuple[Optional[StockPrice], Dict[str, Optional[StockPrice]], List[StockPrice]]:
+        """
+        최신 주가, 기간별 기준가, 일별 차트 데이터를 단일 쿼리로 조회
+
+        거래일 역순 ROW_NUMBER()를 매겨 차트 구간(최근 N년)과
+        기준가 구간(최근 45거래일)을 한 번에 가져온다.
+
+        Args:
+            company_id: 회사 ID
+            years: 차트 조회 기간 (년)
+
+        Returns:
+            (최신 주가, {"1d": ..., "1w": ..., "1m": ..., "2m": ...}, 차트 데이터)
+        """
         start_date = datetime.now().date() - timedelta(days=365 * years)
+        max_offset = max(self.PERIOD_TRADING_DAYS.values())
+
+        ranked = (
+            select(
+                StockPrice,
+                func.row_number().over(order_by=desc(StockPrice.trade_date)).label("rn")
+            )
+            .where(StockPrice.company_id == company_id)
+            .subquery()
+        )
+        ranked_price = aliased(StockPrice, ranked)
         query = (
-            select(StockPrice)
+            select(ranked_price, ranked.c.rn)
             .where(
-                and_(
-                    StockPrice.company_id == company_id,
-                    StockPrice.trade_date >= start_date
+                or_(
+                    ranked.c.trade_date >= start_date,
+                    ranked.c.rn <= max_offset + 1
                 )
             )
-            .order_by(StockPrice.trade_date)
+            .order_by(ranked.c.trade_date)
         )
         result = await self.db.execute(query)
-        return result.scalars().all()
+        rows = result.all()
+
+        # rn=1 → 최신, rn=n+1 → n 거래일 전
+        by_rank = {rn: price for price, rn in rows}
+        latest_price = by_rank.get(1)
+        reference_prices = {
+            period: by_rank.get(days + 1)
+            for period, days in self.PERIOD_TRADING_DAYS.items()
+        }
+        price_history = [price for price, _ in rows if price.trade_date >= start_date]
+
+        return latest_price, reference_prices, price_history
 
     async def _get_financial_statements(
         self,
@@ -540,88 +595,38 @@ class CompanyInfoService:
             "current_ratio": current_ratio
         }
 
-    async def _calculate_period_change_rates(
+    def _calculate_period_change_rates(
         self,
-        company_id: int,
-        latest_price: Optional[StockPrice]
+        latest_price: Optional[StockPrice],
+        reference_prices: Dict[str, Optional[StockPrice]]
     ) -> Dict[str, Optional[float]]:
         """
         기간별 변동률 계산
 
         Args:
-            company_id: 회사 ID
             latest_price: 최신 주가 정보
+            reference_prices: 기간별 기준 주가 ({"1d": ..., "1w": ..., "1m": ..., "2m": ...})
 
         Returns:
             기간별 변동률 딕셔너리 (1d, 1w, 1m, 2m)
         """
-        if not latest_price or not latest_price.close_price:
-            return {
-                "1d_change": None,
-                "1w_change": None,
-                "1m_change": None,
-                "2m_change": None,
-                "1d_rate": None,
-                "1w_rate": None,
-                "1m_rate": None,
-                "2m_rate": None
-            }
-
-        current_price = latest_price.close_price
-
-        # 각 기간별 가격 조회 (거래일 기준)
-        price_1d = await self._get_price_n_trading_days_ago(company_id, 1)
-        price_1w = await self._get_price_n_trading_days_ago(company_id, 5)  # 5 거래일 = 1주
-        price_1m = await self._get_price_n_trading_days_ago(company_id, 22)  # 22 거래일 ≈ 1개월
-        price_2m = await self._get_price_n_trading_days_ago(company_id, 44)  # 44 거래일 ≈ 2개월
-
-        # 변동량 계산
-        change_vs_1d = self._calculate_change_amount(current_price, price_1d)
-        change_vs_1w = self._calculate_change_amount(current_price, price_1w)
-        change_vs_1m = self._calculate_change_amount(current_price, price_1m)
-        change_vs_2m = self._calculate_change_amount(current_price, price_2m)
-
-        # 변동률 계산
-        change_rate_1d = self._calculate_change_rate(current_price, price_1d.close_price if price_1d else None)
-        change_rate_1w = self._calculate_change_rate(current_price, price_1w.close_price if price_1w else None)
-        change_rate_1m = self._calculate_change_rate(current_price, price_1m.close_price if price_1m else None)
-        change_rate_2m = self._calculate_change_rate(current_price, price_2m.close_price if price_2m else None)
-
-        return {
-            "1d_change": change_vs_1d,
-            "1w_change": change_vs_1w,
-            "1m_change": change_vs_1m,
-            "2m_change": change_vs_2m,
-            "1d_rate": change_rate_1d,
-            "1w_rate": change_rate_1w,
-            "1m_rate": change_rate_1m,
-            "2m_rate": change_rate_2m
-        }
-
-    async def _get_price_n_trading_days_ago(
-        self,
-        company_id: int,
-        trading_days: int
-    ) -> Optional[StockPrice]:
-        """
-        N 거래일 전 주가 조회
-
-        Args:
-            company_id: 회사 ID
-            trading_days: 거래일 수
+        change_rates: Dict[str, Optional[float]] = {}
+        current_price = latest_price.close_price if latest_price else None
+
+        for period in self.PERIOD_TRADING_DAYS:
+            past_price = reference_prices.get(period)
+            if not current_price:
+                change_rates[f"{period}_change"] = None
+                change_rates[f"{period}_rate"] = None
+                continue
+
+            # 변동량 / 변동률 계산
+            change_rates[f"{period}_change"] = self._calculate_change_amount(current_price, past_price)
+            change_rates[f"{period}_rate"] = self._calculate_change_rate(
+                current_price, past_price.close_price if past_price else None
+            )
 
-        Returns:
-            N 거래일 전 주가 정보
-        """
-        query = (
-            select(StockPrice)
-            .where(StockPrice.company_id == company_id)
-            .order_by(desc(StockPrice.trade_date))
-            .offset(trading_days)  # N번째 건너뛰기
-            .limit(1)
-        )
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        return change_rates
 
     def _calculate_change_rate(
         self,
@@ -1,19 +1,22 @@
 """
 시세 조회 서비스
-- 전체 종목 시세 리스트 조회
+- 전체 종목 시세 리스트 조회 (latest_quotes 스냅샷 테이블 기반)
 - 정렬 기능 (거래량, 등락률, 거래대금, 시가총액)
-- 페이지네이션
+- 페이지네이션 (페이지 번호 / keyset 커서)
+- 시세 적재 후 latest_quotes 갱신
 """
 
+import base64
+import json
 import logging
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, and_, desc, asc, func
+from sqlalchemy import select, and_, desc, asc, func, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.company import Company
+from app.models.latest_quote import LatestQuote
 from app.models.stock_price import StockPrice
 from app.models.user_favorite_stock import UserFavoriteStock
 from app.schemas.market_quote import SortBy, SortOrder
@@ -21,6 +24,65 @@ from app.schemas.market_quote import SortBy, SortOrder
 logger = logging.getLogger(__name__)
 
 
+# 최신/전일 거래일 시세로 latest_quotes 전체를 갱신하는 upsert
+# - 등락률: DB값 우선, 없으면 전일 종가로 계산
+# - 등락 금액: DB값 우선, 등락률도 없을 때만 전일 종가로 계산
+REFRESH_LATEST_QUOTES_SQL = text("""
+    INSERT INTO latest_quotes (
+        company_id, stock_code, stock_name, industry, trade_date,
+        close_price, prev_close_price, change_amount, change_rate,
+        volume, trading_value, market_cap, refreshed_at
+    )
+    SELECT
+        c.company_id,
+        c.stock_code,
+        COALESCE(c.stock_name, c.company_name),
+        c.industry,
+        sp.trade_date,
+        COALESCE(sp.close_price, 0),
+        prev.close_price,
+        COALESCE(
+            sp.change_vs_1d,
+            CASE
+                WHEN sp.fluctuation_rate IS NULL AND prev.close_price > 0
+                THEN sp.close_price - prev.close_price
+            END,
+            0
+        ),
+        COALESCE(
+            sp.fluctuation_rate,
+            CASE
+                WHEN prev.close_price > 0
+                THEN (sp.close_price - prev.close_price) * 100.0 / prev.close_price
+            END,
+            0
+        ),
+        COALESCE(sp.volume, 0),
+        COALESCE(sp.trading_value, 0),
+        COALESCE(sp.market_cap, 0),
+        now()
+    FROM companies c
+    INNER JOIN stock_prices sp
+        ON sp.company_id = c.company_id AND sp.trade_date = :latest_date
+    LEFT JOIN stock_prices prev
+        ON prev.company_id = c.company_id AND prev.trade_date = :prev_date
+    WHERE c.stock_code IS NOT NULL
+    ON CONFLICT (company_id) DO UPDATE SET
+        stock_code = EXCLUDED.stock_code,
+        stock_name = EXCLUDED.stock_name,
+        industry = EXCLUDED.industry,
+        trade_date = EXCLUDED.trade_date,
+        close_price = EXCLUDED.close_price,
+        prev_close_price = EXCLUDED.prev_close_price,
+        change_amount = EXCLUDED.change_amount,
+        change_rate = EXCLUDED.change_rate,
+        volume = EXCLUDED.volume,
+        trading_value = EXCLUDED.trading_value,
+        market_cap = EXCLUDED.market_cap,
+        refreshed_at = EXCLUDED.refreshed_at
+""")
+
+
 class MarketQuoteService:
     """시세 조회 서비스"""
 
@@ -34,7 +96,8 @@ class MarketQuoteService:
         page: int = 1,
         page_size: int = 50,
         user_id: Optional[UUID] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         전체 종목 시세 조회
@@ -42,87 +105,57 @@ class MarketQuoteService:
         Args:
             sort_by: 정렬 기준
             sort_order: 정렬 순서
-            page: 페이지 번호
+            page: 페이지 번호 (cursor가 없을 때만 사용)
             page_size: 페이지 크기
             user_id: 사용자 ID (관심종목 판단용, 선택)
             search: 검색어 (종목명 또는 종목코드, 부분 일치)
+            cursor: 이전 응답의 next_cursor (keyset 페이지네이션)
 
         Returns:
             시세 리스트 및 페이지네이션 정보
-        """
-        # 1. 최신 거래일 찾기
-        latest_trade_date = await self._get_latest_trade_date()
-        if not latest_trade_date:
-            return {
-                "items": [],
-                "total": 0,
-                "page": page,
-                "page_size": page_size,
-                "has_next": False
-            }
-
-        # 1-1. 전일 거래일 찾기
-        prev_trade_date_query = (
-            select(StockPrice.trade_date)
-            .where(StockPrice.trade_date < latest_trade_date)
-            .order_by(desc(StockPrice.trade_date))
-            .limit(1)
-        )
-        prev_date_result = await self.db.execute(prev_trade_date_query)
-        prev_trade_date = prev_date_result.scalar_one_or_none()
 
-        # 2. 정렬 컬럼 매핑
+        Raises:
+            ValueError: 커서가 손상되었거나 정렬 조건과 맞지 않는 경우
+        """
+        # 1. 정렬 컬럼 매핑 (동순위는 company_id로 고정 → keyset 안정성 보장)
         sort_column = self._get_sort_column(sort_by)
         order_func = desc if sort_order == SortOrder.DESC else asc
 
-        # 3. 시세 데이터 조회 (전일 데이터와 JOIN하여 등락률 계산)
-        offset = (page - 1) * page_size
-
-        # 전일 주가 서브쿼리 (별칭: prev)
-        PrevStockPrice = StockPrice.__table__.alias("prev_stock_price")
+        # 2. WHERE 조건 구성
+        filter_conditions = []
 
-        # WHERE 조건 구성
-        where_conditions = [StockPrice.trade_date == latest_trade_date]
-
-        # 검색어가 있으면 종목명 또는 종목코드로 필터링
+        # 검색어가 있으면 종목명 또는 종목코드로 필터링 (트라이그램 인덱스 사용)
         if search and search.strip():
             search_term = f"%{search.strip()}%"
-            where_conditions.append(
-                (Company.stock_name.ilike(search_term)) |
-                (Company.stock_code.ilike(search_term))
+            filter_conditions.append(
+                (LatestQuote.stock_name.ilike(search_term)) |
+                (LatestQuote.stock_code.ilike(search_term))
             )
 
-        query = (
-            select(
-                Company.stock_code,
-                Company.stock_name,
-                Company.industry,
-                Company.company_id,
-                StockPrice.close_price,
-                StockPrice.change_vs_1d,
-                StockPrice.fluctuation_rate,
-                StockPrice.volume,
-                StockPrice.trading_value,
-                StockPrice.market_cap,
-                StockPrice.trade_date,
-                PrevStockPrice.c.close_price.label("prev_close_price")
-            )
-            .join(StockPrice, Company.company_id == StockPrice.company_id)
-            .outerjoin(
-                PrevStockPrice,
-                and_(
-                    PrevStockPrice.c.company_id == Company.company_id,
-                    PrevStockPrice.c.trade_date == prev_trade_date
-                )
+        page_conditions = list(filter_conditions)
+        offset = (page - 1) * page_size
+        if cursor:
+            last_value, last_company_id, offset = self._decode_cursor(cursor, sort_by, sort_order)
+            keyset = tuple_(sort_column, LatestQuote.company_id)
+            page_conditions.append(
+                keyset < (last_value, last_company_id)
+                if sort_order == SortOrder.DESC
+                else keyset > (last_value, last_company_id)
             )
-            .where(and_(*where_conditions))
-            .order_by(order_func(sort_column))
-            .offset(offset)
+
+        # 3. 시세 데이터 조회
+        query = (
+            select(LatestQuote)
+            .order_by(order_func(sort_column), order_func(LatestQuote.company_id))
             .limit(page_size + 1)  # has_next 판단을 위해 1개 더 조회
         )
+        if page_conditions:
+            query = query.where(and_(*page_conditions))
+        if not cursor:
+            query = query.offset(offset)
 
         result = await self.db.execute(query)
-        rows = result.all()
+        rows = result.scalars().all()
 
         # 4. has_next 판단
         has_next = len(rows) > page_size
@@ -130,85 +163,153 @@ class MarketQuoteService:
             rows = rows[:page_size]
 
         # 5. 전체 개수 조회 (검색 조건 포함)
-        count_query = (
-            select(func.count())
-            .select_from(Company)
-            .join(StockPrice, Company.company_id == StockPrice.company_id)
-            .where(and_(*where_conditions))
-        )
+        count_query = select(func.count()).select_from(LatestQuote)
+        if filter_conditions:
+            count_query = count_query.where(and_(*filter_conditions))
         count_result = await self.db.execute(count_query)
         total = count_result.scalar()
 
-        # 6. 관심종목 목록 조회 (user_id가 있는 경우)
+        # 6. 관심종목 여부 조회 (현재 페이지 종목만)
         favorite_stock_codes = set()
-        if user_id:
+        if user_id and rows:
             favorite_query = select(UserFavoriteStock.stock_code).where(
-                UserFavoriteStock.user_id == user_id
+                and_(
+                    UserFavoriteStock.user_id == user_id,
+                    UserFavoriteStock.stock_code.in_([row.stock_code for row in rows])
+                )
             )
             favorite_result = await self.db.execute(favorite_query)
             favorite_stock_codes = {row[0] for row in favorite_result.all()}
 
         # 7. 응답 데이터 생성 (rank 추가)
-        offset = (page - 1) * page_size
         items = []
         for idx, row in enumerate(rows):
-            # fluctuation_rate 계산: DB값 우선, 없으면 전일 종가로 계산
-            fluctuation_rate = row.fluctuation_rate
-            change_amount = row.change_vs_1d
-
-            if fluctuation_rate is None and row.prev_close_price and row.prev_close_price != 0:
-                # 등락률 = ((현재가 - 전일종가) / 전일종가) * 100
-                fluctuation_rate = ((row.close_price - row.prev_close_price) / row.prev_close_price) * 100
-                # 등락 금액도 계산
-                if change_amount is None:
-                    change_amount = row.close_price - row.prev_close_price
-            elif fluctuation_rate is None:
-                fluctuation_rate = 0.0
-
             items.append({
-                "rank": offset + idx + 1,  # 페이지 기준 순위 계산
+                "rank": offset + idx + 1,  # 정렬 기준 순위
                 "name": row.stock_name,
                 "code": row.stock_code,
                 "theme": row.industry,
-                "price": row.close_price or 0,
-                "change_amount": change_amount or 0,
-                "change_rate": fluctuation_rate,
-                "trend": self._get_trend(fluctuation_rate),
-                "volume": row.volume or 0,
-                "trading_value": row.trading_value or 0,
-                "market_cap": row.market_cap,
+                "price": row.close_price,
+                "change_amount": row.change_amount,
+                "change_rate": row.change_rate,
+                "trend": self._get_trend(row.change_rate),
+                "volume": row.volume,
+                "trading_value": row.trading_value,
+                "market_cap": row.market_cap or None,
                 "is_favorite": row.stock_code in favorite_stock_codes
             })
 
+        next_cursor = None
+        if has_next and rows:
+            last = rows[-1]
+            next_cursor = self._encode_cursor(
+                sort_by,
+                sort_order,
+                getattr(last, sort_column.key),
+                last.company_id,
+                offset + len(rows)
+            )
+
         return {
             "items": items,
             "total": total,
-            "page": page,
+            "page": page if not cursor else offset // page_size + 1,
             "page_size": page_size,
-            "has_next": has_next
+            "has_next": has_next,
+            "next_cursor": next_cursor
         }
 
-    async def _get_latest_trade_date(self) -> Optional[datetime.date]:
-        """최신 거래일 조회"""
-        query = (
-            select(StockPrice.trade_date)
-            .order_by(desc(StockPrice.trade_date))
-            .limit(1)
+    async def refresh_latest_quotes(self) -> Dict[str, Any]:
+        """
+        latest_quotes 스냅샷 갱신 (시세 적재 직후 호출)
+
+        최신/전일 거래일 시세로 종목별 행을 upsert하고,
+        최신 거래일에 시세가 없는 종목(상장폐지 등)은 제거한다.
+
+        Returns:
+            갱신 결과 통계
+        """
+        latest_trade_date = await self._get_latest_trade_date()
+        if not latest_trade_date:
+            return {"status": "skipped", "reason": "no data"}
+
+        prev_trade_date = await self._get_latest_trade_date(before=latest_trade_date)
+
+        result = await self.db.execute(
+            REFRESH_LATEST_QUOTES_SQL,
+            {"latest_date": latest_trade_date, "prev_date": prev_trade_date}
+        )
+        upserted = result.rowcount
+
+        delete_result = await self.db.execute(
+            LatestQuote.__table__.delete().where(LatestQuote.trade_date < latest_trade_date)
         )
+        await self.db.commit()
+
+        logger.info(
+            f"latest_quotes 갱신 완료: {latest_trade_date} (전일 {prev_trade_date}), "
+            f"{upserted}건 upsert, {delete_result.rowcount}건 삭제"
+        )
+        return {
+            "status": "success",
+            "trade_date": latest_trade_date.strftime("%Y-%m-%d"),
+            "prev_trade_date": prev_trade_date.strftime("%Y-%m-%d") if prev_trade_date else None,
+            "rows_upserted": upserted,
+            "rows_deleted": delete_result.rowcount
+        }
+
+    async def _get_latest_trade_date(
+        self,
+        before: Optional[datetime.date] = None
+    ) -> Optional[datetime.date]:
+        """최신 거래일 조회 (before가 있으면 그 이전 거래일)"""
+        query = select(func.max(StockPrice.trade_date))
+        if before:
+            query = query.where(StockPrice.trade_date < before)
         result = await self.db.execute(query)
-        row = result.scalar_one_or_none()
-        return row
+        return result.scalar_one_or_none()
 
     def _get_sort_column(self, sort_by: SortBy):
         """정렬 컬럼 매핑"""
         sort_map = {
-            SortBy.VOLUME: StockPrice.volume,
-            SortBy.CHANGE_RATE: StockPrice.fluctuation_rate,
-            SortBy.TRADING_VALUE: StockPrice.trading_value,
-            SortBy.MARKET_CAP: StockPrice.market_cap,
-            SortBy.NAME: Company.stock_name
+            SortBy.VOLUME: LatestQuote.volume,
+            SortBy.CHANGE_RATE: LatestQuote.change_rate,
+            SortBy.TRADING_VALUE: LatestQuote.trading_value,
+            SortBy.MARKET_CAP: LatestQuote.market_cap,
+            SortBy.NAME: LatestQuote.stock_name
         }
-        return sort_map.get(sort_by, StockPrice.market_cap)
+        return sort_map.get(sort_by, LatestQuote.market_cap)
+
+    @staticmethod
+    def _encode_cursor(
+        sort_by: SortBy,
+        sort_order: SortOrder,
+        last_value: Any,
+        last_company_id: int,
+        offset: int
+    ) -> str:
+        """keyset 커서 생성 (정렬 조건 + 마지막 행 정렬값/ID + 누적 순위)"""
+        payload = {
+            "s": sort_by.value,
+            "o": sort_order.value,
+            "v": last_value,
+            "id": last_company_id,
+            "n": offset
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort_by: SortBy, sort_order: SortOrder) -> tuple:
+        """keyset 커서 해석 → (마지막 정렬값, 마지막 company_id, 누적 순위)"""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            if payload["s"] != sort_by.value or payload["o"] != sort_order.value:
+                raise ValueError("커서의 정렬 조건이 요청과 다릅니다")
+            return payload["v"], int(payload["id"]), int(payload["n"])
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"잘못된 커서입니다: {e}")
 
     @staticmethod
     def _get_trend(change_rate: Optional[float]) -> str:
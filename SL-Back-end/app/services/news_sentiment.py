@@ -0,0 +1,190 @@
+"""
+종목 뉴스 감성 추세 서비스
+- news_sentiment_daily 롤업(일간 기사 수/감성 점수 합)만 읽어 7일/30일 추세 계산
+- 최근 일자의 감성 급변(change-point) 감지
+- 원문 기사 대신 수백 바이트 요약만 반환 (챗봇 analyze_stock_sentiment 도구용)
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.news import NewsArticle, NewsSentimentDaily
+
+logger = logging.getLogger(__name__)
+
+# 추세 윈도우 (일)
+TREND_WINDOWS = (7, 30)
+# 급변 감지: 최근 1일 평균과 직전 3일 평균 차이 임계값
+SUDDEN_CHANGE_LOOKBACK = 3
+SUDDEN_CHANGE_THRESHOLD = 0.6
+# 전후반 평균 차이로 방향 판단
+DIRECTION_THRESHOLD = 0.25
+
+
+@dataclass
+class DailySentiment:
+    date: date
+    score_sum: int
+    count: int
+    positive: int
+    negative: int
+    neutral: int
+
+    @property
+    def average(self) -> float:
+        return self.score_sum / self.count if self.count else 0.0
+
+
+def _ratio(items: Sequence[DailySentiment]) -> float:
+    count = sum(item.count for item in items)
+    return sum(item.score_sum for item in items) / count if count else 0.0
+
+
+class NewsSentimentService:
+    """news_sentiment_daily 기반 종목 감성 추세 조회"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_stock_sentiment_trend(
+        self,
+        stock_code: str,
+        latest_limit: int = 5,
+        today: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        종목 감성 추세 요약
+
+        Returns:
+            {
+                "stock_code", "data_points",
+                "window_trends": {"7d": {...}, "30d": {...}},
+                "sudden_change": {...} | None,
+                "latest_articles": [{"title", "sentiment", "publishedAt"}]
+            }
+        """
+        today = today or date.today()
+        max_window = max(TREND_WINDOWS)
+
+        # 최근 일자 롤업 행만 조회 (PK 인덱스 역순 스캔)
+        result = await self.db.execute(
+            select(NewsSentimentDaily)
+            .where(NewsSentimentDaily.stock_code == stock_code)
+            .order_by(NewsSentimentDaily.date.desc())
+            .limit(max(max_window, SUDDEN_CHANGE_LOOKBACK + 1))
+        )
+        daily = [
+            DailySentiment(
+                date=row.date,
+                score_sum=row.score_sum,
+                count=row.article_count,
+                positive=row.positive_count,
+                negative=row.negative_count,
+                neutral=row.neutral_count,
+            )
+            for row in reversed(result.scalars().all())
+            if row.article_count > 0
+        ]
+
+        return {
+            "stock_code": stock_code,
+            "data_points": sum(item.count for item in daily),
+            "window_trends": {
+                f"{days}d": self._compute_window_trend(daily, days, today)
+                for days in TREND_WINDOWS
+            },
+            "sudden_change": self._detect_sudden_change(daily),
+            "latest_articles": await self._latest_articles(stock_code, latest_limit),
+        }
+
+    async def _latest_articles(self, stock_code: str, limit: int) -> List[Dict[str, Any]]:
+        if limit <= 0:
+            return []
+        result = await self.db.execute(
+            select(NewsArticle.title, NewsArticle.sentiment_label, NewsArticle.news_date)
+            .where(NewsArticle.stock_code == stock_code)
+            .order_by(NewsArticle.news_date.desc().nulls_last(), NewsArticle.analyzed_at.desc().nulls_last())
+            .limit(limit)
+        )
+        return [
+            {
+                "title": row.title,
+                "sentiment": (row.sentiment_label or "neutral").lower(),
+                "publishedAt": row.news_date.strftime("%Y.%m.%d") if row.news_date else "",
+            }
+            for row in result.all()
+        ]
+
+    @staticmethod
+    def _compute_window_trend(daily: Sequence[DailySentiment], days: int, today: date) -> Dict[str, Any]:
+        cutoff = today - timedelta(days=days)
+        window = [item for item in daily if item.date > cutoff]
+        if not window:
+            return {"window_days": days, "status": "insufficient_data"}
+
+        total_count = sum(item.count for item in window)
+        avg_score = _ratio(window)
+
+        midpoint = max(1, len(window) // 2)
+        delta = _ratio(window[midpoint:]) - _ratio(window[:midpoint])
+
+        if delta > DIRECTION_THRESHOLD:
+            direction = "상승"
+        elif delta < -DIRECTION_THRESHOLD:
+            direction = "하락"
+        else:
+            direction = "보합"
+
+        dominant = max(
+            ("positive", sum(item.positive for item in window)),
+            ("negative", sum(item.negative for item in window)),
+            ("neutral", sum(item.neutral for item in window)),
+            key=lambda x: x[1],
+        )[0]
+
+        return {
+            "window_days": days,
+            "status": "ok",
+            "avg_score": round(avg_score, 2),
+            "direction": direction,
+            "momentum": round(delta, 2),
+            "dominant_sentiment": dominant,
+            "article_count": total_count,
+            "explanation": (
+                f"최근 {days}일 동안 평균 감성 점수는 {avg_score:.2f}로 {direction} 흐름을 보입니다. "
+                f"{dominant} 기사가 상대적으로 많았습니다."
+            ),
+        }
+
+    @staticmethod
+    def _detect_sudden_change(daily: Sequence[DailySentiment]) -> Optional[Dict[str, Any]]:
+        if len(daily) < SUDDEN_CHANGE_LOOKBACK + 1:
+            return None
+
+        recent = daily[-1]
+        prior_window = daily[-(SUDDEN_CHANGE_LOOKBACK + 1):-1]
+        if not sum(item.count for item in prior_window):
+            return None
+
+        prior_avg = _ratio(prior_window)
+        change = recent.average - prior_avg
+        if abs(change) < SUDDEN_CHANGE_THRESHOLD:
+            return None
+
+        direction = "급등" if change > 0 else "급락"
+        return {
+            "date": recent.date.strftime("%Y-%m-%d"),
+            "change": round(change, 2),
+            "direction": direction,
+            "description": (
+                f"{recent.date.strftime('%Y-%m-%d')} 기준 감성 점수가 {change:+.2f}만큼 {direction}했습니다. "
+                "최근 기사에서 정서 변화가 크게 나타났습니다."
+            ),
+            "recent_avg": round(recent.average, 2),
+            "previous_avg": round(prior_avg, 2),
+        }
@@ -0,0 +1,193 @@
+"""
+백테스트 결과 대량 저장 모듈
+- asyncpg binary COPY로 일별 값/거래 내역을 스트리밍 저장 (multi-row INSERT 문 생성 없음)
+- chunk 단위 전송으로 행 수와 무관하게 메모리 사용량 일정
+- asyncpg가 아닌 드라이버에서는 chunk 단위 executemany INSERT로 대체
+- 저장 행 수/소요 시간/rows per sec 로깅
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import JSON, Date, Float, Integer, Numeric, Table, insert
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+@dataclass
+class WriteStats:
+    table: str
+    rows: int
+    seconds: float
+    method: str
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+
+def _to_decimal(value: Any) -> Optional[Decimal]:
+    if value is None or isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def _to_int(value: Any) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _to_date(value: Any) -> Optional[date]:
+    # datetime / pandas.Timestamp → date
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _to_json(value: Any) -> Optional[str]:
+    # asyncpg는 json/jsonb를 문자열로 받음
+    return None if value is None else json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _converter(column) -> Optional[Callable[[Any], Any]]:
+    """COPY(binary)용 컬럼 타입별 값 변환 (float → Decimal 등)"""
+    column_type = column.type
+    if isinstance(column_type, (JSON, JSONB)):
+        return _to_json
+    if isinstance(column_type, Float):
+        return lambda value: None if value is None else float(value)
+    if isinstance(column_type, Numeric):
+        return _to_decimal
+    if isinstance(column_type, Integer):
+        return _to_int
+    if isinstance(column_type, Date):
+        return _to_date
+    return None
+
+
+class BulkResultWriter:
+    """백테스트 결과 테이블 대량 저장 (COPY 우선, INSERT 대체)"""
+
+    def __init__(self, db: AsyncSession, chunk_size: int = DEFAULT_CHUNK_SIZE, use_copy: bool = True):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.use_copy = use_copy
+
+    async def write(self, model: Any, rows: Iterable[Dict[str, Any]]) -> WriteStats:
+        """
+        rows를 model 테이블에 저장 (현재 트랜잭션 안에서 실행, commit은 호출 측 책임)
+
+        Args:
+            model: ORM 모델 클래스 또는 Table
+            rows: 컬럼명 → 값 dict (첫 행의 키로 컬럼 목록 결정)
+        """
+        table: Table = getattr(model, "__table__", model)
+        start = time.perf_counter()
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is None:
+            return WriteStats(table.name, 0, 0.0, "none")
+
+        # ORM이 채우던 스칼라 기본값(default=0 등)은 COPY에서도 채움
+        defaults = {
+            column.name: column.default.arg
+            for column in table.columns
+            if column.name not in first and column.default is not None and column.default.is_scalar
+        }
+        columns = list(first.keys()) + list(defaults.keys())
+
+        driver_conn = await self._copy_connection() if self.use_copy else None
+        if driver_conn is not None:
+            written = await self._copy(driver_conn, table, columns, defaults, first, iterator)
+            method = "copy"
+        else:
+            written = await self._insert(table, defaults, first, iterator)
+            method = "insert"
+
+        stats = WriteStats(table.name, written, time.perf_counter() - start, method)
+        logger.info(
+            f"💾 {stats.table}: {stats.rows}건 저장 ({stats.method}, "
+            f"{stats.seconds:.3f}초, {stats.rows_per_sec:,.0f} rows/sec)"
+        )
+        return stats
+
+    async def _copy_connection(self) -> Optional[Any]:
+        """현재 세션 트랜잭션의 asyncpg 커넥션 (asyncpg가 아니면 None)"""
+        try:
+            connection = await self.db.connection()
+            if connection.dialect.driver != "asyncpg":
+                return None
+            # ORM으로 add()한 부모 행(FK 대상)이 먼저 INSERT되도록 flush
+            await self.db.flush()
+            raw = await connection.get_raw_connection()
+            driver_conn = getattr(raw, "driver_connection", None)
+            if driver_conn is None:
+                # SQLAlchemy 1.4: AdaptedConnection._connection
+                driver_conn = getattr(raw.connection, "_connection", None)
+            return driver_conn if hasattr(driver_conn, "copy_records_to_table") else None
+        except Exception as e:
+            logger.warning(f"COPY 커넥션 획득 실패, INSERT로 대체: {e}")
+            return None
+
+    async def _copy(
+        self,
+        driver_conn: Any,
+        table: Table,
+        columns: Sequence[str],
+        defaults: Dict[str, Any],
+        first: Dict[str, Any],
+        rest: Iterable[Dict[str, Any]],
+    ) -> int:
+        converters = [_converter(table.columns[name]) for name in columns]
+
+        def to_record(row: Dict[str, Any]) -> tuple:
+            values = []
+            for name, convert in zip(columns, converters):
+                value = row[name] if name in row else defaults.get(name)
+                values.append(convert(value) if convert else value)
+            return tuple(values)
+
+        written = 0
+        chunk: List[tuple] = [to_record(first)]
+        for row in rest:
+            chunk.append(to_record(row))
+            if len(chunk) >= self.chunk_size:
+                await driver_conn.copy_records_to_table(
+                    table.name, records=chunk, columns=list(columns), schema_name=table.schema
+                )
+                written += len(chunk)
+                chunk = []
+        if chunk:
+            await driver_conn.copy_records_to_table(
+                table.name, records=chunk, columns=list(columns), schema_name=table.schema
+            )
+            written += len(chunk)
+        return written
+
+    async def _insert(
+        self,
+        table: Table,
+        defaults: Dict[str, Any],
+        first: Dict[str, Any],
+        rest: Iterable[Dict[str, Any]],
+    ) -> int:
+        written = 0
+        chunk: List[Dict[str, Any]] = [{**defaults, **first}]
+        for row in rest:
+            chunk.append({**defaults, **row})
+            if len(chunk) >= self.chunk_size:
+                await self.db.execute(insert(table), chunk)
+                written += len(chunk)
+                chunk = []
+        if chunk:
+            await self.db.execute(insert(table), chunk)
+            written += len(chunk)
+        return written
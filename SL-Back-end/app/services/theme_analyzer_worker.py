@@ -1,20 +1,39 @@
 """
 Background theme sentiment analysis worker.
+
+- 테마별 뉴스 크롤링을 제한된 동시성으로 병렬 실행
+- 기사 URL(없으면 제목 해시)로 이미 채점한 기사를 건너뛰고 신규 기사만 채점
+- 신규 기사는 테마 구분 없이 한 번에 배치 채점 (keyword 또는 llm)
+- 모든 테마 결과를 하나의 트랜잭션으로 저장
 """
 import asyncio
+import hashlib
 import os
-from typing import List, Dict
+from datetime import datetime, timedelta
+from typing import List, Dict, Tuple
 from loguru import logger
 from sqlalchemy import select
 import json
-from sqlalchemy.dialects.postgresql import insert
 
 from app.services.news_crawler import NewsCrawler
 from app.core.database import AsyncSessionLocal
 from app.core.config import get_settings
-from app.api.routes.news import ThemeSentiment
+from app.core.cache import cache
+from app.models.news import ThemeSentiment
 from app.services.shared_data import AVAILABLE_THEMES
 
+# 분석 대상 테마
+MAJOR_THEME_IDS = ['semiconductor', 'ai', 'secondary_battery', 'bio_pharma', 'robot', 'construction', 'finance']
+
+# 테마별 집계 윈도우 (최신 기사 수)
+THEME_WINDOW_SIZE = 50
+
+# 채점 결과 보관 TTL (초) - 윈도우에서 밀려난 기사는 자연 만료
+SCORED_ARTICLES_TTL = 3 * 24 * 60 * 60
+
+# LLM 배치 채점 시 한 번에 보내는 제목 수
+LLM_BATCH_SIZE = 25
+
 
 def simple_sentiment_analyzer(text: str) -> float:
     """
@@ -35,9 +54,39 @@ def simple_sentiment_analyzer(text: str) -> float:
     else:
         return 0.0
 
+def _classify_titles_with_bedrock(bedrock, news_titles: List[str]) -> List[float]:
+    """제목 묶음을 한 번의 호출로 분류 (동기 boto3 호출, 스레드에서 실행)"""
+    numbered = "\n".join(f"{i + 1}. {title}" for i, title in enumerate(news_titles))
+    prompt = f"""Human: 다음 뉴스 제목 각각의 감성을 '긍정', '부정', '중립' 중 하나로만 분류해줘.
+"번호. 분류" 형식으로 한 줄에 하나씩만 답하고 다른 설명은 절대 추가하지 마.
+{numbered}
+Assistant:"""
+
+    body = json.dumps({
+        "prompt": prompt,
+        "max_tokens_to_sample": 12 * len(news_titles),
+        "temperature": 0.1,
+    })
+
+    response = bedrock.invoke_model(body=body, modelId="anthropic.claude-instant-v1")
+    completion = json.loads(response.get('body').read()).get('completion', '')
+
+    scores = [0.0] * len(news_titles)
+    for line in completion.strip().splitlines():
+        number, _, label = line.partition('.')
+        if not number.strip().isdigit():
+            continue
+        idx = int(number.strip()) - 1
+        if 0 <= idx < len(scores):
+            if "긍정" in label: scores[idx] = 1.0
+            elif "부정" in label: scores[idx] = -1.0
+    return scores
+
+
 async def llm_sentiment_analyzer(news_titles: List[str]) -> List[float]:
     """
     LLM을 사용한 뉴스 제목 감성 분석 (Bedrock Claude 사용)
+    - LLM_BATCH_SIZE개씩 묶어 호출, 동기 boto3 호출은 스레드로 오프로드
     """
     try:
         import boto3
@@ -52,30 +101,58 @@ async def llm_sentiment_analyzer(news_titles: List[str]) -> List[float]:
         return [0.0] * len(news_titles)
 
     scores = []
-    for title in news_titles:
-        prompt = f"""Human: 다음 뉴스 제목의 감성을 '긍정', '부정', '중립' 중 하나로만 분류해줘. 다른 설명은 절대 추가하지 마.
-뉴스 제목: "{title}"
-Assistant:"""
-
-        body = json.dumps({
-            "prompt": prompt,
-            "max_tokens_to_sample": 10,
-            "temperature": 0.1,
-        })
-        
+    for start in range(0, len(news_titles), LLM_BATCH_SIZE):
+        batch = news_titles[start:start + LLM_BATCH_SIZE]
         try:
-            response = bedrock.invoke_model(body=body, modelId="anthropic.claude-instant-v1")
-            result = json.loads(response.get('body').read()).get('completion', '중립').strip()
-            
-            if "긍정" in result: scores.append(1.0)
-            elif "부정" in result: scores.append(-1.0)
-            else: scores.append(0.0)
+            scores.extend(await asyncio.to_thread(_classify_titles_with_bedrock, bedrock, batch))
         except Exception as e:
             logger.error(f"LLM 감성 분석 API 호출 오류: {e}")
-            scores.append(0.0)
+            scores.extend([0.0] * len(batch))
     return scores
 
 
+def _article_key(news: Dict) -> str:
+    """기사 식별 키 (URL 우선, 없으면 제목 해시)"""
+    source = news.get('link') or news.get('url') or news.get('title', '')
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+
+def _scored_cache_key(theme_id: str) -> str:
+    return f"theme_sentiment:scored:{theme_id}"
+
+
+async def _crawl_theme(
+    crawler: "NewsCrawler",
+    theme: Dict,
+    semaphore: asyncio.Semaphore
+) -> Tuple[Dict, List[Dict]]:
+    """테마 하나의 최신 뉴스 크롤링 (세마포어로 동시성 제한)"""
+    async with semaphore:
+        try:
+            news_list = await crawler.crawl_stock_news("unknown", theme['name'], max_results=THEME_WINDOW_SIZE)
+        except Exception as e:
+            logger.error(f"'{theme['name']}' 테마 뉴스 크롤링 실패: {e}")
+            news_list = []
+    return theme, news_list or []
+
+
+async def _score_titles(titles: List[str]) -> List[float]:
+    """신규 제목 배치 채점 (THEME_SENTIMENT_ANALYZER=keyword|llm)"""
+    if not titles:
+        return []
+    if os.getenv("THEME_SENTIMENT_ANALYZER", "keyword").lower() == "llm":
+        return await llm_sentiment_analyzer(titles)
+    return [simple_sentiment_analyzer(title) for title in titles]
+
+
+def _sentiment_label(avg_score: float) -> str:
+    if avg_score > 0.1:
+        return "positive"
+    if avg_score < -0.1:
+        return "negative"
+    return "neutral"
+
+
 async def analyze_and_save_theme_sentiment():
     """주요 테마의 뉴스 감성을 분석하고 DB에 저장합니다."""
     logger.info("테마 감성 분석 작업 시작...")
@@ -88,55 +165,93 @@ async def analyze_and_save_theme_sentiment():
         return
 
     crawler = NewsCrawler(client_id, client_secret)
-    major_themes = [theme for theme in AVAILABLE_THEMES if theme['id'] in ['semiconductor', 'ai', 'secondary_battery', 'bio_pharma', 'robot', 'construction', 'finance']]
+    major_themes = [theme for theme in AVAILABLE_THEMES if theme['id'] in MAJOR_THEME_IDS]
+    concurrency = int(os.getenv("THEME_ANALYSIS_CONCURRENCY", 4))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # 1. 테마별 크롤링 (병렬) + 기존 채점 결과 로드
+    crawled = await asyncio.gather(*[_crawl_theme(crawler, theme, semaphore) for theme in major_themes])
+    previously_scored = await asyncio.gather(*[cache.get(_scored_cache_key(theme['id'])) for theme in major_themes])
+    known_scores: Dict[str, float] = {}
+    for scored in previously_scored:
+        if scored:
+            known_scores.update(scored)
+
+    # 2. 신규 기사만 추려 테마 구분 없이 배치 채점 (같은 기사가 여러 테마에 걸쳐도 1회)
+    theme_windows: List[Tuple[Dict, List[str]]] = []
+    pending: Dict[str, str] = {}
+    for theme, news_list in crawled:
+        keys = []
+        for news in news_list[:THEME_WINDOW_SIZE]:
+            key = _article_key(news)
+            keys.append(key)
+            if key not in known_scores and key not in pending:
+                pending[key] = news.get('title', '')
+        theme_windows.append((theme, keys))
+
+    pending_keys = list(pending.keys())
+    new_scores = await _score_titles([pending[key] for key in pending_keys])
+    known_scores.update(zip(pending_keys, new_scores))
+    logger.info(f"신규 기사 {len(pending_keys)}건 채점 (재사용 {sum(len(k) for _, k in theme_windows) - len(pending_keys)}건)")
+
+    # 3. 테마별 집계 후 한 트랜잭션으로 저장
+    now = datetime.now()
+    window_start = now - timedelta(seconds=int(os.getenv("THEME_ANALYSIS_INTERVAL_SECONDS", 3600)))
 
     async with AsyncSessionLocal() as db:
-        for theme in major_themes:
-            theme_name = theme['name']
-            logger.info(f"'{theme_name}' 테마 뉴스 분석 중...")
-            news_list = await crawler.crawl_stock_news("unknown", theme_name, max_results=50)
-
-            if not news_list:
-                logger.info(f"'{theme_name}' 테마 분석 종료: 뉴스 0건")
-                continue
-
-            news_titles = [news['title'] for news in news_list]
-            # Use simple keyword-based sentiment analysis for now (faster and cheaper)
-            sentiments = [simple_sentiment_analyzer(title) for title in news_titles]
-
-            total_score = 0
-            positive_count = 0
-            negative_count = 0
-            for sentiment in sentiments:
-                total_score += sentiment
-                if sentiment > 0: positive_count += 1
-                if sentiment < 0: negative_count += 1
-
-            avg_score = total_score / len(sentiments) if sentiments else 0
-
-            # Upsert (Insert or Update) a a ThemeSentiment
-            stmt = insert(ThemeSentiment).values(
-                theme_name=theme_name, # type: ignore
-                sentiment_score=avg_score,
-                summary=f"최근 50개 뉴스 중 긍정 {positive_count}개, 부정 {negative_count}개",
-                positive_news_count=positive_count,
-                negative_news_count=negative_count
-            ).on_conflict_do_update(
-                index_elements=['theme_name'],
-                set_={
-                    "sentiment_score": avg_score,
-                    "summary": f"최근 50개 뉴스 중 긍정 {positive_count}개, 부정 {negative_count}개",
-                    "positive_news_count": positive_count,
-                    "negative_news_count": negative_count,
-                }
-            )
-            await db.execute(stmt)
-            logger.info(
-                f"'{theme_name}' 테마 분석 종료: 뉴스 {len(news_list)}건, 긍정 {positive_count}건, 부정 {negative_count}건, 평균 {avg_score:.2f}"
+        try:
+            theme_ids = [theme['id'] for theme, keys in theme_windows if keys]
+            existing_result = await db.execute(
+                select(ThemeSentiment).where(ThemeSentiment.theme.in_(theme_ids))
             )
-        
-        await db.commit()
-        logger.info("테마 감성 분석 작업 완료.")
+            existing = {row.theme: row for row in existing_result.scalars().all()}
+
+            for theme, keys in theme_windows:
+                theme_name = theme['name']
+                if not keys:
+                    logger.info(f"'{theme_name}' 테마 분석 종료: 뉴스 0건")
+                    continue
+
+                sentiments = [known_scores[key] for key in keys]
+                positive_count = sum(1 for sentiment in sentiments if sentiment > 0)
+                negative_count = sum(1 for sentiment in sentiments if sentiment < 0)
+                avg_score = sum(sentiments) / len(sentiments)
+
+                # Upsert: 테마당 1행 유지 (점수는 -100 ~ 100 정수)
+                row = existing.get(theme['id'])
+                if row is None:
+                    row = ThemeSentiment(theme=theme['id'], theme_code=theme['id'])
+                    db.add(row)
+                row.avg_sentiment_score = round(avg_score * 100)
+                row.sentiment_label = _sentiment_label(avg_score)
+                row.total_count = len(sentiments)
+                row.positive_count = positive_count
+                row.negative_count = negative_count
+                row.neutral_count = len(sentiments) - positive_count - negative_count
+                row.window_start = window_start
+                row.window_end = now
+                row.calculated_at = now
+
+                logger.info(
+                    f"'{theme_name}' 테마 분석 종료: 뉴스 {len(keys)}건, 긍정 {positive_count}건, 부정 {negative_count}건, 평균 {avg_score:.2f}"
+                )
+
+            await db.commit()
+        except Exception as e:
+            logger.error(f"테마 감성 저장 실패: {e}")
+            await db.rollback()
+            return
+
+    # 4. 현재 윈도우의 채점 결과만 보관 (윈도우 밖 기사는 다음 실행에서 제외)
+    await asyncio.gather(*[
+        cache.set(
+            _scored_cache_key(theme['id']),
+            {key: known_scores[key] for key in keys},
+            ttl=SCORED_ARTICLES_TTL
+        )
+        for theme, keys in theme_windows if keys
+    ])
+    logger.info("테마 감성 분석 작업 완료.")
 
 async def theme_analyzer_loop(stop_event: asyncio.Event):
     """주기적인 테마 분석 루프"""
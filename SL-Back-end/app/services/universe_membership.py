@@ -0,0 +1,149 @@
+"""
+시점별 유니버스 편입 비트맵 인덱스
+- stock_universe_history를 한 번에 읽어 (유니버스 × 거래일 × 종목) 비트셋으로 압축
+- 리밸런싱 날짜마다 해당 시점의 편입 종목을 벡터 마스크로 조회
+- 직렬화된 인덱스는 Redis에 캐싱 (1회 GET으로 로드)
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class UniverseMembershipIndex:
+    """
+    유니버스 편입 비트맵 인덱스
+
+    bits[u, d]는 거래일 d에 유니버스 u에 편입된 종목 인덱스의 packbits 비트셋이다.
+    조회 시점에 데이터가 없으면 그 이전 가장 가까운 거래일(as-of) 분류를 사용한다.
+    """
+
+    def __init__(
+        self,
+        universe_ids: List[str],
+        stock_codes: List[str],
+        dates: np.ndarray,
+        bits: np.ndarray
+    ):
+        self.universe_ids = list(universe_ids)
+        self.stock_codes = np.asarray(stock_codes, dtype=object)
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.bits = bits
+        self._code_index = pd.Index(self.stock_codes)
+        self._universe_pos = {uid: i for i, uid in enumerate(self.universe_ids)}
+
+    @classmethod
+    def from_rows(
+        cls,
+        stock_codes: Iterable[str],
+        universe_ids: Iterable[str],
+        trade_dates: Iterable[Any]
+    ) -> "UniverseMembershipIndex":
+        """(종목코드, 유니버스ID, 거래일) 행으로 인덱스 생성"""
+        codes_arr = np.asarray(list(stock_codes), dtype=object)
+        uids_arr = np.asarray(list(universe_ids), dtype=object)
+        dates_arr = np.asarray(list(trade_dates), dtype="datetime64[D]")
+
+        if len(codes_arr) == 0:
+            return cls([], [], np.array([], dtype="datetime64[D]"), np.zeros((0, 0, 0), dtype=np.uint8))
+
+        code_values, code_idx = np.unique(codes_arr, return_inverse=True)
+        uid_values, uid_idx = np.unique(uids_arr, return_inverse=True)
+        date_values, date_idx = np.unique(dates_arr, return_inverse=True)
+
+        dense = np.zeros((len(uid_values), len(date_values), len(code_values)), dtype=bool)
+        dense[uid_idx, date_idx, code_idx] = True
+        bits = np.packbits(dense, axis=-1)
+
+        return cls(list(uid_values), list(code_values), date_values, bits)
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "UniverseMembershipIndex":
+        """캐시 직렬화 형식에서 복원"""
+        return cls(
+            payload["universe_ids"],
+            payload["stock_codes"],
+            np.asarray(payload["dates"], dtype="datetime64[D]"),
+            payload["bits"]
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """캐시 직렬화 형식 (numpy 배열 그대로 pickle)"""
+        return {
+            "universe_ids": self.universe_ids,
+            "stock_codes": self.stock_codes.tolist(),
+            "dates": self.dates,
+            "bits": self.bits
+        }
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.dates) == 0 or len(self.stock_codes) == 0
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.bits.nbytes)
+
+    def _date_position(self, trade_date: Any) -> Optional[int]:
+        """as-of 거래일 위치 (trade_date 이하 가장 최근 분류일)"""
+        target = np.datetime64(pd.Timestamp(trade_date).date(), "D")
+        pos = int(np.searchsorted(self.dates, target, side="right")) - 1
+        return pos if pos >= 0 else None
+
+    def _universe_positions(self, universe_ids: Optional[Iterable[str]]) -> List[int]:
+        if universe_ids is None:
+            return list(range(len(self.universe_ids)))
+        return [self._universe_pos[uid] for uid in universe_ids if uid in self._universe_pos]
+
+    def member_mask(self, trade_date: Any, universe_ids: Optional[Iterable[str]] = None) -> np.ndarray:
+        """
+        시점별 편입 마스크 (종목 인덱스 기준, 여러 유니버스는 OR)
+
+        Returns:
+            shape (n_stocks,) bool 배열
+        """
+        n_stocks = len(self.stock_codes)
+        pos = self._date_position(trade_date) if not self.is_empty else None
+        u_positions = self._universe_positions(universe_ids)
+        if pos is None or not u_positions:
+            return np.zeros(n_stocks, dtype=bool)
+
+        packed = np.bitwise_or.reduce(self.bits[u_positions, pos], axis=0)
+        return np.unpackbits(packed, count=n_stocks).astype(bool)
+
+    def mask_for(
+        self,
+        trade_date: Any,
+        stock_codes: Iterable[str],
+        universe_ids: Optional[Iterable[str]] = None
+    ) -> Optional[np.ndarray]:
+        """
+        임의 종목코드 배열에 대한 편입 여부 (인덱스에 없는 종목은 False)
+
+        trade_date가 첫 분류일 이전이면 None (호출 측에서 기존 분류를 그대로 사용)
+        """
+        if self.is_empty or self._date_position(trade_date) is None:
+            return None
+        member = self.member_mask(trade_date, universe_ids)
+        positions = self._code_index.get_indexer(list(stock_codes))
+        result = np.zeros(len(positions), dtype=bool)
+        known = positions >= 0
+        result[known] = member[positions[known]]
+        return result
+
+    def members(self, trade_date: Any, universe_ids: Optional[Iterable[str]] = None) -> Set[str]:
+        """시점별 편입 종목코드 집합"""
+        return set(self.stock_codes[self.member_mask(trade_date, universe_ids)].tolist())
+
+    def all_members(self, universe_ids: Optional[Iterable[str]] = None) -> Set[str]:
+        """기간 중 한 번이라도 편입된 종목코드 집합 (가격 데이터 로드용)"""
+        u_positions = self._universe_positions(universe_ids)
+        if self.is_empty or not u_positions:
+            return set()
+        packed = np.bitwise_or.reduce(self.bits[u_positions].reshape(-1, self.bits.shape[-1]), axis=0)
+        mask = np.unpackbits(packed, count=len(self.stock_codes)).astype(bool)
+        return set(self.stock_codes[mask].tolist())
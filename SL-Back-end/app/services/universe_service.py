@@ -7,14 +7,16 @@
 
 import logging
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-from sqlalchemy import select, and_, func, desc
+from sqlalchemy import select, and_, or_, func, desc, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache
 from app.models.company import Company
 from app.models.stock_price import StockPrice
 from app.models.stock_universe_history import StockUniverseHistory
+from app.services.universe_membership import UniverseMembershipIndex
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +40,12 @@ class UniverseService:
         }
     }
 
+    # 편입 비트맵 인덱스 캐시 TTL (초) - 히스토리는 일 배치로 갱신
+    MEMBERSHIP_CACHE_TTL = 6 * 60 * 60
+
+    # 시작일 as-of 분류를 찾기 위한 추가 조회 기간 (연휴 대비)
+    MEMBERSHIP_LOOKBACK_DAYS = 14
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -410,9 +418,39 @@ class UniverseService:
             logger.error(f"날짜 변환 실패: {e}")
             return []
 
-        all_stock_codes = set()
+        # 모든 유니버스 조건을 OR로 묶어 단일 쿼리로 조회
+        universe_conditions = self._build_universe_conditions(universe_ids)
+        if not universe_conditions:
+            return []
+
+        stmt = (
+            select(Company.stock_code)
+            .select_from(Company)
+            .join(StockPrice, Company.company_id == StockPrice.company_id)
+            .where(
+                and_(
+                    StockPrice.trade_date == trade_date,
+                    StockPrice.market_cap.isnot(None),
+                    or_(*universe_conditions.values())
+                )
+            )
+            .distinct()
+        )
+
+        result = await self.db.execute(stmt)
+        all_stock_codes = {row.stock_code for row in result.all()}
 
-        # 각 유니버스별로 종목 코드 수집
+        logger.info(f"🔄 동적 계산으로 {len(all_stock_codes)}개 종목 조회")
+        return list(all_stock_codes)
+
+    def _build_universe_conditions(self, universe_ids: List[str]) -> Dict[str, Any]:
+        """
+        유니버스 ID별 시가총액/시장 조건 생성
+
+        Returns:
+            {universe_id: SQLAlchemy 조건식}
+        """
+        conditions = {}
         for universe_id in universe_ids:
             universe_config = None
             market_type = None
@@ -427,28 +465,125 @@ class UniverseService:
                 logger.warning(f"유효하지 않은 유니버스 ID: {universe_id}")
                 continue
 
-            # 조건 설정
-            conditions = [
-                StockPrice.trade_date == trade_date,
+            universe_condition = [
                 Company.market_type == market_type,
-                StockPrice.market_cap.isnot(None),
                 StockPrice.market_cap >= universe_config["min_cap"]
             ]
-
             if universe_config["max_cap"] is not None:
-                conditions.append(StockPrice.market_cap < universe_config["max_cap"])
+                universe_condition.append(StockPrice.market_cap < universe_config["max_cap"])
 
-            # 쿼리 실행
-            stmt = (
-                select(Company.stock_code)
-                .select_from(Company)
-                .join(StockPrice, Company.company_id == StockPrice.company_id)
-                .where(and_(*conditions))
+            conditions[universe_id] = and_(*universe_condition)
+        return conditions
+
+    async def get_membership_index(
+        self,
+        universe_ids: List[str],
+        start_date: date,
+        end_date: date
+    ) -> Optional[UniverseMembershipIndex]:
+        """
+        기간 내 시점별 유니버스 편입 비트맵 인덱스 조회 (백테스트용)
+
+        1차: Redis 캐시 (직렬화된 비트셋 1회 GET)
+        2차: stock_universe_history 단일 쿼리
+        3차: 히스토리가 없으면 시작일 기준 동적 분류 (단일 쿼리, 기간 내 고정)
+             히스토리가 시작일 이후부터 있으면 그 이전 구간은 시작일 기준 동적 분류 사용
+
+        Args:
+            universe_ids: 유니버스 ID 리스트
+            start_date: 백테스트 시작일
+            end_date: 백테스트 종료일
+
+        Returns:
+            UniverseMembershipIndex 또는 None (편입 종목 없음)
+        """
+        if not universe_ids:
+            return None
+
+        cache_key = f"universe_membership:{','.join(sorted(universe_ids))}:{start_date}:{end_date}"
+        cached = await cache.get(cache_key)
+        if cached:
+            index = UniverseMembershipIndex.from_dict(cached)
+            logger.info(f"💾 유니버스 편입 인덱스 캐시 히트: {len(index.dates)}일 × {len(index.stock_codes)}종목")
+            return index
+
+        query_start = start_date - timedelta(days=self.MEMBERSHIP_LOOKBACK_DAYS)
+        stmt = (
+            select(
+                StockUniverseHistory.stock_code,
+                StockUniverseHistory.universe_id,
+                StockUniverseHistory.trade_date
             )
+            .where(
+                and_(
+                    StockUniverseHistory.universe_id.in_(universe_ids),
+                    StockUniverseHistory.trade_date >= query_start,
+                    StockUniverseHistory.trade_date <= end_date
+                )
+            )
+        )
+        result = await self.db.execute(stmt)
+        rows = [tuple(row) for row in result.all()]
+
+        if not rows:
+            logger.info(f"히스토리 테이블에 데이터 없음. 시작일 기준 동적 분류로 폴백: {start_date}")
+            rows = await self._dynamic_membership_rows(universe_ids, start_date)
+        else:
+            first_date = min(row[2] for row in rows)
+            if first_date > start_date:
+                # 히스토리 시작 전 리밸런싱도 전부 제외되지 않도록 시작일 기준 분류를 앞에 채움
+                logger.info(f"히스토리가 {first_date}부터 존재. 이전 구간은 시작일 기준 동적 분류 사용: {start_date}")
+                rows = await self._dynamic_membership_rows(universe_ids, start_date) + rows
+
+        if not rows:
+            return None
 
-            result = await self.db.execute(stmt)
-            stock_codes = [row.stock_code for row in result.all()]
-            all_stock_codes.update(stock_codes)
+        codes, uids, dates = zip(*rows)
+        index = UniverseMembershipIndex.from_rows(codes, uids, dates)
+        if index.is_empty:
+            return None
 
-        logger.info(f"🔄 동적 계산으로 {len(all_stock_codes)}개 종목 조회")
-        return list(all_stock_codes)
+        logger.info(
+            f"✅ 유니버스 편입 인덱스 구축: {len(index.universe_ids)}개 유니버스 × "
+            f"{len(index.dates)}일 × {len(index.stock_codes)}종목 ({index.nbytes / 1024:.1f}KB)"
+        )
+        await cache.set(cache_key, index.to_dict(), ttl=self.MEMBERSHIP_CACHE_TTL)
+        return index
+
+    async def _dynamic_membership_rows(
+        self,
+        universe_ids: List[str],
+        trade_date: date
+    ) -> List[tuple]:
+        """시작일(또는 그 이전 최근 거래일) 시가총액으로 분류한 (종목코드, 유니버스ID, 분류일) 행"""
+        universe_conditions = self._build_universe_conditions(universe_ids)
+        if not universe_conditions:
+            return []
+
+        latest_date_stmt = select(func.max(StockPrice.trade_date)).where(
+            and_(StockPrice.trade_date <= trade_date, StockPrice.market_cap > 0)
+        )
+        as_of_date = (await self.db.execute(latest_date_stmt)).scalar_one_or_none()
+        if not as_of_date:
+            return []
+
+        # 유니버스 정의는 시장/시총 구간이 겹치지 않으므로 CASE 하나로 분류
+        universe_label = case(
+            *[(condition, universe_id) for universe_id, condition in universe_conditions.items()],
+            else_=None
+        ).label("universe_id")
+
+        stmt = (
+            select(Company.stock_code, universe_label)
+            .select_from(Company)
+            .join(StockPrice, Company.company_id == StockPrice.company_id)
+            .where(
+                and_(
+                    StockPrice.trade_date == as_of_date,
+                    StockPrice.market_cap.isnot(None),
+                    or_(*universe_conditions.values())
+                )
+            )
+        )
+        result = await self.db.execute(stmt)
+        return [(row.stock_code, row.universe_id, as_of_date) for row in result.all() if row.universe_id]
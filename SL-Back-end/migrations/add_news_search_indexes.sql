@@ -0,0 +1,42 @@
+-- Migration: 뉴스 검색 트라이그램 인덱스
+-- Date: 2026-10-18
+-- Description: 뉴스 키워드 검색(LIKE/ILIKE '%키워드%')용 pg_trgm GIN 인덱스
+--              - 형태소 분석 없이 한국어 부분 문자열 검색을 그대로 지원
+--              - /news/db/search, /news/db/search/ranked 에서 사용
+-- 주의: 본문(content) 인덱스는 크기가 크므로 CONCURRENTLY로 생성
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ============================================================
+-- 1. 제목 / 회사명 / 종목코드
+-- ============================================================
+
+-- 쿼리: SELECT ... FROM news WHERE title ILIKE '%반도체%' OR ...;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_title_trgm
+ON news USING GIN (title gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_company_name_trgm
+ON news USING GIN (company_name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_stock_code_trgm
+ON news USING GIN (stock_code gin_trgm_ops);
+
+
+-- ============================================================
+-- 2. 본문
+-- ============================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_content_trgm
+ON news USING GIN (content gin_trgm_ops);
+
+COMMENT ON INDEX idx_news_content_trgm IS
+'뉴스 본문 부분 일치 검색 최적화 (leading-wildcard LIKE/ILIKE)';
+
+
+-- ============================================================
+-- 3. 종목별 최신 뉴스 조회
+-- ============================================================
+
+-- 쿼리: SELECT * FROM news WHERE stock_code = ? ORDER BY news_date DESC, analyzed_at DESC LIMIT ?;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_stock_code_date
+ON news (stock_code, news_date DESC, analyzed_at DESC);
@@ -0,0 +1,12 @@
+-- Migration: 시뮬레이션 세션 체크포인트 컬럼
+-- Date: 2026-10-18
+-- Description: 완료 시점 시뮬레이션 상태(보유 종목/현금/최고 평가액/일별·체결 기록) 저장
+-- 같은 설정(checkpoint_key)으로 종료일만 늘린 재실행은 체크포인트 다음 거래일부터 시뮬레이션
+
+ALTER TABLE simulation_sessions ADD COLUMN IF NOT EXISTS checkpoint JSON;
+ALTER TABLE simulation_sessions ADD COLUMN IF NOT EXISTS checkpoint_key VARCHAR(64);
+
+CREATE INDEX IF NOT EXISTS ix_simulation_sessions_checkpoint_key ON simulation_sessions (checkpoint_key);
+
+COMMENT ON COLUMN simulation_sessions.checkpoint IS '완료 시점 시뮬레이션 상태 (종료일 연장 재실행용)';
+COMMENT ON COLUMN simulation_sessions.checkpoint_key IS '체크포인트 설정 키 (종료일 제외 설정 해시)';
@@ -0,0 +1,8 @@
+-- Migration: 시뮬레이션 세션 단계별 트레이스 컬럼
+-- Date: 2026-10-18
+-- Description: 백테스트 엔진 단계/하위 단계 span 트리(소요 시간, 행 수/바이트, 반복 구간 집계) 저장
+-- 조회: GET /api/v1/backtest/{backtest_id}/trace
+
+ALTER TABLE simulation_sessions ADD COLUMN IF NOT EXISTS trace JSON;
+
+COMMENT ON COLUMN simulation_sessions.trace IS '단계별 실행 트레이스 (span 트리)';
@@ -0,0 +1,57 @@
+-- Migration: 시세 화면용 latest_quotes 스냅샷 테이블
+-- Date: 2026-10-18
+-- Description: 종목당 1행의 최신 시세 테이블 (전일 종가/등락 사전 계산),
+--              정렬 컬럼별 keyset 인덱스, 종목명/종목코드 트라이그램 검색 인덱스
+-- 갱신: scripts/update_latest_quotes.py (시세 적재 직후 실행)
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ============================================================
+-- 1. latest_quotes 테이블
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS latest_quotes (
+    company_id       INTEGER PRIMARY KEY REFERENCES companies(company_id) ON DELETE CASCADE,
+    stock_code       VARCHAR(6)   NOT NULL UNIQUE,
+    stock_name       VARCHAR(100) NOT NULL,
+    industry         VARCHAR(100),
+    trade_date       DATE         NOT NULL,
+    close_price      INTEGER      NOT NULL DEFAULT 0,
+    prev_close_price INTEGER,
+    change_amount    INTEGER      NOT NULL DEFAULT 0,
+    change_rate      DOUBLE PRECISION NOT NULL DEFAULT 0,
+    volume           BIGINT       NOT NULL DEFAULT 0,
+    trading_value    BIGINT       NOT NULL DEFAULT 0,
+    market_cap       BIGINT       NOT NULL DEFAULT 0,
+    refreshed_at     TIMESTAMP    NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE latest_quotes IS '최신 시세 스냅샷 테이블 - 시세 화면 전용';
+
+
+-- ============================================================
+-- 2. 정렬 컬럼별 keyset 인덱스
+-- ============================================================
+
+-- 쿼리: SELECT ... FROM latest_quotes
+--       WHERE (market_cap, company_id) < (?, ?)
+--       ORDER BY market_cap DESC, company_id DESC LIMIT 51;
+CREATE INDEX IF NOT EXISTS idx_latest_quotes_market_cap ON latest_quotes(market_cap, company_id);
+CREATE INDEX IF NOT EXISTS idx_latest_quotes_volume ON latest_quotes(volume, company_id);
+CREATE INDEX IF NOT EXISTS idx_latest_quotes_change_rate ON latest_quotes(change_rate, company_id);
+CREATE INDEX IF NOT EXISTS idx_latest_quotes_trading_value ON latest_quotes(trading_value, company_id);
+CREATE INDEX IF NOT EXISTS idx_latest_quotes_stock_name ON latest_quotes(stock_name, company_id);
+
+
+-- ============================================================
+-- 3. 트라이그램 검색 인덱스 (ILIKE '%검색어%')
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS idx_latest_quotes_stock_name_trgm
+ON latest_quotes USING GIN (stock_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_latest_quotes_stock_code_trgm
+ON latest_quotes USING GIN (stock_code gin_trgm_ops);
+
+COMMENT ON INDEX idx_latest_quotes_stock_name_trgm IS
+'시세 검색 최적화: 종목명 부분 일치 (ILIKE) 검색';
@@ -0,0 +1,112 @@
+-- Migration: 종목별 일간 뉴스 감성 롤업 테이블
+-- Date: 2026-10-18
+-- Description: news_sentiment_daily(stock_code, date) 1행에 기사 수/감성별 건수/점수 합을 보관
+--              - news INSERT/UPDATE/DELETE 트리거로 증분 갱신 (크롤러 적재 시점에 반영)
+--              - /news/db/stock/{stock_code}/sentiment-trend 에서 7일/30일 추세, 급변 감지에 사용
+-- 점수: positive=+1, negative=-1, 그 외(neutral/NULL)=0
+
+-- ============================================================
+-- 1. news_sentiment_daily 테이블
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS news_sentiment_daily (
+    stock_code     VARCHAR(20) NOT NULL,
+    date           DATE        NOT NULL,
+    article_count  INTEGER     NOT NULL DEFAULT 0,
+    positive_count INTEGER     NOT NULL DEFAULT 0,
+    negative_count INTEGER     NOT NULL DEFAULT 0,
+    neutral_count  INTEGER     NOT NULL DEFAULT 0,
+    score_sum      INTEGER     NOT NULL DEFAULT 0,
+    updated_at     TIMESTAMP   NOT NULL DEFAULT now(),
+    PRIMARY KEY (stock_code, date)
+);
+
+COMMENT ON TABLE news_sentiment_daily IS '종목별 일간 뉴스 감성 롤업 - news 트리거로 증분 갱신';
+
+
+-- ============================================================
+-- 2. 증분 갱신 트리거
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION news_sentiment_score(label TEXT) RETURNS INTEGER AS $$
+    SELECT CASE lower(coalesce(label, 'neutral'))
+        WHEN 'positive' THEN 1
+        WHEN 'negative' THEN -1
+        ELSE 0
+    END;
+$$ LANGUAGE SQL IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION news_sentiment_daily_apply(
+    p_stock_code TEXT, p_date DATE, p_label TEXT, p_sign INTEGER
+) RETURNS VOID AS $$
+DECLARE
+    v_score INTEGER := news_sentiment_score(p_label);
+BEGIN
+    IF p_stock_code IS NULL OR p_date IS NULL THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO news_sentiment_daily AS d
+        (stock_code, date, article_count, positive_count, negative_count, neutral_count, score_sum, updated_at)
+    VALUES (
+        p_stock_code, p_date, p_sign,
+        CASE WHEN v_score > 0 THEN p_sign ELSE 0 END,
+        CASE WHEN v_score < 0 THEN p_sign ELSE 0 END,
+        CASE WHEN v_score = 0 THEN p_sign ELSE 0 END,
+        v_score * p_sign, now()
+    )
+    ON CONFLICT (stock_code, date) DO UPDATE SET
+        article_count  = d.article_count  + EXCLUDED.article_count,
+        positive_count = d.positive_count + EXCLUDED.positive_count,
+        negative_count = d.negative_count + EXCLUDED.negative_count,
+        neutral_count  = d.neutral_count  + EXCLUDED.neutral_count,
+        score_sum      = d.score_sum      + EXCLUDED.score_sum,
+        updated_at     = now();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION news_sentiment_daily_trigger() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM news_sentiment_daily_apply(OLD.stock_code, OLD.news_date, OLD.sentiment_label, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM news_sentiment_daily_apply(NEW.stock_code, NEW.news_date, NEW.sentiment_label, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_news_sentiment_daily ON news;
+
+-- 감성 분석 결과가 나중에 채워지는 경우(UPDATE)도 반영
+CREATE TRIGGER trg_news_sentiment_daily
+AFTER INSERT OR DELETE OR UPDATE OF stock_code, news_date, sentiment_label ON news
+FOR EACH ROW EXECUTE FUNCTION news_sentiment_daily_trigger();
+
+
+-- ============================================================
+-- 3. 기존 뉴스 백필 (재실행 시 전체 재계산)
+-- ============================================================
+
+INSERT INTO news_sentiment_daily
+    (stock_code, date, article_count, positive_count, negative_count, neutral_count, score_sum, updated_at)
+SELECT
+    stock_code,
+    news_date,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE news_sentiment_score(sentiment_label) > 0),
+    COUNT(*) FILTER (WHERE news_sentiment_score(sentiment_label) < 0),
+    COUNT(*) FILTER (WHERE news_sentiment_score(sentiment_label) = 0),
+    COALESCE(SUM(news_sentiment_score(sentiment_label)), 0),
+    now()
+FROM news
+WHERE stock_code IS NOT NULL AND news_date IS NOT NULL
+GROUP BY stock_code, news_date
+ON CONFLICT (stock_code, date) DO UPDATE SET
+    article_count  = EXCLUDED.article_count,
+    positive_count = EXCLUDED.positive_count,
+    negative_count = EXCLUDED.negative_count,
+    neutral_count  = EXCLUDED.neutral_count,
+    score_sum      = EXCLUDED.score_sum,
+    updated_at     = now();
@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+백테스트 엔진 단계별 성능 벤치마크 (합성 데이터)
+- 종목 수 × 기간(년) 조합마다 합성 시세(OHLCV)/재무제표/유니버스 편입 이력 생성 (시드 고정)
+- 운영 Postgres/Redis 대신 로컬 대체물 사용
+  - Redis → 프로세스 내 pickle 캐시 (캐시 히트 경로로 시세/재무 로드)
+  - 유니버스 편입 이력 → 합성 시가총액 기준 월별 분류로 만든 UniverseMembershipIndex
+  - 결과 저장 → SQLite(aiosqlite) 또는 --save-db-url로 지정한 DB
+- BacktestEngine 단계(load_price, load_financial, factors, conditions, simulate, stats, save)별
+  소요 시간과 tracemalloc 최대 메모리 증가량 기록
+- 기준선(JSON) 대비 허용 오차를 넘으면 종료 코드 1 (CI 회귀 검사용)
+
+simulate 단계 시간에는 엔진 내부의 리밸런싱 조건 사전 평가가 포함된다
+(conditions 단계는 같은 평가를 따로 떼어 측정한 값).
+
+Usage:
+    python scripts/benchmark_backtest.py --stocks 500 --years 1
+    python scripts/benchmark_backtest.py --stocks 500 2500 --years 1 3 10 --output bench.json
+    python scripts/benchmark_backtest.py --stocks 500 --years 1 --save-baseline benchmarks/baseline.json
+    python scripts/benchmark_backtest.py --stocks 500 --years 1 --baseline benchmarks/baseline.json --tolerance 0.2
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import pickle
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.core.cache as cache_module
+from app.core.cache import RedisCache
+from app.models.simulation import SimulationDailyValue, SimulationTrade
+from app.services import backtest as backtest_module
+from app.services import backtest_config as config
+from app.services.backtest import BacktestEngine
+from app.services.factor_integration import FactorIntegration
+from app.services.universe_membership import UniverseMembershipIndex
+from app.services.universe_service import UniverseService
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(message)s'
+)
+logger = logging.getLogger(__name__)
+
+END_DATE = date(2024, 12, 30)
+STAGES = ["load_price", "load_financial", "factors", "conditions", "simulate", "stats", "save"]
+
+INDUSTRIES = [
+    "반도체", "자동차", "2차전지", "바이오", "인터넷", "게임", "금융", "화학",
+    "철강", "조선", "건설", "유통", "화장품", "방산", "통신", "음식료",
+]
+
+# 피터 린치 전략 (cache_warming_v2.py와 동일 조건) + 우선순위 팩터
+BUY_CONDITIONS = [
+    {'name': 'A', 'exp_left_side': '기본값({PER})', 'inequality': '<', 'exp_right_side': 40},
+    {'name': 'B', 'exp_left_side': '기본값({PEG})', 'inequality': '>', 'exp_right_side': 0},
+    {'name': 'C', 'exp_left_side': '기본값({PEG})', 'inequality': '<', 'exp_right_side': 2.0},
+    {'name': 'D', 'exp_left_side': '기본값({DEBT_RATIO})', 'inequality': '<', 'exp_right_side': 180},
+    {'name': 'E', 'exp_left_side': '기본값({ROE})', 'inequality': '>', 'exp_right_side': 3},
+    {'name': 'F', 'exp_left_side': '기본값({ROA})', 'inequality': '>', 'exp_right_side': 0.5, 'priority_factor': '{ROE}'},
+]
+
+# 보고서 코드 → (분기 종료 월, 공시 지연 일수) - _load_financial_data와 동일
+REPORT_CODES = {"11013": (3, 45), "11012": (6, 60), "11014": (9, 45), "11011": (12, 90)}
+
+
+class InMemoryCache(RedisCache):
+    """Redis 대체 캐시 (값을 pickle로 직렬화해 Redis 왕복의 역직렬화 비용 유지)"""
+
+    def __init__(self):
+        super().__init__()
+        self._store: Dict[str, bytes] = {}
+
+    async def initialize(self):
+        return None
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = self._store.get(key)
+        return pickle.loads(value) if value is not None else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        self._store[key] = pickle.dumps(value)
+        return True
+
+
+def install_cache(cache: RedisCache) -> None:
+    """get_cache()와 backtest 모듈 전역 cache를 모두 교체"""
+    cache_module.cache = cache
+    backtest_module.cache = cache
+
+
+def make_companies(n_stocks: int, rng: np.random.Generator) -> pd.DataFrame:
+    """종목 기본 정보 (코스피 40% / 코스닥 60%)"""
+    return pd.DataFrame({
+        "company_id": np.arange(1, n_stocks + 1),
+        "stock_code": [f"{i:06d}" for i in range(1, n_stocks + 1)],
+        "stock_name": [f"합성종목{i}" for i in range(1, n_stocks + 1)],
+        "industry": rng.choice(INDUSTRIES, n_stocks),
+        "market_type": np.where(rng.random(n_stocks) < 0.4, "KOSPI", "KOSDAQ"),
+        # 상장주식수: 시가총액이 수백억 ~ 수십조 범위에 고르게 퍼지도록 로그정규 분포
+        "listed_shares": np.round(rng.lognormal(16.5, 1.2, n_stocks)).astype(np.int64),
+    })
+
+
+def make_prices(companies: pd.DataFrame, start: date, end: date, rng: np.random.Generator) -> pd.DataFrame:
+    """일별 OHLCV (기하 브라운 운동, 종목별 변동성 1~3%)"""
+    dates = pd.bdate_range(start, end)
+    n_days, n_stocks = len(dates), len(companies)
+
+    sigma = rng.uniform(0.01, 0.03, n_stocks)
+    log_returns = rng.normal(0.0003, 1.0, (n_days, n_stocks)) * sigma
+    close = rng.lognormal(9.5, 1.0, n_stocks) * np.exp(np.cumsum(log_returns, axis=0))
+    open_ = close * (1 + rng.normal(0, 0.005, (n_days, n_stocks)))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, (n_days, n_stocks))))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, (n_days, n_stocks))))
+    volume = np.round(rng.lognormal(11, 1.0, (n_days, n_stocks)))
+
+    def column(values: np.ndarray) -> np.ndarray:
+        # (일 × 종목) → 종목별 연속 행
+        return values.T.reshape(-1)
+
+    listed_shares = companies["listed_shares"].to_numpy()
+    close_flat = column(np.round(close))
+    volume_flat = column(volume)
+    prices = pd.DataFrame({
+        "company_id": np.repeat(companies["company_id"].to_numpy(), n_days),
+        "stock_code": np.repeat(companies["stock_code"].to_numpy(), n_days),
+        "stock_name": np.repeat(companies["stock_name"].to_numpy(), n_days),
+        "industry": np.repeat(companies["industry"].to_numpy(), n_days),
+        "market_type": np.repeat(companies["market_type"].to_numpy(), n_days),
+        "date": np.tile(dates.to_numpy(), n_stocks),
+        "open_price": column(np.round(open_)),
+        "high_price": column(np.round(high)),
+        "low_price": column(np.round(low)),
+        "close_price": close_flat,
+        "volume": volume_flat,
+        "trading_value": close_flat * volume_flat,
+        "market_cap": close_flat * np.repeat(listed_shares, n_days),
+        "listed_shares": np.repeat(listed_shares, n_days),
+    })
+    return prices
+
+
+def make_financials(companies: pd.DataFrame, start: date, end: date, rng: np.random.Generator) -> pd.DataFrame:
+    """분기/반기/사업보고서 재무제표 (_load_financial_data 피벗 결과와 같은 컬럼)"""
+    n_stocks = len(companies)
+    years = list(range(start.year - 1, end.year + 1))
+    base_revenue = rng.lognormal(25, 1.2, n_stocks)
+    growth = rng.normal(0.05, 0.15, n_stocks)
+    gross_margin = rng.uniform(0.1, 0.6, n_stocks)
+    operating_margin = gross_margin * rng.uniform(0.1, 0.6, n_stocks)
+    equity_ratio = rng.uniform(0.25, 0.8, n_stocks)
+
+    frames = []
+    for year_index, year in enumerate(years):
+        for report_code, (month, delay_days) in REPORT_CODES.items():
+            noise = rng.normal(1.0, 0.05, n_stocks)
+            revenue = base_revenue * (1 + growth) ** year_index * (month / 12) * noise
+            gross_profit = revenue * gross_margin
+            operating_income = revenue * operating_margin * rng.normal(1.0, 0.2, n_stocks)
+            net_income = operating_income * 0.75
+            assets = base_revenue * (1 + growth) ** year_index * rng.uniform(0.8, 1.5, n_stocks)
+            equity = assets * equity_ratio
+            report_date = pd.Timestamp(year, month, 1) + pd.offsets.MonthEnd(0)
+            frames.append(pd.DataFrame({
+                "company_id": companies["company_id"].to_numpy(),
+                "stock_code": companies["stock_code"].to_numpy(),
+                "fiscal_year": str(year),
+                "report_code": report_code,
+                "매출액": revenue,
+                "매출원가": revenue - gross_profit,
+                "매출총이익": gross_profit,
+                "영업이익": operating_income,
+                "당기순이익": net_income,
+                "판매비와관리비": gross_profit - operating_income,
+                "이자비용": (assets - equity) * 0.01,
+                "법인세비용": operating_income * 0.22,
+                "자산총계": assets,
+                "자본총계": equity,
+                "부채총계": assets - equity,
+                "유동자산": assets * 0.45,
+                "비유동자산": assets * 0.55,
+                "유동부채": (assets - equity) * 0.6,
+                "비유동부채": (assets - equity) * 0.4,
+                "현금및현금성자산": assets * 0.1,
+                "재고자산": assets * 0.12,
+                "매출채권": revenue * 0.15,
+                "report_date": report_date,
+                "available_date": report_date + pd.Timedelta(days=delay_days),
+            }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def make_universe_index(prices: pd.DataFrame, companies: pd.DataFrame) -> UniverseMembershipIndex:
+    """월말 시가총액 기준 유니버스 분류 (UniverseService.UNIVERSES 구간 사용)"""
+    month_ends = prices.groupby(prices["date"].dt.to_period("M"))["date"].max()
+    snapshot = prices[prices["date"].isin(month_ends)][["stock_code", "date", "market_cap"]]
+    snapshot = snapshot.merge(companies[["stock_code", "market_type"]], on="stock_code")
+
+    codes, universe_ids, trade_dates = [], [], []
+    for market_type, universes in UniverseService.UNIVERSES.items():
+        market_rows = snapshot[snapshot["market_type"] == market_type]
+        for universe_id, universe_config in universes.items():
+            mask = market_rows["market_cap"] >= universe_config["min_cap"]
+            if universe_config["max_cap"] is not None:
+                mask &= market_rows["market_cap"] < universe_config["max_cap"]
+            members = market_rows[mask]
+            codes.extend(members["stock_code"].tolist())
+            universe_ids.extend([universe_id] * len(members))
+            trade_dates.extend(members["date"].dt.date.tolist())
+    return UniverseMembershipIndex.from_rows(codes, universe_ids, trade_dates)
+
+
+def to_cache_records(df: pd.DataFrame, date_columns: List[str]) -> List[Dict[str, Any]]:
+    """캐시 워밍과 같은 형식 (날짜는 문자열)"""
+    cache_df = df.copy()
+    for column in date_columns:
+        cache_df[column] = cache_df[column].astype(str)
+    return cache_df.to_dict("records")
+
+
+async def run_stage(
+    name: str,
+    func: Callable[[], Awaitable[Any]],
+    results: Dict[str, Dict[str, Any]],
+    trace_memory: bool
+) -> Any:
+    """단계 실행 + 소요 시간/최대 메모리 증가량 기록"""
+    gc.collect()
+    base_memory = 0
+    if trace_memory:
+        tracemalloc.reset_peak()
+        base_memory = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    value = await func()
+    seconds = time.perf_counter() - start
+
+    peak_mb = None
+    if trace_memory:
+        peak_mb = (tracemalloc.get_traced_memory()[1] - base_memory) / 1024 / 1024
+    results[name] = {"seconds": round(seconds, 3), "peak_mb": round(peak_mb, 1) if peak_mb is not None else None}
+    memory_text = f"  peak +{peak_mb:>8.1f}MB" if peak_mb is not None else ""
+    logger.info(f"  {name:<16} {seconds:>9.3f}s{memory_text}")
+    return value
+
+
+async def run_scale(
+    n_stocks: int,
+    years: int,
+    seed: int,
+    universes: List[str],
+    save_db_url: str,
+    trace_memory: bool,
+    compact_dtypes: bool = False
+) -> Dict[str, Any]:
+    """한 규모(종목 수 × 기간)에서 단계별 측정"""
+    rng = np.random.default_rng(seed)
+    start_date = date(END_DATE.year - years + 1, 1, 2)
+    end_date = END_DATE
+
+    engine = BacktestEngine(None, headless=True)
+    engine.compact_dtypes = compact_dtypes
+    engine._configure_run(
+        commission_rate=0.00015,
+        slippage=0.001,
+        initial_capital=Decimal("100000000"),
+        target_universes=universes
+    )
+    extended_start = start_date - timedelta(days=config.get_lookback_days(getattr(engine, "required_factors", None)))
+
+    # 합성 데이터 생성 (측정 제외)
+    generate_start = time.perf_counter()
+    companies = make_companies(n_stocks, rng)
+    prices = make_prices(companies, extended_start, end_date, rng)
+    financials = make_financials(companies, start_date, end_date, rng)
+    membership = make_universe_index(prices, companies)
+
+    cache = InMemoryCache()
+    install_cache(cache)
+    await cache.set(f"price_data:all:{extended_start}:{end_date}", to_cache_records(prices, ["date"]), ttl=0)
+
+    async def resolve_universe_stock_codes(target_universes, _start, _end):
+        # 편입 이력 DB 조회 대신 합성 인덱스 사용
+        engine.universe_membership = membership
+        return sorted(membership.all_members(target_universes))
+
+    engine._resolve_universe_stock_codes = resolve_universe_stock_codes
+    logger.info(
+        f"[{n_stocks}종목 × {years}년] 시세 {len(prices):,}행, 재무 {len(financials):,}행 "
+        f"(생성 {time.perf_counter() - generate_start:.1f}s)"
+    )
+    del prices
+
+    results: Dict[str, Dict[str, Any]] = {}
+    price_data = await run_stage(
+        "load_price",
+        lambda: engine._load_price_data(start_date, end_date, target_universes=universes),
+        results, trace_memory
+    )
+
+    actual_stocks = price_data["stock_code"].unique().tolist()
+    financial_key = f"financial_data:{start_date}:{end_date}:{','.join(sorted(actual_stocks))}"
+    await cache.set(
+        financial_key,
+        to_cache_records(financials[financials["stock_code"].isin(actual_stocks)], ["report_date", "available_date"]),
+        ttl=0
+    )
+    financial_data = await run_stage(
+        "load_financial",
+        lambda: engine._load_financial_data(start_date, end_date, actual_stocks),
+        results, trace_memory
+    )
+
+    buy_conditions = [dict(condition) for condition in BUY_CONDITIONS]
+    backtest_conditions, priority_factor = engine._prepare_buy_conditions(buy_conditions)
+    factor_data = await run_stage(
+        "factors",
+        lambda: engine._calculate_all_factors_optimized(
+            price_data, financial_data, start_date, end_date,
+            buy_conditions=backtest_conditions,
+            priority_factor=priority_factor
+        ),
+        results, trace_memory
+    )
+
+    trading_days = sorted(price_data["date"].unique())
+    rebalance_dates = [
+        pd.Timestamp(d) for d in engine._get_rebalance_dates(trading_days, "MONTHLY")
+        if pd.Timestamp(d) >= pd.Timestamp(start_date)
+    ]
+
+    async def evaluate_conditions():
+        factor_integrator = FactorIntegration(None)
+        stock_codes = factor_data["stock_code"].unique().tolist()
+        return {
+            rebalance_date: factor_integrator.evaluate_buy_conditions_with_factors(
+                factor_data=factor_data,
+                stock_codes=stock_codes,
+                buy_conditions=buy_conditions,
+                trading_date=rebalance_date
+            )
+            for rebalance_date in rebalance_dates
+        }
+
+    await run_stage("conditions", evaluate_conditions, results, trace_memory)
+
+    benchmark_data = await engine._load_benchmark_data("KOSPI", start_date, end_date)
+    backtest_id = uuid4()
+    initial_capital = Decimal("100000000")
+    portfolio_result = await run_stage(
+        "simulate",
+        lambda: engine._simulate_portfolio(
+            backtest_id=backtest_id,
+            factor_data=factor_data,
+            price_data=price_data,
+            buy_conditions=buy_conditions,
+            sell_conditions=[],
+            condition_sell=None,
+            initial_capital=initial_capital,
+            rebalance_frequency="MONTHLY",
+            max_positions=20,
+            position_sizing="EQUAL_WEIGHT",
+            benchmark_data=benchmark_data,
+            start_date=start_date,
+            end_date=end_date
+        ),
+        results, trace_memory
+    )
+
+    async def calculate_statistics():
+        return engine._calculate_statistics(portfolio_result, initial_capital, start_date, end_date)
+
+    statistics = await run_stage("stats", calculate_statistics, results, trace_memory)
+
+    db_engine = create_async_engine(save_db_url)
+    try:
+        async with db_engine.begin() as conn:
+            await conn.run_sync(
+                SimulationDailyValue.metadata.create_all,
+                tables=[SimulationDailyValue.__table__, SimulationTrade.__table__]
+            )
+        async with async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)() as session:
+            engine.db = session
+            await run_stage(
+                "save",
+                lambda: engine._save_simulation_results(
+                    backtest_id,
+                    portfolio_result["daily_snapshots"],
+                    portfolio_result["executions"],
+                    initial_capital,
+                    benchmark_data
+                ),
+                results, trace_memory
+            )
+    finally:
+        engine.db = None
+        await db_engine.dispose()
+
+    return {
+        "stocks": n_stocks,
+        "years": years,
+        "price_rows": len(price_data),
+        "factor_rows": len(factor_data),
+        # 시뮬레이션 동안 유지되는 프레임 크기 (object 문자열 내용 포함)
+        "price_frame_mb": round(price_data.memory_usage(deep=True).sum() / 2**20, 1),
+        "factor_frame_mb": round(factor_data.memory_usage(deep=True).sum() / 2**20, 1),
+        "rebalance_dates": len(rebalance_dates),
+        "trades": len(portfolio_result["executions"]),
+        "total_return": float(statistics.total_return),
+        "stages": results,
+        "total_seconds": round(sum(stage["seconds"] for stage in results.values()), 3),
+    }
+
+
+def find_regressions(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float,
+    min_seconds: float,
+    min_mb: float
+) -> List[str]:
+    """기준선 대비 (1 + tolerance)배를 넘고 절대 차이도 최소값 이상인 단계"""
+    regressions = []
+    for scale_key, scale in current.items():
+        base_scale = baseline.get(scale_key)
+        if not base_scale:
+            continue
+        for stage, measured in scale["stages"].items():
+            base_stage = base_scale["stages"].get(stage)
+            if not base_stage:
+                continue
+            for metric, min_delta in (("seconds", min_seconds), ("peak_mb", min_mb)):
+                value, base_value = measured.get(metric), base_stage.get(metric)
+                if value is None or base_value is None:
+                    continue
+                if value > base_value * (1 + tolerance) and value - base_value >= min_delta:
+                    regressions.append(f"{scale_key} {stage} {metric}: {base_value} → {value}")
+    return regressions
+
+
+async def main() -> int:
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="백테스트 엔진 단계별 성능 벤치마크")
+    parser.add_argument("--stocks", type=int, nargs="+", default=[500], help="종목 수 (여러 개 가능)")
+    parser.add_argument("--years", type=int, nargs="+", default=[1], help="백테스트 기간(년) (여러 개 가능)")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 시드")
+    parser.add_argument(
+        "--universes", nargs="*", default=["KOSPI_LARGE", "KOSPI_MID", "KOSDAQ_LARGE", "KOSDAQ_MID"],
+        help="매매 대상 유니버스 (빈 값이면 전체 종목)"
+    )
+    parser.add_argument("--save-db-url", default="sqlite+aiosqlite:///:memory:", help="save 단계 DB URL")
+    parser.add_argument("--compact", action="store_true", help="압축 dtype 모드 (범주형 문자열, float32 팩터, int32 순위)")
+    parser.add_argument("--no-trace-memory", action="store_true", help="tracemalloc 비활성화 (시간 측정 오버헤드 제거)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="회귀 비교 기준선 JSON")
+    parser.add_argument("--save-baseline", help="이번 결과를 기준선 JSON으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 증가율 (0.2 = 20%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="회귀로 판단할 최소 시간 차이(초)")
+    parser.add_argument("--min-mb", type=float, default=16.0, help="회귀로 판단할 최소 메모리 차이(MB)")
+    args = parser.parse_args()
+
+    # 단계별 INFO 로그는 측정 결과만 보이도록 숨김
+    logging.getLogger("app").setLevel(logging.WARNING)
+    trace_memory = not args.no_trace_memory
+    if trace_memory:
+        tracemalloc.start()
+
+    results: Dict[str, Any] = {}
+    logger.info("=" * 80)
+    for n_stocks in args.stocks:
+        for years in args.years:
+            scale_key = f"{n_stocks}x{years}y"
+            results[scale_key] = await run_scale(
+                n_stocks, years, args.seed, args.universes or None, args.save_db_url, trace_memory, args.compact
+            )
+            logger.info(f"  {'total':<16} {results[scale_key]['total_seconds']:>9.3f}s")
+            logger.info(
+                f"  {'frames':<16} 가격 {results[scale_key]['price_frame_mb']}MB, "
+                f"팩터 {results[scale_key]['factor_frame_mb']}MB"
+            )
+            logger.info("-" * 80)
+
+    report = {"seed": args.seed, "trace_memory": trace_memory, "compact": args.compact, "scales": results}
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            logger.info(f"결과 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("trace_memory") != trace_memory:
+            logger.warning("⚠️ 기준선과 tracemalloc 설정이 달라 시간 비교가 부정확할 수 있습니다")
+        regressions = find_regressions(
+            results, baseline.get("scales", {}), args.tolerance, args.min_seconds, args.min_mb
+        )
+        if regressions:
+            logger.info(f"❌ 성능 회귀 {len(regressions)}건 (허용 +{args.tolerance:.0%})")
+            for line in regressions:
+                logger.info(f"  {line}")
+            return 1
+        logger.info(f"✅ 기준선 대비 회귀 없음 (허용 +{args.tolerance:.0%})")
+    logger.info("=" * 80)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+뉴스 검색 벤치마크
+- news_bench 스키마에 합성 뉴스 코퍼스(기본 200만 건) 생성
+- 인덱스 없음 / pg_trgm GIN 인덱스 적용 후 검색 지연 비교
+- search_path를 news_bench로 바꿔 NewsRepository 코드를 그대로 실행
+
+Usage:
+    python scripts/benchmark_news_search.py --rows 2000000 --repeat 5
+    python scripts/benchmark_news_search.py --rows 100000 --keep   # 스키마 유지
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.news_repository import NewsRepository
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(message)s'
+)
+logger = logging.getLogger(__name__)
+
+BENCH_SCHEMA = "news_bench"
+
+# 합성 기사 생성용 어휘 (종목명/업종/시황 표현)
+VOCABULARY = [
+    "삼성전자", "SK하이닉스", "현대차", "LG에너지솔루션", "카카오", "네이버", "셀트리온", "기아",
+    "반도체", "2차전지", "바이오", "자동차", "조선", "방산", "게임", "인터넷", "화장품", "원전",
+    "실적", "영업이익", "매출", "전망", "목표주가", "상향", "하향", "수주", "공시", "배당",
+    "외국인", "기관", "순매수", "순매도", "급등", "급락", "신고가", "금리", "환율", "코스피",
+    "코스닥", "시장", "투자자", "증권가", "분기", "성장", "감소", "증가", "계약", "발표",
+]
+
+SEARCH_KEYWORDS = ["삼성전자", "반도체", "영업이익", "신고가", "005930", "2차전지 수주"]
+
+CREATE_INDEX_STATEMENTS = [
+    "CREATE INDEX idx_news_bench_title_trgm ON news USING GIN (title gin_trgm_ops)",
+    "CREATE INDEX idx_news_bench_company_name_trgm ON news USING GIN (company_name gin_trgm_ops)",
+    "CREATE INDEX idx_news_bench_stock_code_trgm ON news USING GIN (stock_code gin_trgm_ops)",
+    "CREATE INDEX idx_news_bench_content_trgm ON news USING GIN (content gin_trgm_ops)",
+]
+
+
+async def create_corpus(session: AsyncSession, rows: int) -> None:
+    """합성 뉴스 코퍼스 생성 (news 테이블과 동일 구조)"""
+    await session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    await session.execute(text(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE"))
+    await session.execute(text(f"CREATE SCHEMA {BENCH_SCHEMA}"))
+    await session.execute(text(f"CREATE TABLE {BENCH_SCHEMA}.news (LIKE public.news INCLUDING DEFAULTS)"))
+
+    # 서브쿼리가 g를 참조해야 행마다 어휘 샘플링이 다시 평가됨
+    await session.execute(
+        text(f"""
+            INSERT INTO {BENCH_SCHEMA}.news (
+                id, stock_code, company_name, title, content, source, link, news_date, analyzed_at, sentiment_label
+            )
+            SELECT
+                g,
+                lpad(((g * 7919) % 999999)::text, 6, '0'),
+                v.words[1 + (g % 8)],
+                (SELECT string_agg(v.words[1 + floor(random() * CAST(:vocab_size AS int))::int], ' ')
+                   FROM generate_series(1, 6 + g * 0)),
+                (SELECT string_agg(v.words[1 + floor(random() * CAST(:vocab_size AS int))::int], ' ')
+                   FROM generate_series(1, 80 + g % 40)),
+                'bench',
+                'https://example.com/news/' || g,
+                DATE '2020-01-01' + (g % 2000),
+                TIMESTAMP '2020-01-01' + (g % 2000) * INTERVAL '1 day',
+                (ARRAY['positive', 'negative', 'neutral'])[1 + (g % 3)]
+            FROM generate_series(1, :rows) AS g
+            CROSS JOIN (SELECT CAST(:vocab AS text[]) AS words) AS v
+        """),
+        {"vocab": VOCABULARY, "vocab_size": len(VOCABULARY), "rows": rows}
+    )
+    await session.execute(text(f"ANALYZE {BENCH_SCHEMA}.news"))
+    await session.commit()
+
+
+async def create_indexes(session: AsyncSession) -> float:
+    """트라이그램 인덱스 생성 (소요 시간 반환)"""
+    start = time.perf_counter()
+    await session.execute(text(f"SET search_path TO {BENCH_SCHEMA}, public"))
+    for statement in CREATE_INDEX_STATEMENTS:
+        await session.execute(text(statement))
+    await session.execute(text("ANALYZE news"))
+    await session.commit()
+    return time.perf_counter() - start
+
+
+async def measure(
+    label: str,
+    func: Callable[[str], Awaitable[int]],
+    repeat: int
+) -> Dict[str, float]:
+    """키워드별 반복 실행 후 지연 통계 계산"""
+    latencies: List[float] = []
+    hits = 0
+    for keyword in SEARCH_KEYWORDS:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            hits = await func(keyword)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    result = {
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": sorted(latencies)[int(len(latencies) * 0.95) - 1],
+        "max_ms": max(latencies),
+        "last_hits": hits,
+    }
+    logger.info(
+        f"{label:<32} p50 {result['p50_ms']:>9.1f}ms  p95 {result['p95_ms']:>9.1f}ms  "
+        f"max {result['max_ms']:>9.1f}ms"
+    )
+    return result
+
+
+async def run_queries(session: AsyncSession, repeat: int, legacy_limit: int, page_size: int) -> None:
+    """기존 검색 / 랭킹 검색 지연 측정"""
+    await session.execute(text(f"SET search_path TO {BENCH_SCHEMA}, public"))
+
+    async def legacy(keyword: str) -> int:
+        return len(await NewsRepository.search_news_in_db(session, keyword, legacy_limit))
+
+    async def ranked(keyword: str) -> int:
+        result = await NewsRepository.search_news_ranked(session, keyword, page_size)
+        return len(result["news"])
+
+    await measure(f"search_news_in_db (limit {legacy_limit})", legacy, repeat)
+    await measure(f"search_news_ranked (limit {page_size})", ranked, repeat)
+
+
+async def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="뉴스 검색 벤치마크")
+    parser.add_argument("--rows", type=int, default=2_000_000, help="합성 기사 수")
+    parser.add_argument("--repeat", type=int, default=5, help="키워드별 반복 횟수")
+    parser.add_argument("--legacy-limit", type=int, default=1000, help="기존 검색 limit")
+    parser.add_argument("--page-size", type=int, default=20, help="랭킹 검색 페이지 크기")
+    parser.add_argument("--keep", action="store_true", help="벤치마크 스키마 유지")
+    args = parser.parse_args()
+
+    async with AsyncSessionLocal() as session:
+        try:
+            logger.info("=" * 80)
+            logger.info(f"합성 코퍼스 생성: {args.rows:,}건")
+            start = time.perf_counter()
+            await create_corpus(session, args.rows)
+            logger.info(f"생성 완료: {time.perf_counter() - start:.1f}s")
+
+            logger.info("-" * 80)
+            logger.info("[인덱스 없음]")
+            await run_queries(session, args.repeat, args.legacy_limit, args.page_size)
+
+            logger.info("-" * 80)
+            index_seconds = await create_indexes(session)
+            logger.info(f"[pg_trgm GIN 인덱스 적용] (생성 {index_seconds:.1f}s)")
+            await run_queries(session, args.repeat, args.legacy_limit, args.page_size)
+            logger.info("=" * 80)
+        finally:
+            await session.rollback()
+            if not args.keep:
+                await session.execute(text(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE"))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -19,7 +19,6 @@ import logging
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Any
 from decimal import Decimal
-from uuid import uuid4
 import time
 
 # 프로젝트 루트 경로 추가
@@ -180,11 +179,10 @@ async def run_warming_backtest(strategy: Dict[str, Any], start_date: date, end_d
 
     try:
         async with AsyncSessionLocal() as db:
-            engine = BacktestEngine(db=db)
-            engine.skip_db_save = True  # DB 저장 스킵 (캐시만 채움)
+            # headless: 진행률/WebSocket/결과 저장 없이 통계만 계산 (캐시만 채움)
+            engine = BacktestEngine(db=db, headless=True)
 
-            result = await engine.run_backtest(
-                backtest_id=uuid4(),
+            result = await engine.run_headless(
                 buy_conditions=strategy['buy_conditions'],
                 sell_conditions=[],
                 start_date=start_date,
@@ -209,13 +207,13 @@ async def run_warming_backtest(strategy: Dict[str, Any], start_date: date, end_d
 
             elapsed = time.time() - start_time
 
-            if result and result.statistics:
+            if result and result['statistics']:
                 return {
                     'strategy': strategy['name'],
                     'success': True,
                     'elapsed': elapsed,
-                    'total_return': result.statistics.total_return,
-                    'total_trades': result.statistics.total_trades
+                    'total_return': result['statistics']['total_return'],
+                    'total_trades': result['statistics']['total_trades']
                 }
             else:
                 return {
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+일일 배치: latest_quotes 스냅샷 테이블 갱신
+- 시세(stock_prices) 적재 직후 실행하여 시세 화면용 스냅샷 갱신
+- cron: 30 21 * * * (매일 밤 9시 30분, update_universe_history.py 이전)
+"""
+
+import asyncio
+import logging
+
+from app.core.database import AsyncSessionLocal
+from app.services.market_quote import MarketQuoteService
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    """메인 실행 함수"""
+    logger.info("=" * 60)
+    logger.info("latest_quotes 일일 배치 시작")
+    logger.info("=" * 60)
+
+    async with AsyncSessionLocal() as session:
+        try:
+            result = await MarketQuoteService(session).refresh_latest_quotes()
+        except Exception as e:
+            logger.error(f"❌ 갱신 실패: {e}", exc_info=True)
+            await session.rollback()
+            result = {"status": "error", "error": str(e)}
+
+    logger.info("=" * 60)
+    logger.info(f"배치 결과: {result['status']}")
+    if result['status'] == 'success':
+        logger.info(f"거래일: {result['trade_date']} (전일: {result['prev_trade_date']})")
+        logger.info(f"처리 건수: {result['rows_upserted']} upsert / {result['rows_deleted']} 삭제")
+    logger.info("=" * 60)
+
+    return result
+
+
+if __name__ == "__main__":
+    result = asyncio.run(main())
+    exit(0 if result['status'] in ('success', 'skipped') else 1)
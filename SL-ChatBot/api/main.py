@@ -18,6 +18,7 @@ if chatbot_path.exists() and str(chatbot_path) not in sys.path:
 sys.path.insert(0, str(chatbot_path))
 
 from routes import chat, recommend, dsl
+from backend_client import close_backend_client
 from models.request import ChatRequest, RecommendRequest
 from models.response import ChatResponse, RecommendResponse
 
@@ -26,8 +27,15 @@ from models.response import ChatResponse, RecommendResponse
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
     print("Quant Advisor API starting up...")
+    # 첫 요청 전에 ChatHandler를 미리 초기화 (실패해도 기동은 계속, 첫 요청에서 다시 시도)
+    try:
+        await chat.get_bot()
+    except Exception as e:
+        print(f"Chatbot warm-up failed, will retry on first request: {e}")
     yield
     print("Quant Advisor API shutting down...")
+    # 백엔드 커넥션 풀 정리
+    await close_backend_client()
 
 
 app = FastAPI(
@@ -41,17 +41,30 @@ router = APIRouter()
 
 # Global bot instance
 bot = None
+_bot_lock: Optional[asyncio.Lock] = None
 
 
-def get_bot():
-    """Get or create bot instance."""
-    global bot
-    if bot is None and QuantAdvisorBot:
-        # Docker path or local development path
-        config_path = Path("/app/sl-chatbot/chatbot/config.yaml")
-        if not config_path.exists():
-            config_path = Path(__file__).parent.parent.parent / "chatbot" / "config.yaml"
-        bot = QuantAdvisorBot(str(config_path))
+async def get_bot():
+    """Get or create bot instance (shares the process-wide ChatHandler).
+
+    A failed creation leaves ``bot`` unset, so the next call retries.
+    """
+    global bot, _bot_lock
+    if bot is not None or not QuantAdvisorBot:
+        return bot
+    if _bot_lock is None:
+        _bot_lock = asyncio.Lock()
+    async with _bot_lock:
+        if bot is None:
+            # Docker path or local development path
+            config_path = Path("/app/sl-chatbot/chatbot/config.yaml")
+            if not config_path.exists():
+                config_path = Path(__file__).parent.parent.parent / "chatbot" / "config.yaml"
+            try:
+                bot = await QuantAdvisorBot.create(str(config_path))
+            except Exception as e:
+                print(f"Failed to initialize QuantAdvisorBot: {e}")
+                return None
     return bot
 
 
@@ -65,7 +78,7 @@ async def chat_message(request: ChatRequest):
     Returns:
         ChatResponse with answer and metadata
     """
-    chatbot = get_bot()
+    chatbot = await get_bot()
 
     if not chatbot:
         return make_error_response(
@@ -235,7 +248,7 @@ async def chat_stream(
         - ui_language: UI 언어 데이터 (선택)
         - error: 에러 발생
     """
-    chatbot = get_bot()
+    chatbot = await get_bot()
 
     if not chatbot:
         # 챗봇 초기화 실패 시 에러 이벤트 즉시 전송
@@ -272,7 +285,7 @@ async def chat_stream(
 @router.delete("/session/{session_id}")
 async def delete_session(session_id: str):
     """Delete chat session history."""
-    chatbot = get_bot()
+    chatbot = await get_bot()
 
     if not chatbot:
         raise HTTPException(
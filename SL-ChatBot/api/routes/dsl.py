@@ -34,7 +34,7 @@ class DSLResponse(BaseModel):
 @router.post("/parse", response_model=DSLResponse)
 async def parse_strategy(req: DSLRequest):
     try:
-        from schemas.dsl_generator import parse_strategy_text
+        from schemas.dsl_generator import parse_strategy_text_async
     except Exception as e:
         return make_error_response(
             status_code=500,
@@ -46,7 +46,7 @@ async def parse_strategy(req: DSLRequest):
         )
 
     try:
-        result = parse_strategy_text(req.text)
+        result = await parse_strategy_text_async(req.text)
         # dict 형태로 변환 후 스키마에 매핑 (Pydantic v1 호환)
         conditions = [ConditionSchema(**cond.dict()) for cond in result.conditions]
         return DSLResponse(conditions=conditions)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+DSL 문법 fast path 정확도/지연 벤치마크
+- 코퍼스(jsonl)의 각 문장을 ConditionGrammar로 파싱
+- expected가 null인 문장은 모호한 입력으로, LLM으로 넘겨야(None) 정답
+- 적중률, 정확도, 오탐(모호한 입력을 잘못 해석), 파싱 지연 출력
+
+Usage:
+    python scripts/benchmark_dsl_grammar.py
+    python scripts/benchmark_dsl_grammar.py --corpus my_corpus.jsonl --repeat 2000 --verbose
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from schemas.dsl_generator import get_condition_grammar  # noqa: E402
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "dsl_grammar_corpus.jsonl"
+
+
+def as_triples(conditions):
+    return sorted((c["factor"], c["operator"], round(float(c["value"]), 6)) for c in conditions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DSL 문법 fast path 벤치마크")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=1000, help="문장별 지연 측정 반복 횟수")
+    parser.add_argument("--verbose", action="store_true", help="오답 문장 출력")
+    args = parser.parse_args()
+
+    grammar = get_condition_grammar()
+    cases = [json.loads(line) for line in args.corpus.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+    resolvable = [c for c in cases if c["expected"] is not None]
+    ambiguous = [c for c in cases if c["expected"] is None]
+    hits = correct = false_positive = 0
+    latencies_us = []
+
+    for case in cases:
+        result = grammar.parse(case["text"])
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            grammar.parse(case["text"])
+        latencies_us.append((time.perf_counter() - start) / args.repeat * 1e6)
+
+        if case["expected"] is None:
+            if result is not None:
+                false_positive += 1
+                if args.verbose:
+                    print(f"[FALSE POSITIVE] {case['text']} → {as_triples(result)}")
+            continue
+
+        if result is None:
+            if args.verbose:
+                print(f"[MISS] {case['text']}")
+            continue
+        hits += 1
+        expected = sorted((f, op, round(float(v), 6)) for f, op, v in case["expected"])
+        if as_triples(result) == expected:
+            correct += 1
+        elif args.verbose:
+            print(f"[WRONG] {case['text']} → {as_triples(result)} (expected {expected})")
+
+    ordered = sorted(latencies_us)
+    print("=" * 72)
+    print(f"corpus: {len(cases)}건 (해석 가능 {len(resolvable)}, 모호 {len(ambiguous)})")
+    print(f"fast path 적중률: {hits}/{len(resolvable)} ({hits / max(1, len(resolvable)):.1%})")
+    print(f"적중 정확도:      {correct}/{hits} ({correct / max(1, hits):.1%})")
+    print(f"오탐(모호 입력):  {false_positive}/{len(ambiguous)}")
+    print(f"파싱 지연:        p50 {statistics.median(ordered):.1f}us  max {ordered[-1]:.1f}us")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
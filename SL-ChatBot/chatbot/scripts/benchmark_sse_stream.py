@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+SSE 채팅 스트리밍 벤치마크
+- /api/v1/chat/stream 에 동시 요청을 보내 첫 청크까지 시간(TTFB), 전체 시간, tokens/sec 측정
+- 실행 후 서버 측 /api/v1/metrics/stream 집계도 함께 출력
+
+Usage:
+    python scripts/stub_llm_server.py --latency-ms 800 --token-ms 20 &
+    BEDROCK_ENDPOINT_URL=http://localhost:8090 python src/api_server.py &
+    python scripts/benchmark_sse_stream.py --url http://localhost:8003 --concurrency 8 --requests 64
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from typing import Dict, List
+
+import aiohttp
+
+SAMPLE_MESSAGES = [
+    "PER이 뭐야?",
+    "MDD가 높으면 어떤 의미야?",
+    "모멘텀 전략 설명해줘",
+    "샤프 비율은 어떻게 해석해?",
+]
+
+
+def summarize(label: str, values: List[float], unit: str = "ms") -> None:
+    if not values:
+        print(f"{label:<14} no samples")
+        return
+    ordered = sorted(values)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(
+        f"{label:<14} n={len(ordered):<5} p50 {statistics.median(ordered):>8.1f}{unit}  "
+        f"p95 {p95:>8.1f}{unit}  max {ordered[-1]:>8.1f}{unit}"
+    )
+
+
+async def stream_once(session, url: str, message: str, results: Dict[str, List[float]]) -> None:
+    params = {"sessionId": f"bench_{uuid.uuid4().hex[:8]}", "message": message}
+    start = time.perf_counter()
+    first_chunk = last_chunk = None
+    chunks = 0
+    try:
+        async with session.get(f"{url}/api/v1/chat/stream", params=params) as resp:
+            async for raw_line in resp.content:
+                line = raw_line.decode("utf-8").strip()
+                if not line.startswith("data:"):
+                    continue
+                event = json.loads(line[5:])
+                if event.get("type") == "stream_chunk":
+                    now = time.perf_counter()
+                    first_chunk = first_chunk or now
+                    last_chunk = now
+                    chunks += 1
+                elif event.get("type") == "error":
+                    results["errors"].append(1)
+    except Exception:
+        results["errors"].append(1)
+        return
+
+    end = time.perf_counter()
+    results["total"].append((end - start) * 1000)
+    if first_chunk:
+        results["ttfb"].append((first_chunk - start) * 1000)
+    if chunks > 1 and last_chunk > first_chunk:
+        results["tps"].append((chunks - 1) / (last_chunk - first_chunk))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="SSE 스트리밍 벤치마크")
+    parser.add_argument("--url", default="http://localhost:8003")
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    results: Dict[str, List[float]] = {"ttfb": [], "total": [], "tps": [], "errors": []}
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            await stream_once(session, args.url, SAMPLE_MESSAGES[i % len(SAMPLE_MESSAGES)], results)
+
+    timeout = aiohttp.ClientTimeout(total=300)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        started = time.perf_counter()
+        await asyncio.gather(*[one(i) for i in range(args.requests)])
+        elapsed = time.perf_counter() - started
+
+        server_metrics = None
+        try:
+            async with session.get(f"{args.url}/api/v1/metrics/stream") as resp:
+                server_metrics = await resp.json()
+        except Exception:
+            pass
+
+    print("=" * 72)
+    print(f"requests={args.requests} concurrency={args.concurrency} elapsed={elapsed:.1f}s "
+          f"errors={len(results['errors'])}")
+    summarize("ttfb", results["ttfb"])
+    summarize("total", results["total"])
+    summarize("tokens/sec", results["tps"], unit="/s")
+    if server_metrics:
+        print("-" * 72)
+        print(json.dumps(server_metrics, ensure_ascii=False, indent=2))
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+DSL 생성 경로 부하 테스트
+- /api/v1/dsl/parse 에 동시 요청을 보내면서 헬스 체크 지연을 함께 측정
+- LLM 호출이 이벤트 루프를 막으면 헬스 체크 지연이 LLM 지연만큼 늘어남
+
+Usage:
+    python scripts/stub_llm_server.py --latency-ms 1500 &
+    python scripts/load_test_dsl.py --url http://localhost:8003 --concurrency 32 --requests 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import aiohttp
+
+SAMPLE_TEXTS = [
+    "PER 10 이하",
+    "ROE 15% 이상이고 PBR 1 이하",
+    "3일동안 8% 이상 오르면 매수",
+    "RSI 30 이하면 매수",
+    "부채비율 100 미만, 배당수익률 3% 이상",
+]
+
+
+def summarize(label: str, latencies: List[float]) -> None:
+    if not latencies:
+        print(f"{label:<12} no samples")
+        return
+    ordered = sorted(latencies)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(
+        f"{label:<12} n={len(ordered):<5} p50 {statistics.median(ordered):>8.1f}ms  "
+        f"p95 {p95:>8.1f}ms  max {ordered[-1]:>8.1f}ms"
+    )
+
+
+async def run_dsl_requests(session, url: str, total: int, concurrency: int, latencies: List[float], errors: List[int]):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                async with session.post(f"{url}/api/v1/dsl/parse", json={"text": SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)]}) as resp:
+                    await resp.read()
+                    if resp.status != 200:
+                        errors.append(resp.status)
+            except Exception:
+                errors.append(-1)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*[one(i) for i in range(total)])
+
+
+async def probe_health(session, url: str, stop: asyncio.Event, latencies: List[float], interval: float):
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            async with session.get(f"{url}/") as resp:
+                await resp.read()
+        except Exception:
+            pass
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="DSL 생성 부하 테스트")
+    parser.add_argument("--url", default="http://localhost:8003")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--probe-interval", type=float, default=0.1, help="헬스 체크 간격 (초)")
+    args = parser.parse_args()
+
+    dsl_latencies: List[float] = []
+    health_latencies: List[float] = []
+    errors: List[int] = []
+    stop = asyncio.Event()
+
+    timeout = aiohttp.ClientTimeout(total=300)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        started = time.perf_counter()
+        probe = asyncio.create_task(probe_health(session, args.url, stop, health_latencies, args.probe_interval))
+        await run_dsl_requests(session, args.url, args.requests, args.concurrency, dsl_latencies, errors)
+        stop.set()
+        await probe
+        elapsed = time.perf_counter() - started
+
+    print("=" * 72)
+    print(f"requests={args.requests} concurrency={args.concurrency} elapsed={elapsed:.1f}s "
+          f"throughput={args.requests / elapsed:.1f} req/s errors={len(errors)}")
+    summarize("dsl/parse", dsl_latencies)
+    summarize("health", health_latencies)
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
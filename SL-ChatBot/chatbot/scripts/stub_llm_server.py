@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+로컬 스텁 LLM 서버 (Bedrock invoke_model 호환)
+- POST /model/{modelId}/invoke 에 고정 DSL JSON을 지정한 지연 후 응답
+- POST /model/{modelId}/invoke-with-response-stream 에 Anthropic 스트리밍 이벤트를
+  AWS event stream 형식으로 토큰 단위 전송 (첫 토큰까지 --latency-ms, 토큰 간격 --token-ms)
+- 챗봇을 BEDROCK_ENDPOINT_URL로 연결해 실제 LLM 없이 부하 테스트
+
+Usage:
+    python scripts/stub_llm_server.py --port 8090 --latency-ms 1500 --token-ms 20
+
+    BEDROCK_ENDPOINT_URL=http://localhost:8090 \
+    AWS_ACCESS_KEY_ID=stub AWS_SECRET_ACCESS_KEY=stub \
+    python src/api_server.py
+"""
+import argparse
+import asyncio
+import base64
+import json
+import random
+import struct
+import zlib
+
+from aiohttp import web
+
+STUB_DSL = {
+    "conditions": [
+        {
+            "factor": "PER",
+            "params": [],
+            "operator": "<=",
+            "right_factor": None,
+            "right_params": [],
+            "value": 10
+        }
+    ]
+}
+
+STUB_ANSWER = (
+    "PER은 주가를 주당순이익으로 나눈 값으로, 낮을수록 이익 대비 주가가 저평가되었다는 뜻입니다. "
+    "업종마다 적정 수준이 다르므로 같은 업종 안에서 비교하는 것이 좋습니다. "
+    "예를 들어 PER 10 이하 조건과 ROE 15% 이상 조건을 함께 쓰면 수익성이 좋은 저평가 종목을 찾을 수 있습니다."
+)
+
+
+def _event_stream_message(payload: dict) -> bytes:
+    """AWS event stream 메시지 1개 인코딩 (chunk 이벤트, payload는 base64 bytes)"""
+    body = json.dumps({
+        "bytes": base64.b64encode(json.dumps(payload, ensure_ascii=False).encode("utf-8")).decode("ascii")
+    }).encode("utf-8")
+    headers = b""
+    for name, value in ((":event-type", "chunk"), (":content-type", "application/json"), (":message-type", "event")):
+        encoded = value.encode("utf-8")
+        headers += bytes([len(name)]) + name.encode("utf-8") + b"\x07" + struct.pack(">H", len(encoded)) + encoded
+    total_length = 12 + len(headers) + len(body) + 4
+    prelude = struct.pack(">II", total_length, len(headers))
+    message = prelude + struct.pack(">I", zlib.crc32(prelude)) + headers + body
+    return message + struct.pack(">I", zlib.crc32(message))
+
+
+def _stream_events(answer: str):
+    """Anthropic Messages 스트리밍 이벤트 순서 (토큰은 어절 단위)"""
+    tokens = [word + " " for word in answer.split(" ")]
+    yield {
+        "type": "message_start",
+        "message": {
+            "id": "msg_stub", "type": "message", "role": "assistant", "content": [],
+            "model": "stub", "stop_reason": None, "usage": {"input_tokens": 10, "output_tokens": 1},
+        },
+    }
+    yield {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}
+    for token in tokens:
+        yield {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": token}}
+    yield {"type": "content_block_stop", "index": 0}
+    yield {
+        "type": "message_delta",
+        "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+        "usage": {"output_tokens": len(tokens)},
+    }
+    yield {
+        "type": "message_stop",
+        "amazon-bedrock-invocationMetrics": {
+            "inputTokenCount": 10, "outputTokenCount": len(tokens),
+            "invocationLatency": 0, "firstByteLatency": 0,
+        },
+    }
+
+
+def build_app(latency_ms: float, jitter_ms: float, error_rate: float, token_ms: float = 20) -> web.Application:
+    stats = {"requests": 0, "inflight": 0, "max_inflight": 0}
+
+    async def invoke(request: web.Request) -> web.Response:
+        stats["requests"] += 1
+        stats["inflight"] += 1
+        stats["max_inflight"] = max(stats["max_inflight"], stats["inflight"])
+        try:
+            await request.read()
+            delay = max(0.0, latency_ms + random.uniform(-jitter_ms, jitter_ms)) / 1000
+            await asyncio.sleep(delay)
+            if random.random() < error_rate:
+                return web.json_response(
+                    {"message": "Rate exceeded"},
+                    status=429,
+                    headers={"x-amzn-ErrorType": "ThrottlingException"}
+                )
+            body = {
+                "content": [{"type": "text", "text": json.dumps(STUB_DSL)}],
+                "stop_reason": "end_turn",
+            }
+            return web.json_response(body)
+        finally:
+            stats["inflight"] -= 1
+
+    async def invoke_stream(request: web.Request) -> web.StreamResponse:
+        stats["requests"] += 1
+        stats["inflight"] += 1
+        stats["max_inflight"] = max(stats["max_inflight"], stats["inflight"])
+        try:
+            await request.read()
+            delay = max(0.0, latency_ms + random.uniform(-jitter_ms, jitter_ms)) / 1000
+            await asyncio.sleep(delay)
+            response = web.StreamResponse(
+                headers={"Content-Type": "application/vnd.amazon.eventstream"}
+            )
+            await response.prepare(request)
+            for event in _stream_events(STUB_ANSWER):
+                await response.write(_event_stream_message(event))
+                if event["type"] == "content_block_delta":
+                    await asyncio.sleep(token_ms / 1000)
+            await response.write_eof()
+            return response
+        finally:
+            stats["inflight"] -= 1
+
+    async def get_stats(_request: web.Request) -> web.Response:
+        return web.json_response(stats)
+
+    app = web.Application()
+    app.router.add_post("/model/{model_id:.+}/invoke-with-response-stream", invoke_stream)
+    app.router.add_post("/model/{model_id:.+}/invoke", invoke)
+    app.router.add_get("/stats", get_stats)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bedrock 호환 스텁 LLM 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=float, default=1500, help="응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=300, help="지연 편차 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--token-ms", type=float, default=20, help="스트리밍 토큰 간격 (ms)")
+    args = parser.parse_args()
+
+    web.run_app(
+        build_app(args.latency_ms, args.jitter_ms, args.error_rate, args.token_ms),
+        host=args.host,
+        port=args.port
+    )
+
+
+if __name__ == "__main__":
+    main()
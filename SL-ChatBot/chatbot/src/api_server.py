@@ -1,5 +1,7 @@
 """LLM Chat API Server - FastAPI 기반"""
+import asyncio
 import json
+import time
 import uuid
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,7 +10,9 @@ from pydantic import BaseModel
 from typing import Optional, Dict, Any, List, AsyncGenerator
 import uvicorn
 
-from handlers.chat_handler import ChatHandler
+from handlers.chat_handler import ChatHandler, get_shared_handler
+from backend_client import close_backend_client, get_backend_client
+from stream_metrics import StreamTrace, get_stream_metrics
 
 # Pydantic 모델
 class ChatRequest(BaseModel):
@@ -75,8 +79,14 @@ handler: Optional[ChatHandler] = None
 async def startup_event():
     """서버 시작시 ChatHandler 초기화"""
     global handler
-    handler = ChatHandler()
-    print("[Server] ChatHandler initialized")
+    handler = await get_shared_handler()
+    print(f"[Server] ChatHandler initialized ({handler.startup_profile.get('total')}ms)")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료시 백엔드 커넥션 풀 정리"""
+    await close_backend_client()
 
 
 @app.get("/")
@@ -173,10 +183,8 @@ async def delete_session(session_id: str):
         raise HTTPException(status_code=500, detail="ChatHandler not initialized")
 
     try:
-        # 세션 데이터 정리
-        if session_id in handler.session_state:
-            del handler.session_state[session_id]
-        handler.delete_session_history(session_id)
+        # 세션 데이터 정리 (메모리/상태, Redis 포함)
+        await handler.delete_session(session_id)
 
         return {
             "message": "Session deleted",
@@ -196,6 +204,45 @@ async def health_check():
     }
 
 
+@app.get("/api/v1/metrics/backend")
+async def backend_metrics():
+    """백엔드 호출 지표 (엔드포인트별 지연 히스토그램, 캐시/병합 횟수)"""
+    return get_backend_client().metrics()
+
+
+@app.get("/api/v1/metrics/stream")
+async def stream_metrics():
+    """SSE 스트리밍 지표 (경로별 TTFB/소요 시간 히스토그램, tokens/sec)"""
+    return get_stream_metrics().snapshot()
+
+
+@app.get("/api/v1/metrics/response-cache")
+async def response_cache_metrics():
+    """설명/일반 질문 응답 캐시 적중률과 절약한 LLM 시간"""
+    if not handler or not handler.response_cache:
+        return {"enabled": False}
+    return {"enabled": True, **handler.response_cache.metrics()}
+
+
+@app.get("/api/v1/metrics/startup")
+async def startup_metrics():
+    """ChatHandler 초기화 단계별 소요 시간 (ms)과 생성된 에이전트"""
+    if not handler:
+        raise HTTPException(status_code=503, detail="ChatHandler not initialized")
+    return {
+        "startup_profile": handler.startup_profile,
+        "agents": sorted(handler.agent_executors),
+    }
+
+
+@app.get("/api/v1/metrics/dsl")
+async def dsl_metrics():
+    """DSL 문법 fast path 적중률 (LLM 우회 비율)"""
+    from schemas.dsl_generator import get_condition_grammar
+
+    return get_condition_grammar().stats()
+
+
 @app.post("/api/v1/dsl/parse", response_model=DSLResponse)
 async def parse_dsl(request: DSLRequest):
     """
@@ -223,9 +270,9 @@ async def parse_dsl(request: DSLRequest):
     ```
     """
     try:
-        from schemas.dsl_generator import parse_strategy_text
+        from schemas.dsl_generator import parse_strategy_text_async
 
-        result = parse_strategy_text(request.text)
+        result = await parse_strategy_text_async(request.text)
         # Pydantic v1 호환: dict() 사용
         conditions = [ConditionSchema(**cond.dict()) for cond in result.conditions]
         return DSLResponse(conditions=conditions)
@@ -239,6 +286,14 @@ async def parse_dsl(request: DSLRequest):
         )
 
 
+def _sse(event: Dict[str, Any]) -> str:
+    return f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+async def _empty_context() -> str:
+    return ""
+
+
 async def generate_sse_stream(
     message: str,
     session_id: str
@@ -246,19 +301,48 @@ async def generate_sse_stream(
     """
     SSE 스트림 생성기
 
-    기존 handler.handle() 응답을 토큰 단위로 분할하여 SSE 형식으로 전송합니다.
+    빠른 응답 경로는 즉시 단일 청크로, LLM 경로는 토큰이 생성되는 대로 전송합니다.
+    요청별 TTFB/소요 시간/토큰 처리량을 stream_metrics에 기록합니다.
 
     Args:
         message: 사용자 메시지
         session_id: 세션 ID
 
     Yields:
-        SSE 형식의 문자열 ("data: {json}\n\n")
+        SSE 형식의 문자열 ("data: {json}\\n\\n")
     """
+    metrics = get_stream_metrics()
+    trace = metrics.start()
+    events = _generate_sse_events(message, session_id, trace)
+    try:
+        async for event in events:
+            if event.get("type") == "stream_chunk":
+                trace.chunk(token=event.pop("_token", False))
+            yield _sse(event)
+    finally:
+        # 클라이언트 연결 종료 시에도 내부 생성기의 finally(세션 저장)가 지금 실행되도록 명시적으로 닫음
+        try:
+            await events.aclose()
+        finally:
+            metrics.finish(trace)
+
+
+async def _generate_sse_events(
+    message: str,
+    session_id: str,
+    trace: StreamTrace
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """SSE 이벤트(dict) 생성기 - 직렬화와 지표 기록은 generate_sse_stream에서 처리"""
     message_id = f"msg_{uuid.uuid4().hex[:12]}"
+    session_loaded = False
+
+    def chunk(content: str) -> Dict[str, Any]:
+        return {"type": "stream_chunk", "content": content, "format": "markdown"}
+
+    end_event = {"type": "stream_end", "messageId": message_id}
 
     try:
-        yield f"data: {json.dumps({'type': 'stream_start', 'messageId': message_id}, ensure_ascii=False)}\n\n"
+        yield {"type": "stream_start", "messageId": message_id}
 
         # === 1) 스트리밍이 아닌 빠른 응답 케이스 선처리 ===
         client_type = handler._route_client_type(message)
@@ -268,70 +352,83 @@ async def generate_sse_stream(
             result = await handler.handle(message=message, session_id=session_id)
             answer = result.get("answer", "")
             if answer:
-                yield f"data: {json.dumps({'type': 'stream_chunk', 'content': answer, 'format': 'markdown'}, ensure_ascii=False)}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end', 'messageId': message_id}, ensure_ascii=False)}\n\n"
+                yield chunk(answer)
+            yield end_event
             return
 
+        # 세션 상태/대화 기록 로드 (handle 경로는 내부에서 로드/저장)
+        await handler.load_session(session_id)
+        session_loaded = True
+
         news_hint = handler._needs_news_keyword(message)
         if news_hint:
-            yield f"data: {json.dumps({'type': 'stream_chunk', 'content': news_hint, 'format': 'markdown'}, ensure_ascii=False)}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end', 'messageId': message_id}, ensure_ascii=False)}\n\n"
+            yield chunk(news_hint)
+            yield end_event
             return
 
         policy_violation = handler._check_investment_advisory_policy(message, session_id=session_id)
         if policy_violation:
-            yield f"data: {json.dumps({'type': 'stream_chunk', 'content': policy_violation, 'format': 'markdown'}, ensure_ascii=False)}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end', 'messageId': message_id}, ensure_ascii=False)}\n\n"
+            yield chunk(policy_violation)
+            yield end_event
             return
 
         category_response = handler._maybe_handle_category_mapping(message)
         if category_response:
             answer = category_response.get("answer", "")
             if answer:
-                yield f"data: {json.dumps({'type': 'stream_chunk', 'content': answer, 'format': 'markdown'}, ensure_ascii=False)}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end', 'messageId': message_id}, ensure_ascii=False)}\n\n"
+                yield chunk(answer)
+            yield end_event
             return
 
         handler._ensure_news_retriever()
-        if handler._is_news_theme_request(message) and not handler.news_retriever:
-            unavailable_answer = handler._format_news_unavailable(message)
-            yield f"data: {json.dumps({'type': 'stream_chunk', 'content': unavailable_answer, 'format': 'markdown'}, ensure_ascii=False)}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end', 'messageId': message_id}, ensure_ascii=False)}\n\n"
+        is_news_request = handler._is_news_theme_request(message)
+        if is_news_request and not handler.news_retriever:
+            yield chunk(handler._format_news_unavailable(message))
+            yield end_event
             return
 
-        # === 2) 에이전트 입력 준비 ===
         intent = await handler._classify_intent(message)
         if client_type == "ai_helper" and intent not in {"dsl_generation", "backtest_configuration", "explain"}:
             intent = "dsl_generation"
 
-        if client_type == "home_widget":
-            context = ""
-        else:
-            context = await handler._retrieve_context(message, intent)
-
-        news_context = ""
-        if handler._is_news_theme_request(message) and handler.news_retriever:
-            news_context = await handler._fetch_news_for_context(message)
-            sentiment_context = await handler._fetch_sentiment_for_context(message)
-
-            combined_context = ""
-            if news_context:
-                combined_context += f"[최신 뉴스 정보]\n{news_context}"
-            if sentiment_context:
-                combined_context += f"\n\n[감성 분석 데이터]\n{sentiment_context}"
-
-            if combined_context:
-                context = f"{context}\n\n{combined_context}" if context else combined_context
-
+        # 백테스트 설정은 컨텍스트 없이 템플릿으로 응답
         if intent == "backtest_configuration":
             result = handler._handle_backtest_configuration(message, session_id)
             answer = result.get("answer", "")
             if answer:
-                yield f"data: {json.dumps({'type': 'stream_chunk', 'content': answer, 'format': 'markdown'}, ensure_ascii=False)}\n\n"
-            yield f"data: {json.dumps({'type': 'stream_end', 'messageId': message_id}, ensure_ascii=False)}\n\n"
+                yield chunk(answer)
+            yield end_event
             return
 
-        # === 3) LangChain 스트리밍 실행 ===
+        # 반복되는 설명/일반 질문은 캐시된 답변을 단일 청크로 전달
+        cache_scope = handler._response_cache_scope(message, intent, client_type, session_id)
+        if cache_scope:
+            cached = await handler._get_cached_response(message, cache_scope, session_id, client_type)
+            if cached:
+                trace.path = "cache"
+                yield chunk(cached.get("answer", ""))
+                yield end_event
+                return
+        generate_started = time.perf_counter()
+
+        # === 2) 에이전트 입력 준비 (RAG/뉴스/감성 컨텍스트 동시 조회) ===
+        trace.path = "llm"
+        fetch_news = is_news_request and handler.news_retriever
+        context, news_context, sentiment_context = await asyncio.gather(
+            _empty_context() if client_type == "home_widget" else handler._retrieve_context(message, intent),
+            handler._fetch_news_for_context(message) if fetch_news else _empty_context(),
+            handler._fetch_sentiment_for_context(message) if fetch_news else _empty_context(),
+        )
+
+        combined_context = ""
+        if news_context:
+            combined_context += f"[최신 뉴스 정보]\n{news_context}"
+        if sentiment_context:
+            combined_context += f"\n\n[감성 분석 데이터]\n{sentiment_context}"
+        if combined_context:
+            context = f"{context}\n\n{combined_context}" if context else combined_context
+
+        # === 3) LangChain 스트리밍 실행 (토큰 생성 즉시 전달) ===
         final_result = None
         tokens_sent = False
         async for event in handler.stream_response_langchain(
@@ -342,39 +439,32 @@ async def generate_sse_stream(
             client_type=client_type,
         ):
             if event.get("type") == "token":
-                chunk_event = {
-                    "type": "stream_chunk",
-                    "content": event.get("content", ""),
-                    "format": "markdown"
-                }
-                yield f"data: {json.dumps(chunk_event, ensure_ascii=False)}\n\n"
+                token_event = chunk(event.get("content", ""))
+                token_event["_token"] = True
+                yield token_event
                 tokens_sent = True
             elif event.get("type") == "final":
                 final_result = event.get("result", {})
+                tool_calls = final_result.pop("_tool_calls", None)
+                if cache_scope and tool_calls == 0:
+                    await handler._store_cached_response(
+                        message, cache_scope, final_result, (time.perf_counter() - generate_started) * 1000
+                    )
 
         # 스트리밍 토큰이 없었던 경우 최종 응답이라도 단일 청크로 전달
         if final_result and not tokens_sent and final_result.get("answer"):
-            chunk_event = {
-                "type": "stream_chunk",
-                "content": final_result.get("answer", ""),
-                "format": "markdown"
-            }
-            yield f"data: {json.dumps(chunk_event, ensure_ascii=False)}\n\n"
+            yield chunk(final_result.get("answer", ""))
 
         if final_result and final_result.get("ui_language"):
-            ui_language_event = {
-                "type": "ui_language",
-                "data": final_result["ui_language"]
-            }
-            yield f"data: {json.dumps(ui_language_event, ensure_ascii=False)}\n\n"
+            yield {"type": "ui_language", "data": final_result["ui_language"]}
 
         # stream_end 이벤트 전송
-        end_payload = {"type": "stream_end", "messageId": message_id}
         if final_result and final_result.get("backtest_conditions"):
-            end_payload["backtest_conditions"] = final_result["backtest_conditions"]
-        yield f"data: {json.dumps(end_payload, ensure_ascii=False)}\n\n"
+            end_event["backtest_conditions"] = final_result["backtest_conditions"]
+        yield end_event
 
     except Exception as e:
+        trace.error = True
         # 예외 상세를 로그로 남겨 추적
         print(f"[SSE ERROR] message='{message}' session_id='{session_id}' error='{e}'")
         import traceback
@@ -390,12 +480,14 @@ async def generate_sse_stream(
             error_message = "응답 생성 중 오류가 발생했습니다. 다시 시도해주세요."
             error_code = "INTERNAL_ERROR"
 
-        error_event = {
+        yield {
             "type": "error",
             "code": error_code,
             "message": error_message
         }
-        yield f"data: {json.dumps(error_event, ensure_ascii=False)}\n\n"
+    finally:
+        if session_loaded:
+            await handler.persist_session(session_id)
 
 
 @app.get("/api/v1/chat/stream")
@@ -0,0 +1,260 @@
+"""Backend HTTP Client - 챗봇 → 백엔드 API 공용 클라이언트
+
+- 프로세스당 하나의 aiohttp.ClientSession (keep-alive 커넥션 풀)
+- 엔드포인트별 타임아웃
+- 동일 요청이 진행 중이면 결과를 공유 (request coalescing)
+- 짧은 TTL 응답 캐시 (호출자에게는 복사본 반환)
+- 엔드포인트별 지연 히스토그램
+"""
+import asyncio
+import copy
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+
+# 엔드포인트별 타임아웃 (초)
+ENDPOINT_TIMEOUTS: Dict[str, float] = {
+    "news.stock": 10,
+    "news.search": 10,
+    "news.sentiment_trend": 5,
+    "factors.list": 10,
+    "themes.list": 10,
+    "themes.sentiment": 15,
+}
+DEFAULT_TIMEOUT = 30
+
+# 엔드포인트별 응답 캐시 TTL (초, 0이면 캐시 안 함)
+ENDPOINT_CACHE_TTL: Dict[str, float] = {
+    "news.sentiment_trend": 60,
+    "factors.list": 300,
+    "themes.list": 300,
+}
+DEFAULT_CACHE_TTL = float(os.getenv("BACKEND_CACHE_TTL", 30))
+MAX_CACHE_ENTRIES = 512
+
+# 지연 히스토그램 버킷 상한 (ms)
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class BackendError(Exception):
+    """백엔드가 200이 아닌 응답을 반환"""
+
+    def __init__(self, status: int, endpoint: str):
+        super().__init__(f"Backend responded with HTTP {status} ({endpoint})")
+        self.status = status
+        self.endpoint = endpoint
+
+
+class LatencyHistogram:
+    """누적 버킷 히스토그램 (ms)"""
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.errors = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+
+    def observe(self, elapsed_ms: float) -> None:
+        for i, upper in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= upper:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+
+    def percentile(self, q: float) -> Optional[float]:
+        """버킷 상한 기준 근사 백분위수"""
+        if not self.count:
+            return None
+        threshold = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= threshold:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else float("inf")
+        return float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{upper}" for upper in LATENCY_BUCKETS_MS] + ["le_inf"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class BackendClient:
+    """백엔드 API 공용 클라이언트"""
+
+    def __init__(self, pool_size: int = 32, keepalive_timeout: float = 30):
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        self._cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._cache.clear()
+
+    def _histogram(self, endpoint: str) -> LatencyHistogram:
+        if endpoint not in self._histograms:
+            self._histograms[endpoint] = LatencyHistogram()
+        return self._histograms[endpoint]
+
+    async def get_json(
+        self,
+        url: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> Any:
+        """GET 요청 후 JSON 반환
+
+        Args:
+            url: 요청 URL
+            endpoint: 타임아웃/캐시/지표 구분용 엔드포인트 이름 (예: "news.search")
+            params: 쿼리 파라미터
+            timeout: 타임아웃 (기본: ENDPOINT_TIMEOUTS)
+            cache_ttl: 캐시 TTL (기본: ENDPOINT_CACHE_TTL, 0이면 캐시 안 함)
+
+        Raises:
+            BackendError: 200이 아닌 응답
+        """
+        key = (url, json.dumps(params or {}, sort_keys=True, default=str))
+        histogram = self._histogram(endpoint)
+        ttl = ENDPOINT_CACHE_TTL.get(endpoint, DEFAULT_CACHE_TTL) if cache_ttl is None else cache_ttl
+
+        if ttl > 0:
+            cached = self._cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                histogram.cache_hits += 1
+                return copy.deepcopy(cached[1])
+
+        task = self._inflight.get(key)
+        if task is not None:
+            histogram.coalesced += 1
+        else:
+            # 요청은 별도 태스크로 실행: 호출자 하나가 취소돼도 나머지 대기자는 결과를 받음
+            task = asyncio.ensure_future(self._fetch_and_cache(key, url, endpoint, params, timeout, ttl, histogram))
+            task.add_done_callback(_consume_exception)
+            self._inflight[key] = task
+        # 캐시/공유 결과는 호출자끼리 같은 객체이므로 복사본 반환
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _fetch_and_cache(
+        self,
+        key: Tuple,
+        url: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        ttl: float,
+        histogram: LatencyHistogram,
+    ) -> Any:
+        try:
+            data = await self._fetch(url, endpoint, params, timeout, histogram)
+            if ttl > 0:
+                self._cache[key] = (time.monotonic() + ttl, data)
+                self._cache.move_to_end(key)
+                while len(self._cache) > MAX_CACHE_ENTRIES:
+                    self._cache.popitem(last=False)
+            return data
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fetch(
+        self,
+        url: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        histogram: LatencyHistogram,
+    ) -> Any:
+        total = timeout if timeout is not None else ENDPOINT_TIMEOUTS.get(endpoint, DEFAULT_TIMEOUT)
+        start = time.perf_counter()
+        try:
+            async with self._get_session().get(
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=total),
+            ) as resp:
+                if resp.status != 200:
+                    raise BackendError(resp.status, endpoint)
+                return await resp.json()
+        except Exception:
+            histogram.errors += 1
+            raise
+        finally:
+            histogram.observe((time.perf_counter() - start) * 1000)
+
+    def invalidate(self, endpoint_url_prefix: str = "") -> None:
+        """URL 접두사로 캐시 무효화 (빈 문자열이면 전체)"""
+        for key in [k for k in self._cache if k[0].startswith(endpoint_url_prefix)]:
+            del self._cache[key]
+
+    def metrics(self) -> Dict[str, Any]:
+        """엔드포인트별 지연 히스토그램"""
+        return {
+            "pool_size": self.pool_size,
+            "cache_entries": len(self._cache),
+            "inflight": len(self._inflight),
+            "endpoints": {name: h.to_dict() for name, h in self._histograms.items()},
+        }
+
+
+def _consume_exception(task: "asyncio.Future") -> None:
+    """대기자가 모두 취소된 요청의 "exception was never retrieved" 경고 방지"""
+    if not task.cancelled():
+        task.exception()
+
+
+_client: Optional[BackendClient] = None
+
+
+def get_backend_client() -> BackendClient:
+    """프로세스 공용 BackendClient"""
+    global _client
+    if _client is None:
+        _client = BackendClient(pool_size=int(os.getenv("BACKEND_POOL_SIZE", 32)))
+    return _client
+
+
+async def close_backend_client() -> None:
+    """서버 종료 시 커넥션 풀 정리"""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Sequence, Tuple
 
-import aiohttp
+from backend_client import BackendError, get_backend_client
 
 
 def _sentiment_value(label: Optional[str]) -> int:
@@ -45,11 +45,7 @@ class SentimentInsightService:
     async def fetch_theme_summary(self, limit: int = 5) -> Dict:
         url = f"{self.backend_url}/news/themes/sentiment-summary"
         params = {"limit": limit}
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, timeout=15) as resp:
-                if resp.status != 200:
-                    raise RuntimeError(f"Backend responded with HTTP {resp.status}")
-                return await resp.json()
+        return await get_backend_client().get_json(url, "themes.sentiment", params=params)
 
     async def get_theme_sentiment_insights(self, limit: int = 5) -> Dict:
         summary = await self.fetch_theme_summary(limit=limit)
@@ -99,12 +95,24 @@ class SentimentInsightService:
             "confidence": min(1.0, (positive + negative) / 50),
         }
 
+    async def fetch_stock_sentiment_trend(self, stock_code: str, latest: int = 5) -> Dict:
+        url = f"{self.backend_url}/news/db/stock/{stock_code}/sentiment-trend"
+        return await get_backend_client().get_json(url, "news.sentiment_trend", params={"latest": latest})
+
     async def analyze_stock_sentiment(
         self,
         stock_code: str,
         stock_name: Optional[str] = None,
         max_results: int = 400,
     ) -> Dict:
+        # 백엔드 일간 롤업(news_sentiment_daily)으로 추세/급변을 바로 조회
+        try:
+            return await self.fetch_stock_sentiment_trend(stock_code)
+        except BackendError as e:
+            print(f"[WARN] Sentiment trend endpoint unavailable (HTTP {e.status}), aggregating raw news")
+        except Exception as e:
+            print(f"[WARN] Sentiment trend fetch failed ({e}), aggregating raw news")
+
         if not self.news_retriever:
             raise RuntimeError("News retriever not configured.")
 
@@ -1,10 +1,11 @@
 """Backend Factor Sync - 백엔드 팩터 데이터 동기화"""
 import os
-import aiohttp
 from typing import List, Dict, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
+from backend_client import BackendError, get_backend_client
+
 # Load environment variables
 env_path = Path(__file__).parent.parent.parent.parent / ".env"
 load_dotenv(env_path)
@@ -35,18 +36,15 @@ class FactorSync:
             return self._factor_cache
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.backend_url}/api/v1/factors/list",
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        self._factor_cache = data.get("factors", [])
-                        return self._factor_cache
-                    else:
-                        print(f"Factor API error: {resp.status}")
-                        return []
+            data = await get_backend_client().get_json(
+                f"{self.backend_url}/api/v1/factors/list",
+                "factors.list"
+            )
+            self._factor_cache = data.get("factors", [])
+            return self._factor_cache
+        except BackendError as e:
+            print(f"Factor API error: {e.status}")
+            return []
         except Exception as e:
             print(f"Failed to fetch factors from backend: {e}")
             return []
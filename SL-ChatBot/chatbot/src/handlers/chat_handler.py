@@ -9,14 +9,17 @@ import copy
 import traceback
 import logging
 import hashlib
+import time
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 from dotenv import load_dotenv
 import yaml
 try:
     import redis  # type: ignore
+    import redis.asyncio as aioredis  # type: ignore
 except ImportError:
     redis = None
+    aioredis = None
 
 # LangChain 캐시 (Redis)
 RedisCache = None
@@ -29,28 +32,6 @@ except Exception:
         print(f"경고: LangChain RedisCache를 불러오지 못했습니다. 캐시 비활성화. 오류: {e}")
         RedisCache = None
 
-
-class InMemorySessionStore:
-    """대화 세션 스토어 (메모리 기반)."""
-    def __init__(self):
-        self._store: Dict[str, Any] = {}
-
-    def get_or_create(self, key: str, factory: Any) -> Any:
-        if key not in self._store:
-            self._store[key] = factory()
-        return self._store[key]
-
-    def delete(self, key: str) -> None:
-        if key in self._store:
-            del self._store[key]
-
-    def delete_by_suffix(self, suffix: str) -> None:
-        keys = [k for k in self._store.keys() if k.endswith(suffix)]
-        for k in keys:
-            del self._store[k]
-
-    def clear(self) -> None:
-        self._store.clear()
 _pydantic_v1_module = None
 try:
     import pydantic as _pydantic
@@ -182,6 +163,10 @@ except ImportError:
     print("Warning: Tools not imported")
     get_tools = None
 
+from keyword_matcher import KeywordMatcher
+from session_store import create_session_store
+from response_cache import ResponseCache, create_response_cache, prompt_version
+
 
 class ChatHandler:
     """Handles conversation flow and orchestrates components."""
@@ -189,8 +174,80 @@ class ChatHandler:
     GREETING_KEYWORDS = {"안녕", "안녕하세요", "hi", "hello", "하이", "헬로"}
     DEFAULT_GREETING_RESPONSE = "안녕하세요! AI assistent 입니다 :) 어떤 도움이 필요하신가요?"
     DSL_CACHE_VERSION = "v1"
-
-    def __init__(self, config_path: str = "config.yaml"):
+    RESPONSE_CACHE_VERSION = "v1"
+    # 대화 상태/실시간 데이터와 무관해 응답 캐시 대상인 의도
+    CACHEABLE_INTENTS = {"explain", "general"}
+
+    # 라우팅/의도 분류 키워드 사전 (시작 시 KeywordMatcher로 일괄 컴파일)
+    NEWS_KEYWORDS = ["뉴스", "동향", "headline", "테마", "시장", "최근", "트렌드", "이슈"]
+    SCREENING_KEYWORDS = ["per", "pbr", "roe", "스크리닝", "조건 찾", "필터링"]
+    STRATEGY_REQUEST_TRIGGERS = ["전략 추천", "추천받고 싶어요", "추천 해줘", "설문", "투자 성향"]
+    INTENT_KEYWORDS = {
+        "verify": ['맞아', '맞나', '맞는지', '맞니', '확인', '검증', '체크', '이게 맞', '맞는 거'],
+        "dsl": ['만들', '생성', 'per', 'pbr', 'roe', 'roa',
+                'rsi', 'macd', 'sma', 'ema', '이하', '이상', '초과', '미만'],
+        "explain": ['설명', 'explain', '뭐', '무엇', '어떻게', 'how', '왜', 'why',
+                    '알려줘', '가르쳐', 'cagr', 'mdd', '샤프', 'sharpe', '의미'],
+        "recommend": ['전략 추천', 'recommend', '추천'],
+        "backtest": [
+            '백테스트 설정', '전략으로 진행', '전략으로 백테스트', '이 전략으로', '자동 설정', '백테스팅', '백테스트', "테스트",
+            '백테스트 진행', '설정해줘', '전략 실행', '전략 설정', '실행해줘', '하고싶어', '조건 설정', '조건 만들어줘'
+        ],
+        "factor": ['per', 'pbr', 'roe', 'roa', 'rsi', 'sma', 'ema', 'macd', 'mdd', '샤프', 'sharpe'],
+        "backtest_word": ['백테스트'],
+    }
+    ROUTE_KEYWORDS = {
+        # 투자 거장/전략명 (짧아도 assistant로)
+        "investor": [
+            "워렌버핏", "워렌", "버핏", "buffett", "피터린치", "피터", "린치", "lynch",
+            "벤자민그레이엄", "벤자민", "그레이엄", "graham", "레이달리오", "레이", "달리오", "dalio",
+            "필립피셔", "필립", "피셔", "fisher", "전략", "가치투자", "성장투자", "모멘텀투자", "배당투자",
+        ],
+        # 개념 설명 요청
+        "explanation": [
+            "뭐야", "뭔데", "무엇", "뭔지", "뭔가요", "뭘까",
+            "설명", "알려", "가르쳐", "알아야", "이해",
+            "차이", "비교", "다른점", "하기 전에",
+        ],
+        # 요약/간단 요청
+        "widget": ["요약", "간단히", "한줄", "짧게", "핵심만"],
+    }
+    # 키워드로 표현할 수 없는 순서/앵커 조건은 정규식으로 유지 (모듈 로드 시 1회 컴파일)
+    HELPER_EXCEPTION_RE = re.compile(r"백테스트.*(무엇|뭐|왜|어떻게|알아야|필요|의미|설명)")
+    HELPER_RE = re.compile("|".join([
+        # 구체적인 수치가 있는 조건
+        r"(<=|>=|<|>|%|이상|이하).*(매수|매도)",
+        r"\d+.*(이상|이하|초과|미만).*(매수|매도)",
+        # 팩터 + 조건 명시
+        r"(PER|PBR|ROE|RSI|MACD|볼린저).*(조건|매수|매도)",
+        # 명확한 조건/DSL 생성 요청 (전략명 없이)
+        r"^(조건|DSL).*(만들|생성|해줘)",
+        r"^(룰|규칙).*(만들|생성)",
+        # 백테스트 + 구체적 요청
+        r"백테스트.*(조건|만들|생성)",
+    ]))
+    EXPLANATION_RE = re.compile(
+        r"(의미|뜻|개념|정의)(\?|$)"  # "RSI 의미?"
+        r"|(어떤|무슨).*전략"  # "어떤 전략이 맞아?"
+        r"|(\?|？).*\?"  # 물음표가 2개 이상
+    )
+    # client_type별 시스템 프롬프트 (파일 없으면 fallback)
+    AGENT_PROMPT_SPECS = {
+        "assistant": {
+            "filename": "system_assistant.txt",
+            "fallback": "당신은 정량 투자 자문가이자 투자 개념을 설명하는 어시스턴트입니다."
+        },
+        "ai_helper": {
+            "filename": "system_ai_helper.txt",
+            "fallback": "당신은 백테스트 조건을 생성하고 DSL을 만드는 AI 헬퍼입니다."
+        },
+        "home_widget": {
+            "filename": "system_home_widget.txt",
+            "fallback": "당신은 홈 화면 위젯에서 간결하게 금융 질문을 돕는 어시스턴트입니다."
+        },
+    }
+
+    def __init__(self, config_path: str = "config.yaml", defer_init: bool = False):
         if not logging.getLogger().handlers:
             logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
@@ -199,15 +256,25 @@ class ChatHandler:
         self.rag_retriever = None
         self.factor_sync = None
         self.news_retriever = None
+        # client_type별 에이전트 (첫 사용 시 생성)
         self.agent_executors: Dict[str, Any] = {}
         self.system_prompts: Dict[str, str] = {}
-        self.conversation_history = {}
+        self._agent_tools: Optional[List[Any]] = None
+        self._agent_build_failed: set = set()
         self.cache_client = None
-        # 설문/추천 상태
-        self.session_state: Dict[str, Dict[str, Any]] = {}
+        self.async_cache_client = None
+        # 설명/일반 질문 응답 캐시 (초기화 마지막 단계에서 생성)
+        self.response_cache: Optional[ResponseCache] = None
+        # 세션 스토어 (SESSION_STORE=memory|redis, LRU 앞단)
+        self.session_store = create_session_store()
+        # 설문/추천 상태 (세션 스토어의 상태 매핑 뷰)
+        self.session_state = self.session_store.states
         self.forbidden_patterns: Dict[str, List[str]] = {}
         self.questions: List[Dict[str, Any]] = []
         self.nl_category_mapping: Dict[str, List[str]] = {}
+        self.keyword_matcher: Optional[KeywordMatcher] = None
+        self._last_keyword_scan: tuple = ("", frozenset())
+        self._forbidden_regexes: Dict[str, Any] = {}
         # LLM 메타 데이터 (에러 로깅용)
         self.llm_region: Optional[str] = None
         self.llm_model_id: Optional[str] = None
@@ -215,23 +282,71 @@ class ChatHandler:
         self.llm_target_id: Optional[str] = None
         # 외부 서비스 핸들러 (선언만 해 AttributeError 방지)
         self.sentiment_service = None
-        # 챗봇 사용 가이드 캐시
+        # 챗봇 사용 가이드 캐시 (가이드 요청 시 로드)
         self.usage_notes: Optional[str] = None
+        self._usage_notes_loaded = False
         self.page_guides_cache: Dict[str, str] = {}
-        # 세션 스토어 (메모리 기본, 교체 가능)
-        self.session_store = InMemorySessionStore()
-        # 기존 코드 호환용 (더 이상 직접 사용하지 않는 것을 권장)
-        self.conversation_history = self.session_store._store
+        # 초기화 단계별 소요 시간 (ms)
+        self.startup_profile: Dict[str, float] = {}
+        self.initialized = False
 
-        self._load_config()
-        self._load_forbidden_patterns()
+        # defer_init=True면 호출 측에서 await initialize()로 병렬 초기화
+        if not defer_init:
+            started = time.perf_counter()
+            self._run_init_step("config", self._load_config)
+            for name, step in self._init_steps():
+                self._run_init_step(name, step)
+            self._finish_init(started)
+
+    def _init_steps(self) -> List[tuple]:
+        """config 로드 이후 서로 독립적인 초기화 단계."""
+        return [
+            ("forbidden_patterns", self._load_forbidden_patterns),
+            ("questions", self._init_questions),
+            ("strategies", self._load_strategies),
+            ("nl_category_mapping", self._load_nl_category_mapping),
+            ("cache_client", self._init_cache_client),
+            ("retrievers", self._init_retrievers),
+            ("llm_client", self._init_llm_client),
+        ]
+
+    def _run_init_step(self, name: str, step) -> None:
+        start = time.perf_counter()
+        try:
+            step()
+        finally:
+            self.startup_profile[name] = round((time.perf_counter() - start) * 1000, 2)
+
+    async def initialize(self) -> None:
+        """독립적인 로드 단계를 스레드에서 병렬 실행 (서버 시작 시간 단축)."""
+        if self.initialized:
+            return
+        started = time.perf_counter()
+        self._run_init_step("config", self._load_config)
+        await asyncio.gather(*(
+            asyncio.to_thread(self._run_init_step, name, step)
+            for name, step in self._init_steps()
+        ))
+        self._finish_init(started)
+
+    def _finish_init(self, started: float) -> None:
+        """앞 단계 결과에 의존하는 마무리 (키워드 매처, 선택적 에이전트 선생성)."""
+        self._run_init_step("keyword_matcher", self._build_keyword_matcher)
+        self._run_init_step("response_cache", self._init_response_cache)
+        self._ensure_news_retriever()
+        # CHATBOT_PRELOAD_AGENTS=assistant,ai_helper 처럼 지정한 에이전트만 미리 생성
+        for mode in filter(None, (m.strip() for m in os.getenv("CHATBOT_PRELOAD_AGENTS", "").split(","))):
+            self._run_init_step(f"agent:{mode}", lambda mode=mode: self._get_agent_executor(mode))
+        self.startup_profile["total"] = round((time.perf_counter() - started) * 1000, 2)
+        self.initialized = True
+        print(
+            f"[Startup] ChatHandler initialized in {self.startup_profile['total']}ms ("
+            + ", ".join(f"{k}={v}ms" for k, v in self.startup_profile.items() if k != "total")
+            + ")"
+        )
+
+    def _init_questions(self) -> None:
         self.questions = self._load_questions()
-        self._load_strategies()
-        self._load_nl_category_mapping()
-        self._load_usage_notes()
-        self._init_cache_client()
-        self._init_components()
-        self._ensure_news_retriever()
 
     def _needs_news_keyword(self, message: str) -> Optional[str]:
         """뉴스 의도지만 키워드가 없는 경우 간단 안내 반환."""
@@ -255,6 +370,9 @@ class ChatHandler:
             return
         try:
             self.cache_client = redis.from_url(redis_url, decode_responses=True)
+            # 요청 경로(DSL 캐시)는 이벤트 루프를 막지 않도록 비동기 클라이언트 사용
+            if aioredis:
+                self.async_cache_client = aioredis.from_url(redis_url, decode_responses=True)
             self.logger.info(f"Redis cache enabled ({redis_url})")
             # LangChain Redis 캐시 설정 (프롬프트/컨텍스트 해시 기반)
             if RedisCache:
@@ -264,6 +382,21 @@ class ChatHandler:
         except Exception as e:
             self.logger.warning(f"Redis 초기화 실패: {e}")
             self.cache_client = None
+            self.async_cache_client = None
+
+    def _init_response_cache(self):
+        """응답 캐시 생성 (프롬프트 파일 해시로 버전 지정, Redis 있으면 인스턴스 간 공유)."""
+        prompt_dir = Path("/app/prompts")
+        if not prompt_dir.exists():
+            prompt_dir = Path(__file__).parent.parent.parent / "prompts"
+        filenames = [spec["filename"] for spec in self.AGENT_PROMPT_SPECS.values()] + ["explain.txt", "system.txt"]
+        version = prompt_version(
+            [prompt_dir / name for name in filenames],
+            extra=f"{self.RESPONSE_CACHE_VERSION}:{self.config['llm'].get('model', '')}",
+        )
+        self.response_cache = create_response_cache(version, redis_client=self.async_cache_client)
+        if self.response_cache:
+            print(f"Response cache enabled (version {version})")
 
     def _load_questions(self):
         """설문 질문을 외부 파일에서 로드하고, 실패하면 기본값 사용."""
@@ -335,6 +468,13 @@ class ChatHandler:
             },
         ]
 
+    def _get_usage_notes(self) -> Optional[str]:
+        """사용 가이드 요약 (첫 요청 시 로드)."""
+        if not self._usage_notes_loaded:
+            self._load_usage_notes()
+            self._usage_notes_loaded = True
+        return self.usage_notes
+
     def _load_usage_notes(self) -> None:
         """챗봇 사용 가이드(요약)를 로드해 캐시."""
         candidates = [
@@ -405,6 +545,7 @@ class ChatHandler:
                     "top_k": 3
                 }
             }
+        self.provider = self.config["llm"].get("provider", LLM_PROVIDER).lower()
 
     def _load_strategies(self):
         """Load strategies from prompts/strategies.json and build mappings."""
@@ -461,6 +602,44 @@ class ChatHandler:
             )
             self.strategy_alias_map[sid] = alias_tokens
             
+    def _build_keyword_matcher(self):
+        """라우팅/의도/카테고리/전략 별칭 키워드를 하나의 오토마톤으로 컴파일."""
+        matcher = KeywordMatcher()
+        matcher.add(self.NEWS_KEYWORDS, "news")
+        matcher.add(self.SCREENING_KEYWORDS, "screening")
+        matcher.add(self.STRATEGY_REQUEST_TRIGGERS, "strategy_request")
+        for name, keywords in self.INTENT_KEYWORDS.items():
+            matcher.add(keywords, f"intent:{name}")
+        for name, keywords in self.ROUTE_KEYWORDS.items():
+            matcher.add(keywords, f"route:{name}")
+        for category, keywords in self.nl_category_mapping.items():
+            matcher.add(keywords or [], f"category:{category}")
+        for sid, meta in self.strategy_backtest_templates.items():
+            matcher.add([sid, meta["strategy_name"]], f"strategy_name:{sid}", compact=True)
+            alias_tokens = self.strategy_alias_map.get(sid) or [meta["strategy_name"]]
+            matcher.add(alias_tokens, f"strategy:{sid}", compact=True)
+        self.keyword_matcher = matcher.build()
+        print(f"Keyword matcher compiled ({matcher.keyword_count} keywords, {len(matcher.labels)} labels)")
+
+    def _scan_keywords(self, message: str) -> frozenset:
+        """메시지의 매칭 라벨 집합 (같은 메시지에 대한 연속 호출은 재사용)."""
+        if not message or self.keyword_matcher is None:
+            return frozenset()
+        last_message, last_labels = self._last_keyword_scan
+        if message == last_message:
+            return last_labels
+        labels = self.keyword_matcher.scan(message)
+        self._last_keyword_scan = (message, labels)
+        return labels
+
+    def _match_strategy_alias(self, message: str) -> Optional[str]:
+        """메시지에 포함된 전략 별칭의 전략 ID (strategies.json 순서 기준 첫 번째)."""
+        labels = self._scan_keywords(message)
+        for sid in self.strategy_backtest_templates:
+            if f"strategy:{sid}" in labels:
+                return sid
+        return None
+
     def _load_forbidden_patterns(self):
         """금지 패턴을 외부 설정에서 로드 (없으면 기본값 사용)."""
         default_patterns = {
@@ -504,6 +683,7 @@ class ChatHandler:
                 data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
                 if isinstance(data, dict) and data:
                     self.forbidden_patterns = data
+                    self._compile_forbidden_patterns()
                     print(f"Loaded forbidden patterns from {path}")
                     return
             except Exception as e:
@@ -511,15 +691,22 @@ class ChatHandler:
 
         # fallback
         self.forbidden_patterns = default_patterns
+        self._compile_forbidden_patterns()
         print("Using default forbidden patterns")
 
-    def _init_components(self):
-        """Initialize RAG, MCP, and LLM clients."""
-        provider = self.config["llm"].get("provider", LLM_PROVIDER).lower()
-        self.provider = provider
+    def _compile_forbidden_patterns(self):
+        """위반 유형별 패턴을 하나의 정규식으로 합쳐 1회 컴파일."""
+        self._forbidden_regexes = {}
+        for violation_type, patterns in self.forbidden_patterns.items():
+            try:
+                self._forbidden_regexes[violation_type] = re.compile(
+                    "|".join(f"(?:{pattern})" for pattern in patterns)
+                )
+            except re.error as e:
+                print(f"Invalid forbidden pattern in {violation_type}: {e}")
 
-        # Initialize components regardless of provider first
-        print(f"LLM Provider: {self.provider}")
+    def _init_retrievers(self):
+        """Initialize FactorSync, RAG and news retrievers."""
 
         # Initialize FactorSync for Backend integration
         if FactorSync:
@@ -546,7 +733,10 @@ class ChatHandler:
             self.news_retriever = NewsRetriever(backend_url)
             print(f"News Retriever initialized - Backend URL: {backend_url}")
 
-        # Bedrock 제공자용 LangChain 에이전트 초기화
+    def _init_llm_client(self):
+        """Bedrock LLM 클라이언트 초기화 (에이전트는 client_type별 첫 사용 시 생성)."""
+        print(f"LLM Provider: {self.provider}")
+
         if self.provider == "bedrock":
             if not get_tools:
                 print("경고: get_tools를 사용할 수 없습니다. 에이전트가 초기화되지 않습니다.")
@@ -579,7 +769,9 @@ class ChatHandler:
                 bedrock_client = boto3.client(
                     service_name='bedrock-runtime',
                     region_name=aws_region,
-                    config=retry_config
+                    config=retry_config,
+                    # 스텁 LLM 서버로 벤치마크할 때 사용 (scripts/stub_llm_server.py)
+                    endpoint_url=os.getenv("BEDROCK_ENDPOINT_URL") or None
                 )
 
                 model_id = os.getenv("BEDROCK_MODEL_ID", self.config["llm"]["model"])
@@ -638,69 +830,8 @@ class ChatHandler:
                     f"env_profile: {os.getenv('BEDROCK_INFERENCE_PROFILE_ID') or os.getenv('BEDROCK_INFERENCE_PROFILE_ARN')}"
                 )
 
-                # 2. 도구 초기화
-                print("Step 2: 도구 초기화 중...")
-                tools = get_tools(
-                    news_retriever=self.news_retriever,
-                    factor_sync=self.factor_sync
-                )
-                print(f"Step 2 OK: 도구 초기화 완료: {[tool.name for tool in tools]}")
-
-                # 3. 시스템 프롬프트 로드
-                print("Step 3: 시스템 프롬프트 로드 중...")
-                prompt_specs = {
-                    "assistant": {
-                        "filename": "system_assistant.txt",
-                        "fallback": "당신은 정량 투자 자문가이자 투자 개념을 설명하는 어시스턴트입니다."
-                    },
-                    "ai_helper": {
-                        "filename": "system_ai_helper.txt",
-                        "fallback": "당신은 백테스트 조건을 생성하고 DSL을 만드는 AI 헬퍼입니다."
-                    },
-                    "home_widget": {
-                        "filename": "system_home_widget.txt",
-                        "fallback": "당신은 홈 화면 위젯에서 간결하게 금융 질문을 돕는 어시스턴트입니다."
-                    },
-                }
-                self.system_prompts = {}
-                for mode, spec in prompt_specs.items():
-                    self.system_prompts[mode] = self._load_system_prompt_content(
-                        spec["filename"],
-                        spec["fallback"]
-                    )
-                    print(f"  - {mode} 프롬프트 {len(self.system_prompts[mode])}자 로드")
-                print("Step 3 OK: 시스템 프롬프트 로드 완료")
-
-                # 4. Claude 도구 호출 프롬프트/에이전트 생성
-                print("Step 4: Claude 프롬프트 및 AgentExecutor 생성 중...")
-                self.agent_executors = {}
-                for mode, system_prompt in self.system_prompts.items():
-                    prompt_template = ChatPromptTemplate.from_messages([
-                        (
-                            "system",
-                            system_prompt
-                            + "\n\n필요할 때 다음 도구를 사용할 수 있습니다."
-                            + "\n\n{agent_scratchpad}"
-                        ),
-                        MessagesPlaceholder("chat_history"),
-                        ("user", "참고자료:\n{context}\n\n질문: {input}"),
-                    ])
-                    agent = create_tool_calling_agent(self.llm_client, tools, prompt_template)
-                    executor = AgentExecutor(
-                        agent=agent,
-                        tools=tools,
-                        verbose=False,
-                        return_intermediate_steps=True,
-                        handle_parsing_errors=True,
-                        max_iterations=5
-                    )
-                    self.agent_executors[mode] = executor
-                    print(f"  - {mode} AgentExecutor 생성 완료")
-                print("Step 4 OK: 모든 AgentExecutor 생성 완료")
-
-                print("✅ LangChain AgentExecutor 생성 성공")
             except Exception as e:
-                print(f"❌ LangChain 에이전트 초기화 오류: {e}")
+                print(f"❌ LLM 클라이언트 초기화 오류: {e}")
                 import traceback
                 traceback.print_exc()
         else:
@@ -726,6 +857,19 @@ class ChatHandler:
         if session_id is None:
             session_id = str(uuid.uuid4())
 
+        await self.load_session(session_id)
+        try:
+            return await self._handle(message, session_id, answer, client_type)
+        finally:
+            await self.persist_session(session_id)
+
+    async def _handle(
+        self,
+        message: str,
+        session_id: str,
+        answer: Optional[dict],
+        client_type: Optional[str]
+    ) -> dict:
         # client_type이 명시되지 않았거나 "assistant"일 경우 자동 라우팅
         if not client_type or client_type.lower() == "assistant":
             client_type = self._route_client_type(message)
@@ -815,6 +959,15 @@ class ChatHandler:
             if intent != "backtest_configuration":
                 intent = "dsl_generation"
 
+        # 반복되는 설명/일반 질문은 캐시된 답변 반환 (LLM/RAG 생략)
+        cache_scope = self._response_cache_scope(message, intent, client_type, session_id)
+        if cache_scope:
+            cached = await self._get_cached_response(message, cache_scope, session_id, client_type)
+            if cached:
+                cached["session_id"] = session_id
+                return cached
+        generate_started = time.perf_counter()
+
         # 2. Intent에 따라 다른 핸들러 호출
         if intent == 'dsl_generation':
             response = await self._handle_dsl_mode(message, session_id)
@@ -881,6 +1034,12 @@ class ChatHandler:
                     message, intent, context, session_id, client_type
                 )
 
+        tool_calls = response.pop("_tool_calls", None)
+        if cache_scope and tool_calls == 0:
+            await self._store_cached_response(
+                message, cache_scope, response, (time.perf_counter() - generate_started) * 1000
+            )
+
         response["session_id"] = session_id
         # AI 헬퍼 모드에서는 바로 적용 가능한 매수/매도 버튼을 노출하도록 UI 언어를 보강한다.
         if client_type == "ai_helper":
@@ -896,8 +1055,7 @@ class ChatHandler:
     def _is_strategy_request(self, message: str) -> bool:
         """전략 추천 설문을 시작할지 여부 판단."""
         msg = (message or "").lower()
-        triggers = ["전략 추천", "추천받고 싶어요", "추천 해줘", "설문", "투자 성향"]
-        return any(t in msg for t in triggers) or msg.strip() == ""
+        return "strategy_request" in self._scan_keywords(msg) or msg.strip() == ""
 
     def _route_client_type(self, message: str) -> str:
         """메시지 내용을 분석하여 적절한 client_type을 자동으로 결정합니다.
@@ -919,71 +1077,18 @@ class ChatHandler:
 
         text = message.strip()
 
-        # === 1순위: AI HELPER 규칙 (행동 요청) ===
+        labels = self._scan_keywords(text)
 
+        # === 1순위: AI HELPER 규칙 (행동 요청) ===
         # 예외: 백테스트 개념 질문은 헬퍼가 아님
-        helper_exception_patterns = [
-            r"백테스트.*(무엇|뭐|왜|어떻게|알아야|필요|의미|설명)",
-        ]
-
-        is_helper_exception = False
-        for pattern in helper_exception_patterns:
-            if re.search(pattern, text):
-                is_helper_exception = True
-                break
-
-        if not is_helper_exception:
-            # AI HELPER로 보내야 하는 패턴들 (매우 명확한 DSL 생성 요청만)
-            helper_patterns = [
-                # 구체적인 수치가 있는 조건
-                r"(<=|>=|<|>|%|이상|이하).*(매수|매도)",
-                r"\d+.*(이상|이하|초과|미만).*(매수|매도)",
-
-                # 팩터 + 조건 명시
-                r"(PER|PBR|ROE|RSI|MACD|볼린저).*(조건|매수|매도)",
-
-                # 명확한 조건/DSL 생성 요청 (전략명 없이)
-                r"^(조건|DSL).*(만들|생성|해줘)",
-                r"^(룰|규칙).*(만들|생성)",
-
-                # 백테스트 + 구체적 요청
-                r"백테스트.*(조건|만들|생성)",
-            ]
-
-            for pattern in helper_patterns:
-                if re.search(pattern, text):
-                    return "ai_helper"
+        if not self.HELPER_EXCEPTION_RE.search(text) and self.HELPER_RE.search(text):
+            return "ai_helper"
 
         # === 2순위: ASSISTANT 개념 설명 패턴 (짧은 문장이라도 설명 요청이면 assistant) ===
-
-        # 투자 거장/전략명 패턴 (짧아도 assistant로)
-        strategy_investor_patterns = [
-            r"(워렌버핏|워렌|버핏|buffett)",
-            r"(피터린치|피터|린치|lynch)",
-            r"(벤자민그레이엄|벤자민|그레이엄|graham)",
-            r"(레이달리오|레이|달리오|dalio)",
-            r"(필립피셔|필립|피셔|fisher)",
-            r"전략",  # "전략" 키워드
-            r"(가치투자|성장투자|모멘텀투자|배당투자)",
-        ]
-
-        for pattern in strategy_investor_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "assistant"
-
-        explanation_patterns = [
-            r"(뭐야|뭔데|무엇|뭔지|뭔가요|뭘까)",  # "PER이 뭐야?"
-            r"(의미|뜻|개념|정의)(\?|$)",  # "RSI 의미?"
-            r"(설명|알려|가르쳐|알아야|이해)",  # "쉽게 설명해줘"
-            r"(차이|비교|다른점)",  # "모멘텀과 가치 전략 차이"
-            r"(어떤|무슨).*전략",  # "어떤 전략이 맞아?"
-            r"하기 전에",  # "백테스트 하기 전에"
-            r"(\?|？).*\?",  # 물음표가 2개 이상
-        ]
-
-        for pattern in explanation_patterns:
-            if re.search(pattern, text):
-                return "assistant"
+        if "route:investor" in labels:
+            return "assistant"
+        if "route:explanation" in labels or self.EXPLANATION_RE.search(text):
+            return "assistant"
 
         # === 3순위: HOME WIDGET 규칙 (짧은 질문/요약) ===
 
@@ -995,13 +1100,8 @@ class ChatHandler:
                 return "home_widget"
 
         # 요약/간단 요청 키워드
-        widget_patterns = [
-            r"(요약|간단히|한줄|짧게|핵심만)",
-        ]
-
-        for pattern in widget_patterns:
-            if re.search(pattern, text):
-                return "home_widget"
+        if "route:widget" in labels:
+            return "home_widget"
 
         # === 4순위: ASSISTANT (기본값) ===
         return "assistant"
@@ -1133,25 +1233,19 @@ class ChatHandler:
         """홈 위젯 스크리닝 요청 여부 판단 (특정 키워드 기반)."""
         if not message:
             return False
-        lower = message.lower()
         # 단순 스크리닝 키워드 (팩터 조합은 category_mapping에서 처리)
-        keywords = ["per", "pbr", "roe", "스크리닝", "조건 찾", "필터링"]
-        return any(kw in lower for kw in keywords)
+        return "screening" in self._scan_keywords(message)
 
     def _is_home_widget_news_request(self, message: str) -> bool:
         if not message:
             return False
-        lower = message.lower()
-        keywords = ["뉴스", "동향", "headline", "테마", "시장", "최근", "트렌드", "이슈"]
-        return any(kw in lower for kw in keywords)
+        return "news" in self._scan_keywords(message)
 
     def _is_news_theme_request(self, message: str) -> bool:
         """뉴스/테마 요청 여부 판단 (일반 모드용)"""
         if not message:
             return False
-        lower = message.lower()
-        keywords = ["뉴스", "동향", "headline", "테마", "시장", "최근", "트렌드", "이슈"]
-        return any(kw in lower for kw in keywords)
+        return "news" in self._scan_keywords(message)
 
     async def _fetch_news_for_context(self, message: str) -> str:
         """뉴스를 검색해서 컨텍스트 문자열로 반환"""
@@ -1250,14 +1344,8 @@ class ChatHandler:
         """자연어 문장에서 상위 팩터 카테고리를 추출."""
         if not message or not self.nl_category_mapping:
             return []
-        msg_lower = message.lower()
-        detected = []
-        for category, keywords in self.nl_category_mapping.items():
-            for kw in keywords:
-                if kw.lower() in msg_lower:
-                    detected.append(category)
-                    break
-        return detected
+        labels = self._scan_keywords(message)
+        return [category for category in self.nl_category_mapping if f"category:{category}" in labels]
 
     def _build_category_conditions(self, categories: List[str], message: str = "") -> List[Dict[str, Any]]:
         """카테고리별 기본 DSL 조건 묶음 생성 + 메시지 숫자 반영."""
@@ -1496,7 +1584,7 @@ class ChatHandler:
                 }
 
         # 기본 챗봇 가이드
-        summary = self.usage_notes or "챗봇 이용 가이드를 로드하지 못했습니다. docs/user-guide/chatbot-usage-notes.md를 확인해주세요."
+        summary = self._get_usage_notes() or "챗봇 이용 가이드를 로드하지 못했습니다. docs/user-guide/chatbot-usage-notes.md를 확인해주세요."
         answer = (
             "## 챗봇 이용 안내\n"
             "가이드 요약을 전달드려요. 자세한 내용은 docs/user-guide/chatbot-usage-notes.md를 참고하세요.\n\n"
@@ -1671,52 +1759,30 @@ class ChatHandler:
 
     async def _classify_intent(self, message: str) -> str:
         """사용자 의도 분류. DSL 생성과 설명 모드를 명확히 구분합니다."""
-        message_lower = message.strip().lower()
-        message_norm = self._normalize_text(message)
+        labels = self._scan_keywords(message)
 
-        # 검증 관련 키워드 (최우선 - DSL 생성보다 먼저 체크)
-        verification_keywords = ['맞아', '맞나', '맞는지', '맞니', '확인', '검증', '체크', '이게 맞', '맞는 거']
-        
         # 현재 설정된 조건이 포함되어 있으면 검증 요청
         has_current_conditions = '[현재 설정된 조건]' in message
 
-        # DSL 생성 키워드 (조건, 전략 생성 관련)
-        dsl_keywords = ['만들', '생성', 'per', 'pbr', 'roe', 'roa',
-                        'rsi', 'macd', 'sma', 'ema', '이하', '이상', '초과', '미만']
-
-        # Explain 키워드 (설명, 해석 관련)
-        explain_keywords = ['설명', 'explain', '뭐', '무엇', '어떻게', 'how', '왜', 'why',
-                           '알려줘', '가르쳐', 'cagr', 'mdd', '샤프', 'sharpe', '의미']
-
-        # 전략 추천 키워드
-        recommend_keywords = ['전략 추천', 'recommend', '추천']
-        backtest_keywords = [
-            '백테스트 설정', '전략으로 진행', '전략으로 백테스트', '이 전략으로', '자동 설정','백테스팅', '백테스트',"테스트",
-            '백테스트 진행', '설정해줘', '전략 실행', '전략 설정', '실행해줘','하고싶어','조건 설정','조건 만들어줘'
-        ]
-
         # 단일 지표/팩터 + 질문형(뭐/의미/설명)은 explain으로 우선 처리
-        factor_keywords = ['per', 'pbr', 'roe', 'roa', 'rsi', 'sma', 'ema', 'macd', 'mdd', '샤프', 'sharpe']
-        if any(f in message_lower for f in factor_keywords) and any(k in message_lower for k in explain_keywords):
+        if "intent:factor" in labels and "intent:explain" in labels:
             return 'explain'
 
         # 전략명이 포함되어 있고 '백테스트' 키워드가 있으면 강제 backtest_configuration
-        if "백테스트" in message_lower and self.strategy_backtest_templates:
-            for sid, meta in self.strategy_backtest_templates.items():
-                name_norm = self._normalize_text(meta["strategy_name"])
-                if sid in message_norm or name_norm in message_norm:
-                    return 'backtest_configuration'
+        if "intent:backtest_word" in labels and self.strategy_backtest_templates:
+            if any(f"strategy_name:{sid}" in labels for sid in self.strategy_backtest_templates):
+                return 'backtest_configuration'
 
         # 우선순위: 검증 > 백테스트 설정 > 전략 추천 > DSL 생성 > Explain > General
-        if has_current_conditions or any(word in message_lower for word in verification_keywords):
+        if has_current_conditions or "intent:verify" in labels:
             return 'explain'  # 검증은 explain 모드로 처리 (LLM이 자연어로 답변)
-        elif any(word in message_lower for word in backtest_keywords):
+        elif "intent:backtest" in labels:
             return 'backtest_configuration'
-        elif any(word in message_lower for word in recommend_keywords):
+        elif "intent:recommend" in labels:
             return 'recommend'
-        elif any(word in message_lower for word in dsl_keywords):
+        elif "intent:dsl" in labels:
             return 'dsl_generation'
-        elif any(word in message_lower for word in explain_keywords):
+        elif "intent:explain" in labels:
             return 'explain'
         else:
             return 'general'
@@ -1792,16 +1858,8 @@ class ChatHandler:
         ret_pattern = re.search(r"(\d+)\s*일.*?(\d+)\s*%.*?(상승|증가|올라)", message)
         has_custom_return = bool(ret_pattern)
 
-        # 전략 식별 (간단히 이름 매칭)
-        message_norm = self._normalize_text(message)
-        matched_id = None
-        for sid, meta in self.strategy_backtest_templates.items():
-            alias_tokens = self.strategy_alias_map.get(sid, [])
-            if not alias_tokens:
-                alias_tokens = [self._normalize_text(meta["strategy_name"])]
-            if any(token and token in message_norm for token in alias_tokens):
-                matched_id = sid
-                break
+        # 전략 식별 (별칭 매칭)
+        matched_id = self._match_strategy_alias(message)
 
         # 전략 미지정 + 커스텀 조건이 감지되면 자동 전략 설정을 피하고 명확화 질문
         if not matched_id and has_custom_return:
@@ -2093,59 +2151,10 @@ class ChatHandler:
         return re.sub(r"\s+", " ", (text or "").strip().lower())
 
     def _fallback_parse_simple_conditions(self, message: str) -> List[dict]:
-        """LLM DSL 파싱 실패 시 간단한 규칙으로 조건 추출."""
-        text = self._normalize_condition_separators(message.lower())
-        # 문장 분할: 줄바꿈, 쉼표, 그리고/및
-        chunks = re.split(r"[\n,]+|\s+그리고\s+|\s+및\s+", text)
-        conditions: List[dict] = []
-
-        op_map = {
-            "이하": "<=",
-            "미만": "<",
-            "이상": ">=",
-            "초과": ">",
-        }
-
-        for chunk in chunks:
-            chunk = chunk.strip()
-            if not chunk:
-                continue
-
-            # 패턴: [팩터] [숫자][%옵션] [비교어]
-            match = re.search(r"([a-zA-Z가-힣_]+)\s*([\d\.]+)\s*(%|퍼센트)?\s*(이상|초과|이하|미만)", chunk)
-            if not match:
-                # 패턴이 반대 순서인 경우 (예: 30 이하면 RSI)
-                match_alt = re.search(r"([\d\.]+)\s*(%|퍼센트)?\s*(이상|초과|이하|미만)\s*([a-zA-Z가-힣_]+)", chunk)
-                if not match_alt:
-                    continue
-                factor_raw = match_alt.group(4)
-                value_raw = match_alt.group(1)
-                pct = match_alt.group(2) or ""
-                op_kr = match_alt.group(3)
-            else:
-                factor_raw = match.group(1)
-                value_raw = match.group(2)
-                pct = match.group(3) or ""
-                op_kr = match.group(4)
-
-            operator = op_map.get(op_kr)
-            if not operator:
-                continue
-
-            try:
-                value = float(value_raw)
-            except ValueError:
-                continue
-
-            conditions.append({
-                "factor": factor_raw.upper(),
-                "params": [],
-                "operator": operator,
-                "right_factor": None,
-                "right_params": [],
-                "value": value,
-            })
+        """LLM DSL 파싱 실패 시 조건 문법(관대 모드)으로 조건 추출."""
+        from schemas.dsl_generator import get_condition_grammar
 
+        conditions = get_condition_grammar().extract(message or "")
         if conditions:
             print(f"[DSL Fallback] {len(conditions)}개 조건을 규칙 기반으로 파싱")
         return conditions
@@ -2168,64 +2177,48 @@ class ChatHandler:
 
     def _extract_conditions_from_text(self, message: str) -> List[dict]:
         """자연어에서 직접 조건을 추출 (LLM 누락 대비)."""
-        text = self._normalize_condition_separators((message or "").lower())
-        chunks = re.split(r"[\n,]+|\s+그리고\s+|\s+및\s+", text)
-        conditions: List[dict] = []
-
-        op_map = {
-            "이하": "<=",
-            "미만": "<",
-            "이상": ">=",
-            "초과": ">",
-        }
-
-        for chunk in chunks:
-            chunk = chunk.strip()
-            if not chunk:
-                continue
-
-            m = re.search(r"([a-zA-Z가-힣_]+)\s*([\d\.]+)\s*(%|퍼센트)?\s*(이상|초과|이하|미만)", chunk)
-            if not m:
-                m = re.search(r"([\d\.]+)\s*(%|퍼센트)?\s*(이상|초과|이하|미만)\s*([a-zA-Z가-힣_]+)", chunk)
-                if not m:
-                    continue
-                factor = m.group(4)
-                value_raw = m.group(1)
-                op_kr = m.group(3)
-            else:
-                factor = m.group(1)
-                value_raw = m.group(2)
-                op_kr = m.group(4)
-
-            operator = op_map.get(op_kr)
-            if not operator:
-                continue
+        from schemas.dsl_generator import get_condition_grammar
 
-            try:
-                value = float(value_raw)
-            except ValueError:
-                continue
+        return get_condition_grammar().extract(message or "")
 
-            conditions.append({
-                "factor": factor.upper(),
-                "params": [],
-                "operator": operator,
-                "right_factor": None,
-                "right_params": [],
-                "value": value,
-            })
+    def _response_cache_scope(
+        self, message: str, intent: str, client_type: str, session_id: Optional[str] = None
+    ) -> Optional[str]:
+        """응답 캐시 scope (client_type:intent). 캐시 대상이 아니면 None.
 
-        return conditions
+        캐시는 세션/사용자 간 공유되므로 대화 맥락에 따라 답이 달라지는 턴은 제외:
+        조건 검증 요청([현재 설정된 조건], "맞아?"), 대화 기록이 있는 세션의 후속 질문.
+        """
+        if not self.response_cache or intent not in self.CACHEABLE_INTENTS:
+            return None
+        if '[현재 설정된 조건]' in message or "intent:verify" in self._scan_keywords(message):
+            return None
+        if self._is_news_theme_request(message) or not ResponseCache.is_cacheable_message(message):
+            return None
+        if session_id and getattr(self._get_memory(session_id, client_type), "messages", None):
+            return None
+        return f"{client_type}:{intent}"
+
+    async def _get_cached_response(
+        self, message: str, scope: str, session_id: Optional[str], client_type: str
+    ) -> Optional[dict]:
+        """캐시 적중 시 대화 기록에도 추가해 후속 질문 맥락을 유지."""
+        cached = await self.response_cache.get(message, scope)
+        if not cached:
+            return None
+        memory = self._get_memory(session_id, client_type)
+        if memory:
+            memory.add_user_message(message)
+            memory.add_ai_message(cached.get("answer", ""))
+        cached["cached"] = True
+        return cached
 
-    def _normalize_condition_separators(self, text: str) -> str:
-        """조건 연결어를 표준화 (이하이고, 이상이고 등)."""
-        if not text:
-            return text
-        # "이하이고" → "이하 그리고", 등 비교어 뒤에 붙은 '이고'를 분리
-        text = re.sub(r"(이하|이상|미만|초과)\s*이고", r"\1 그리고", text)
-        # 숫자/퍼센트 뒤에 바로 '이고'가 붙은 경우 분리
-        text = re.sub(r"(\d+(?:\.\d+)?\s*%?)\s*이고", r"\1 그리고", text)
-        return text
+    async def _store_cached_response(self, message: str, scope: str, response: dict, latency_ms: float) -> None:
+        """도구 호출 없이 생성된 정상 응답만 저장 (실시간 데이터/세션 의존 답변 제외)."""
+        if not response.get("answer") or response.get("backtest_conditions"):
+            return
+        payload = {k: v for k, v in response.items() if k != "session_id"}
+        await self.response_cache.put(message, scope, payload, latency_ms)
 
     def _make_dsl_cache_key(self, message: str) -> Optional[str]:
         """DSL 캐시 키 생성."""
@@ -2235,22 +2228,22 @@ class ChatHandler:
         digest = hashlib.sha256(norm.encode("utf-8")).hexdigest()
         return f"dsl:{self.DSL_CACHE_VERSION}:{digest}"
 
-    def _get_cache(self, key: Optional[str]) -> Optional[dict]:
-        if not key or not self.cache_client:
+    async def _get_cache(self, key: Optional[str]) -> Optional[dict]:
+        if not key or not self.async_cache_client:
             return None
         try:
-            raw = self.cache_client.get(key)
+            raw = await self.async_cache_client.get(key)
             if raw:
                 return json.loads(raw)
         except Exception as e:
             self.logger.warning(f"Redis 캐시 조회 실패: {e}")
         return None
 
-    def _set_cache(self, key: Optional[str], value: dict, ttl: int = 600):
-        if not key or not self.cache_client:
+    async def _set_cache(self, key: Optional[str], value: dict, ttl: int = 600):
+        if not key or not self.async_cache_client:
             return
         try:
-            self.cache_client.setex(key, ttl, json.dumps(value, ensure_ascii=False))
+            await self.async_cache_client.setex(key, ttl, json.dumps(value, ensure_ascii=False))
         except Exception as e:
             self.logger.warning(f"Redis 캐시 저장 실패: {e}")
 
@@ -2370,19 +2363,85 @@ class ChatHandler:
             normalized = "home_widget"
         else:
             normalized = "assistant"
-        executor = self.agent_executors.get(normalized)
+        executor = self.agent_executors.get(normalized) or self._build_agent_executor(normalized)
         if executor:
             return executor
-        return self.agent_executors.get("assistant")
+        return self.agent_executors.get("assistant") or self._build_agent_executor("assistant")
+
+    def _build_agent_executor(self, mode: str):
+        """client_type 에이전트를 처음 요청될 때 생성 (시스템 프롬프트/도구 포함)."""
+        if mode in self.agent_executors:
+            return self.agent_executors[mode]
+        if mode in self._agent_build_failed or not self.llm_client or not get_tools:
+            return None
+
+        spec = self.AGENT_PROMPT_SPECS.get(mode)
+        if not spec:
+            return None
+
+        start = time.perf_counter()
+        try:
+            if self._agent_tools is None:
+                self._agent_tools = get_tools(
+                    news_retriever=self.news_retriever,
+                    factor_sync=self.factor_sync
+                )
+                print(f"도구 초기화 완료: {[tool.name for tool in self._agent_tools]}")
+            tools = self._agent_tools
+
+            system_prompt = self._load_system_prompt_content(spec["filename"], spec["fallback"])
+            self.system_prompts[mode] = system_prompt
+
+            prompt_template = ChatPromptTemplate.from_messages([
+                (
+                    "system",
+                    system_prompt
+                    + "\n\n필요할 때 다음 도구를 사용할 수 있습니다."
+                    + "\n\n{agent_scratchpad}"
+                ),
+                MessagesPlaceholder("chat_history"),
+                ("user", "참고자료:\n{context}\n\n질문: {input}"),
+            ])
+            agent = create_tool_calling_agent(self.llm_client, tools, prompt_template)
+            executor = AgentExecutor(
+                agent=agent,
+                tools=tools,
+                verbose=False,
+                return_intermediate_steps=True,
+                handle_parsing_errors=True,
+                max_iterations=5
+            )
+        except Exception as e:
+            print(f"❌ {mode} AgentExecutor 생성 오류: {e}")
+            traceback.print_exc()
+            self._agent_build_failed.add(mode)
+            return None
+
+        self.agent_executors[mode] = executor
+        elapsed = round((time.perf_counter() - start) * 1000, 2)
+        self.startup_profile.setdefault(f"agent:{mode}", elapsed)
+        print(f"{mode} AgentExecutor 생성 완료 ({len(system_prompt)}자 프롬프트, {elapsed}ms)")
+        return executor
 
     def _get_memory(self, session_id: str, client_type: str):
         """세션별 대화 메모리 가져오기 (스토어 추상화)."""
-        key = f"{client_type}:{session_id}"
-        return self.session_store.get_or_create(key, ChatMessageHistory)
+        return self.session_store.get_history(session_id, client_type, ChatMessageHistory)
 
     def delete_session_history(self, session_id: str) -> None:
-        """세션별 메모리 삭제."""
-        self.session_store.delete_by_suffix(f":{session_id}")
+        """세션별 메모리 삭제 (로컬 LRU)."""
+        self.session_store.drop_local(session_id)
+
+    async def load_session(self, session_id: str) -> None:
+        """요청 시작 시 세션 메모리/상태 로드."""
+        await self.session_store.load_session(session_id, ChatMessageHistory)
+
+    async def persist_session(self, session_id: str) -> None:
+        """요청 종료 시 세션 메모리/상태 저장."""
+        await self.session_store.persist_session(session_id)
+
+    async def delete_session(self, session_id: str) -> None:
+        """세션 메모리/상태를 스토어에서 삭제."""
+        await self.session_store.delete_session(session_id)
 
     def _process_agent_response(
         self,
@@ -2440,7 +2499,9 @@ class ChatHandler:
         result_dict = {
             "answer": answer,
             "intent": intent,
-            "context": context
+            "context": context,
+            # 응답 캐시 판단용 (호출 측에서 제거)
+            "_tool_calls": len(intermediate_steps),
         }
 
         if backtest_conditions:
@@ -2732,7 +2793,7 @@ class ChatHandler:
         - backtest_conditions 필드로 분리하여 반환
         """
         cache_key = self._make_dsl_cache_key(message)
-        cached = self._get_cache(cache_key)
+        cached = await self._get_cache(cache_key)
         if cached:
             return cached
 
@@ -2762,10 +2823,8 @@ class ChatHandler:
                 except Exception as e:
                     print(f"DSL 시스템 프롬프트 적용 실패: {e}")
 
-            parse_strategy_text = dsl_generator.parse_strategy_text
-
-            # 자연어 → DSL 변환
-            result = parse_strategy_text(message)
+            # 자연어 → DSL 변환 (Bedrock 호출은 스레드 풀 + 동시성 제한)
+            result = await dsl_generator.parse_strategy_text_async(message)
 
             # Condition 객체를 딕셔너리로 변환 (Pydantic v1 호환)
             conditions = [condition.dict() for condition in result.conditions]
@@ -2940,7 +2999,7 @@ class ChatHandler:
                 }
             }
 
-            self._set_cache(cache_key, response_payload)
+            await self._set_cache(cache_key, response_payload)
             return response_payload
         except Exception as e:
             print(f"DSL 생성 오류: {e}")
@@ -2996,12 +3055,11 @@ class ChatHandler:
         message_check = message.strip()
 
         # 패턴 매칭
-        violations_found = []
-        for violation_type, patterns in self.forbidden_patterns.items():
-            for pattern in patterns:
-                if __import__('re').search(pattern, message_check):
-                    violations_found.append(violation_type)
-                    break
+        violations_found = [
+            violation_type
+            for violation_type, regex in self._forbidden_regexes.items()
+            if regex.search(message_check)
+        ]
 
         if violations_found:
             violation_type = violations_found[0]
@@ -3089,3 +3147,22 @@ class ChatHandler:
                 print(json.dumps(log_payload, ensure_ascii=False))
         except Exception as e:
             print(f"Failed to log policy block: {e}")
+
+
+_shared_handler: Optional[ChatHandler] = None
+_shared_handler_lock: Optional[asyncio.Lock] = None
+
+
+async def get_shared_handler(config_path: str = "config.yaml") -> ChatHandler:
+    """프로세스 공용 ChatHandler (최초 호출 시 병렬 초기화, 이후 재사용)."""
+    global _shared_handler, _shared_handler_lock
+    if _shared_handler is not None:
+        return _shared_handler
+    if _shared_handler_lock is None:
+        _shared_handler_lock = asyncio.Lock()
+    async with _shared_handler_lock:
+        if _shared_handler is None:
+            handler = ChatHandler(config_path, defer_init=True)
+            await handler.initialize()
+            _shared_handler = handler
+    return _shared_handler
@@ -0,0 +1,105 @@
+"""Keyword Matcher - 다중 키워드 사전 일괄 매칭 (Aho–Corasick)
+
+의도 분류, 라우팅, 뉴스/카테고리 감지, 전략 별칭 조회에 쓰이는 키워드 사전을
+시작 시 하나의 오토마톤으로 컴파일하고, 메시지를 한 번 훑어 매칭된 라벨을 모두 반환한다.
+매칭 비용은 메시지 길이에 비례하고 사전 크기와는 무관하다.
+
+- 일반 키워드: 소문자 기준 부분 문자열 매칭 (기존 `kw in message.lower()`와 동일)
+- compact 키워드: 공백을 무시하고 매칭 (기존 `_normalize_text` 비교와 동일)
+"""
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+
+class _Automaton:
+    """Aho–Corasick 오토마톤 (goto/fail/output 테이블)"""
+
+    def __init__(self):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Set[str]] = [set()]
+
+    def add(self, keyword: str, label: str) -> None:
+        node = 0
+        for ch in keyword:
+            nxt = self.goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[node][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(set())
+            node = nxt
+        self.output[node].add(label)
+
+    def build(self) -> List[FrozenSet[str]]:
+        """실패 링크 계산 후 출력 집합을 실패 경로까지 병합해 반환"""
+        queue = deque()
+        for nxt in self.goto[0].values():
+            self.fail[nxt] = 0
+            queue.append(nxt)
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.output[nxt] |= self.output[self.fail[nxt]]
+        return [frozenset(labels) for labels in self.output]
+
+    def step(self, node: int, ch: str) -> int:
+        while node and ch not in self.goto[node]:
+            node = self.fail[node]
+        return self.goto[node].get(ch, 0)
+
+
+class KeywordMatcher:
+    """라벨별 키워드 사전을 하나로 컴파일한 매처"""
+
+    def __init__(self):
+        self._raw = _Automaton()
+        self._compact = _Automaton()
+        self._raw_output: List[FrozenSet[str]] = []
+        self._compact_output: List[FrozenSet[str]] = []
+        self.labels: Set[str] = set()
+        self.keyword_count = 0
+
+    def add(self, keywords: Iterable[str], label: str, compact: bool = False) -> "KeywordMatcher":
+        """라벨에 키워드 등록 (compact=True면 공백 무시 매칭)"""
+        for keyword in keywords:
+            if not isinstance(keyword, str):
+                continue
+            key = keyword.lower()
+            if compact:
+                key = "".join(key.split())
+            if not key:
+                continue
+            (self._compact if compact else self._raw).add(key, label)
+            self.keyword_count += 1
+        self.labels.add(label)
+        return self
+
+    def build(self) -> "KeywordMatcher":
+        self._raw_output = self._raw.build()
+        self._compact_output = self._compact.build()
+        return self
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """메시지를 한 번 훑어 매칭된 라벨 집합 반환"""
+        if not text:
+            return frozenset()
+        found: Set[str] = set()
+        raw_node = compact_node = 0
+        raw, compact = self._raw, self._compact
+        raw_output, compact_output = self._raw_output, self._compact_output
+        for ch in text.lower():
+            raw_node = raw.step(raw_node, ch)
+            if raw_output[raw_node]:
+                found |= raw_output[raw_node]
+            if not ch.isspace():
+                compact_node = compact.step(compact_node, ch)
+                if compact_output[compact_node]:
+                    found |= compact_output[compact_node]
+        return frozenset(found)
@@ -1,14 +1,19 @@
 """Chatbot Main Entry Point."""
 import asyncio
 from typing import Optional
-from handlers.chat_handler import ChatHandler
+from handlers.chat_handler import ChatHandler, get_shared_handler
 
 
 class QuantAdvisorBot:
     """Quant Investment Advisor Chatbot."""
 
-    def __init__(self, config_path: str = "config.yaml"):
-        self.handler = ChatHandler(config_path)
+    def __init__(self, config_path: str = "config.yaml", handler: Optional[ChatHandler] = None):
+        self.handler = handler or ChatHandler(config_path)
+
+    @classmethod
+    async def create(cls, config_path: str = "config.yaml") -> "QuantAdvisorBot":
+        """프로세스 공용 ChatHandler를 사용하는 봇 생성 (병렬 초기화)."""
+        return cls(config_path, handler=await get_shared_handler(config_path))
 
     async def chat(
         self,
@@ -46,7 +51,7 @@ class QuantAdvisorBot:
 
 async def main():
     """Interactive CLI for testing."""
-    bot = QuantAdvisorBot()
+    bot = await QuantAdvisorBot.create()
 
     print("Quant Advisor Chatbot")
     print("=" * 50)
@@ -0,0 +1,268 @@
+"""Response Cache - 설명/일반 질문 응답 캐시
+
+같은 개념(MDD, CAGR, PER 등)을 묻는 반복 질문은 LLM을 다시 호출하지 않고 캐시된 답변을 반환한다.
+
+- 1차: 정규화 텍스트 해시 (로컬 LRU → Redis, Redis는 여러 인스턴스가 공유)
+- 2차: 질문 핵심어 임베딩 유사도 (로컬 LRU, 임계값 RESPONSE_CACHE_SIMILARITY)
+  "MDD가 뭐야?" / "mdd 뜻 알려줘"처럼 질문 어미·조사만 다른 경우를 같은 질문으로 본다.
+- 키는 프롬프트 파일 해시(version)와 scope(client_type:intent)를 포함하므로
+  프롬프트가 바뀌면 이전 답변은 자동으로 사용되지 않는다.
+- 캐시는 세션/사용자 간 공유되므로 지시어가 있는 후속 질문("그 전략", "두번째 거")은 저장/조회하지 않는다.
+- 적중률과 절약한 LLM 시간(ms)을 지표로 집계한다.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    from retrievers.local_embedding import HashingEmbedder
+except ImportError:
+    np = None
+    HashingEmbedder = None
+
+TOKEN_PATTERN = re.compile(r"[0-9a-z가-힣]+")
+
+# 질문 형식만 나타내는 단어 (핵심어 추출 시 제거)
+QUESTION_FILLERS = {
+    "뭐", "뭐야", "뭐예요", "뭐에요", "뭔가요", "뭔데", "뭔지", "무엇", "무엇인가요", "무엇인지", "무엇이야",
+    "설명", "설명해", "설명해줘", "설명해주세요", "설명좀", "알려줘", "알려주세요", "알고", "싶어", "싶어요",
+    "의미", "뜻", "개념", "정의", "어떻게", "어떤", "해석", "해석해", "해석해줘", "해석하나요",
+    "좀", "혹시", "이야", "인가요", "이란", "란", "야", "요", "줘",
+    "what", "is", "the", "meaning", "of", "explain", "mean",
+}
+# 단어 끝 조사 (긴 것부터 제거)
+PARTICLE_SUFFIXES = ("이란", "이야", "으로", "은", "는", "이", "가", "을", "를", "의", "에", "로", "와", "과", "란", "야")
+# 앞선 대화를 가리키는 표현이 있으면 대화 맥락에 따라 답이 달라지므로 캐시하지 않음
+# - 단독 지시어/관형사 ("그 전략", "두번째 거")
+REFERENTIAL_WORDS = {"그", "이", "저", "거", "위", "앞", "더", "방금", "아까"}
+# - 단어 앞부분 (조사/어미가 붙은 형태: "그건", "위에서", "이전에")
+REFERENTIAL_PREFIXES = (
+    "그거", "그건", "그게", "그걸", "그것", "이거", "이건", "이게", "이걸", "이것", "저거", "저건", "저게", "저걸", "저것",
+    "그럼", "그러면", "그런", "그렇", "아까", "방금", "다시", "위에", "위의", "앞에", "앞의", "앞서", "이전", "해당",
+)
+# - 단어 중간 ("두번째", "말한", "얘기했던")
+REFERENTIAL_INFIXES = ("번째", "말한", "말했", "얘기한", "얘기했")
+
+
+def question_topic(text: str) -> str:
+    """질문 어미/조사를 제거한 핵심어 문자열 (유사도 비교용)"""
+    words = []
+    for token in TOKEN_PATTERN.findall((text or "").lower()):
+        if token in QUESTION_FILLERS:
+            continue
+        for suffix in PARTICLE_SUFFIXES:
+            if len(token) > len(suffix) + 1 and token.endswith(suffix):
+                token = token[: -len(suffix)]
+                break
+        if token not in QUESTION_FILLERS:
+            words.append(token)
+    return " ".join(words)
+
+
+class _Entry:
+    __slots__ = ("key", "scope", "response", "latency_ms", "expires_at", "vector")
+
+    def __init__(self, key: str, scope: str, response: Dict[str, Any], latency_ms: float, expires_at: float, vector):
+        self.key = key
+        self.scope = scope
+        self.response = response
+        self.latency_ms = latency_ms
+        self.expires_at = expires_at
+        self.vector = vector
+
+
+class ResponseCache:
+    """정규화 텍스트 + 임베딩 유사도 기반 응답 캐시"""
+
+    def __init__(
+        self,
+        version: str,
+        redis_client: Any = None,
+        ttl: int = 3600,
+        similarity_threshold: float = 0.9,
+        max_entries: int = 1000,
+    ):
+        self.version = version
+        self.redis = redis_client
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.embedder = HashingEmbedder(dim=512) if HashingEmbedder else None
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # scope별 (키 목록, 벡터 행렬) - 저장/만료 시 무효화
+        self._matrices: Dict[str, Tuple[List[str], Any]] = {}
+
+        self.lookups = 0
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.stores = 0
+        self.saved_ms = 0.0
+        self.lookup_ms = 0.0
+
+    @staticmethod
+    def is_cacheable_message(message: str) -> bool:
+        """대화 맥락에 의존하지 않는 질문인지 (핵심어가 있고 지시어가 없음)"""
+        for token in TOKEN_PATTERN.findall((message or "").lower()):
+            if (
+                token in REFERENTIAL_WORDS
+                or token.startswith(REFERENTIAL_PREFIXES)
+                or any(infix in token for infix in REFERENTIAL_INFIXES)
+            ):
+                return False
+        return bool(question_topic(message))
+
+    def _key(self, message: str, scope: str) -> str:
+        norm = re.sub(r"\s+", " ", (message or "").strip().lower())
+        digest = hashlib.sha256(norm.encode("utf-8")).hexdigest()
+        return f"resp:{self.version}:{scope}:{digest}"
+
+    def _embed(self, message: str):
+        if not self.embedder:
+            return None
+        topic = question_topic(message)
+        return self.embedder.embed(topic) if topic else None
+
+    async def get(self, message: str, scope: str) -> Optional[Dict[str, Any]]:
+        """캐시된 응답 (없으면 None). 반환값은 복사본."""
+        start = time.perf_counter()
+        self.lookups += 1
+        try:
+            key = self._key(message, scope)
+            entry = self._get_local(key)
+            if entry is None and self.redis is not None:
+                entry = await self._get_redis(key, scope, message)
+            if entry is not None:
+                self.exact_hits += 1
+            else:
+                entry = self._get_similar(message, scope)
+                if entry is not None:
+                    self.semantic_hits += 1
+            if entry is None:
+                return None
+            self.saved_ms += entry.latency_ms
+            return dict(entry.response)
+        finally:
+            self.lookup_ms += (time.perf_counter() - start) * 1000
+
+    def _get_local(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def _get_redis(self, key: str, scope: str, message: str) -> Optional[_Entry]:
+        try:
+            raw = await self.redis.get(key)
+        except Exception as e:
+            print(f"[ResponseCache] Redis 조회 실패: {e}")
+            return None
+        if not raw:
+            return None
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            return None
+        # 다른 인스턴스가 저장한 답변도 로컬 유사도 검색 대상에 추가
+        return self._put_local(key, scope, message, payload["response"], payload.get("latency_ms", 0.0))
+
+    def _get_similar(self, message: str, scope: str) -> Optional[_Entry]:
+        vector = self._embed(message)
+        if vector is None:
+            return None
+        keys, matrix = self._scope_matrix(scope)
+        if not keys:
+            return None
+        scores = matrix @ vector
+        best = int(np.argmax(scores))
+        if float(scores[best]) < self.similarity_threshold:
+            return None
+        return self._get_local(keys[best])
+
+    def _scope_matrix(self, scope: str) -> Tuple[List[str], Any]:
+        cached = self._matrices.get(scope)
+        if cached is None:
+            rows = [(k, e.vector) for k, e in self._entries.items() if e.scope == scope and e.vector is not None]
+            keys = [k for k, _ in rows]
+            matrix = np.stack([v for _, v in rows]) if rows else None
+            cached = self._matrices[scope] = (keys, matrix)
+        return cached
+
+    async def put(self, message: str, scope: str, response: Dict[str, Any], latency_ms: float) -> None:
+        """LLM 응답 저장 (latency_ms: 적중 시 절약되는 시간으로 집계)"""
+        key = self._key(message, scope)
+        self._put_local(key, scope, message, response, latency_ms)
+        self.stores += 1
+        if self.redis is None:
+            return
+        try:
+            payload = json.dumps({"response": response, "latency_ms": latency_ms}, ensure_ascii=False, default=str)
+            await self.redis.setex(key, self.ttl, payload)
+        except Exception as e:
+            print(f"[ResponseCache] Redis 저장 실패: {e}")
+
+    def _put_local(self, key: str, scope: str, message: str, response: Dict[str, Any], latency_ms: float) -> _Entry:
+        entry = _Entry(key, scope, dict(response), latency_ms, time.monotonic() + self.ttl, self._embed(message))
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._matrices.pop(scope, None)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+        return entry
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._matrices.pop(entry.scope, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._matrices.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        hits = self.exact_hits + self.semantic_hits
+        return {
+            "version": self.version,
+            "entries": len(self._entries),
+            "lookups": self.lookups,
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.lookups - hits,
+            "stores": self.stores,
+            "hit_rate": round(hits / self.lookups, 3) if self.lookups else None,
+            "saved_ms": round(self.saved_ms, 1),
+            "avg_lookup_ms": round(self.lookup_ms / self.lookups, 3) if self.lookups else None,
+            "similarity_threshold": self.similarity_threshold,
+        }
+
+
+def prompt_version(paths: List[Any], extra: str = "") -> str:
+    """프롬프트 파일 내용 해시 (파일이 바뀌면 캐시 버전이 바뀜)"""
+    digest = hashlib.sha256(extra.encode("utf-8"))
+    for path in paths:
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(b"-")
+    return digest.hexdigest()[:12]
+
+
+def create_response_cache(version: str, redis_client: Any = None) -> Optional[ResponseCache]:
+    """환경 변수로 응답 캐시 생성 (RESPONSE_CACHE_ENABLED=0이면 None)"""
+    if os.getenv("RESPONSE_CACHE_ENABLED", "1").lower() in ("0", "false", "no"):
+        return None
+    return ResponseCache(
+        version,
+        redis_client=redis_client,
+        ttl=int(os.getenv("RESPONSE_CACHE_TTL", "3600")),
+        similarity_threshold=float(os.getenv("RESPONSE_CACHE_SIMILARITY", "0.9")),
+        max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1000")),
+    )
@@ -7,11 +7,17 @@ try:
 except ImportError:
     ChromaDBRetriever = None
 
+try:
+    from .local_vector_retriever import LocalVectorRetriever
+except ImportError:
+    LocalVectorRetriever = None
+
 from .factory import RetrieverFactory
 
 __all__ = [
     "BaseRetriever",
     "AWSKBRetriever",
     "ChromaDBRetriever",
+    "LocalVectorRetriever",
     "RetrieverFactory",
 ]
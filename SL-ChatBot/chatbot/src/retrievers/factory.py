@@ -12,6 +12,14 @@ except ImportError:
     ChromaDBRetriever = None
     HAS_CHROMADB = False
 
+# 로컬 벡터 검색은 numpy 필요
+try:
+    from .local_vector_retriever import LocalVectorRetriever
+    HAS_LOCAL_VECTOR = True
+except ImportError:
+    LocalVectorRetriever = None
+    HAS_LOCAL_VECTOR = False
+
 
 class RetrieverFactory:
     """Retriever 인스턴스를 생성하는 팩토리"""
@@ -25,7 +33,7 @@ class RetrieverFactory:
         환경 설정에 따라 Retriever 생성
 
         Args:
-            retriever_type: "aws_kb" | "chroma" | None (자동 선택)
+            retriever_type: "aws_kb" | "chroma" | "local" | None (자동 선택)
             config: Retriever 설정 딕셔너리
 
         Returns:
@@ -34,6 +42,7 @@ class RetrieverFactory:
         config = config or {}
 
         # 자동 선택: RETRIEVER_TYPE 환경변수 확인, 없으면 AWS KB ID 확인
+        # (로컬 인덱스는 자동 선택하지 않음: retriever_type="local" 또는 RETRIEVER_TYPE=local로 지정)
         if retriever_type is None:
             retriever_type = os.getenv("RETRIEVER_TYPE")
             if retriever_type is None:
@@ -60,6 +69,14 @@ class RetrieverFactory:
                 )
             return ChromaDBRetriever(config)
 
+        elif retriever_type == "local":
+            if not HAS_LOCAL_VECTOR:
+                raise ImportError(
+                    "numpy가 설치되어 있지 않습니다. "
+                    "설치: pip install numpy"
+                )
+            return LocalVectorRetriever(config)
+
         else:
             raise ValueError(f"Unknown retriever type: {retriever_type}")
 
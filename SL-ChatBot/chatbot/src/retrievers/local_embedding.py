@@ -0,0 +1,101 @@
+"""로컬 벡터 검색용 임베딩 모델
+
+- HashingEmbedder: 외부 호출 없는 결정적 임베딩 (단어 + 문자 n-gram 해싱)
+  오프라인 테스트와 인덱스 빌드에 사용. 프로세스/머신이 달라도 같은 벡터를 만든다.
+- BedrockTitanEmbedder: AWS Bedrock Titan 임베딩 (인덱스를 Titan으로 빌드한 경우)
+
+인덱스 meta.json의 "embedder" 항목으로 검색 시에도 같은 모델을 생성한다.
+"""
+import hashlib
+import json
+import math
+import os
+import re
+from typing import Any, Dict, List
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[0-9a-z가-힣]+")
+
+
+class HashingEmbedder:
+    """결정적 해싱 임베딩 (signed feature hashing, L2 정규화)"""
+
+    def __init__(self, dim: int = 512, ngram_range=(2, 3)):
+        self.dim = dim
+        self.ngram_range = tuple(ngram_range)
+
+    def spec(self) -> Dict[str, Any]:
+        return {"type": "hash", "dim": self.dim, "ngram_range": list(self.ngram_range)}
+
+    def _features(self, text: str) -> List[str]:
+        features = []
+        min_n, max_n = self.ngram_range
+        for token in TOKEN_PATTERN.findall((text or "").lower()):
+            features.append(f"w:{token}")
+            # 한국어 조사/어미 변형에 강하도록 문자 n-gram 추가
+            for n in range(min_n, max_n + 1):
+                for i in range(len(token) - n + 1):
+                    features.append(f"c{n}:{token[i:i + n]}")
+        return features
+
+    def embed(self, text: str) -> np.ndarray:
+        counts: Dict[int, float] = {}
+        for feature in self._features(text):
+            # 파이썬 hash()는 프로세스마다 달라지므로 blake2b 사용
+            digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+            index = digest % self.dim
+            sign = 1.0 if (digest >> 63) & 1 else -1.0
+            counts[index] = counts.get(index, 0.0) + sign
+
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for index, value in counts.items():
+            # 빈도 로그 스케일 (긴 문서의 반복 단어 영향 완화)
+            vector[index] = math.copysign(1.0 + math.log(abs(value)), value) if value else 0.0
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        return np.vstack([self.embed(text) for text in texts]) if texts else np.zeros((0, self.dim), dtype=np.float32)
+
+
+class BedrockTitanEmbedder:
+    """AWS Bedrock Titan 임베딩"""
+
+    def __init__(self, model_id: str = "amazon.titan-embed-text-v2:0", dim: int = 1024, region: str = None):
+        import boto3
+
+        self.model_id = model_id
+        self.dim = dim
+        self.client = boto3.client(
+            "bedrock-runtime",
+            region_name=region or os.getenv("AWS_REGION", "ap-northeast-2")
+        )
+
+    def spec(self) -> Dict[str, Any]:
+        return {"type": "bedrock", "model_id": self.model_id, "dim": self.dim}
+
+    def embed(self, text: str) -> np.ndarray:
+        response = self.client.invoke_model(
+            modelId=self.model_id,
+            body=json.dumps({"inputText": text, "dimensions": self.dim, "normalize": True})
+        )
+        payload = json.loads(response["body"].read())
+        return np.asarray(payload["embedding"], dtype=np.float32)
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        return np.vstack([self.embed(text) for text in texts]) if texts else np.zeros((0, self.dim), dtype=np.float32)
+
+
+def create_embedder(spec: Dict[str, Any]):
+    """meta.json의 embedder 스펙으로 임베딩 모델 생성"""
+    spec = spec or {}
+    embedder_type = spec.get("type", "hash")
+    if embedder_type == "hash":
+        return HashingEmbedder(dim=int(spec.get("dim", 512)), ngram_range=spec.get("ngram_range", (2, 3)))
+    if embedder_type == "bedrock":
+        return BedrockTitanEmbedder(
+            model_id=spec.get("model_id", "amazon.titan-embed-text-v2:0"),
+            dim=int(spec.get("dim", 1024))
+        )
+    raise ValueError(f"Unknown embedder type: {embedder_type}")
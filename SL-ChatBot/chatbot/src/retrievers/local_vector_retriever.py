@@ -0,0 +1,249 @@
+"""로컬 임베딩 행렬 기반 Retriever
+
+rag/scripts/build_local_index.py로 빌드한 인덱스(vectors.npy + meta.json)를
+메모리에 올려 원격 호출 없이 top-k 검색한다.
+
+- 벡터는 로드 시 L2 정규화 (내적 = 코사인 유사도)
+- quantize="int8": 행별 스케일로 int8 양자화 (메모리 1/4)
+- search="exact": 전수 내적 / "ann": k-means 클러스터(IVF) 중 nprobe개만 탐색
+  "auto"는 문서 수가 ann_min_size 이상일 때 ANN 사용
+- 쿼리 임베딩 LRU 캐시 (같은 질문 반복 시 임베딩 생략)
+"""
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .base_retriever import BaseRetriever
+from .local_embedding import HashingEmbedder, create_embedder
+
+# 검색 시 내적을 나눠 계산할 행 수 (int8 → float32 임시 행렬 크기 제한)
+SEARCH_BLOCK_ROWS = 65536
+
+
+def default_index_dir() -> Optional[Path]:
+    """LOCAL_VECTOR_INDEX_DIR 또는 rag/vectordb/local (컨테이너/로컬 경로 순)"""
+    env_dir = os.getenv("LOCAL_VECTOR_INDEX_DIR")
+    if env_dir:
+        return Path(env_dir)
+    here = Path(__file__).resolve()
+    for base in (here.parents[2], here.parents[3]):
+        candidate = base / "rag" / "vectordb" / "local"
+        if (candidate / "meta.json").exists():
+            return candidate
+    return None
+
+
+class LocalVectorRetriever(BaseRetriever):
+    """NumPy 임베딩 행렬을 메모리에서 검색하는 Retriever"""
+
+    def __init__(self, config: Dict):
+        """
+        Args:
+            config: {
+                "local_index_dir": "rag/vectordb/local",
+                "quantize": "none" | "int8",
+                "search": "auto" | "exact" | "ann",
+                "ann_lists": 0 (0이면 sqrt(N)),
+                "ann_nprobe": 8,
+                "ann_min_size": 20000,
+                "query_cache_size": 1024
+            }
+        """
+        index_dir = config.get("local_index_dir") or default_index_dir()
+        if not index_dir:
+            raise ValueError(
+                "로컬 벡터 인덱스를 찾을 수 없습니다. "
+                "rag/scripts/build_local_index.py로 빌드하거나 LOCAL_VECTOR_INDEX_DIR을 설정하세요."
+            )
+        self.index_dir = Path(index_dir)
+
+        with open(self.index_dir / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.documents: List[Dict] = meta["documents"]
+        self.embedder = create_embedder(meta.get("embedder"))
+
+        vectors = np.load(self.index_dir / "vectors.npy").astype(np.float32, copy=False)
+        if vectors.shape[0] != len(self.documents):
+            raise ValueError(
+                f"인덱스 불일치: vectors {vectors.shape[0]}개, documents {len(self.documents)}개"
+            )
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors = vectors / norms
+
+        self.quantize = (config.get("quantize") or os.getenv("LOCAL_VECTOR_QUANTIZE", "none")).lower()
+        if self.quantize == "int8":
+            # 행별 대칭 양자화: v ≈ q * scale
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            self.vectors = np.round(vectors / scales[:, None]).astype(np.int8)
+            self.scales = scales.astype(np.float32)
+        else:
+            self.vectors = np.ascontiguousarray(vectors)
+            self.scales = None
+
+        search_mode = (config.get("search") or os.getenv("LOCAL_VECTOR_SEARCH", "auto")).lower()
+        ann_min_size = int(config.get("ann_min_size", 20000))
+        if search_mode == "auto":
+            search_mode = "ann" if len(self.documents) >= ann_min_size else "exact"
+        self.search_mode = search_mode
+        self.ann_nprobe = int(config.get("ann_nprobe", 8))
+        self.centroids: Optional[np.ndarray] = None
+        self.lists: List[np.ndarray] = []
+        if self.search_mode == "ann":
+            self._build_ivf(vectors, int(config.get("ann_lists", 0)))
+
+        self.query_cache_size = int(config.get("query_cache_size", os.getenv("LOCAL_QUERY_CACHE_SIZE", 1024)))
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.searches = 0
+        self.search_seconds = 0.0
+
+        print(
+            f"[OK] Local Vector Retriever initialized: {len(self.documents)} chunks, "
+            f"dim={self.vectors.shape[1] if self.vectors.ndim == 2 else 0}, "
+            f"quantize={self.quantize}, search={self.search_mode}"
+        )
+
+    # ------------------------------------------------------------------
+    # ANN (IVF) 인덱스
+    # ------------------------------------------------------------------
+    def _build_ivf(self, vectors: np.ndarray, n_lists: int, iterations: int = 10) -> None:
+        """구면 k-means로 클러스터를 만들고 클러스터별 행 번호 목록 생성 (시드 고정)"""
+        n = vectors.shape[0]
+        n_lists = n_lists or max(1, int(np.sqrt(n)))
+        n_lists = min(n_lists, n)
+        rng = np.random.default_rng(42)
+        centroids = vectors[rng.choice(n, size=n_lists, replace=False)].copy()
+        assign = np.zeros(n, dtype=np.int64)
+        for _ in range(iterations):
+            assign = np.argmax(vectors @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = vectors[assign == c]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    centroids[c] = centroid / norm if norm > 0 else centroid
+        self.centroids = centroids.astype(np.float32)
+        self.lists = [np.flatnonzero(assign == c) for c in range(n_lists)]
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    async def _embed_query(self, query: str) -> np.ndarray:
+        key = " ".join(query.split()).lower()
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        if isinstance(self.embedder, HashingEmbedder):
+            vector = self.embedder.embed(key)
+        else:
+            # 원격 임베딩은 이벤트 루프를 막지 않도록 스레드에서 실행
+            vector = await asyncio.to_thread(self.embedder.embed, key)
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm > 0:
+            vector = vector / norm
+
+        self._query_cache[key] = vector
+        while len(self._query_cache) > self.query_cache_size:
+            self._query_cache.popitem(last=False)
+        return vector
+
+    def _scores(self, rows: Optional[np.ndarray], query_vector: np.ndarray) -> np.ndarray:
+        """후보 행(rows=None이면 전체)과 쿼리의 코사인 유사도"""
+        vectors = self.vectors if rows is None else self.vectors[rows]
+        if len(vectors) <= SEARCH_BLOCK_ROWS:
+            scores = vectors @ query_vector
+        else:
+            scores = np.concatenate([
+                vectors[start:start + SEARCH_BLOCK_ROWS] @ query_vector
+                for start in range(0, len(vectors), SEARCH_BLOCK_ROWS)
+            ])
+        if self.scales is not None:
+            scores = scores * (self.scales if rows is None else self.scales[rows])
+        return scores.astype(np.float32, copy=False)
+
+    def search(self, query_vector: np.ndarray, top_k: int = 3) -> List[tuple]:
+        """(문서 번호, 점수) 목록을 점수 내림차순으로 반환"""
+        if not self.documents or top_k <= 0:
+            return []
+
+        rows = None
+        if self.search_mode == "ann" and self.centroids is not None:
+            nprobe = min(self.ann_nprobe, len(self.lists))
+            probe = np.argpartition(-(self.centroids @ query_vector), nprobe - 1)[:nprobe]
+            rows = np.concatenate([self.lists[c] for c in probe])
+            if len(rows) < top_k:
+                rows = None
+
+        scores = self._scores(rows, query_vector)
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        ids = top if rows is None else rows[top]
+        return [(int(i), float(s)) for i, s in zip(ids, scores[top])]
+
+    async def retrieve(self, query: str, top_k: int = 3) -> List[Dict]:
+        """로컬 인덱스에서 검색"""
+        try:
+            query_vector = await self._embed_query(query)
+            start = time.perf_counter()
+            hits = self.search(query_vector, top_k)
+            self.search_seconds += time.perf_counter() - start
+            self.searches += 1
+
+            return [
+                {
+                    "document_id": self.documents[i].get("document_id", f"local-{i}"),
+                    "title": self.documents[i].get("title", ""),
+                    "content": self.documents[i].get("content", ""),
+                    "source": self.documents[i].get("source", ""),
+                    "score": score,
+                }
+                for i, score in hits
+            ]
+        except Exception as e:
+            print(f"[FAIL] Local vector retrieval failed: {e}")
+            return []
+
+    async def get_context(self, query: str, top_k: int = 3) -> str:
+        """포맷된 컨텍스트 반환"""
+        results = await self.retrieve(query, top_k)
+
+        if not results:
+            return ""
+
+        context_parts = []
+        for i, result in enumerate(results, 1):
+            context_parts.append(
+                f"[참고자료 {i}] {result['title']}\n{result['content'].strip()}"
+            )
+
+        return "\n\n".join(context_parts)
+
+    async def health_check(self) -> bool:
+        """인덱스 로드 상태 확인"""
+        return bool(self.documents) and self.vectors.shape[0] == len(self.documents)
+
+    def stats(self) -> Dict:
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "documents": len(self.documents),
+            "quantize": self.quantize,
+            "search": self.search_mode,
+            "query_cache_size": len(self._query_cache),
+            "query_cache_hit_rate": round(self.cache_hits / lookups, 4) if lookups else None,
+            "avg_search_ms": round(self.search_seconds / self.searches * 1000, 3) if self.searches else None,
+        }
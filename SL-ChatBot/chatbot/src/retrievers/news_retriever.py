@@ -2,9 +2,10 @@
 Backend 뉴스 API를 통해 실시간 뉴스 검색
 """
 from typing import List, Dict, Optional
-import aiohttp
 from datetime import datetime
 
+from backend_client import BackendError, get_backend_client
+
 
 class NewsRetriever:
     """Backend API 기반 뉴스 검색"""
@@ -23,19 +24,11 @@ class NewsRetriever:
         params = {"limit": max_results}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("news", [])
-                    else:
-                        print(f"[WARN] Failed to fetch news for {stock_name}: HTTP {resp.status}")
-                        return []
-
+            data = await get_backend_client().get_json(url, "news.stock", params=params)
+            return data.get("news", [])
+        except BackendError as e:
+            print(f"[WARN] Failed to fetch news for {stock_name}: HTTP {e.status}")
+            return []
         except Exception as e:
             print(f"[ERROR] News retrieval error for {stock_name}: {e}")
             return []
@@ -55,23 +48,16 @@ class NewsRetriever:
         Returns:
             뉴스 리스트
         """
-        url = f"{self.backend_url}/news/db/search"
+        # 관련도순 랭킹 검색 (트라이그램 인덱스, 페이지 크기만큼만 전송)
+        url = f"{self.backend_url}/news/db/search/ranked"
         params = {"keyword": keyword, "limit": max_results}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("news", [])
-                    else:
-                        print(f"[WARN] Failed to search news for '{keyword}': HTTP {resp.status}")
-                        return []
-
+            data = await get_backend_client().get_json(url, "news.search", params=params)
+            return data.get("news", [])
+        except BackendError as e:
+            print(f"[WARN] Failed to search news for '{keyword}': HTTP {e.status}")
+            return []
         except Exception as e:
             print(f"[ERROR] News search error for '{keyword}': {e}")
             return []
@@ -3,11 +3,13 @@
 한국어/영어 자연어 → JSON 조건 DSL 변환
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Optional, Dict
 from pathlib import Path
 
@@ -15,6 +17,8 @@ import boto3
 from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 from pydantic import BaseModel
 
+from schemas.dsl_grammar import ConditionGrammar
+
 logger = logging.getLogger("quant-dsl-parser")
 logging.basicConfig(level="INFO")
 
@@ -31,6 +35,13 @@ BEDROCK_INFERENCE_PROFILE_ID = (
     or os.getenv("BEDROCK_INFERENCE_PROFILE_ARN")
     or "arn:aws:bedrock:ap-northeast-2:749559064959:inference-profile/global.anthropic.claude-sonnet-4-5-20250929-v1:0"
 )
+# 로컬 스텁 LLM 서버 등 대체 엔드포인트 (부하 테스트용)
+BEDROCK_ENDPOINT_URL = os.getenv("BEDROCK_ENDPOINT_URL")
+
+# 동시 Bedrock 호출 상한 (초과 요청은 대기) / boto3 호출 전용 스레드 수
+DSL_LLM_CONCURRENCY = int(os.getenv("DSL_LLM_CONCURRENCY", "8"))
+DSL_LLM_MAX_WORKERS = int(os.getenv("DSL_LLM_MAX_WORKERS", str(DSL_LLM_CONCURRENCY)))
+DSL_RETRY_BACKOFF = [1, 2, 4]  # seconds
 
 # ==============================
 # Claude 시스템 프롬프트 (한국어)
@@ -129,38 +140,70 @@ DSL 스키마:
 # Bedrock 클라이언트 지연 생성
 # ======================================
 _bedrock_client = None
+_llm_executor: Optional[ThreadPoolExecutor] = None
+_llm_semaphore: Optional[asyncio.Semaphore] = None
 _factor_alias_map: Dict[str, str] = {}
 _operator_map: Dict[str, str] = {}
 _known_factors: set[str] = set()
 _factor_units: Dict[str, str] = {}  # factor -> unit(raw|percent|ratio)
+_condition_grammar: Optional[ConditionGrammar] = None
 
 def get_bedrock_client():
     global _bedrock_client
     if _bedrock_client is None:
-        _bedrock_client = boto3.client("bedrock-runtime", region_name=BEDROCK_REGION)
+        _bedrock_client = boto3.client(
+            "bedrock-runtime",
+            region_name=BEDROCK_REGION,
+            endpoint_url=BEDROCK_ENDPOINT_URL,
+        )
     return _bedrock_client
 
 
+def _get_llm_executor() -> ThreadPoolExecutor:
+    """boto3 동기 호출 전용 스레드 풀 (기본 executor와 분리해 상한 고정)"""
+    global _llm_executor
+    if _llm_executor is None:
+        _llm_executor = ThreadPoolExecutor(max_workers=DSL_LLM_MAX_WORKERS, thread_name_prefix="dsl-llm")
+    return _llm_executor
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(DSL_LLM_CONCURRENCY)
+    return _llm_semaphore
+
+
 def _normalize_factor_key(value: str) -> str:
     return re.sub(r"\s+", "", value).lower()
 
 
+def _resolve_config_path(filename: str) -> Path:
+    """컨테이너(/app/config) → chatbot/config → 저장소 루트 config 순으로 탐색."""
+    here = Path(__file__).resolve()
+    candidates = [
+        Path("/app/config") / filename,
+        here.parent.parent.parent / "config" / filename,
+        here.parent.parent.parent.parent / "config" / filename,
+    ]
+    for path in candidates:
+        if path.exists():
+            return path
+    return candidates[0]
+
+
 def _load_alias_and_operator_maps():
     """Load factor alias, operator map, and factor units from config files (with safe fallback)."""
     global _factor_alias_map, _operator_map, _factor_units
     # factor alias
-    factor_path = Path("/app/config/factor_alias.json")
-    if not factor_path.exists():
-        factor_path = Path(__file__).parent.parent.parent / "config" / "factor_alias.json"
+    factor_path = _resolve_config_path("factor_alias.json")
     try:
         if factor_path.exists():
             _factor_alias_map = json.loads(factor_path.read_text(encoding="utf-8"))
     except Exception as exc:
         logger.warning("factor_alias.json 로드 실패: %s", exc)
     # operator map
-    op_path = Path("/app/config/operator_rules.yaml")
-    if not op_path.exists():
-        op_path = Path(__file__).parent.parent.parent / "config" / "operator_rules.yaml"
+    op_path = _resolve_config_path("operator_rules.yaml")
     try:
         if op_path.exists():
             import yaml  # local import to avoid hard dependency elsewhere
@@ -214,6 +257,15 @@ def _load_known_factors():
     for key in _factor_units.keys():
         _known_factors.add(_normalize_factor_key(key))
 
+def get_condition_grammar() -> ConditionGrammar:
+    """alias/operator 설정으로 컴파일한 조건 문법 (프로세스당 1회 생성)."""
+    global _condition_grammar
+    if _condition_grammar is None:
+        if not _factor_alias_map and not _operator_map:
+            _load_alias_and_operator_maps()
+        _condition_grammar = ConditionGrammar(_factor_alias_map, _operator_map, _factor_units.keys())
+    return _condition_grammar
+
 # ======================================
 # DSL 스키마 모델
 # ======================================
@@ -309,9 +361,8 @@ def _guard_value_by_unit(unit: str, factor: Any, value: float) -> float:
 # ======================================
 # Claude 호출
 # ======================================
-def call_claude_and_get_json(text: str) -> dict:
-    """Bedrock 호출 + 간단한 재시도(Throttling 대비)."""
-    payload = {
+def _build_claude_payload(text: str) -> dict:
+    return {
         "anthropic_version": "bedrock-2023-05-31",
         "max_tokens": 2000,
         "temperature": 0.2,
@@ -324,48 +375,80 @@ def call_claude_and_get_json(text: str) -> dict:
         ],
     }
 
-    client = get_bedrock_client()
-    attempts = [1, 2, 4]  # seconds backoff
-    for idx, wait in enumerate([0] + attempts):
+
+def _invoke_claude_once(payload: dict) -> dict:
+    """Bedrock 1회 호출 후 JSON 파싱 (동기)."""
+    invoke_kwargs = {
+        "contentType": "application/json",
+        "accept": "application/json",
+        "body": json.dumps(payload),
+    }
+    if BEDROCK_INFERENCE_PROFILE_ID:
+        invoke_kwargs["inferenceProfileId"] = BEDROCK_INFERENCE_PROFILE_ID
+    else:
+        invoke_kwargs["modelId"] = BEDROCK_MODEL_ID
+
+    response = get_bedrock_client().invoke_model(**invoke_kwargs)
+
+    body = json.loads(response["body"].read())
+    completion = body["content"][0]["text"]
+
+    cleaned = sanitize_json(completion)
+    return json.loads(cleaned)
+
+
+def call_claude_and_get_json(text: str) -> dict:
+    """Bedrock 호출 + 간단한 재시도(Throttling 대비). 스크립트 등 동기 환경 전용."""
+    payload = _build_claude_payload(text)
+    last_exc = None
+    for idx, wait in enumerate([0] + DSL_RETRY_BACKOFF):
         if wait:
             time.sleep(wait)
         try:
-            invoke_kwargs = {
-                "contentType": "application/json",
-                "accept": "application/json",
-                "body": json.dumps(payload),
-            }
-            if BEDROCK_INFERENCE_PROFILE_ID:
-                invoke_kwargs["inferenceProfileId"] = BEDROCK_INFERENCE_PROFILE_ID
-            else:
-                invoke_kwargs["modelId"] = BEDROCK_MODEL_ID
-
-            response = client.invoke_model(**invoke_kwargs)
+            return _invoke_claude_once(payload)
+        except Exception as exc:
+            logger.warning(
+                "Claude DSL 변환 실패(시도 %s/%s) → %s",
+                idx + 1,
+                len(DSL_RETRY_BACKOFF) + 1,
+                exc,
+            )
+            last_exc = exc
+            # 다음 루프에서 재시도
+    logger.warning("Claude DSL 변환 재시도 모두 실패 → fallback 사용. 사유: %s", last_exc)
+    return {"conditions": []}
 
-            body = json.loads(response["body"].read())
-            completion = body["content"][0]["text"]
 
-            cleaned = sanitize_json(completion)
-            parsed = json.loads(cleaned)
+async def call_claude_and_get_json_async(text: str) -> dict:
+    """call_claude_and_get_json의 비동기 버전.
 
-            return parsed
+    boto3 호출은 전용 스레드 풀에서 실행하고, 세마포어로 동시 호출 수를 제한하며,
+    재시도 대기는 asyncio.sleep으로 처리해 이벤트 루프를 막지 않는다.
+    """
+    payload = _build_claude_payload(text)
+    loop = asyncio.get_running_loop()
+    last_exc = None
+    for idx, wait in enumerate([0] + DSL_RETRY_BACKOFF):
+        if wait:
+            await asyncio.sleep(wait)
+        try:
+            async with _get_llm_semaphore():
+                return await loop.run_in_executor(_get_llm_executor(), _invoke_claude_once, payload)
         except Exception as exc:
             logger.warning(
                 "Claude DSL 변환 실패(시도 %s/%s) → %s",
                 idx + 1,
-                len(attempts) + 1,
+                len(DSL_RETRY_BACKOFF) + 1,
                 exc,
             )
             last_exc = exc
-            # 다음 루프에서 재시도
     logger.warning("Claude DSL 변환 재시도 모두 실패 → fallback 사용. 사유: %s", last_exc)
     return {"conditions": []}
 
 # ======================================
 # 최종 파싱 인터페이스
 # ======================================
-def parse_strategy_text(text: str) -> StrategyResponse:
-    claude_payload = call_claude_and_get_json(text)
+def _build_strategy_response(claude_payload: dict) -> StrategyResponse:
     conditions = claude_payload.get("conditions", [])
     normalized: List[Condition] = []
     for raw in conditions:
@@ -383,3 +466,21 @@ def parse_strategy_text(text: str) -> StrategyResponse:
 
     typed_conditions = normalized
     return StrategyResponse(conditions=typed_conditions)
+
+
+def parse_strategy_text(text: str) -> StrategyResponse:
+    fast_conditions = get_condition_grammar().parse(text)
+    if fast_conditions is not None:
+        return _build_strategy_response({"conditions": fast_conditions})
+    return _build_strategy_response(call_claude_and_get_json(text))
+
+
+async def parse_strategy_text_async(text: str) -> StrategyResponse:
+    """비동기 핸들러용 파싱 인터페이스 (이벤트 루프 비차단).
+
+    문법으로 완전히 해석되는 문장은 LLM 호출 없이 바로 변환한다.
+    """
+    fast_conditions = get_condition_grammar().parse(text)
+    if fast_conditions is not None:
+        return _build_strategy_response({"conditions": fast_conditions})
+    return _build_strategy_response(await call_claude_and_get_json_async(text))
@@ -0,0 +1,244 @@
+"""
+조건 문법 기반 DSL 파서 (LLM 우회 fast path)
+
+config/factor_alias.json, operator_rules.yaml로 토크나이저 정규식을 한 번 컴파일하고
+"PER 10 이하, ROE 15% 이상" 같은 정형 문장을 DSL 조건으로 바로 변환한다.
+해석되지 않는 단어가 남는 문장(모호한 입력)은 None을 반환해 LLM으로 넘긴다.
+"""
+
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 조건 구분자: 줄바꿈, 쉼표/세미콜론, 그리고/및/and, "이고/이며"
+CLAUSE_SEPARATOR = re.compile(r"[\n,;]+|\s+(?:그리고|및|and|&)\s+|(?<=[가-힣%\d])\s*(?:이고|이며|고)\s+")
+
+# 한국어 비교어 (operator_rules.yaml의 operator_map으로 확장됨)
+DEFAULT_OPERATOR_WORDS = {
+    "이상": ">=",
+    "초과": ">",
+    "이하": "<=",
+    "미만": "<",
+    "넘으면": ">",
+    "보다 크면": ">",
+    "보다 높으면": ">",
+    "보다 작으면": "<",
+    "보다 낮으면": "<",
+}
+SYMBOL_OPERATORS = {
+    ">=": ">=", "<=": "<=", ">": ">", "<": "<", "==": "==", "=": "==",
+    "≥": ">=", "≤": "<=", "=>": ">=", "=<": "<=",
+}
+
+# 알려진 팩터 (alias 파일 누락 대비 기본값)
+DEFAULT_FACTORS = [
+    "PER", "PBR", "PSR", "PCR", "PEG", "ROE", "ROA", "EPS", "EBITDA",
+    "OperatingProfitMargin", "DebtRatio", "DividendYield",
+    "SMA", "EMA", "RSI", "MACD", "MOMENTUM_3M", "MOMENTUM_6M", "MOMENTUM_12M",
+    "VOLATILITY_20D", "VOLATILITY_60D", "TURNOVER_RATE_20D", "VOLUME_MA_20",
+]
+
+# 조건 의미가 없는 단어 (이것만 남으면 해석 완료로 간주)
+FILLER_PATTERN = re.compile(
+    r"(?:인\s*종목|종목|주식|조건|기준|매수|매도|사고|팔고|사줘|팔아줘|사|팔아|"
+    r"일\s*때|일때|일\s*경우|경우|이면|이라면|라면|하면|되면|면|인|일|시|에|때|"
+    r"이|가|은|는|을|를|이고|이며|으로|로|해줘|해\s*줘|찾아줘|골라줘|추천|전략|:|\.|!|\?|\s)+"
+)
+
+PARTICLE = r"(?:\s*(?:이|가|은|는|값이|값은))?"
+NUMBER = r"(-?\d+(?:\.\d+)?)"
+PERCENT = r"(%|퍼센트|프로)?"
+VALUE_UNIT = r"(?:\s*(?:배|원|점))?"
+
+# N일 수익률 표현: "3일동안 8% 이상 오르면", "5일 전 대비 10% 상승", "10일간 5% 하락"
+RETURN_PATTERN = re.compile(
+    r"(\d+)\s*일\s*(?:동안|간|전\s*대비|대비)?\s*(?:수익률(?:이|가)?\s*)?"
+    r"(\d+(?:\.\d+)?)\s*(?:%|퍼센트|프로)\s*(이상|초과)?\s*"
+    r"(오르면|올랐|오를|상승|급등|하락|떨어지면|떨어질|내리면|급락)"
+)
+FALL_WORDS = {"하락", "떨어지면", "떨어질", "내리면", "급락"}
+
+
+class ConditionGrammar:
+    """컴파일된 조건 문법"""
+
+    def __init__(
+        self,
+        alias_map: Dict[str, str],
+        operator_map: Dict[str, str],
+        extra_factors: Iterable[str] = ()
+    ):
+        # 별칭 → 정식 팩터명 (소문자 키)
+        self.factor_lookup: Dict[str, str] = {}
+        for factor in list(DEFAULT_FACTORS) + list(extra_factors):
+            self.factor_lookup[factor.lower()] = factor
+        for alias, target in (alias_map or {}).items():
+            if isinstance(alias, str) and isinstance(target, str):
+                self.factor_lookup[alias.lower().strip()] = target
+                self.factor_lookup.setdefault(target.lower(), target)
+
+        self.operator_words: Dict[str, str] = dict(DEFAULT_OPERATOR_WORDS)
+        for word, op in (operator_map or {}).items():
+            if isinstance(word, str) and isinstance(op, str) and word not in SYMBOL_OPERATORS:
+                self.operator_words[word.lower()] = op
+
+        factor_alt = "|".join(
+            re.escape(alias) for alias in sorted(self.factor_lookup, key=len, reverse=True)
+        )
+        # ASCII 별칭이 다른 영단어의 일부로 매칭되지 않도록 경계 지정
+        factor = rf"(?<![a-z0-9_])({factor_alt})(?![a-z0-9_])"
+        word_ops = "|".join(
+            re.escape(word) for word in sorted(self.operator_words, key=len, reverse=True)
+            if self.operator_words[word] != "between"
+        )
+        between_words = "|".join(
+            re.escape(word) for word, op in self.operator_words.items() if op == "between"
+        ) or "사이"
+        symbol_ops = "|".join(re.escape(op) for op in sorted(SYMBOL_OPERATORS, key=len, reverse=True))
+
+        # PER 10 이하 / ROE가 15% 이상 / PER이 10보다 작으면
+        self._factor_value_op = re.compile(
+            rf"{factor}{PARTICLE}\s*{NUMBER}\s*{PERCENT}{VALUE_UNIT}\s*({word_ops})"
+        )
+        # 30 이하 RSI (역순)
+        self._value_op_factor = re.compile(
+            rf"{NUMBER}\s*{PERCENT}{VALUE_UNIT}\s*({word_ops})\s*(?:인|의)?\s*{factor}"
+        )
+        # PER <= 10 / ROE > 15%
+        self._factor_symbol_value = re.compile(
+            rf"{factor}\s*({symbol_ops})\s*{NUMBER}\s*{PERCENT}"
+        )
+        # PER 5 ~ 10 사이 / PER 5에서 10 사이
+        self._between = re.compile(
+            rf"{factor}{PARTICLE}\s*{NUMBER}\s*{PERCENT}\s*(?:~|-|에서|부터)\s*{NUMBER}\s*{PERCENT}\s*(?:까지\s*)?(?:{between_words})?"
+        )
+        self._generic_factor_value_op = re.compile(
+            rf"([a-z가-힣_]+?){PARTICLE}\s*{NUMBER}\s*{PERCENT}\s*({word_ops})"
+        )
+
+        self.hits = 0
+        self.misses = 0
+        self.total_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # 단일 조건절 파싱
+    # ------------------------------------------------------------------
+    def _condition(self, factor: str, operator: str, value: Any) -> Dict[str, Any]:
+        return {
+            "factor": factor,
+            "params": [],
+            "operator": operator,
+            "right_factor": None,
+            "right_params": [],
+            "value": value,
+        }
+
+    def _scale(self, factor: str, value: float, percent: Optional[str]) -> float:
+        # 수익률 계열만 퍼센트를 소수로 변환 (ROE 15% → 15 유지)
+        if percent and factor.upper().startswith(("RET_", "PRICE_CHANGE_")):
+            return value / 100.0
+        return value
+
+    def _parse_clause(self, clause: str, allow_unknown_factor: bool = False) -> Optional[Tuple[List[Dict[str, Any]], str]]:
+        """조건절 하나를 파싱해 (조건 목록, 남은 텍스트) 반환. 매칭 실패 시 None."""
+        m = RETURN_PATTERN.search(clause)
+        if m:
+            days, pct, _, verb = m.groups()
+            value = float(pct) / 100.0
+            if verb in FALL_WORDS:
+                cond = self._condition(f"RET_{days}D", "<=", -value)
+            else:
+                cond = self._condition(f"RET_{days}D", ">=", value)
+            return [cond], clause[:m.start()] + clause[m.end():]
+
+        m = self._between.search(clause)
+        if m:
+            factor = self.factor_lookup[m.group(1)]
+            low = self._scale(factor, float(m.group(2)), m.group(3))
+            high = self._scale(factor, float(m.group(4)), m.group(5) or m.group(3))
+            # between은 두 조건으로 확장 (dsl_generator._normalize_condition과 동일 규칙)
+            conds = [self._condition(factor, ">", low), self._condition(factor, "<", high)]
+            return conds, clause[:m.start()] + clause[m.end():]
+
+        m = self._factor_value_op.search(clause)
+        if m:
+            factor = self.factor_lookup[m.group(1)]
+            operator = self.operator_words[m.group(4)]
+            value = self._scale(factor, float(m.group(2)), m.group(3))
+            return [self._condition(factor, operator, value)], clause[:m.start()] + clause[m.end():]
+
+        m = self._factor_symbol_value.search(clause)
+        if m:
+            factor = self.factor_lookup[m.group(1)]
+            operator = SYMBOL_OPERATORS[m.group(2)]
+            value = self._scale(factor, float(m.group(3)), m.group(4))
+            return [self._condition(factor, operator, value)], clause[:m.start()] + clause[m.end():]
+
+        m = self._value_op_factor.search(clause)
+        if m:
+            factor = self.factor_lookup[m.group(4)]
+            operator = self.operator_words[m.group(3)]
+            value = self._scale(factor, float(m.group(1)), m.group(2))
+            return [self._condition(factor, operator, value)], clause[:m.start()] + clause[m.end():]
+
+        if allow_unknown_factor:
+            m = self._generic_factor_value_op.search(clause)
+            if m:
+                operator = self.operator_words[m.group(4)]
+                cond = self._condition(m.group(1).upper(), operator, float(m.group(2)))
+                return [cond], clause[:m.start()] + clause[m.end():]
+
+        return None
+
+    @staticmethod
+    def _is_filler(text: str) -> bool:
+        return FILLER_PATTERN.fullmatch(text) is not None if text.strip() else True
+
+    def _clauses(self, text: str) -> List[str]:
+        return [c.strip() for c in CLAUSE_SEPARATOR.split((text or "").lower()) if c and c.strip()]
+
+    # ------------------------------------------------------------------
+    # 공개 인터페이스
+    # ------------------------------------------------------------------
+    def parse(self, text: str) -> Optional[List[Dict[str, Any]]]:
+        """엄격 모드: 모든 조건절이 완전히 해석될 때만 조건 목록 반환, 아니면 None."""
+        start = time.perf_counter()
+        conditions: Optional[List[Dict[str, Any]]] = []
+        clauses = self._clauses(text)
+        if not clauses:
+            conditions = None
+        for clause in clauses:
+            if self._is_filler(clause):
+                continue
+            parsed = self._parse_clause(clause)
+            if parsed is None or not self._is_filler(parsed[1]):
+                conditions = None
+                break
+            conditions.extend(parsed[0])
+        if not conditions:
+            conditions = None
+
+        self.total_seconds += time.perf_counter() - start
+        if conditions is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return conditions
+
+    def extract(self, text: str) -> List[Dict[str, Any]]:
+        """관대 모드: 해석 가능한 조건절만 추출 (알 수 없는 팩터명도 대문자로 허용)."""
+        conditions: List[Dict[str, Any]] = []
+        for clause in self._clauses(text):
+            parsed = self._parse_clause(clause, allow_unknown_factor=True)
+            if parsed:
+                conditions.extend(parsed[0])
+        return conditions
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else None,
+            "avg_parse_us": round(self.total_seconds / total * 1e6, 2) if total else None,
+        }
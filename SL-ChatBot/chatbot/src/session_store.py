@@ -0,0 +1,250 @@
+"""Session Store - 대화 세션 스토어
+
+세션마다 LangChain 대화 메모리(client_type별)와 설문/백테스트 상태를 보관한다.
+
+- InMemorySessionStore: 프로세스 내 LRU (최대 세션 수 제한)
+- RedisSessionStore: Redis를 원본으로 두고 LRU를 앞단 캐시로 사용
+  요청 시작 시 load_session으로 1회 GET, 종료 시 persist_session으로 1회 SETEX.
+  load_session ~ persist_session 사이(요청 처리 중)의 세션은 LRU에서 축출하지 않는다.
+  여러 챗봇 인스턴스가 같은 세션을 처리할 수 있어 sticky routing이 필요 없다.
+
+직렬화 형식 (JSON): {"state": {...}, "hist": {"assistant": [["h", "..."], ["a", "..."]]}}
+대화 기록은 최근 max_turns 턴만 유지한다 (요약 없이 앞부분 절단).
+상태에 JSON으로 표현할 수 없는 값이 있으면 저장 시 TypeError (문자열로 바꿔 저장하지 않음).
+"""
+import itertools
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, MutableMapping, Optional
+
+try:
+    import redis.asyncio as aioredis  # type: ignore
+except ImportError:
+    aioredis = None
+
+
+class _Session:
+    __slots__ = ("state", "histories", "raw")
+
+    def __init__(self):
+        self.state: Optional[Dict[str, Any]] = None
+        self.histories: Dict[str, Any] = {}
+        # 마지막으로 읽거나 쓴 직렬화 문자열 (변경 없으면 역직렬화 생략)
+        self.raw: Optional[str] = None
+
+
+class _SessionStateView(MutableMapping):
+    """session_id → 상태 dict 매핑 뷰 (기존 self.session_state 사용 코드 호환)"""
+
+    def __init__(self, store: "InMemorySessionStore"):
+        self._store = store
+
+    def __getitem__(self, session_id: str) -> Dict[str, Any]:
+        session = self._store._sessions.get(session_id)
+        if session is None or session.state is None:
+            raise KeyError(session_id)
+        return session.state
+
+    def __setitem__(self, session_id: str, value: Dict[str, Any]) -> None:
+        self._store._session(session_id).state = value
+
+    def __delitem__(self, session_id: str) -> None:
+        session = self._store._sessions.get(session_id)
+        if session is None or session.state is None:
+            raise KeyError(session_id)
+        session.state = None
+
+    def __iter__(self) -> Iterator[str]:
+        return (sid for sid, s in list(self._store._sessions.items()) if s.state is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for s in self._store._sessions.values() if s.state is not None)
+
+
+class InMemorySessionStore:
+    """대화 세션 스토어 (메모리 기반, LRU로 세션 수 제한)."""
+
+    def __init__(self, max_sessions: int = 1000, max_turns: int = 20):
+        self.max_sessions = max_sessions
+        self.max_turns = max_turns
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        # 처리 중인 요청 수 (load_session에서 +1, persist_session에서 -1)
+        self._pins: Dict[str, int] = {}
+        self.states = _SessionStateView(self)
+
+    def _session(self, session_id: str) -> _Session:
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = _Session()
+            self._sessions[session_id] = session
+            self._evict()
+        else:
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def _evict(self) -> None:
+        """오래된 세션부터 max_sessions까지 축출 (요청 처리 중인 세션은 건너뜀)"""
+        excess = len(self._sessions) - self.max_sessions
+        if excess <= 0:
+            return
+        idle = (sid for sid in self._sessions if sid not in self._pins)
+        for sid in list(itertools.islice(idle, excess)):
+            del self._sessions[sid]
+
+    def _pin(self, session_id: str) -> None:
+        self._pins[session_id] = self._pins.get(session_id, 0) + 1
+
+    def _unpin(self, session_id: str) -> None:
+        count = self._pins.get(session_id, 0) - 1
+        if count > 0:
+            self._pins[session_id] = count
+        else:
+            self._pins.pop(session_id, None)
+
+    def get_history(self, session_id: str, client_type: str, factory: Callable[[], Any]) -> Any:
+        """client_type별 대화 메모리 (없으면 factory로 생성)"""
+        session = self._session(session_id)
+        history = session.histories.get(client_type)
+        if history is None:
+            history = factory()
+            session.histories[client_type] = history
+        return history
+
+    def _trim(self, history: Any) -> None:
+        messages = getattr(history, "messages", None)
+        limit = self.max_turns * 2
+        if isinstance(messages, list) and len(messages) > limit:
+            del messages[:-limit]
+
+    async def load_session(self, session_id: str, history_factory: Callable[[], Any]) -> None:
+        """요청 시작 시 세션 로드 (메모리 스토어는 LRU 갱신만)"""
+        self._pin(session_id)
+        if session_id in self._sessions:
+            self._sessions.move_to_end(session_id)
+
+    async def persist_session(self, session_id: str) -> None:
+        """요청 종료 시 세션 저장 후 축출 대상으로 복귀"""
+        try:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                await self._persist(session_id, session)
+        finally:
+            self._unpin(session_id)
+            self._evict()
+
+    async def _persist(self, session_id: str, session: _Session) -> None:
+        """메모리 스토어는 기록 길이만 제한"""
+        for history in session.histories.values():
+            self._trim(history)
+
+    def drop_local(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    async def delete_session(self, session_id: str) -> None:
+        self.drop_local(session_id)
+
+    def clear(self) -> None:
+        self._sessions.clear()
+        self._pins.clear()
+
+
+class RedisSessionStore(InMemorySessionStore):
+    """Redis 기반 세션 스토어 (LRU 앞단 캐시 + TTL)."""
+
+    KEY_PREFIX = "chatbot:session:"
+
+    def __init__(self, redis_url: str, ttl: int = 86400, max_sessions: int = 1000, max_turns: int = 20):
+        super().__init__(max_sessions=max_sessions, max_turns=max_turns)
+        self.ttl = ttl
+        self.client = aioredis.from_url(redis_url, decode_responses=True)
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}"
+
+    def _serialize(self, session: _Session) -> str:
+        limit = self.max_turns * 2
+        hist = {}
+        for client_type, history in session.histories.items():
+            pairs = []
+            for m in getattr(history, "messages", [])[-limit:]:
+                role = getattr(m, "type", "")
+                if role in ("human", "ai") and isinstance(m.content, str):
+                    pairs.append(["h" if role == "human" else "a", m.content])
+            hist[client_type] = pairs
+        return json.dumps({"state": session.state, "hist": hist}, ensure_ascii=False, separators=(",", ":"))
+
+    def _deserialize(self, session: _Session, raw: str, history_factory: Callable[[], Any]) -> None:
+        data = json.loads(raw)
+        session.state = data.get("state")
+        session.histories = {}
+        for client_type, pairs in (data.get("hist") or {}).items():
+            history = history_factory()
+            for role, content in pairs:
+                if role == "h":
+                    history.add_user_message(content)
+                else:
+                    history.add_ai_message(content)
+            session.histories[client_type] = history
+
+    async def load_session(self, session_id: str, history_factory: Callable[[], Any]) -> None:
+        """Redis에서 세션을 읽어 LRU에 반영 (다른 인스턴스의 변경도 반영)"""
+        self._pin(session_id)
+        session = self._session(session_id)
+        try:
+            raw = await self.client.get(self._key(session_id))
+        except Exception as e:
+            print(f"[SessionStore] Redis 조회 실패, 로컬 세션 사용: {e}")
+            return
+        if raw is None or raw == session.raw:
+            return
+        self._deserialize(session, raw, history_factory)
+        session.raw = raw
+
+    async def _persist(self, session_id: str, session: _Session) -> None:
+        await super()._persist(session_id, session)
+        if session.state is None and not session.histories:
+            return
+        try:
+            raw = self._serialize(session)
+        except TypeError as e:
+            raise TypeError(f"[SessionStore] 세션 상태를 JSON으로 저장할 수 없습니다 ({session_id}): {e}") from e
+        if raw == session.raw:
+            # 내용 변경 없으면 TTL만 연장
+            try:
+                await self.client.expire(self._key(session_id), self.ttl)
+            except Exception as e:
+                print(f"[SessionStore] Redis TTL 갱신 실패: {e}")
+            return
+        try:
+            await self.client.setex(self._key(session_id), self.ttl, raw)
+            session.raw = raw
+        except Exception as e:
+            print(f"[SessionStore] Redis 저장 실패: {e}")
+
+    async def delete_session(self, session_id: str) -> None:
+        self.drop_local(session_id)
+        try:
+            await self.client.delete(self._key(session_id))
+        except Exception as e:
+            print(f"[SessionStore] Redis 삭제 실패: {e}")
+
+
+def create_session_store() -> InMemorySessionStore:
+    """환경 변수로 세션 스토어 선택 (SESSION_STORE=memory|redis)"""
+    max_sessions = int(os.getenv("SESSION_LRU_SIZE", "1000"))
+    max_turns = int(os.getenv("SESSION_MAX_TURNS", "20"))
+    backend = os.getenv("SESSION_STORE", "memory").lower()
+    redis_url = os.getenv("REDIS_URL")
+
+    if backend == "redis":
+        if redis_url and aioredis:
+            print(f"[SessionStore] Redis 세션 스토어 사용 ({redis_url})")
+            return RedisSessionStore(
+                redis_url,
+                ttl=int(os.getenv("SESSION_TTL_SECONDS", "86400")),
+                max_sessions=max_sessions,
+                max_turns=max_turns,
+            )
+        print("[SessionStore] REDIS_URL 또는 redis 패키지가 없어 메모리 스토어 사용")
+    return InMemorySessionStore(max_sessions=max_sessions, max_turns=max_turns)
@@ -0,0 +1,95 @@
+"""Stream Metrics - SSE 스트리밍 지표
+
+요청별 StreamTrace로 첫 청크까지 시간(TTFB), 전체 소요 시간, LLM 토큰 수를 기록하고
+경로(path)별 히스토그램으로 집계한다.
+
+- fast: 설문/정책/카테고리 등 LLM 없이 바로 응답한 경로
+- cache: 응답 캐시 적중 (response_cache)
+- llm: 에이전트 스트리밍 경로 (tokens/sec 집계 대상)
+"""
+import time
+from typing import Any, Dict, Optional
+
+from backend_client import LatencyHistogram
+
+
+class StreamTrace:
+    """요청 하나의 스트리밍 타이밍"""
+
+    __slots__ = ("started_at", "first_chunk_at", "last_chunk_at", "chunks", "tokens", "path", "error")
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.first_chunk_at: Optional[float] = None
+        self.last_chunk_at: Optional[float] = None
+        self.chunks = 0
+        self.tokens = 0
+        self.path = "fast"
+        self.error = False
+
+    def chunk(self, token: bool = False) -> None:
+        now = time.perf_counter()
+        if self.first_chunk_at is None:
+            self.first_chunk_at = now
+        self.last_chunk_at = now
+        self.chunks += 1
+        if token:
+            self.tokens += 1
+
+
+class _PathStats:
+    def __init__(self):
+        self.ttfb = LatencyHistogram()
+        self.duration = LatencyHistogram()
+        self.tokens = 0
+        self.token_seconds = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ttfb": self.ttfb.to_dict(),
+            "duration": self.duration.to_dict(),
+            "tokens": self.tokens,
+            "tokens_per_sec": round(self.tokens / self.token_seconds, 1) if self.token_seconds else None,
+        }
+
+
+class StreamMetrics:
+    """경로별 TTFB/소요 시간 히스토그램 + 토큰 처리량"""
+
+    def __init__(self):
+        self._paths: Dict[str, _PathStats] = {}
+        self.streams = 0
+        self.errors = 0
+
+    def start(self) -> StreamTrace:
+        return StreamTrace()
+
+    def finish(self, trace: StreamTrace) -> None:
+        stats = self._paths.setdefault(trace.path, _PathStats())
+        self.streams += 1
+        if trace.error:
+            self.errors += 1
+            stats.duration.errors += 1
+
+        now = time.perf_counter()
+        stats.duration.observe((now - trace.started_at) * 1000)
+        if trace.first_chunk_at is not None:
+            stats.ttfb.observe((trace.first_chunk_at - trace.started_at) * 1000)
+        if trace.tokens > 1 and trace.last_chunk_at > trace.first_chunk_at:
+            # 첫 토큰 이후 구간의 생성 속도
+            stats.tokens += trace.tokens - 1
+            stats.token_seconds += trace.last_chunk_at - trace.first_chunk_at
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "streams": self.streams,
+            "errors": self.errors,
+            "paths": {path: stats.to_dict() for path, stats in self._paths.items()},
+        }
+
+
+_metrics = StreamMetrics()
+
+
+def get_stream_metrics() -> StreamMetrics:
+    return _metrics
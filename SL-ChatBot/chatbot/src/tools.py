@@ -4,9 +4,9 @@ Defines available tools that the agent can use to perform tasks.
 """
 from typing import List, Dict, Any, Optional, Union
 from langchain_core.tools import tool
-import aiohttp
 from langchain_core.tools import BaseTool # Import BaseTool for type hinting
 from db.sentiment_insights import SentimentInsightService
+from backend_client import BackendError, get_backend_client
 
 
 def get_tools(news_retriever=None, factor_sync=None) -> List:
@@ -115,12 +115,10 @@ def get_tools(news_retriever=None, factor_sync=None) -> List:
         url = f"{backend_url}/news/themes/sentiment-summary"
         params = {"limit": limit}
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=15) as resp:
-                    if resp.status == 200:
-                        return {"success": True, "summary": await resp.json()}
-                    else:
-                        return {"success": False, "error": f"Backend API error: HTTP {resp.status}"}
+            summary = await get_backend_client().get_json(url, "themes.sentiment", params=params)
+            return {"success": True, "summary": summary}
+        except BackendError as e:
+            return {"success": False, "error": f"Backend API error: HTTP {e.status}"}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -147,13 +145,10 @@ def get_tools(news_retriever=None, factor_sync=None) -> List:
         
         url = f"{backend_url}/news/themes"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return {"success": True, "themes": data.get("themes", []), "count": data.get("count", 0)}
-                    else:
-                        return {"success": False, "error": f"Backend API error: HTTP {resp.status}"}
+            data = await get_backend_client().get_json(url, "themes.list")
+            return {"success": True, "themes": data.get("themes", []), "count": data.get("count", 0)}
+        except BackendError as e:
+            return {"success": False, "error": f"Backend API error: HTTP {e.status}"}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -194,10 +189,10 @@ def get_tools(news_retriever=None, factor_sync=None) -> List:
             변환된 DSL 조건 리스트와 성공 여부
         """
         try:
-            from schemas.dsl_generator import parse_strategy_text
+            from schemas.dsl_generator import parse_strategy_text_async
 
             # 자연어 → DSL 변환
-            result = parse_strategy_text(strategy_description)
+            result = await parse_strategy_text_async(strategy_description)
 
             # Condition 객체를 딕셔너리로 변환
             conditions = [condition.model_dump() for condition in result.conditions]
@@ -223,8 +218,8 @@ def get_tools(news_retriever=None, factor_sync=None) -> List:
     @tool
     async def analyze_stock_sentiment(stock_code: str, stock_name: Optional[str] = None, max_results: int = 400) -> Dict:
         """종목별 7일/30일 감성 추세와 급변 감성 변화를 분석합니다."""
-        if not sentiment_service or not sentiment_service.news_retriever:
-            return {"success": False, "error": "News retriever not available for stock sentiment analysis"}
+        if not sentiment_service:
+            return {"success": False, "error": "Sentiment service not available for stock sentiment analysis"}
         try:
             analysis = await sentiment_service.analyze_stock_sentiment(
                 stock_code=stock_code,
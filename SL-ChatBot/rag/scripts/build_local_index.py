@@ -0,0 +1,101 @@
+"""Build a local embedding index for LocalVectorRetriever.
+
+Chunks the markdown documents and writes a NumPy embedding matrix
+(vectors.npy) plus chunk metadata (meta.json) to ../vectordb/local.
+
+The default embedder is the deterministic hashing model, so the index can be
+built and tested fully offline. Use --embedder bedrock to embed with Titan.
+
+Usage:
+    python build_local_index.py
+    python build_local_index.py --embedder bedrock --dim 1024
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR.parents[1] / "chatbot" / "src"))
+
+from retrievers.local_embedding import BedrockTitanEmbedder, HashingEmbedder  # noqa: E402
+
+
+def split_text(text: str, chunk_size: int = 1000, chunk_overlap: int = 200) -> List[str]:
+    """Split on paragraph boundaries, packing paragraphs up to chunk_size."""
+    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+    chunks: List[str] = []
+    current = ""
+    for paragraph in paragraphs:
+        if current and len(current) + len(paragraph) + 2 > chunk_size:
+            chunks.append(current)
+            current = current[-chunk_overlap:] if chunk_overlap else ""
+        while len(paragraph) > chunk_size:
+            head, paragraph = paragraph[:chunk_size], paragraph[chunk_size - chunk_overlap:]
+            chunks.append((current + "\n\n" + head).strip() if current else head)
+            current = ""
+        current = f"{current}\n\n{paragraph}".strip() if current else paragraph
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def load_chunks(docs_dir: Path, chunk_size: int, chunk_overlap: int) -> List[Dict]:
+    """Load all markdown documents as chunk records."""
+    records = []
+    for path in sorted(docs_dir.rglob("*.md")):
+        text = path.read_text(encoding="utf-8")
+        title = path.stem
+        for line in text.splitlines():
+            if line.startswith("# "):
+                title = line[2:].strip()
+                break
+        source = str(path.relative_to(docs_dir))
+        for i, chunk in enumerate(split_text(text, chunk_size, chunk_overlap)):
+            records.append({
+                "document_id": f"{source}#{i}",
+                "title": title,
+                "content": chunk,
+                "source": source,
+            })
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build local vector index")
+    parser.add_argument("--docs-dir", default=str(SCRIPT_DIR / "../documents"))
+    parser.add_argument("--out-dir", default=str(SCRIPT_DIR / "../vectordb/local"))
+    parser.add_argument("--embedder", choices=["hash", "bedrock"], default="hash")
+    parser.add_argument("--dim", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--chunk-overlap", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.embedder == "bedrock":
+        embedder = BedrockTitanEmbedder(dim=args.dim or 1024)
+    else:
+        embedder = HashingEmbedder(dim=args.dim or 512)
+
+    records = load_chunks(Path(args.docs_dir), args.chunk_size, args.chunk_overlap)
+    if not records:
+        print("No documents found!")
+        return
+    print(f"Embedding {len(records)} chunks with {embedder.spec()}")
+
+    texts = [f"{r['title']}\n{r['content']}" for r in records]
+    vectors = embedder.embed_batch(texts).astype(np.float32)
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    np.save(out_dir / "vectors.npy", vectors)
+    with open(out_dir / "meta.json", "w", encoding="utf-8") as f:
+        json.dump({"embedder": embedder.spec(), "documents": records}, f, ensure_ascii=False)
+
+    print(f"✅ Local index written to {out_dir} ({vectors.shape[0]} x {vectors.shape[1]})")
+
+
+if __name__ == "__main__":
+    main()